@@ -28,6 +28,38 @@ FILE_WATCHER_DEBOUNCE: float = float(
     os.environ.get("AG3NT_FILE_WATCHER_DEBOUNCE", "0.1")
 )
 
+# Skills / memory source cache: seconds a parsed source is trusted before its
+# files are re-stat'd (file-watcher events invalidate immediately)
+SOURCE_CACHE_REVALIDATE: float = float(
+    os.environ.get("AG3NT_SOURCE_CACHE_REVALIDATE", "5.0")
+)
+
+# Skill trigger matching: "substring" (default), "word" (whole words only) or
+# "stem" (whole words, ignoring simple suffixes like -s/-ing/-ed)
+SKILL_TRIGGER_MATCH: str = os.environ.get("AG3NT_SKILL_TRIGGER_MATCH", "substring")
+
+# Agent pool: seconds a turn waits for a warm instance before building an
+# extra one on demand
+POOL_ACQUIRE_TIMEOUT: float = float(
+    os.environ.get("AG3NT_POOL_ACQUIRE_TIMEOUT", "10.0")
+)
+
+# Autonomous event bus: directory for the durable event log (segments,
+# consumer offsets, dead letters); empty keeps events in memory only
+EVENT_LOG_DIR: str = os.environ.get("AG3NT_EVENT_LOG_DIR", "")
+
+# Learning engine: spool for action records Context-Engine could not store;
+# empty keeps them in memory only
+LEARNING_SPOOL_PATH: str = os.environ.get(
+    "AG3NT_LEARNING_SPOOL_PATH", str(Path.home() / ".ag3nt" / "learning_spool.jsonl")
+)
+
+# Decision audit log: JSON-lines file that decisions are appended to once
+# they drop out of the in-memory log; empty discards them
+DECISION_AUDIT_SPILL_PATH: str = os.environ.get(
+    "AG3NT_DECISION_AUDIT_SPILL_PATH", str(Path.home() / ".ag3nt" / "decision_audit.jsonl")
+)
+
 # Smart output truncation
 TRUNCATION_MAX_LINES: int = int(os.environ.get("AG3NT_TRUNCATION_MAX_LINES", "2000"))
 TRUNCATION_MAX_BYTES: int = int(os.environ.get("AG3NT_TRUNCATION_MAX_BYTES", str(50 * 1024)))
@@ -4,15 +4,20 @@ This module provides a pool of pre-warmed agent instances to eliminate
 cold start latency. Instead of building an agent on first request,
 agents are pre-built and ready to serve immediately.
 
+Each instance is checked out by one turn at a time, so up to ``pool_size``
+turns run concurrently on separate instances. Checkouts are session-affine:
+a session goes back to the instance that served its previous turn whenever
+that instance is idle, keeping the instance's in-memory caches hot for it.
+
 Usage:
     from ag3nt_agent.agent_pool import get_agent_pool
 
     pool = get_agent_pool()
 
     # Acquire an agent for a turn
-    entry = pool.acquire()
+    entry = pool.acquire(session_id)
     try:
-        result = await run_turn_with_agent(entry["agent"], ...)
+        result = run_turn_with_agent(entry.agent, ...)
     finally:
         pool.release(entry)
 """
@@ -20,15 +25,59 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import gc
 import logging
+import sys
 import threading
 import time
-from collections import deque
+import types
+import uuid
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from typing import Any
 
 logger = logging.getLogger("ag3nt.agent_pool")
 
+_DEFAULT_ACQUIRE_TIMEOUT = 10.0
+_MAX_AFFINITY_SESSIONS = 10_000
+_MEMORY_REFRESH_SECONDS = 60.0
+_MEMORY_SCAN_LIMIT = 200_000
+
+# Objects shared by every instance (code, classes, modules) are not counted
+# towards an instance's memory.
+_SHARED_TYPES: tuple[type, ...] = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.CodeType,
+)
+try:  # The checkpointer is shared across instances too
+    from langgraph.checkpoint.base import BaseCheckpointSaver
+
+    _SHARED_TYPES += (BaseCheckpointSaver,)
+except ImportError:  # pragma: no cover - langgraph is a runtime dependency
+    pass
+
+
+def estimate_size(obj: Any, max_objects: int = _MEMORY_SCAN_LIMIT) -> int:
+    """Approximate bytes reachable from *obj*, excluding shared code/types.
+
+    Walks ``gc`` referents breadth-first and stops after *max_objects*
+    objects, so the result is a lower bound for very large graphs.
+    """
+    seen: set[int] = set()
+    pending: deque[Any] = deque([obj])
+    total = 0
+    while pending and len(seen) < max_objects:
+        current = pending.popleft()
+        if id(current) in seen or issubclass(type(current), _SHARED_TYPES):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current, 0)
+        pending.extend(gc.get_referents(current))
+    return total
+
 
 @dataclass
 class PoolEntry:
@@ -38,6 +87,15 @@ class PoolEntry:
     created_at: float = field(default_factory=time.time)
     turns_executed: int = 0
     last_used_at: float = field(default_factory=time.time)
+    entry_id: str = field(default_factory=lambda: uuid.uuid4().hex[:8])
+    build_seconds: float = 0.0
+    session_id: str | None = None  # Session of the current checkout
+    checked_out_at: float | None = None
+    total_turn_seconds: float = 0.0
+    max_turn_seconds: float = 0.0
+    last_turn_seconds: float = 0.0
+    memory_bytes: int | None = None
+    memory_measured_at: float = 0.0
 
     def is_stale(self, max_age_seconds: float) -> bool:
         """Check if this entry is too old."""
@@ -47,6 +105,29 @@ class PoolEntry:
         """Check if this entry has executed too many turns."""
         return self.turns_executed >= max_turns
 
+    def record_turn(self, seconds: float) -> None:
+        """Record the latency of a completed turn."""
+        self.total_turn_seconds += seconds
+        self.last_turn_seconds = seconds
+        self.max_turn_seconds = max(self.max_turn_seconds, seconds)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "id": self.entry_id,
+            "inUse": self.checked_out_at is not None,
+            "sessionId": self.session_id,
+            "turnsExecuted": self.turns_executed,
+            "ageSeconds": round(time.time() - self.created_at, 1),
+            "buildSeconds": round(self.build_seconds, 3),
+            "avgTurnSeconds": round(self.total_turn_seconds / self.turns_executed, 3)
+            if self.turns_executed
+            else 0.0,
+            "lastTurnSeconds": round(self.last_turn_seconds, 3),
+            "maxTurnSeconds": round(self.max_turn_seconds, 3),
+            "memoryBytes": self.memory_bytes,
+        }
+
 
 @dataclass
 class PoolStats:
@@ -60,6 +141,12 @@ class PoolStats:
     current_size: int = 0
     warmups_started: int = 0
     warmups_completed: int = 0
+    in_use: int = 0
+    affinity_hits: int = 0
+    affinity_misses: int = 0
+    waits: int = 0
+    wait_timeouts: int = 0
+    total_wait_seconds: float = 0.0
 
     @property
     def hit_rate(self) -> float:
@@ -67,6 +154,12 @@ class PoolStats:
         total = self.pool_hits + self.pool_misses
         return self.pool_hits / total if total > 0 else 0.0
 
+    @property
+    def affinity_hit_rate(self) -> float:
+        """Share of returning sessions served by their previous instance."""
+        total = self.affinity_hits + self.affinity_misses
+        return self.affinity_hits / total if total > 0 else 0.0
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -77,8 +170,15 @@ class PoolStats:
             "hitRate": self.hit_rate,
             "retirements": self.retirements,
             "currentSize": self.current_size,
+            "inUse": self.in_use,
             "warmupsStarted": self.warmups_started,
             "warmupsCompleted": self.warmups_completed,
+            "affinityHits": self.affinity_hits,
+            "affinityMisses": self.affinity_misses,
+            "affinityHitRate": self.affinity_hit_rate,
+            "waits": self.waits,
+            "waitTimeouts": self.wait_timeouts,
+            "totalWaitSeconds": round(self.total_wait_seconds, 3),
         }
 
 
@@ -89,8 +189,14 @@ class AgentPool:
     is needed, it's acquired from the pool (fast) instead of being built
     from scratch (slow). After use, agents are returned to the pool for reuse.
 
+    When every instance is checked out, ``acquire`` waits up to
+    ``acquire_timeout`` seconds for one to be released before building an
+    extra instance on demand; extra instances are dropped on release so the
+    pool never grows past ``pool_size``.
+
     Agents are retired after a configurable number of turns or age to prevent
-    memory leaks from accumulating conversation state.
+    memory leaks from accumulating conversation state. Retired instances are
+    replaced by a background warmup.
     """
 
     def __init__(
@@ -99,6 +205,7 @@ class AgentPool:
         max_turns_per_agent: int = 100,
         max_age_seconds: float = 3600.0,  # 1 hour
         warmup_threshold: float = 0.5,  # Replenish when below 50%
+        acquire_timeout: float = _DEFAULT_ACQUIRE_TIMEOUT,
     ):
         """Initialize the agent pool.
 
@@ -106,42 +213,68 @@ class AgentPool:
             pool_size: Target number of agents to keep warm
             max_turns_per_agent: Retire agents after this many turns
             max_age_seconds: Retire agents older than this
-            warmup_threshold: Start warming when pool falls below this fraction
+            warmup_threshold: Start warming replacements for retired agents
+                when idle agents fall below this fraction of pool_size
+            acquire_timeout: Seconds to wait for an idle agent before
+                building one on demand
         """
         self.pool_size = pool_size
         self.max_turns_per_agent = max_turns_per_agent
         self.max_age_seconds = max_age_seconds
         self.warmup_threshold = warmup_threshold
+        self.acquire_timeout = acquire_timeout
 
-        self._pool: deque[PoolEntry] = deque()
+        self._pool: deque[PoolEntry] = deque()  # Idle entries, least recently used first
+        self._busy: dict[str, PoolEntry] = {}
+        self._building = 0
+        self._affinity: OrderedDict[str, str] = OrderedDict()  # session -> entry_id
         self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
         self._warming = False
+        self._measuring = False
         self._stats = PoolStats()
         self._initialized = False
+        self._init_lock = threading.Lock()  # Serializes initialize/initialize_async
         self._shutdown = False
 
     def initialize(self) -> None:
         """Pre-warm the agent pool.
 
         This should be called at startup to populate the pool with
-        ready-to-use agents.
+        ready-to-use agents. Concurrent callers wait for the first one to
+        finish instead of warming a second pool.
         """
         if self._initialized:
             return
 
+        with self._init_lock:
+            if self._initialized:
+                return
+            self._initialize_locked()
+
+    def _initialize_locked(self) -> None:
+        """Warm the pool up to ``pool_size``. Caller holds ``_init_lock``."""
         logger.info(f"Initializing agent pool with {self.pool_size} agents...")
         start_time = time.time()
 
         for i in range(self.pool_size):
+            with self._available:
+                if self._live_count() >= self.pool_size:
+                    break  # On-demand builds already filled the pool
+                self._building += 1
+            entry = None
             try:
-                agent = self._build_agent()
-                entry = PoolEntry(agent=agent)
-                with self._lock:
-                    self._pool.append(entry)
-                    self._stats.warmups_completed += 1
+                entry = self._new_entry()
                 logger.debug(f"Warmed agent {i + 1}/{self.pool_size}")
             except Exception as e:
                 logger.error(f"Failed to warm agent {i + 1}: {e}")
+            finally:
+                with self._available:
+                    self._building -= 1
+                    if entry is not None and self._live_count() < self.pool_size:
+                        self._pool.append(entry)
+                        self._stats.warmups_completed += 1
+                    self._available.notify()
 
         self._initialized = True
         elapsed = time.time() - start_time
@@ -154,31 +287,55 @@ class AgentPool:
         if self._initialized:
             return
 
+        loop = asyncio.get_running_loop()
+        locked = loop.run_in_executor(None, self._init_lock.acquire)
+        try:
+            await asyncio.shield(locked)
+        except asyncio.CancelledError:
+            locked.add_done_callback(lambda _: self._init_lock.release())
+            raise
+        try:
+            if not self._initialized:
+                await self._initialize_async_locked()
+        finally:
+            self._init_lock.release()
+
+    async def _initialize_async_locked(self) -> None:
+        """Warm the pool in parallel. Caller holds ``_init_lock``."""
+        with self._available:
+            missing = max(self.pool_size - self._live_count(), 0)
+            self._building += missing
+
         logger.info(f"Initializing agent pool with {self.pool_size} agents...")
         start_time = time.time()
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         # Build agents in parallel using thread pool
         async def build_one(index: int) -> PoolEntry | None:
             try:
-                agent = await loop.run_in_executor(None, self._build_agent)
-                self._stats.warmups_completed += 1
+                entry = await loop.run_in_executor(None, self._new_entry)
                 logger.debug(f"Warmed agent {index + 1}/{self.pool_size}")
-                return PoolEntry(agent=agent)
+                return entry
             except Exception as e:
                 logger.error(f"Failed to warm agent {index + 1}: {e}")
                 return None
 
         # Build all agents concurrently
-        entries = await asyncio.gather(
-            *[build_one(i) for i in range(self.pool_size)]
-        )
+        try:
+            entries = await asyncio.gather(
+                *[build_one(i) for i in range(missing)]
+            )
+        finally:
+            with self._available:
+                self._building -= missing
 
-        with self._lock:
+        with self._available:
             for entry in entries:
-                if entry is not None:
+                if entry is not None and self._live_count() < self.pool_size:
                     self._pool.append(entry)
+                    self._stats.warmups_completed += 1
+            self._available.notify_all()
 
         self._initialized = True
         elapsed = time.time() - start_time
@@ -186,120 +343,130 @@ class AgentPool:
             f"Agent pool initialized: {len(self._pool)} agents in {elapsed:.2f}s"
         )
 
-    def acquire(self) -> PoolEntry:
+    def acquire(self, session_id: str | None = None, timeout: float | None = None) -> PoolEntry:
         """Acquire an agent from the pool.
 
         Returns a PoolEntry containing the agent. The entry must be
         returned via release() when done.
 
-        If the pool is empty, a new agent is built on demand (slower).
+        Args:
+            session_id: Session the turn belongs to. If the instance that
+                served this session last is idle, that instance is returned.
+            timeout: Seconds to wait for an idle agent when all are checked
+                out (defaults to ``acquire_timeout``). On timeout, or if the
+                pool is below size, a new agent is built on demand (slower).
         """
-        with self._lock:
+        timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        wait_started: float | None = None
+
+        with self._available:
             self._stats.total_acquires += 1
 
-            # Try to get from pool
-            while self._pool:
-                entry = self._pool.popleft()
+            while True:
+                entry = self._take_idle(session_id)
+                if entry is not None:
+                    self._stats.pool_hits += 1
+                    break
 
-                # Check if entry is still valid
-                if entry.is_stale(self.max_age_seconds):
-                    self._stats.retirements += 1
-                    logger.debug("Retired stale agent from pool")
-                    continue
+                if self._shutdown or self._live_count() < self.pool_size:
+                    break
 
-                if entry.is_exhausted(self.max_turns_per_agent):
-                    self._stats.retirements += 1
-                    logger.debug("Retired exhausted agent from pool")
-                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats.wait_timeouts += 1
+                    logger.warning(f"No idle agent after {timeout:.1f}s, building one on demand")
+                    break
 
-                # Valid entry found
-                self._stats.pool_hits += 1
-                self._stats.current_size = len(self._pool)
+                if wait_started is None:
+                    wait_started = time.monotonic()
+                    self._stats.waits += 1
+                self._available.wait(remaining)
 
-                # Trigger replenishment if needed
-                if len(self._pool) < self.pool_size * self.warmup_threshold:
-                    self._replenish_async()
+            if wait_started is not None:
+                self._stats.total_wait_seconds += time.monotonic() - wait_started
 
+            if entry is not None:
+                self._checkout(entry, session_id)
+                self._maybe_replenish()
                 return entry
 
             # Pool exhausted
             self._stats.pool_misses += 1
+            self._building += 1
 
         logger.warning("Pool exhausted, building agent on demand")
 
-        agent = self._build_agent()
-        return PoolEntry(agent=agent)
+        try:
+            entry = self._new_entry()
+        finally:
+            with self._available:
+                self._building -= 1
+                self._available.notify()
 
-    async def acquire_async(self) -> PoolEntry:
+        with self._available:
+            self._checkout(entry, session_id)
+        return entry
+
+    async def acquire_async(self, session_id: str | None = None, timeout: float | None = None) -> PoolEntry:
         """Acquire an agent asynchronously.
 
-        Same as acquire() but builds agent in thread pool if pool is empty.
+        Same as acquire() but waits and builds in the thread pool, so the
+        event loop is never blocked. If the caller is cancelled, an agent
+        acquired in the meantime is returned to the pool.
         """
-        with self._lock:
-            self._stats.total_acquires += 1
-
-            # Try to get from pool
-            while self._pool:
-                entry = self._pool.popleft()
-
-                # Check if entry is still valid
-                if entry.is_stale(self.max_age_seconds):
-                    self._stats.retirements += 1
-                    continue
-
-                if entry.is_exhausted(self.max_turns_per_agent):
-                    self._stats.retirements += 1
-                    continue
-
-                # Valid entry found
-                self._stats.pool_hits += 1
-                self._stats.current_size = len(self._pool)
-
-                # Trigger replenishment if needed
-                if len(self._pool) < self.pool_size * self.warmup_threshold:
-                    self._replenish_async()
-
-                return entry
-
-            # Pool exhausted
-            self._stats.pool_misses += 1
-
-        logger.warning("Pool exhausted, building agent on demand")
-
-        loop = asyncio.get_event_loop()
-        agent = await loop.run_in_executor(None, self._build_agent)
-        return PoolEntry(agent=agent)
-
-    def release(self, entry: PoolEntry) -> None:
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(None, self.acquire, session_id, timeout)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            future.add_done_callback(self._release_abandoned)
+            raise
+
+    def release(self, entry: PoolEntry, *, completed_turn: bool = True) -> None:
         """Return an agent to the pool.
 
         Args:
             entry: The PoolEntry acquired earlier
+            completed_turn: Count this checkout as a turn (for retirement
+                and latency stats)
         """
-        entry.turns_executed += 1
-        entry.last_used_at = time.time()
+        now = time.time()
+        if completed_turn:
+            entry.turns_executed += 1
+            if entry.checked_out_at is not None:
+                entry.record_turn(time.monotonic() - entry.checked_out_at)
+        entry.last_used_at = now
+        entry.checked_out_at = None
+        entry.session_id = None
 
         # Check if should retire
-        with self._lock:
+        with self._available:
             self._stats.total_releases += 1
+            self._busy.pop(entry.entry_id, None)
 
-            if entry.is_stale(self.max_age_seconds):
-                self._stats.retirements += 1
-                logger.debug("Retiring stale agent on release")
-                return
+            try:
+                if entry.is_stale(self.max_age_seconds):
+                    self._stats.retirements += 1
+                    logger.debug("Retiring stale agent on release")
+                    self._maybe_replenish()
+                    return
 
-            if entry.is_exhausted(self.max_turns_per_agent):
-                self._stats.retirements += 1
-                logger.debug("Retiring exhausted agent on release")
-                return
+                if entry.is_exhausted(self.max_turns_per_agent):
+                    self._stats.retirements += 1
+                    logger.debug("Retiring exhausted agent on release")
+                    self._maybe_replenish()
+                    return
 
-            if self._shutdown:
-                return
+                if self._shutdown:
+                    return
 
-            # Only add back if pool isn't overfull
-            if len(self._pool) < self.pool_size:
-                self._pool.append(entry)
-                self._stats.current_size = len(self._pool)
+                # Only add back if pool isn't overfull (drops on-demand extras)
+                if self._live_count() < self.pool_size:
+                    self._pool.append(entry)
+                    self._stats.current_size = len(self._pool)
+            finally:
+                self._available.notify()
 
     def get_stats(self) -> PoolStats:
         """Get pool statistics."""
@@ -314,16 +481,64 @@ class AgentPool:
                 current_size=len(self._pool),
                 warmups_started=self._stats.warmups_started,
                 warmups_completed=self._stats.warmups_completed,
+                in_use=len(self._busy),
+                affinity_hits=self._stats.affinity_hits,
+                affinity_misses=self._stats.affinity_misses,
+                waits=self._stats.waits,
+                wait_timeouts=self._stats.wait_timeouts,
+                total_wait_seconds=self._stats.total_wait_seconds,
             )
 
+    def get_instance_stats(self, measure_memory: bool = True) -> list[dict[str, Any]]:
+        """Get per-instance statistics for idle and checked-out agents.
+
+        Memory sizes are the last background measurement (None until the
+        first one finishes), so this never walks the agent graphs itself.
+
+        Args:
+            measure_memory: Start a background refresh of memory sizes older
+                than a minute
+        """
+        with self._lock:
+            entries = [*self._pool, *self._busy.values()]
+            if measure_memory and not self._measuring and any(map(self._memory_stale, entries)):
+                self._measuring = True
+                threading.Thread(target=self._refresh_memory_in_background, daemon=True).start()
+
+        return [entry.to_dict() for entry in sorted(entries, key=lambda e: e.created_at)]
+
+    def refresh_memory(self) -> None:
+        """Measure the approximate memory size of instances not measured recently."""
+        with self._lock:
+            entries = [*self._pool, *self._busy.values()]
+        for entry in entries:
+            if self._memory_stale(entry):
+                entry.memory_bytes = estimate_size(entry.agent)
+                entry.memory_measured_at = time.time()
+
+    @staticmethod
+    def _memory_stale(entry: PoolEntry) -> bool:
+        return entry.memory_bytes is None or time.time() - entry.memory_measured_at > _MEMORY_REFRESH_SECONDS
+
+    def _refresh_memory_in_background(self) -> None:
+        try:
+            self.refresh_memory()
+        except Exception as e:
+            logger.error(f"Pool memory measurement failed: {e}")
+        finally:
+            with self._lock:
+                self._measuring = False
+
     def shutdown(self) -> None:
         """Shutdown the pool and release all agents."""
         logger.info("Shutting down agent pool")
-        self._shutdown = True
 
-        with self._lock:
+        with self._available:
+            self._shutdown = True
             self._pool.clear()
+            self._affinity.clear()
             self._stats.current_size = 0
+            self._available.notify_all()
 
     def _build_agent(self) -> Any:
         """Build a new agent instance."""
@@ -331,13 +546,79 @@ class AgentPool:
 
         return _build_agent()
 
+    def _new_entry(self) -> PoolEntry:
+        """Build an agent and wrap it in a timed PoolEntry."""
+        start = time.monotonic()
+        agent = self._build_agent()
+        return PoolEntry(agent=agent, build_seconds=time.monotonic() - start)
+
+    def _live_count(self) -> int:
+        """Idle, checked-out and in-flight instances. Caller holds the lock."""
+        return len(self._pool) + len(self._busy) + self._building
+
+    def _take_idle(self, session_id: str | None) -> PoolEntry | None:
+        """Pop the best idle entry, retiring invalid ones. Caller holds the lock."""
+        for entry in list(self._pool):
+            if entry.is_stale(self.max_age_seconds):
+                self._pool.remove(entry)
+                self._stats.retirements += 1
+                logger.debug("Retired stale agent from pool")
+            elif entry.is_exhausted(self.max_turns_per_agent):
+                self._pool.remove(entry)
+                self._stats.retirements += 1
+                logger.debug("Retired exhausted agent from pool")
+
+        if not self._pool:
+            return None
+
+        affine_id = self._affinity.get(session_id) if session_id else None
+        if affine_id is not None:
+            for entry in self._pool:
+                if entry.entry_id == affine_id:
+                    self._pool.remove(entry)
+                    self._stats.affinity_hits += 1
+                    return entry
+            # Its instance is busy or retired; any warm instance will do
+            self._stats.affinity_misses += 1
+
+        return self._pool.popleft()
+
+    def _checkout(self, entry: PoolEntry, session_id: str | None) -> None:
+        """Mark *entry* as in use by *session_id*. Caller holds the lock."""
+        entry.checked_out_at = time.monotonic()
+        entry.session_id = session_id
+        self._busy[entry.entry_id] = entry
+        self._stats.current_size = len(self._pool)
+        if session_id:
+            self._affinity[session_id] = entry.entry_id
+            self._affinity.move_to_end(session_id)
+            while len(self._affinity) > _MAX_AFFINITY_SESSIONS:
+                self._affinity.popitem(last=False)
+
+    def _release_abandoned(self, future: asyncio.Future[PoolEntry]) -> None:
+        """Return an entry whose async acquirer was cancelled."""
+        if not future.cancelled() and future.exception() is None:
+            self.release(future.result(), completed_turn=False)
+
+    def _maybe_replenish(self) -> None:
+        """Warm replacements for retired agents if idle capacity is low.
+
+        Caller holds the lock.
+        """
+        if (
+            self._initialized
+            and self._live_count() < self.pool_size
+            and len(self._pool) < self.pool_size * self.warmup_threshold
+        ):
+            self._replenish_async()
+
     def _replenish_async(self) -> None:
         """Replenish pool in background thread.
 
         Note: This method may be called with self._lock held (from acquire),
         so we only check/set _warming under the existing lock context.
         """
-        # _lock is already held by caller (acquire/acquire_async)
+        # _lock is already held by caller (acquire/release)
         if self._warming or self._shutdown:
             return
 
@@ -346,15 +627,25 @@ class AgentPool:
 
         def build_and_add():
             try:
-                agent = self._build_agent()
-                entry = PoolEntry(agent=agent)
-
-                with self._lock:
-                    if not self._shutdown and len(self._pool) < self.pool_size:
-                        self._pool.append(entry)
-                        self._stats.warmups_completed += 1
-                        self._stats.current_size = len(self._pool)
-                        logger.debug("Background warmup completed")
+                while True:
+                    with self._available:
+                        if self._shutdown or self._live_count() >= self.pool_size:
+                            return
+                        self._building += 1
+
+                    try:
+                        entry = self._new_entry()
+                    finally:
+                        with self._available:
+                            self._building -= 1
+
+                    with self._available:
+                        if not self._shutdown and self._live_count() < self.pool_size:
+                            self._pool.append(entry)
+                            self._stats.warmups_completed += 1
+                            self._stats.current_size = len(self._pool)
+                            self._available.notify()
+                            logger.debug("Background warmup completed")
             except Exception as e:
                 logger.error(f"Background warmup failed: {e}")
             finally:
@@ -388,9 +679,12 @@ def get_agent_pool(
     if _agent_pool is None:
         with _pool_lock:
             if _agent_pool is None:
+                from ag3nt_agent.agent_config import POOL_ACQUIRE_TIMEOUT
+
                 _agent_pool = AgentPool(
                     pool_size=pool_size,
                     max_turns_per_agent=max_turns_per_agent,
+                    acquire_timeout=POOL_ACQUIRE_TIMEOUT,
                 )
 
     return _agent_pool
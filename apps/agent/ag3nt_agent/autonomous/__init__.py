@@ -29,6 +29,7 @@ Usage:
 """
 
 from .event_bus import EventBus, Event, EventPriority
+from .event_log import EventLog
 from .learning_engine import LearningEngine
 from .goal_manager import GoalManager, Goal
 from .decision_engine import DecisionEngine, Decision, DecisionType
@@ -38,6 +39,7 @@ __all__ = [
     "EventBus",
     "Event",
     "EventPriority",
+    "EventLog",
     # Learning Engine
     "LearningEngine",
     # Goal Manager
@@ -8,11 +8,15 @@ Evaluates whether to act autonomously or request approval based on:
 - User preferences
 """
 
+import json
 import logging
+import threading
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from pathlib import Path
+from typing import Iterator, Optional
 
 from .learning_engine import LearningEngine, ConfidenceScore
 from .goal_manager import Goal, RiskLevel
@@ -358,49 +362,175 @@ class DecisionAuditLog:
     """
     Audit log for tracking all decisions.
 
-    Maintains a rolling log of decisions for compliance and debugging.
+    Maintains a rolling log of decisions for compliance and debugging:
+    - Fixed-capacity ring buffer; a new decision overwrites the oldest
+    - Per-goal and per-type indexes of sequence numbers, trimmed as
+      entries are overwritten, so queries never scan the whole log
+    - Running counts by decision type for get_stats
+    - Optional spill of overwritten decisions to a JSON-lines file for
+      long-term retention
     """
 
-    def __init__(self, max_entries: int = 10000):
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        spill_path: Optional[str] = None,
+        spill_batch_size: int = 100,
+        auto_flush: bool = True
+    ):
+        """
+        Initialize the audit log.
+
+        Args:
+            max_entries: Number of decisions kept in memory
+            spill_path: JSON-lines file that overwritten decisions are
+                appended to (None = discard them)
+            spill_batch_size: Overwritten decisions buffered before a write
+            auto_flush: Write a full batch from record() itself. Pass False
+                when record() runs on an event loop and the caller flushes
+                in a worker thread once needs_flush() is True.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
         self.max_entries = max_entries
-        self._log: list[Decision] = []
+        self.spill_path = Path(spill_path) if spill_path else None
+        self.spill_batch_size = spill_batch_size
+        self.auto_flush = auto_flush
+
+        # Decision with sequence number n lives in slot n % max_entries
+        self._ring: list[Optional[Decision]] = [None] * max_entries
+        self._next_seq = 0
+
+        # Sequence numbers in the ring, oldest first
+        self._by_goal: dict[str, deque[int]] = {}
+        self._by_type: dict[DecisionType, deque[int]] = {}
+        self._type_counts: dict[str, int] = {}
+
+        self._spill_buffer: list[dict] = []
+        self._spilled = 0
+        self._flush_lock = threading.Lock()  # Keeps concurrent flushes in order
+
+    def __len__(self) -> int:
+        return min(self._next_seq, self.max_entries)
 
     def record(self, decision: Decision):
         """Record a decision to the audit log."""
-        self._log.append(decision)
+        seq = self._next_seq
+        slot = seq % self.max_entries
+        overwritten = self._ring[slot]
+        if overwritten is not None:
+            self._evict(overwritten)
 
-        # Trim if over limit
-        if len(self._log) > self.max_entries:
-            self._log = self._log[-self.max_entries:]
+        self._ring[slot] = decision
+        self._next_seq += 1
+
+        self._by_goal.setdefault(decision.goal.id, deque()).append(seq)
+        self._by_type.setdefault(decision.decision_type, deque()).append(seq)
+        type_key = decision.decision_type.value
+        self._type_counts[type_key] = self._type_counts.get(type_key, 0) + 1
 
     def get_recent(self, limit: int = 100) -> list[Decision]:
         """Get recent decisions."""
-        return self._log[-limit:]
+        count = max(0, min(limit, len(self)))
+        return [self._ring[seq % self.max_entries] for seq in range(self._next_seq - count, self._next_seq)]
 
     def get_by_goal(self, goal_id: str, limit: int = 100) -> list[Decision]:
         """Get decisions for a specific goal."""
-        matching = [d for d in self._log if d.goal.id == goal_id]
-        return matching[-limit:]
+        return self._select(self._by_goal.get(goal_id), limit)
 
     def get_by_type(self, decision_type: DecisionType, limit: int = 100) -> list[Decision]:
         """Get decisions of a specific type."""
-        matching = [d for d in self._log if d.decision_type == decision_type]
-        return matching[-limit:]
+        return self._select(self._by_type.get(decision_type), limit)
 
     def get_stats(self) -> dict:
         """Get decision statistics."""
-        total = len(self._log)
+        total = len(self)
         if total == 0:
             return {"total": 0}
 
-        by_type = {}
-        for d in self._log:
-            by_type[d.decision_type.value] = by_type.get(d.decision_type.value, 0) + 1
-
-        return {
+        stats = {
             "total": total,
-            "by_type": by_type,
-            "act_rate": by_type.get("act", 0) / total,
-            "ask_rate": by_type.get("ask", 0) / total,
-            "reject_rate": by_type.get("reject", 0) / total
+            "by_type": dict(self._type_counts),
+            "act_rate": self._type_counts.get("act", 0) / total,
+            "ask_rate": self._type_counts.get("ask", 0) / total,
+            "reject_rate": self._type_counts.get("reject", 0) / total
         }
+        if self.spill_path:
+            stats["spilled"] = self._spilled + len(self._spill_buffer)
+        return stats
+
+    def needs_flush(self) -> bool:
+        """True once a full batch of overwritten decisions is buffered."""
+        return len(self._spill_buffer) >= self.spill_batch_size
+
+    def flush(self):
+        """
+        Write buffered overwritten decisions to the spill file.
+
+        Safe to call from a worker thread while record() runs on the loop:
+        the buffer is swapped out before writing.
+        """
+        if not self.spill_path:
+            return
+
+        with self._flush_lock:
+            entries, self._spill_buffer = self._spill_buffer, []
+            if not entries:
+                return
+
+            data = "".join(json.dumps(entry, default=str) + "\n" for entry in entries)
+            try:
+                self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.spill_path, "a", encoding="utf-8") as f:
+                    f.write(data)
+            except OSError as e:
+                logger.warning(f"Failed to spill decisions to {self.spill_path}: {e}")
+                self._spill_buffer[:0] = entries
+                return
+
+            self._spilled += len(entries)
+
+    def iter_spilled(self) -> Iterator[dict]:
+        """
+        Iterate over spilled decisions, oldest first.
+
+        Yields:
+            Decision dictionaries as produced by Decision.to_dict()
+        """
+        self.flush()
+        if not self.spill_path or not self.spill_path.exists():
+            return
+
+        with open(self.spill_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    logger.warning(f"Skipping corrupt entry in {self.spill_path}")
+
+    def _select(self, seqs: Optional[deque], limit: int) -> list[Decision]:
+        """Resolve the newest ``limit`` sequence numbers of an index."""
+        if not seqs:
+            return []
+        count = max(0, min(limit, len(seqs)))
+        return [self._ring[seqs[i] % self.max_entries] for i in range(len(seqs) - count, len(seqs))]
+
+    def _evict(self, decision: Decision):
+        """Drop an overwritten decision from the indexes and counters."""
+        # It is the oldest entry, so it is at the front of both indexes
+        for index, key in ((self._by_goal, decision.goal.id), (self._by_type, decision.decision_type)):
+            seqs = index[key]
+            seqs.popleft()
+            if not seqs:
+                del index[key]
+
+        type_key = decision.decision_type.value
+        self._type_counts[type_key] -= 1
+        if not self._type_counts[type_key]:
+            del self._type_counts[type_key]
+
+        if self.spill_path:
+            self._spill_buffer.append(decision.to_dict())
+            if self.auto_flush and self.needs_flush():
+                self.flush()
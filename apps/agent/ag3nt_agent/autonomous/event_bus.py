@@ -5,12 +5,20 @@ Central event routing system that:
 - Receives events from various sources (HTTP monitors, file watchers, etc.)
 - Routes events to registered handlers
 - Supports priority-based event processing
+- Dispatches to each subscription through its own bounded queue, so a slow
+  or failing handler only delays its own events
+- Retries failed handlers with backoff from a delay queue
 - Provides event deduplication and dead letter queue
+- Optionally persists events to an append-only log, so events not yet
+  handled are replayed after a restart
 """
 
 import asyncio
 import hashlib
+import heapq
 import logging
+import time
+from bisect import bisect_left
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -18,6 +26,8 @@ from enum import IntEnum
 from typing import Any, Callable, Optional
 from uuid import uuid4
 
+from .event_log import EventLog
+
 logger = logging.getLogger(__name__)
 
 
@@ -104,6 +114,45 @@ class Event:
 # Type alias for event handlers
 EventHandler = Callable[[Event], Any]
 
+# Histogram bucket upper bounds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+QUEUE_DEPTH_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram.
+
+    Each observation is counted in the first bucket whose upper bound is
+    >= the value, or in "+Inf".
+    """
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for metrics."""
+        buckets = {str(bound): count for bound, count in zip(self.bounds, self.counts)}
+        buckets["+Inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "avg": round(self.total / self.count, 6) if self.count else 0.0,
+            "max": round(self.max, 6),
+            "buckets": buckets,
+        }
+
 
 @dataclass
 class Subscription:
@@ -113,6 +162,79 @@ class Subscription:
     priority_filter: Optional[EventPriority] = None  # None = all priorities
     source_filter: Optional[str] = None  # None = all sources
     subscription_id: str = field(default_factory=lambda: str(uuid4()))
+    max_concurrency: int = 1  # Handler invocations in flight for this subscription
+    queue_size: int = 1000  # Events waiting for this subscription
+    name: str = ""  # Stable consumer name, used for committed log offsets
+
+
+@dataclass
+class DeadLetter:
+    """An event a handler could not process."""
+    event: Event
+    error: str
+    error_type: str
+    consumer: Optional[str] = None  # Name of the subscription that failed
+    offset: Optional[int] = None  # Event log offset, if logged
+    failed_at: datetime = field(default_factory=datetime.utcnow)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "event": self.event.to_dict(),
+            "error": self.error,
+            "error_type": self.error_type,
+            "consumer": self.consumer,
+            "offset": self.offset,
+            "failed_at": self.failed_at.isoformat()
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DeadLetter":
+        """Create dead letter from dictionary."""
+        return cls(
+            event=Event.from_dict(data["event"]),
+            error=data.get("error", ""),
+            error_type=data.get("error_type", "Exception"),
+            consumer=data.get("consumer"),
+            offset=data.get("offset"),
+            failed_at=datetime.fromisoformat(data["failed_at"]) if "failed_at" in data else datetime.utcnow()
+        )
+
+
+class _SubscriptionQueue:
+    """Pending events, workers and metrics for one subscription."""
+
+    def __init__(self, subscription: Subscription, start_offset: int = 0):
+        self.subscription = subscription
+        # (priority, seq, attempt, offset, event)
+        self.queue: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize=subscription.queue_size)
+        self.workers: list[asyncio.Task] = []
+        # Logged events before start_offset were handled in an earlier run;
+        # pending holds offsets queued, in flight or awaiting a retry
+        self.start_offset = start_offset
+        self.pending: set[int] = set()
+        self.in_flight = 0
+        self.invoked = 0
+        self.failed = 0
+        self.dropped = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.queue_depth = Histogram(QUEUE_DEPTH_BUCKETS)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for metrics."""
+        handler = self.subscription.handler
+        return {
+            "handler": getattr(handler, "__qualname__", repr(handler)),
+            "consumer": self.subscription.name,
+            "max_concurrency": self.subscription.max_concurrency,
+            "queue_size": self.queue.qsize(),
+            "in_flight": self.in_flight,
+            "invoked": self.invoked,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "latency_seconds": self.latency.to_dict(),
+            "queue_depth": self.queue_depth.to_dict(),
+        }
 
 
 class EventBus:
@@ -121,9 +243,17 @@ class EventBus:
 
     Features:
     - Priority queue for event ordering
-    - Subscription-based routing
+    - Subscription-based routing to per-subscription bounded queues,
+      drained by up to ``max_concurrency`` workers each and at most
+      ``max_workers`` handler invocations overall
+    - Retries with exponential backoff, rescheduled on a delay queue
     - Event deduplication
-    - Dead letter queue for failed events
+    - Dead letter queue for failed events, with replay
+    - Optional durable event log: published events are appended with
+      offsets, each subscription's offset is committed once its handler has
+      succeeded (or dead-lettered the event), and on start the events past a
+      subscription's committed offset are replayed to it and the dedup cache
+      is rebuilt from the log tail. Subscribe before start() to get a replay.
     - Metrics tracking
     """
 
@@ -132,7 +262,13 @@ class EventBus:
         max_queue_size: int = 10000,
         dedup_window_seconds: int = 60,
         max_retries: int = 3,
-        retry_delay_seconds: float = 1.0
+        retry_delay_seconds: float = 1.0,
+        retry_backoff: float = 2.0,
+        max_retry_delay_seconds: float = 60.0,
+        max_workers: int = 8,
+        subscription_queue_size: int = 1000,
+        event_log: Optional[EventLog] = None,
+        log_flush_interval: float = 0.05
     ):
         """
         Initialize the event bus.
@@ -140,13 +276,27 @@ class EventBus:
         Args:
             max_queue_size: Maximum events in the queue
             dedup_window_seconds: Window for deduplication
-            max_retries: Max retry attempts for failed handlers
-            retry_delay_seconds: Delay between retries
+            max_retries: Max attempts for failed handlers
+            retry_delay_seconds: Delay before the first retry
+            retry_backoff: Multiplier applied to the delay for each further retry
+            max_retry_delay_seconds: Upper bound on the retry delay
+            max_workers: Max handler invocations running at once across all
+                subscriptions
+            subscription_queue_size: Default bound on each subscription's queue
+            event_log: Log to persist events, offsets and dead letters in
+                (None = in memory only)
+            log_flush_interval: Seconds between event log syncs; a full
+                fsync batch triggers one sooner
         """
         self.max_queue_size = max_queue_size
         self.dedup_window_seconds = dedup_window_seconds
         self.max_retries = max_retries
         self.retry_delay_seconds = retry_delay_seconds
+        self.retry_backoff = retry_backoff
+        self.max_retry_delay_seconds = max_retry_delay_seconds
+        self.max_workers = max_workers
+        self.subscription_queue_size = subscription_queue_size
+        self.log_flush_interval = log_flush_interval
 
         # Event queue (priority queue using asyncio.PriorityQueue)
         self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize=max_queue_size)
@@ -158,13 +308,32 @@ class EventBus:
         self._subscriptions: dict[str, Subscription] = {}
         self._handlers_by_type: dict[str, list[Subscription]] = defaultdict(list)
         self._global_handlers: list[Subscription] = []
+        self._subscription_queues: dict[str, _SubscriptionQueue] = {}
+        self._consumers: dict[str, str] = {}  # name -> subscription_id
+
+        # Bounds handler invocations across all subscriptions
+        self._worker_slots = asyncio.Semaphore(max_workers)
+
+        # Delay queue for retries: (due_monotonic, seq, subscription_id, attempt, offset, event)
+        self._retries: list[tuple[float, int, str, int, Optional[int], Event]] = []
+        self._retry_wakeup = asyncio.Event()
 
         # Deduplication cache: dedup_key -> expiry_time
         self._dedup_cache: dict[str, datetime] = {}
 
         # Dead letter queue
-        self._dlq: list[tuple[Event, Exception]] = []
+        self._dlq: list[DeadLetter] = []
         self._dlq_max_size: int = 1000
+        self._replaying: dict[tuple[str, str], DeadLetter] = {}  # (consumer, event_id) -> entry
+        self._dlq_dirty = False
+
+        # Durable log
+        self._event_log = event_log
+        self._replay_until: Optional[int] = None  # Log end when this bus first opened it
+        self._replayed = False
+        self._replay_position: Optional[int] = None  # Next backlog offset to feed
+        self._unrouted: set[int] = set()  # Logged offsets still in the main queue
+        self._flush_wakeup = asyncio.Event()
 
         # Metrics
         self._metrics = {
@@ -172,13 +341,19 @@ class EventBus:
             "events_processed": 0,
             "events_deduplicated": 0,
             "events_failed": 0,
-            "handlers_invoked": 0
+            "events_dropped": 0,
+            "handlers_invoked": 0,
+            "retries_scheduled": 0
         }
+        self._queue_depth = Histogram(QUEUE_DEPTH_BUCKETS)
 
         # Control
         self._running = False
         self._processor_task: Optional[asyncio.Task] = None
+        self._retry_task: Optional[asyncio.Task] = None
         self._cleanup_task: Optional[asyncio.Task] = None
+        self._replay_task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def start(self):
         """Start the event bus processor."""
@@ -186,7 +361,21 @@ class EventBus:
             return
 
         self._running = True
+        if self._event_log is not None:
+            await asyncio.to_thread(self._open_event_log)
+            if not self._replayed:
+                self._replayed = True
+                backlog, recent = await asyncio.to_thread(self._read_event_log)
+                self._rebuild_dedup_cache(recent)
+                if backlog:
+                    self._replay_position = backlog[0][0]
+                    self._replay_task = asyncio.create_task(self._replay_backlog(backlog))
+            self._flush_task = asyncio.create_task(self._flush_event_log())
+
+        for subscription_queue in self._subscription_queues.values():
+            self._start_workers(subscription_queue)
         self._processor_task = asyncio.create_task(self._process_events())
+        self._retry_task = asyncio.create_task(self._process_retries())
         self._cleanup_task = asyncio.create_task(self._cleanup_dedup_cache())
 
         logger.info("Event bus started")
@@ -195,19 +384,30 @@ class EventBus:
         """Stop the event bus processor."""
         self._running = False
 
-        if self._processor_task:
-            self._processor_task.cancel()
-            try:
-                await self._processor_task
-            except asyncio.CancelledError:
-                pass
+        tasks = [self._processor_task, self._retry_task, self._cleanup_task, self._replay_task]
+        for subscription_queue in self._subscription_queues.values():
+            tasks.extend(subscription_queue.workers)
+            subscription_queue.workers = []
 
-        if self._cleanup_task:
-            self._cleanup_task.cancel()
-            try:
-                await self._cleanup_task
-            except asyncio.CancelledError:
-                pass
+        for task in tasks:
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._replay_task = None
+
+        # Let an in-progress sync finish rather than cancel it mid-write
+        if self._flush_task:
+            self._flush_wakeup.set()
+            await self._flush_task
+            self._flush_task = None
+
+        # Commit what was handled; anything still queued is replayed next start
+        if self._event_log is not None and self._event_log.is_open:
+            await self._sync_event_log()
+            await asyncio.to_thread(self._event_log.close)
 
         logger.info("Event bus stopped")
 
@@ -216,7 +416,10 @@ class EventBus:
         handler: EventHandler,
         event_types: Optional[set[str]] = None,
         priority_filter: Optional[EventPriority] = None,
-        source_filter: Optional[str] = None
+        source_filter: Optional[str] = None,
+        max_concurrency: int = 1,
+        queue_size: Optional[int] = None,
+        name: Optional[str] = None
     ) -> str:
         """
         Subscribe a handler to events.
@@ -226,18 +429,39 @@ class EventBus:
             event_types: Set of event types to handle (None = all)
             priority_filter: Only handle events of this priority or higher
             source_filter: Only handle events from this source
+            max_concurrency: Max events this handler processes at once.
+                With 1 (the default) events reach the handler one at a time.
+            queue_size: Max events waiting for this handler; further events
+                go to the dead letter queue (default: subscription_queue_size)
+            name: Consumer name under which log offsets are committed; must be
+                stable across restarts (default: the handler's qualified name)
 
         Returns:
             Subscription ID for unsubscribing
         """
+        base_name = name or getattr(handler, "__qualname__", None) or type(handler).__name__
+        name = base_name
+        suffix = 2
+        while name in self._consumers:
+            name = f"{base_name}#{suffix}"
+            suffix += 1
+
         subscription = Subscription(
             handler=handler,
             event_types=event_types or set(),
             priority_filter=priority_filter,
-            source_filter=source_filter
+            source_filter=source_filter,
+            max_concurrency=max(1, max_concurrency),
+            queue_size=queue_size or self.subscription_queue_size,
+            name=name
         )
 
         self._subscriptions[subscription.subscription_id] = subscription
+        self._consumers[name] = subscription.subscription_id
+        subscription_queue = _SubscriptionQueue(subscription, self._start_offset(name))
+        self._subscription_queues[subscription.subscription_id] = subscription_queue
+        if self._running:
+            self._start_workers(subscription_queue)
 
         if not subscription.event_types:
             # Global handler
@@ -265,6 +489,15 @@ class EventBus:
         if not subscription:
             return False
 
+        # Pending events for this handler are discarded with its workers,
+        # and its committed offset no longer holds log segments back
+        self._consumers.pop(subscription.name, None)
+        if self._event_log is not None:
+            self._event_log.forget(subscription.name)
+        subscription_queue = self._subscription_queues.pop(subscription_id)
+        for task in subscription_queue.workers:
+            task.cancel()
+
         # Remove from global handlers
         self._global_handlers = [s for s in self._global_handlers if s.subscription_id != subscription_id]
 
@@ -300,18 +533,28 @@ class EventBus:
         expiry = datetime.utcnow() + timedelta(seconds=event.dedup_window_seconds)
         self._dedup_cache[event.dedup_key] = expiry
 
-        # Add to queue with priority
-        # PriorityQueue sorts by first element, then second, etc.
-        # Using (priority, seq, event) to ensure stable ordering without comparing Event objects
-        try:
-            self._seq += 1
-            self._queue.put_nowait((event.priority.value, self._seq, event))
-            logger.debug(f"Published event: {event.event_type} from {event.source}")
-            return True
-        except asyncio.QueueFull:
+        if self._queue.full():
             logger.warning(f"Event queue full, dropping event: {event.event_id}")
             return False
 
+        offset = None
+        if self._event_log is not None:
+            if not self._event_log.is_open:
+                self._open_event_log()
+            offset = self._event_log.append(event.to_dict())
+            self._unrouted.add(offset)
+            if self._event_log.needs_sync():
+                self._flush_wakeup.set()
+
+        # Add to queue with priority
+        # PriorityQueue sorts by first element, then second, etc.
+        # Using (priority, seq, offset, event) to ensure stable ordering without comparing Event objects
+        self._seq += 1
+        self._queue.put_nowait((event.priority.value, self._seq, offset, event))
+        self._queue_depth.observe(self._queue.qsize())
+        logger.debug(f"Published event: {event.event_type} from {event.source}")
+        return True
+
     def _is_duplicate(self, event: Event) -> bool:
         """Check if event is a duplicate within the dedup window."""
         if event.dedup_key in self._dedup_cache:
@@ -321,24 +564,21 @@ class EventBus:
         return False
 
     async def _process_events(self):
-        """Main event processing loop."""
+        """Route queued events to the queues of matching subscriptions."""
         while self._running:
             try:
                 # Get next event with timeout
                 try:
-                    priority, seq, event = await asyncio.wait_for(
+                    _, _, offset, event = await asyncio.wait_for(
                         self._queue.get(),
                         timeout=1.0
                     )
                 except asyncio.TimeoutError:
                     continue
 
-                # Find matching handlers
-                handlers = self._get_handlers_for_event(event)
-
-                # Invoke handlers
-                for subscription in handlers:
-                    await self._invoke_handler(subscription, event)
+                for subscription in self._get_handlers_for_event(event):
+                    self._enqueue(subscription.subscription_id, event, attempt=0, offset=offset)
+                self._unrouted.discard(offset)
 
                 self._metrics["events_processed"] += 1
                 self._queue.task_done()
@@ -373,32 +613,154 @@ class EventBus:
 
         return filtered
 
-    async def _invoke_handler(self, subscription: Subscription, event: Event):
-        """Invoke a handler with retry logic."""
-        for attempt in range(self.max_retries):
+    def _enqueue(self, subscription_id: str, event: Event, attempt: int, offset: Optional[int]) -> bool:
+        """
+        Queue an event for one subscription.
+
+        Returns:
+            True if queued, False if the subscription is gone, already
+            handled the logged event in an earlier run, or its queue is full
+        """
+        subscription_queue = self._subscription_queues.get(subscription_id)
+        if subscription_queue is None:
+            return False
+        if offset is not None and offset < subscription_queue.start_offset:
+            return False
+
+        try:
+            self._seq += 1
+            subscription_queue.queue.put_nowait((event.priority.value, self._seq, attempt, offset, event))
+        except asyncio.QueueFull:
+            subscription_queue.dropped += 1
+            self._metrics["events_dropped"] += 1
+            self._add_to_dlq(
+                event,
+                asyncio.QueueFull(f"Queue full for handler {subscription_id}"),
+                subscription_queue.subscription.name,
+                offset
+            )
+            self._finish(subscription_queue, event, offset)
+            return False
+
+        if offset is not None:
+            subscription_queue.pending.add(offset)
+        subscription_queue.queue_depth.observe(subscription_queue.queue.qsize())
+        return True
+
+    def _finish(self, subscription_queue: _SubscriptionQueue, event: Event, offset: Optional[int]):
+        """Mark an event done for a subscription (handled or dead-lettered)."""
+        if offset is not None:
+            subscription_queue.pending.discard(offset)
+        if self._replaying.pop((subscription_queue.subscription.name, event.event_id), None) is not None:
+            self._dlq_dirty = True
+
+    def _start_workers(self, subscription_queue: _SubscriptionQueue):
+        """Start the workers draining a subscription's queue."""
+        subscription_queue.workers = [
+            asyncio.create_task(self._run_subscription(subscription_queue))
+            for _ in range(subscription_queue.subscription.max_concurrency)
+        ]
+
+    async def _run_subscription(self, subscription_queue: _SubscriptionQueue):
+        """Worker loop: invoke the handler for each event in its queue."""
+        queue = subscription_queue.queue
+        while True:
+            _, _, attempt, offset, event = await queue.get()
             try:
-                result = subscription.handler(event)
-                if asyncio.iscoroutine(result):
-                    await result
+                async with self._worker_slots:
+                    await self._invoke_handler(subscription_queue, event, attempt, offset)
+            finally:
+                queue.task_done()
 
-                self._metrics["handlers_invoked"] += 1
-                return
+    async def _invoke_handler(
+        self,
+        subscription_queue: _SubscriptionQueue,
+        event: Event,
+        attempt: int,
+        offset: Optional[int] = None
+    ):
+        """Invoke a handler once; on failure schedule a retry or dead-letter the event."""
+        subscription = subscription_queue.subscription
+        subscription_queue.in_flight += 1
+        start = time.monotonic()
+        try:
+            result = subscription.handler(event)
+            if asyncio.iscoroutine(result):
+                await result
+
+            subscription_queue.invoked += 1
+            self._metrics["handlers_invoked"] += 1
+            self._finish(subscription_queue, event, offset)
+
+        except Exception as e:
+            subscription_queue.failed += 1
+            logger.warning(
+                f"Handler {subscription.subscription_id} failed (attempt {attempt + 1}): {e}"
+            )
+
+            if attempt < self.max_retries - 1:
+                self._schedule_retry(subscription.subscription_id, event, attempt + 1, offset)
+            else:
+                # Send to dead letter queue
+                self._add_to_dlq(event, e, subscription.name, offset)
+                self._metrics["events_failed"] += 1
+                self._finish(subscription_queue, event, offset)
+
+        finally:
+            subscription_queue.in_flight -= 1
+            subscription_queue.latency.observe(time.monotonic() - start)
+
+    def _schedule_retry(self, subscription_id: str, event: Event, attempt: int, offset: Optional[int]):
+        """Put a failed event on the delay queue for another attempt."""
+        delay = min(
+            self.retry_delay_seconds * self.retry_backoff ** (attempt - 1),
+            self.max_retry_delay_seconds
+        )
+        self._seq += 1
+        heapq.heappush(
+            self._retries,
+            (time.monotonic() + delay, self._seq, subscription_id, attempt, offset, event)
+        )
+        self._metrics["retries_scheduled"] += 1
+        self._retry_wakeup.set()
 
+    async def _process_retries(self):
+        """Move retries whose delay has elapsed back onto their subscription queues."""
+        while self._running:
+            try:
+                now = time.monotonic()
+                while self._retries and self._retries[0][0] <= now:
+                    _, _, subscription_id, attempt, offset, event = heapq.heappop(self._retries)
+                    self._enqueue(subscription_id, event, attempt, offset)
+
+                timeout = self._retries[0][0] - now if self._retries else None
+                self._retry_wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._retry_wakeup.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+            except asyncio.CancelledError:
+                break
             except Exception as e:
-                logger.warning(
-                    f"Handler {subscription.subscription_id} failed (attempt {attempt + 1}): {e}"
-                )
-
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay_seconds)
-                else:
-                    # Send to dead letter queue
-                    self._add_to_dlq(event, e)
-                    self._metrics["events_failed"] += 1
-
-    def _add_to_dlq(self, event: Event, error: Exception):
+                logger.error(f"Error in retry scheduler: {e}", exc_info=True)
+
+    def _add_to_dlq(
+        self,
+        event: Event,
+        error: Exception,
+        consumer: Optional[str] = None,
+        offset: Optional[int] = None
+    ):
         """Add failed event to dead letter queue."""
-        self._dlq.append((event, error))
+        self._dlq.append(DeadLetter(
+            event=event,
+            error=str(error),
+            error_type=type(error).__name__,
+            consumer=consumer,
+            offset=offset
+        ))
+        self._dlq_dirty = True
 
         # Trim DLQ if too large
         if len(self._dlq) > self._dlq_max_size:
@@ -406,6 +768,128 @@ class EventBus:
 
         logger.error(f"Event {event.event_id} sent to DLQ: {error}")
 
+    def _start_offset(self, consumer: str) -> int:
+        """First log offset a consumer should receive."""
+        log = self._event_log
+        if log is None or not log.is_open:
+            return 0
+        committed = log.committed(consumer)
+        return committed if committed is not None else log.next_offset
+
+    def _open_event_log(self):
+        """Open the event log and load committed offsets and dead letters."""
+        log = self._event_log
+        if log.is_open:
+            return
+
+        log.open()
+        if self._replay_until is not None:
+            return
+
+        self._replay_until = log.next_offset
+        for subscription_queue in self._subscription_queues.values():
+            subscription_queue.start_offset = self._start_offset(subscription_queue.subscription.name)
+        self._dlq = [DeadLetter.from_dict(entry) for entry in log.load_dead_letters()] + self._dlq
+
+    def _read_event_log(self) -> tuple[list[tuple[int, Event]], list[dict]]:
+        """
+        Read what start() needs from the log (runs in a worker thread).
+
+        Returns:
+            (backlog, recent): events past the lowest committed offset, to
+            replay, and the records recent enough to still deduplicate
+        """
+        log = self._event_log
+        starts = [
+            q.start_offset for q in self._subscription_queues.values()
+            if q.start_offset < self._replay_until
+        ]
+        backlog = []
+        if starts:
+            backlog = [
+                (offset, Event.from_dict(record))
+                for offset, record in log.read(min(starts), self._replay_until)
+            ]
+        recent = [
+            record for _, record in log.read(log.first_offset_since(self.dedup_window_seconds), self._replay_until)
+        ]
+        return backlog, recent
+
+    def _rebuild_dedup_cache(self, records: list[dict]):
+        """Restore dedup entries for logged events still inside their window."""
+        now = datetime.utcnow()
+        window = timedelta(seconds=self.dedup_window_seconds)
+        restored = 0
+        for record in records:
+            key = record.get("dedup_key")
+            if not key or "timestamp" not in record:
+                continue
+            expiry = datetime.fromisoformat(record["timestamp"]) + window
+            if expiry > now and expiry > self._dedup_cache.get(key, now):
+                self._dedup_cache[key] = expiry
+                restored += 1
+
+        if restored:
+            logger.debug(f"Restored {restored} dedup entries from the event log")
+
+    async def _replay_backlog(self, backlog: list[tuple[int, Event]]):
+        """Feed logged events not yet handled back through the processor."""
+        for offset, event in backlog:
+            self._replay_position = offset
+            self._unrouted.add(offset)
+            self._seq += 1
+            await self._queue.put((event.priority.value, self._seq, offset, event))
+
+        # Left set if cancelled, so the unfed remainder is not committed
+        self._replay_position = None
+        logger.info(f"Replayed {len(backlog)} events from the event log")
+
+    def _commit_offsets(self):
+        """Commit, per subscription, the offset before which everything is handled."""
+        log = self._event_log
+        floor = log.next_offset
+        if self._unrouted:
+            floor = min(floor, min(self._unrouted))
+        if self._replay_position is not None:
+            floor = min(floor, self._replay_position)
+
+        for subscription_queue in self._subscription_queues.values():
+            offset = min(min(subscription_queue.pending, default=floor), floor)
+            log.commit(subscription_queue.subscription.name, max(offset, subscription_queue.start_offset))
+
+    async def _sync_event_log(self):
+        """Commit offsets, then fsync the log and persist dead letters off the loop."""
+        self._commit_offsets()
+        dead_letters = None
+        if self._dlq_dirty:
+            self._dlq_dirty = False
+            dead_letters = [entry.to_dict() for entry in [*self._dlq, *self._replaying.values()]]
+        consumers = list(self._consumers)
+
+        def sync():
+            self._event_log.sync()
+            if dead_letters is not None:
+                self._event_log.write_dead_letters(dead_letters)
+            self._event_log.compact(consumers)
+
+        await asyncio.to_thread(sync)
+
+    async def _flush_event_log(self):
+        """Periodically sync the event log (sooner when a batch is full)."""
+        while self._running:
+            try:
+                try:
+                    await asyncio.wait_for(self._flush_wakeup.wait(), timeout=self.log_flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._flush_wakeup.clear()
+                await self._sync_event_log()
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error syncing event log: {e}", exc_info=True)
+
     async def _cleanup_dedup_cache(self):
         """Periodically clean up expired dedup entries."""
         while self._running:
@@ -434,32 +918,85 @@ class EventBus:
         return {
             **self._metrics,
             "queue_size": self._queue.qsize(),
+            "queue_depth": self._queue_depth.to_dict(),
             "subscriptions": len(self._subscriptions),
+            "max_workers": self.max_workers,
+            "in_flight": sum(q.in_flight for q in self._subscription_queues.values()),
+            "retries_pending": len(self._retries),
             "dlq_size": len(self._dlq),
-            "dedup_cache_size": len(self._dedup_cache)
+            "dedup_cache_size": len(self._dedup_cache),
+            "handlers": {
+                subscription_id: subscription_queue.to_dict()
+                for subscription_id, subscription_queue in self._subscription_queues.items()
+            },
+            "event_log": self._event_log.get_stats() if self._event_log is not None else None
         }
 
     def get_dlq(self, limit: int = 100) -> list[dict]:
         """Get recent dead letter queue entries."""
-        entries = []
-        for event, error in self._dlq[-limit:]:
-            entries.append({
-                "event": event.to_dict(),
-                "error": str(error),
-                "error_type": type(error).__name__
-            })
-        return entries
+        return [entry.to_dict() for entry in self._dlq[-limit:]]
 
     async def replay_from_dlq(self, event_id: str) -> bool:
         """Replay a specific event from the DLQ."""
-        for i, (event, _) in enumerate(self._dlq):
-            if event.event_id == event_id:
+        for i, entry in enumerate(self._dlq):
+            if entry.event.event_id == event_id:
                 # Remove from DLQ
                 self._dlq.pop(i)
-                # Republish
-                return await self.publish(event)
+                self._dlq_dirty = True
+                return await self._replay_dead_letter(entry)
         return False
 
+    async def replay_dlq(
+        self,
+        consumer: Optional[str] = None,
+        event_type: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> int:
+        """
+        Replay dead letters, oldest first.
+
+        Args:
+            consumer: Only entries that failed in this subscription (by name)
+            event_type: Only entries of this event type
+            limit: Max entries to replay (None = all matching)
+
+        Returns:
+            Number of entries requeued
+        """
+        selected = [
+            entry for entry in self._dlq
+            if (consumer is None or entry.consumer == consumer)
+            and (event_type is None or entry.event.event_type == event_type)
+        ][:limit]
+        if not selected:
+            return 0
+
+        chosen = {id(entry) for entry in selected}
+        self._dlq = [entry for entry in self._dlq if id(entry) not in chosen]
+        self._dlq_dirty = True
+
+        replayed = 0
+        for entry in selected:
+            if await self._replay_dead_letter(entry):
+                replayed += 1
+        return replayed
+
+    async def _replay_dead_letter(self, entry: DeadLetter) -> bool:
+        """
+        Hand a dead letter back to the subscription that failed it.
+
+        The entry stays persisted until that handler succeeds, so a restart
+        during the replay does not lose it. Entries without a known
+        subscription are published again.
+        """
+        subscription_id = self._consumers.get(entry.consumer) if entry.consumer else None
+        if subscription_id is None:
+            return await self.publish(entry.event)
+
+        self._replaying[(entry.consumer, entry.event.event_id)] = entry
+        self._dlq_dirty = True
+        return self._enqueue(subscription_id, entry.event, attempt=0, offset=None)
+
     @property
     def is_running(self) -> bool:
         """Check if the event bus is running."""
@@ -0,0 +1,398 @@
+"""
+Event Log for AG3NT Autonomous System
+
+Append-only, file-backed log of published events:
+- Every record gets a monotonically increasing offset
+- Records are JSON lines in segment files named after their first offset;
+  a new segment starts when the active one reaches its size limit
+- Writes are buffered and fsync'ed in batches rather than per record
+- Consumer offsets and dead letters are stored beside the segments, so a
+  restarted worker can replay what was not yet handled
+- Segments every live consumer has committed past are deleted
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_SUFFIX = ".log"
+OFFSETS_FILE = "offsets.json"
+DEAD_LETTERS_FILE = "dead_letters.jsonl"
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+DEFAULT_FSYNC_BATCH_SIZE = 256
+
+
+def _write_atomic(path: Path, data: bytes, fsync: bool) -> None:
+    """Replace a file's contents so readers see the old or the new version."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        if fsync:
+            os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class EventLog:
+    """
+    Segmented append-only event log.
+
+    ``append`` is cheap and may be called on the event loop; ``sync`` does
+    the fsync and is meant to run in a worker thread. A lock keeps the two
+    from racing when a segment is rolled or the log is closed; a second,
+    briefly held lock guards the consumer offsets, so ``commit`` never waits
+    for an fsync.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_max_bytes: int = DEFAULT_SEGMENT_BYTES,
+        fsync: bool = True,
+        fsync_batch_size: int = DEFAULT_FSYNC_BATCH_SIZE
+    ):
+        """
+        Initialize the event log.
+
+        Args:
+            directory: Directory holding segments, offsets and dead letters
+            segment_max_bytes: Size at which a new segment is started
+            fsync: fsync on sync(); disable only where durability is not needed
+            fsync_batch_size: Appends after which needs_sync() turns True
+        """
+        self.directory = Path(directory)
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync = fsync
+        self.fsync_batch_size = fsync_batch_size
+
+        self._segments: list[int] = []  # Base offsets, ascending
+        self._file = None  # Active segment, opened for appending
+        self._active_size = 0
+        self._next_offset = 0
+        self._unsynced = 0
+        self._offsets: dict[str, int] = {}
+        self._offsets_dirty = False
+        self._offsets_lock = threading.Lock()
+        self._lock = threading.Lock()
+
+        # Stats
+        self._appended = 0
+        self._syncs = 0
+        self._sync_seconds = 0.0
+        self._max_sync_seconds = 0.0
+        self._segments_deleted = 0
+
+    @property
+    def is_open(self) -> bool:
+        """Check if the log is open for appending."""
+        return self._file is not None
+
+    @property
+    def next_offset(self) -> int:
+        """Offset the next appended record will get."""
+        return self._next_offset
+
+    def open(self) -> None:
+        """Open the log, recovering the active segment after a crash."""
+        if self._file is not None:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._segments = sorted(
+            int(path.stem) for path in self.directory.glob(f"*{SEGMENT_SUFFIX}")
+            if path.stem.isdigit()
+        )
+        self._load_offsets()
+
+        if self._segments:
+            base = self._segments[-1]
+            path = self._segment_path(base)
+            count, valid_bytes = self._recover_segment(path)
+            self._next_offset = base + count
+            self._active_size = valid_bytes
+        else:
+            self._segments = [0]
+            self._next_offset = 0
+            self._active_size = 0
+
+        self._file = open(self._segment_path(self._segments[-1]), "ab")
+        logger.info(
+            f"Event log opened at {self.directory} "
+            f"({len(self._segments)} segments, next offset {self._next_offset})"
+        )
+
+    def close(self) -> None:
+        """Sync and close the log."""
+        if self._file is None:
+            return
+        self.sync()
+        with self._lock:
+            self._file.close()
+            self._file = None
+
+    def append(self, record: dict) -> int:
+        """
+        Append a record.
+
+        The record is buffered; it is durable once sync() returns.
+
+        Returns:
+            The record's offset
+        """
+        if self._file is None:
+            self.open()
+
+        offset = self._next_offset
+        line = json.dumps({"offset": offset, "record": record}, separators=(",", ":")).encode() + b"\n"
+        if self._active_size and self._active_size + len(line) > self.segment_max_bytes:
+            self._roll()
+
+        self._file.write(line)
+        self._active_size += len(line)
+        self._next_offset += 1
+        self._unsynced += 1
+        self._appended += 1
+        return offset
+
+    def needs_sync(self) -> bool:
+        """True once a full fsync batch is waiting."""
+        return self._unsynced >= self.fsync_batch_size
+
+    def sync(self) -> None:
+        """Flush and fsync pending appends and persist changed consumer offsets."""
+        with self._lock:
+            if self._file is None or (not self._unsynced and not self._offsets_dirty):
+                return
+
+            start = time.perf_counter()
+            self._unsynced = 0
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+
+            with self._offsets_lock:
+                offsets = dict(self._offsets) if self._offsets_dirty else None
+                self._offsets_dirty = False
+            if offsets is not None:
+                data = json.dumps(offsets, sort_keys=True).encode()
+                _write_atomic(self.directory / OFFSETS_FILE, data, self.fsync)
+
+            elapsed = time.perf_counter() - start
+            self._syncs += 1
+            self._sync_seconds += elapsed
+            self._max_sync_seconds = max(self._max_sync_seconds, elapsed)
+
+    def read(self, from_offset: int = 0, to_offset: Optional[int] = None) -> Iterator[tuple[int, dict]]:
+        """
+        Read records in offset order.
+
+        Args:
+            from_offset: First offset to return
+            to_offset: Stop before this offset (None = end of log)
+
+        Yields:
+            (offset, record) tuples
+        """
+        if self._file is not None:
+            with self._lock:
+                self._file.flush()
+
+        end = self._next_offset if to_offset is None else to_offset
+        segments = list(self._segments)
+        for i, base in enumerate(segments):
+            next_base = segments[i + 1] if i + 1 < len(segments) else None
+            if (next_base is not None and next_base <= from_offset) or base >= end:
+                continue
+            try:
+                with open(self._segment_path(base), "rb") as f:
+                    for line in f:
+                        entry = self._parse(line)
+                        if entry is None:
+                            break  # Torn tail
+                        offset, record = entry
+                        if offset >= end:
+                            return
+                        if offset >= from_offset:
+                            yield offset, record
+            except FileNotFoundError:  # Deleted by compact()
+                continue
+
+    def first_offset_since(self, seconds: float) -> int:
+        """
+        First offset of the oldest segment written to in the last ``seconds``.
+
+        Records before it are at least that old, so reading from here covers
+        everything more recent.
+        """
+        cutoff = time.time() - seconds
+        for base in self._segments:
+            try:
+                if os.path.getmtime(self._segment_path(base)) >= cutoff:
+                    return base
+            except FileNotFoundError:
+                continue
+        return self._segments[-1] if self._segments else self._next_offset
+
+    def commit(self, consumer: str, offset: int) -> None:
+        """
+        Record that a consumer has handled everything before ``offset``.
+
+        Persisted on the next sync().
+        """
+        with self._offsets_lock:
+            if self._offsets.get(consumer) != offset:
+                self._offsets[consumer] = offset
+                self._offsets_dirty = True
+
+    def committed(self, consumer: str) -> Optional[int]:
+        """Get a consumer's committed offset (None if it never committed)."""
+        return self._offsets.get(consumer)
+
+    def forget(self, consumer: str) -> None:
+        """
+        Drop a consumer's committed offset, e.g. when it unsubscribes.
+
+        Persisted on the next sync().
+        """
+        with self._offsets_lock:
+            if self._offsets.pop(consumer, None) is not None:
+                self._offsets_dirty = True
+
+    def compact(self, consumers: Optional[Iterable[str]] = None) -> int:
+        """
+        Delete segments every consumer has committed past.
+
+        The active segment is always kept.
+
+        Args:
+            consumers: Names of the live consumers; offsets left behind by
+                others (unsubscribed or renamed) don't hold segments back.
+                Default: every consumer with a committed offset.
+
+        Returns:
+            Number of segments deleted
+        """
+        with self._offsets_lock:
+            if consumers is None:
+                offsets = list(self._offsets.values())
+            else:
+                offsets = [self._offsets[c] for c in consumers if c in self._offsets]
+        if not offsets:
+            return 0
+
+        floor = min(offsets)
+        deleted = 0
+        while len(self._segments) > 1 and self._segments[1] <= floor:
+            base = self._segments.pop(0)
+            try:
+                os.remove(self._segment_path(base))
+            except FileNotFoundError:
+                pass
+            deleted += 1
+
+        self._segments_deleted += deleted
+        return deleted
+
+    def load_dead_letters(self) -> list[dict]:
+        """Load persisted dead letters."""
+        path = self.directory / DEAD_LETTERS_FILE
+        if not path.exists():
+            return []
+
+        entries = []
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    logger.warning(f"Skipping corrupt dead letter in {path}")
+        return entries
+
+    def write_dead_letters(self, entries: list[dict]) -> None:
+        """Replace the persisted dead letters."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        data = b"".join(json.dumps(entry, separators=(",", ":")).encode() + b"\n" for entry in entries)
+        _write_atomic(self.directory / DEAD_LETTERS_FILE, data, self.fsync)
+
+    def get_stats(self) -> dict:
+        """Get event log statistics."""
+        return {
+            "directory": str(self.directory),
+            "segments": len(self._segments),
+            "next_offset": self._next_offset,
+            "appended": self._appended,
+            "unsynced": self._unsynced,
+            "syncs": self._syncs,
+            "avg_sync_ms": round(self._sync_seconds / self._syncs * 1000, 3) if self._syncs else 0.0,
+            "max_sync_ms": round(self._max_sync_seconds * 1000, 3),
+            "segments_deleted": self._segments_deleted,
+            "consumer_offsets": self._offsets_snapshot(),
+        }
+
+    def _offsets_snapshot(self) -> dict[str, int]:
+        with self._offsets_lock:
+            return dict(self._offsets)
+
+    def _segment_path(self, base: int) -> Path:
+        return self.directory / f"{base:020d}{SEGMENT_SUFFIX}"
+
+    def _roll(self) -> None:
+        """Seal the active segment and start a new one."""
+        with self._lock:
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self._file.close()
+            self._segments.append(self._next_offset)
+            self._file = open(self._segment_path(self._next_offset), "ab")
+            self._active_size = 0
+
+    def _load_offsets(self) -> None:
+        path = self.directory / OFFSETS_FILE
+        if not path.exists():
+            return
+        try:
+            self._offsets = {str(k): int(v) for k, v in json.loads(path.read_bytes()).items()}
+        except (ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring corrupt consumer offsets in {path}: {e}")
+
+    def _recover_segment(self, path: Path) -> tuple[int, int]:
+        """
+        Count the valid records in a segment and cut off a torn tail.
+
+        Returns:
+            (record_count, valid_bytes)
+        """
+        count = 0
+        valid_bytes = 0
+        if not path.exists():
+            return 0, 0
+
+        with open(path, "rb") as f:
+            for line in f:
+                if self._parse(line) is None:
+                    break
+                count += 1
+                valid_bytes += len(line)
+
+        if valid_bytes < path.stat().st_size:
+            logger.warning(f"Truncating torn record at the end of {path}")
+            with open(path, "r+b") as f:
+                f.truncate(valid_bytes)
+        return count, valid_bytes
+
+    @staticmethod
+    def _parse(line: bytes) -> Optional[tuple[int, dict]]:
+        if not line.endswith(b"\n"):
+            return None
+        try:
+            entry = json.loads(line)
+            return int(entry["offset"]), entry["record"]
+        except (ValueError, KeyError, TypeError):
+            return None
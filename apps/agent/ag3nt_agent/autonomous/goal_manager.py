@@ -6,15 +6,22 @@ Manages YAML-based goal configurations that define:
 - Actions to execute
 - Risk levels and confidence thresholds
 - Rate limiting and cooldowns
+
+Goals are indexed by trigger event type, and goals held back by a cooldown
+or rate limit sit on a timing wheel until they may run again, so matching
+an event only evaluates the filters of goals that can act on it.
 """
 
 import logging
+import math
 import re
+import time
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import yaml
 
@@ -49,33 +56,54 @@ class ActionType(Enum):
     AGENT = "agent"
 
 
+def _compile_condition(pattern: Any) -> Callable[[Any], bool]:
+    """Build a predicate for one filter value."""
+    # Handle regex patterns
+    if isinstance(pattern, str) and pattern.startswith("regex:"):
+        search = re.compile(pattern[6:]).search  # Remove "regex:" prefix
+        return lambda value: search(str(value)) is not None
+    # Handle exact match
+    return lambda value: value == pattern
+
+
 @dataclass
 class Trigger:
-    """Event trigger configuration."""
+    """
+    Event trigger configuration.
+
+    Filter conditions are compiled on first use. Assign a new ``filter``
+    dict (or call ``compile()``) after changing it in place.
+    """
     event_type: str
     filter: dict = field(default_factory=dict)
     cooldown_seconds: int = 60
 
+    _compiled: Optional[list[tuple[str, Callable[[Any], bool]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _compiled_from: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def compile(self) -> list[tuple[str, Callable[[Any], bool]]]:
+        """Compile the filter into (payload_key, predicate) pairs."""
+        self._compiled = [(key, _compile_condition(pattern)) for key, pattern in self.filter.items()]
+        self._compiled_from = self.filter
+        return self._compiled
+
     def matches(self, event: Event) -> bool:
         """Check if an event matches this trigger."""
         # Check event type
         if event.event_type != self.event_type:
             return False
 
-        # Check filter conditions
-        for key, pattern in self.filter.items():
-            value = event.payload.get(key)
+        conditions = self._compiled
+        if conditions is None or self._compiled_from is not self.filter:
+            conditions = self.compile()
 
-            if value is None:
-                return False
-
-            # Handle regex patterns
-            if isinstance(pattern, str) and pattern.startswith("regex:"):
-                regex = pattern[6:]  # Remove "regex:" prefix
-                if not re.search(regex, str(value)):
-                    return False
-            # Handle exact match
-            elif value != pattern:
+        # Check filter conditions
+        payload = event.payload
+        for key, condition in conditions:
+            value = payload.get(key)
+            if value is None or not condition(value):
                 return False
 
         return True
@@ -186,6 +214,7 @@ class Goal:
     _executions_today: int = field(default=0, repr=False)
     _hour_reset: Optional[datetime] = field(default=None, repr=False)
     _day_reset: Optional[datetime] = field(default=None, repr=False)
+    _on_execute: Optional[Callable[["Goal"], None]] = field(default=None, repr=False, compare=False)
 
     def matches(self, event: Event) -> bool:
         """Check if this goal should handle an event."""
@@ -210,15 +239,7 @@ class Goal:
                 remaining = (cooldown_end - now).seconds
                 return False, f"Cooldown active ({remaining}s remaining)"
 
-        # Reset hourly counter if needed
-        if self._hour_reset is None or now >= self._hour_reset:
-            self._executions_this_hour = 0
-            self._hour_reset = now + timedelta(hours=1)
-
-        # Reset daily counter if needed
-        if self._day_reset is None or now >= self._day_reset:
-            self._executions_today = 0
-            self._day_reset = now.replace(hour=0, minute=0, second=0) + timedelta(days=1)
+        self._roll_windows(now)
 
         # Check hourly limit
         if self._executions_this_hour >= self.limits.max_executions_per_hour:
@@ -230,13 +251,51 @@ class Goal:
 
         return True, "OK"
 
+    def blocked_until(self) -> Optional[datetime]:
+        """
+        Get when the goal may execute again.
+
+        Returns:
+            None if it can execute now, else the time the cooldown and any
+            exhausted limits are over
+        """
+        now = datetime.utcnow()
+        self._roll_windows(now)
+
+        until = None
+        if self._last_triggered:
+            cooldown_end = self._last_triggered + timedelta(seconds=self.trigger.cooldown_seconds)
+            if now < cooldown_end:
+                until = cooldown_end
+        if self._executions_this_hour >= self.limits.max_executions_per_hour:
+            until = max(until or self._hour_reset, self._hour_reset)
+        if self._executions_today >= self.limits.max_executions_per_day:
+            until = max(until or self._day_reset, self._day_reset)
+        return until
+
     def record_execution(self):
         """Record that the goal was executed."""
         now = datetime.utcnow()
+        self._roll_windows(now)
         self._last_triggered = now
         self._executions_this_hour += 1
         self._executions_today += 1
 
+        if self._on_execute is not None:
+            self._on_execute(self)
+
+    def _roll_windows(self, now: datetime):
+        """Start new hourly/daily counting windows once the current ones end."""
+        # Reset hourly counter if needed
+        if self._hour_reset is None or now >= self._hour_reset:
+            self._executions_this_hour = 0
+            self._hour_reset = now + timedelta(hours=1)
+
+        # Reset daily counter if needed
+        if self._day_reset is None or now >= self._day_reset:
+            self._executions_today = 0
+            self._day_reset = now.replace(hour=0, minute=0, second=0) + timedelta(days=1)
+
     def to_dict(self) -> dict:
         """Convert goal to dictionary."""
         return {
@@ -311,6 +370,83 @@ class Goal:
         )
 
 
+class TimingWheel:
+    """
+    Hashed timing wheel.
+
+    Timers are hashed by due tick into ``slots`` buckets of ``resolution``
+    seconds. Advancing only visits the buckets for the ticks that passed,
+    so expiring timers costs O(elapsed ticks + expired timers) rather than
+    a scan of every timer. Timers never fire early; they may fire up to one
+    resolution late.
+    """
+
+    def __init__(self, resolution: float = 1.0, slots: int = 3600):
+        """
+        Initialize the wheel.
+
+        Args:
+            resolution: Seconds per tick
+            slots: Number of buckets; longer delays wrap around the wheel
+        """
+        self.resolution = resolution
+        self.slots = slots
+        self._buckets: list[dict[str, int]] = [{} for _ in range(slots)]  # key -> due tick
+        self._due: dict[str, int] = {}
+        self._tick: Optional[int] = None
+
+    def schedule(self, key: str, delay: float, now: float):
+        """Schedule (or reschedule) ``key`` to expire ``delay`` seconds after ``now``."""
+        if self._tick is None:
+            self._tick = int(now // self.resolution)
+
+        self.cancel(key)
+        due = max(math.ceil((now + delay) / self.resolution), self._tick + 1)
+        self._due[key] = due
+        self._buckets[due % self.slots][key] = due
+
+    def cancel(self, key: str):
+        """Cancel a timer (no-op if not scheduled)."""
+        due = self._due.pop(key, None)
+        if due is not None:
+            self._buckets[due % self.slots].pop(key, None)
+
+    def advance(self, now: float) -> list[str]:
+        """
+        Move the wheel to ``now``.
+
+        Returns:
+            Keys whose timers expired
+        """
+        tick = int(now // self.resolution)
+        if self._tick is None:
+            self._tick = tick
+            return []
+        if tick <= self._tick:
+            return []
+
+        expired = []
+        if self._due:
+            for t in range(self._tick + 1, self._tick + 1 + min(tick - self._tick, self.slots)):
+                bucket = self._buckets[t % self.slots]
+                if not bucket:
+                    continue
+                for key, due in list(bucket.items()):
+                    if due <= tick:
+                        del bucket[key]
+                        del self._due[key]
+                        expired.append(key)
+
+        self._tick = tick
+        return expired
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._due
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+
 class GoalManager:
     """
     Manages goal configurations and event-to-goal matching.
@@ -331,6 +467,13 @@ class GoalManager:
         self.config_dir = config_dir
         self._goals: dict[str, Goal] = {}
 
+        # event_type -> goals triggered by it (in insertion order)
+        self._index: dict[str, list[Goal]] = defaultdict(list)
+
+        # Goals in cooldown or over a limit, released by the wheel
+        self._blocked: set[str] = set()
+        self._wheel = TimingWheel()
+
         # Global settings
         self._emergency_stop = False
         self._default_confidence_threshold = 0.75
@@ -377,7 +520,7 @@ class GoalManager:
         for goal_data in goals_data:
             try:
                 goal = Goal.from_dict(goal_data)
-                self._goals[goal.id] = goal
+                self._register(goal)
                 logger.debug(f"Loaded goal: {goal.id}")
             except Exception as e:
                 logger.error(f"Failed to parse goal: {e}")
@@ -393,17 +536,62 @@ class GoalManager:
 
     def add_goal(self, goal: Goal):
         """Add a goal programmatically."""
-        self._goals[goal.id] = goal
+        self._register(goal)
         logger.info(f"Added goal: {goal.id}")
 
     def remove_goal(self, goal_id: str) -> bool:
         """Remove a goal by ID."""
         if goal_id in self._goals:
-            del self._goals[goal_id]
+            self._unregister(self._goals.pop(goal_id))
             logger.info(f"Removed goal: {goal_id}")
             return True
         return False
 
+    def _register(self, goal: Goal):
+        """Add a goal to the index and track its execution state."""
+        previous = self._goals.get(goal.id)
+        if previous is not None:
+            self._unregister(previous)
+
+        self._goals[goal.id] = goal
+        self._index[goal.trigger.event_type].append(goal)
+        goal._on_execute = self._on_goal_executed
+        self._refresh_block(goal)
+
+    def _unregister(self, goal: Goal):
+        """Drop a goal from the index and the timing wheel."""
+        goals = self._index.get(goal.trigger.event_type, [])
+        if goal in goals:
+            goals.remove(goal)
+            if not goals:
+                del self._index[goal.trigger.event_type]
+        self._blocked.discard(goal.id)
+        self._wheel.cancel(goal.id)
+        goal._on_execute = None
+
+    def _on_goal_executed(self, goal: Goal):
+        """Re-check a goal's limits after it executes."""
+        if self._goals.get(goal.id) is goal:
+            self._refresh_block(goal)
+
+    def _refresh_block(self, goal: Goal):
+        """Block a goal until its cooldown and limits allow it to run."""
+        until = goal.blocked_until()
+        if until is None:
+            self._blocked.discard(goal.id)
+            self._wheel.cancel(goal.id)
+            return
+
+        self._blocked.add(goal.id)
+        self._wheel.schedule(goal.id, (until - datetime.utcnow()).total_seconds(), time.monotonic())
+
+    def _release_expired(self):
+        """Re-check goals whose timers expired on the wheel."""
+        for goal_id in self._wheel.advance(time.monotonic()):
+            goal = self._goals.get(goal_id)
+            if goal is not None:
+                self._refresh_block(goal)
+
     def get_goal(self, goal_id: str) -> Optional[Goal]:
         """Get a goal by ID."""
         return self._goals.get(goal_id)
@@ -426,14 +614,18 @@ class GoalManager:
             logger.warning("Emergency stop is active, no goals will match")
             return []
 
+        if self._blocked:
+            self._release_expired()
+
         matching = []
-        for goal in self._goals.values():
-            if goal.matches(event):
-                can_execute, reason = goal.can_execute()
-                if can_execute:
-                    matching.append(goal)
-                else:
-                    logger.debug(f"Goal {goal.id} matched but cannot execute: {reason}")
+        for goal in self._index.get(event.event_type, ()):
+            if not goal.matches(event):
+                continue
+            if goal.id in self._blocked:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Goal {goal.id} matched but cannot execute: {goal.can_execute()[1]}")
+                continue
+            matching.append(goal)
 
         return matching
 
@@ -470,6 +662,8 @@ class GoalManager:
             "total_goals": len(self._goals),
             "enabled_goals": enabled_count,
             "disabled_goals": len(self._goals) - enabled_count,
+            "blocked_goals": len(self._blocked),
+            "indexed_event_types": len(self._index),
             "emergency_stop": self._emergency_stop,
             "default_confidence_threshold": self._default_confidence_threshold,
             "global_limits": self._global_limits
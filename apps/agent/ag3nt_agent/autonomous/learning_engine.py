@@ -9,11 +9,19 @@ Key features:
 - Cross-session and cross-agent learning
 - Action history with rich metadata
 - Recommendation generation
+- Write-behind batching of action records, spooled to disk while
+  Context-Engine is unreachable
+- Cached confidence scores updated in place from local outcomes
 """
 
+import asyncio
+import json
 import logging
+import os
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Optional
 
 from ..context_engine_client import (
@@ -25,6 +33,27 @@ from ..context_engine_client import (
 
 logger = logging.getLogger(__name__)
 
+# Similarity below which past actions are not considered relevant
+MIN_SIMILARITY = 0.3
+
+# After a failed flush the next attempt waits flush_interval, doubling per
+# further failure up to this many seconds
+MAX_RETRY_INTERVAL = 300.0
+
+
+def _context_similarity(a: str, b: str) -> float:
+    """
+    Token overlap (Jaccard) between two contexts.
+
+    A local stand-in for Context-Engine's semantic score, used to decide
+    which cached confidence scores a new outcome applies to.
+    """
+    tokens_a = set(a.lower().split())
+    tokens_b = set(b.lower().split())
+    if not tokens_a or not tokens_b:
+        return 1.0 if a == b else 0.0
+    return len(tokens_a & tokens_b) / len(tokens_a | tokens_b)
+
 
 @dataclass
 class ActionRecord:
@@ -52,6 +81,37 @@ class ActionRecord:
             "metadata": self.metadata
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "ActionRecord":
+        return cls(
+            action_id=data["action_id"],
+            action_type=data["action_type"],
+            goal_id=data["goal_id"],
+            context=data["context"],
+            success=data["success"],
+            duration_ms=data["duration_ms"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            error_message=data.get("error_message"),
+            metadata=data.get("metadata", {})
+        )
+
+    def to_store_kwargs(self) -> dict:
+        """Keyword arguments for ContextEngineClient.store_action."""
+        return {
+            "action_type": self.action_type,
+            "goal_id": self.goal_id,
+            "success": self.success,
+            "duration_ms": self.duration_ms,
+            "context": self.context,
+            "details": {
+                "action_id": self.action_id,
+                "error_message": self.error_message,
+                **self.metadata,
+                # When the action ran, not when the batch was flushed
+                "timestamp": self.timestamp.isoformat()
+            }
+        }
+
 
 @dataclass
 class ConfidenceScore:
@@ -70,6 +130,18 @@ class ConfidenceScore:
         return self.sample_count >= 3
 
 
+@dataclass
+class _ConfidenceTotals:
+    """Running sums behind a ConfidenceScore, so it can be updated in place."""
+    weighted_success: float = 0.0
+    total_weight: float = 0.0
+    samples: int = 0
+    successes: int = 0
+    total_duration: int = 0
+    last_success: Optional[datetime] = None
+    last_failure: Optional[datetime] = None
+
+
 @dataclass
 class Recommendation:
     """A learning-based recommendation."""
@@ -86,6 +158,13 @@ class LearningEngine:
 
     Uses semantic search to find similar past actions and
     calculate confidence scores based on outcomes.
+
+    Action records are buffered and stored in batches, when ``batch_size``
+    records are waiting or every ``flush_interval`` seconds. Batches that
+    cannot be stored are appended to ``spool_path`` and retried first on
+    the next flush. While Context-Engine keeps failing, flushes back off
+    exponentially (up to ``MAX_RETRY_INTERVAL``) instead of being retried
+    for every full batch. Call ``stop()`` on shutdown to flush what is left.
     """
 
     def __init__(
@@ -94,7 +173,11 @@ class LearningEngine:
         min_samples: int = 3,
         confidence_decay_days: int = 30,
         success_weight: float = 1.0,
-        failure_weight: float = 1.5
+        failure_weight: float = 1.5,
+        batch_size: int = 50,
+        flush_interval: float = 5.0,
+        spool_path: Optional[str] = None,
+        max_buffer_size: int = 10000
     ):
         """
         Initialize the learning engine.
@@ -105,17 +188,45 @@ class LearningEngine:
             confidence_decay_days: Days after which confidence starts decaying
             success_weight: Weight multiplier for successful actions
             failure_weight: Weight multiplier for failed actions
+            batch_size: Buffered records that trigger a flush
+            flush_interval: Seconds between time-triggered flushes
+            spool_path: JSON-lines file for records that could not be
+                stored (None = keep them in memory, up to max_buffer_size)
+            max_buffer_size: Records kept in memory while Context-Engine is
+                unreachable and no spool is configured
         """
         self._ce = context_engine
         self.min_samples = min_samples
         self.confidence_decay_days = confidence_decay_days
         self.success_weight = success_weight
         self.failure_weight = failure_weight
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spool_path = Path(spool_path) if spool_path else None
+        self.max_buffer_size = max_buffer_size
 
         # Local cache for recent actions (reduces API calls)
         self._cache: dict[str, ConfidenceScore] = {}
         self._cache_ttl = timedelta(minutes=5)
         self._cache_timestamps: dict[str, datetime] = {}
+        self._cache_totals: dict[str, _ConfidenceTotals] = {}
+
+        # Write-behind buffer
+        self._buffer: list[ActionRecord] = []
+        self._in_flight: list[ActionRecord] = []
+        self._flush_lock = asyncio.Lock()
+        self._flush_wakeup: Optional[asyncio.Event] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._retry_delay = 0.0
+        self._retry_at = 0.0  # time.monotonic() before which flushes are held back
+
+        # Stats
+        self._stored = 0
+        self._spooled = 0
+        self._dropped = 0
+        self._failed_flushes = 0
+        self._cache_updates = 0
 
     @property
     def context_engine(self) -> ContextEngineClient:
@@ -124,6 +235,26 @@ class LearningEngine:
             self._ce = get_context_engine()
         return self._ce
 
+    async def start(self):
+        """Start the background flush loop."""
+        if self._flush_task is None or self._flush_task.done():
+            self._stopping = False
+            self._flush_wakeup = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        """Stop the flush loop and flush buffered records.
+
+        A flush already in progress is allowed to finish rather than being
+        cancelled between batches.
+        """
+        task, self._flush_task = self._flush_task, None
+        if task is not None:
+            self._stopping = True
+            self._flush_wakeup.set()
+            await asyncio.wait({task})
+        await self.flush()
+
     async def record_action(
         self,
         action_type: str,
@@ -137,6 +268,9 @@ class LearningEngine:
         """
         Record an action outcome for learning.
 
+        The record is buffered and stored with the next batch; cached
+        confidence scores for similar contexts are updated right away.
+
         Args:
             action_type: Type of action (shell, notify, agent, etc.)
             goal_id: Goal that triggered this action
@@ -162,34 +296,195 @@ class LearningEngine:
             metadata=metadata or {}
         )
 
-        # Store in Context-Engine
-        try:
-            await self.context_engine.store_action(
-                action_type=action_type,
-                goal_id=goal_id,
-                success=success,
-                duration_ms=duration_ms,
-                context=context,
-                details={
-                    "action_id": record.action_id,
-                    "error_message": error_message,
-                    **(metadata or {})
-                }
-            )
+        self._buffer.append(record)
+        self._apply_to_cache(record)
 
-            logger.info(
-                f"Recorded action: {action_type} for {goal_id} "
-                f"({'success' if success else 'failure'})"
-            )
+        logger.info(
+            f"Recorded action: {action_type} for {goal_id} "
+            f"({'success' if success else 'failure'})"
+        )
 
-            # Invalidate cache for this action type
-            self._invalidate_cache(action_type)
+        await self.start()
+        if len(self._buffer) >= self.batch_size and time.monotonic() >= self._retry_at:
+            self._flush_wakeup.set()
 
+        return record
+
+    async def flush(self):
+        """
+        Store buffered records in Context-Engine.
+
+        Spooled records are retried first. Records that cannot be stored
+        are spooled (or kept in memory when no spool is configured).
+        """
+        async with self._flush_lock:
+            if not await self._drain_spool():
+                await self._store_failed(self._take_buffer())
+                self._back_off()
+                return
+
+            while self._buffer:
+                batch = self._take_buffer(self.batch_size)
+                try:
+                    failed = await self._store_batch(batch)
+                except asyncio.CancelledError:
+                    self._buffer[:0] = batch
+                    raise
+                if failed:
+                    await self._store_failed(failed + self._take_buffer())
+                    self._back_off()
+                    return
+
+            self._retry_delay = 0.0
+            self._retry_at = 0.0
+
+    def get_stats(self) -> dict:
+        """Get learning engine statistics."""
+        return {
+            "buffered": len(self._buffer),
+            "in_flight": len(self._in_flight),
+            "stored": self._stored,
+            "spooled": self._spooled,
+            "dropped": self._dropped,
+            "failed_flushes": self._failed_flushes,
+            "cached_scores": len(self._cache),
+            "cache_updates": self._cache_updates
+        }
+
+    async def _flush_loop(self):
+        """Flush when a batch is full or the interval (or retry back-off) has passed."""
+        while not self._stopping:
+            timeout = max(self.flush_interval, self._retry_at - time.monotonic())
+            try:
+                await asyncio.wait_for(self._flush_wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_wakeup.clear()
+            if self._stopping:
+                return  # stop() does the final flush
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Learning engine flush failed: {e}")
+                self._back_off()
+
+    def _back_off(self):
+        """Hold back flushes after a failure, doubling the delay each time."""
+        self._retry_delay = min(max(self._retry_delay * 2, self.flush_interval), MAX_RETRY_INTERVAL)
+        self._retry_at = time.monotonic() + self._retry_delay
+
+    def _take_buffer(self, limit: Optional[int] = None) -> list[ActionRecord]:
+        count = len(self._buffer) if limit is None else limit
+        batch = self._buffer[:count]
+        del self._buffer[:count]
+        return batch
+
+    async def _store_batch(self, batch: list[ActionRecord]) -> list[ActionRecord]:
+        """
+        Store one batch.
+
+        Returns:
+            The records that could not be stored
+        """
+        self._in_flight = batch
+        try:
+            results = await self.context_engine.store_actions(
+                [record.to_store_kwargs() for record in batch]
+            )
         except ContextEngineError as e:
-            logger.error(f"Failed to store action in Context-Engine: {e}")
-            # Continue without storage - action was still executed
+            logger.warning(f"Failed to store {len(batch)} actions in Context-Engine: {e}")
+            results = [e] * len(batch)
+        finally:
+            self._in_flight = []
+
+        failed = [record for record, result in zip(batch, results) if isinstance(result, Exception)]
+        self._stored += len(batch) - len(failed)
+        if failed:
+            self._failed_flushes += 1
+            logger.warning(f"Failed to store {len(failed)} of {len(batch)} actions in Context-Engine")
+        return failed
+
+    async def _store_failed(self, records: list[ActionRecord]):
+        """Spool records that could not be stored, or keep them buffered."""
+        if not records:
+            return
+
+        if self.spool_path is not None:
+            lines = [json.dumps(record.to_dict(), default=str) for record in records]
+            try:
+                await asyncio.to_thread(self._append_spool, lines)
+                self._spooled += len(records)
+                return
+            except OSError as e:
+                logger.error(f"Failed to spool actions to {self.spool_path}: {e}")
+
+        self._buffer[:0] = records
+        overflow = len(self._buffer) - self.max_buffer_size
+        if overflow > 0:
+            del self._buffer[:overflow]
+            self._dropped += overflow
+            logger.error(f"Dropped {overflow} unstored action records (buffer full)")
+
+    async def _drain_spool(self) -> bool:
+        """
+        Retry spooled records, oldest first.
 
-        return record
+        Returns:
+            True if the spool is empty afterwards
+        """
+        if self.spool_path is None or not self.spool_path.exists():
+            return True
+
+        try:
+            records = await asyncio.to_thread(self._read_spool)
+        except OSError as e:
+            logger.error(f"Failed to read action spool {self.spool_path}: {e}")
+            return False
+
+        for start in range(0, len(records), self.batch_size):
+            try:
+                failed = await self._store_batch(records[start:start + self.batch_size])
+            except asyncio.CancelledError:
+                # Drop the batches already stored so they aren't stored again
+                if start:
+                    self._rewrite_spool([json.dumps(record.to_dict(), default=str) for record in records[start:]])
+                raise
+            if failed:
+                remaining = failed + records[start + self.batch_size:]
+                lines = [json.dumps(record.to_dict(), default=str) for record in remaining]
+                await asyncio.to_thread(self._rewrite_spool, lines)
+                return False
+
+        await asyncio.to_thread(self._rewrite_spool, [])
+        return True
+
+    def _append_spool(self, lines: list[str]):
+        self.spool_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.spool_path, "a", encoding="utf-8") as f:
+            f.write("".join(line + "\n" for line in lines))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _read_spool(self) -> list[ActionRecord]:
+        records = []
+        with open(self.spool_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(ActionRecord.from_dict(json.loads(line)))
+                except (ValueError, KeyError, TypeError):
+                    logger.warning(f"Skipping corrupt record in {self.spool_path}")
+        return records
+
+    def _rewrite_spool(self, lines: list[str]):
+        if not lines:
+            self.spool_path.unlink(missing_ok=True)
+            return
+        tmp = self.spool_path.with_name(self.spool_path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("".join(line + "\n" for line in lines))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.spool_path)
 
     async def get_confidence(
         self,
@@ -221,7 +516,7 @@ class LearningEngine:
                 query=f"{action_type} action: {context}",
                 limit=50,
                 collection=ContextEngineClient.COLLECTION_LEARNING,
-                min_score=0.3  # Only reasonably similar actions
+                min_score=MIN_SIMILARITY  # Only reasonably similar actions
             )
         except ContextEngineError as e:
             logger.error(f"Failed to query action history: {e}")
@@ -232,20 +527,27 @@ class LearningEngine:
                 avg_duration_ms=0.0
             )
 
-        if len(results) < self.min_samples:
+        totals = self._calculate_totals(results)
+
+        # Include outcomes recorded here but not yet stored
+        for record in self._in_flight + self._buffer:
+            if record.action_type == action_type:
+                self._add_record(totals, record, context)
+
+        if totals.samples < self.min_samples:
             return ConfidenceScore(
                 score=0.0,
-                sample_count=len(results),
+                sample_count=totals.samples,
                 success_rate=0.0,
                 avg_duration_ms=0.0,
                 similar_actions=results
             )
 
         # Calculate weighted confidence
-        confidence_score = self._calculate_confidence(results)
+        confidence_score = self._to_score(totals, results[:5])
 
         # Cache the result
-        self._set_cached(cache_key, confidence_score)
+        self._set_cached(cache_key, confidence_score, totals)
 
         return confidence_score
 
@@ -258,20 +560,15 @@ class LearningEngine:
         - Recency (recent actions weighted higher)
         - Failure penalty (failures weight 1.5x more than successes)
         """
-        weighted_success = 0.0
-        total_weight = 0.0
-        total_duration = 0
-        successes = 0
-        failures = 0
-        last_success = None
-        last_failure = None
+        return self._to_score(self._calculate_totals(results), results[:5])
 
+    def _calculate_totals(self, results: list[MemoryResult]) -> _ConfidenceTotals:
+        """Sum weighted outcomes of similar actions."""
+        totals = _ConfidenceTotals()
         now = datetime.utcnow()
 
         for result in results:
             metadata = result.metadata
-            success = metadata.get("success", False)
-            duration = metadata.get("duration_ms", 0)
             timestamp_str = metadata.get("timestamp")
 
             # Parse timestamp for recency weighting
@@ -280,43 +577,77 @@ class LearningEngine:
             except (ValueError, TypeError):
                 timestamp = now
 
-            # Calculate recency factor (1.0 for today, decays over time)
-            days_old = (now - timestamp).days
-            recency_factor = max(0.1, 1.0 - (days_old / self.confidence_decay_days))
-
-            # Base weight from similarity score
-            weight = result.score * recency_factor
-
-            # Apply success/failure weights
-            if success:
-                weight *= self.success_weight
-                weighted_success += weight
-                successes += 1
-                if last_success is None or timestamp > last_success:
-                    last_success = timestamp
-            else:
-                weight *= self.failure_weight
-                failures += 1
-                if last_failure is None or timestamp > last_failure:
-                    last_failure = timestamp
+            self._add_outcome(
+                totals,
+                similarity=result.score,
+                success=metadata.get("success", False),
+                duration_ms=metadata.get("duration_ms", 0),
+                timestamp=timestamp,
+                now=now
+            )
 
-            total_weight += weight
-            total_duration += duration
+        return totals
 
-        # Calculate final confidence
-        confidence = weighted_success / total_weight if total_weight > 0 else 0.0
-        sample_count = len(results)
-        success_rate = successes / sample_count if sample_count > 0 else 0.0
-        avg_duration = total_duration / sample_count if sample_count > 0 else 0.0
+    def _add_outcome(
+        self,
+        totals: _ConfidenceTotals,
+        similarity: float,
+        success: bool,
+        duration_ms: int,
+        timestamp: datetime,
+        now: datetime
+    ):
+        """Add one weighted outcome to running totals."""
+        # Calculate recency factor (1.0 for today, decays over time)
+        days_old = (now - timestamp).days
+        recency_factor = max(0.1, 1.0 - (days_old / self.confidence_decay_days))
+
+        # Base weight from similarity score
+        weight = similarity * recency_factor
+
+        # Apply success/failure weights
+        if success:
+            weight *= self.success_weight
+            totals.weighted_success += weight
+            totals.successes += 1
+            if totals.last_success is None or timestamp > totals.last_success:
+                totals.last_success = timestamp
+        else:
+            weight *= self.failure_weight
+            if totals.last_failure is None or timestamp > totals.last_failure:
+                totals.last_failure = timestamp
+
+        totals.total_weight += weight
+        totals.total_duration += duration_ms
+        totals.samples += 1
+
+    def _add_record(self, totals: _ConfidenceTotals, record: ActionRecord, context: str) -> bool:
+        """Add a local record to totals if its context is similar enough."""
+        similarity = _context_similarity(context, record.context[:100])
+        if similarity < MIN_SIMILARITY:
+            return False
+        self._add_outcome(
+            totals,
+            similarity=similarity,
+            success=record.success,
+            duration_ms=record.duration_ms,
+            timestamp=record.timestamp,
+            now=datetime.utcnow()
+        )
+        return True
 
+    @staticmethod
+    def _to_score(totals: _ConfidenceTotals, similar_actions: list) -> ConfidenceScore:
+        """Build a confidence score from running totals."""
+        samples = totals.samples
         return ConfidenceScore(
-            score=confidence,
-            sample_count=sample_count,
-            success_rate=success_rate,
-            avg_duration_ms=avg_duration,
-            last_success=last_success,
-            last_failure=last_failure,
-            similar_actions=results[:5]  # Keep top 5 for reference
+            score=totals.weighted_success / totals.total_weight if totals.total_weight > 0 else 0.0,
+            sample_count=samples,
+            success_rate=totals.successes / samples if samples > 0 else 0.0,
+            avg_duration_ms=totals.total_duration / samples if samples > 0 else 0.0,
+            last_success=totals.last_success,
+            last_failure=totals.last_failure,
+            similar_actions=similar_actions  # Keep top 5 for reference
         )
 
     async def get_recommendations(
@@ -471,21 +802,31 @@ class LearningEngine:
                 # Expired, remove from cache
                 del self._cache[key]
                 self._cache_timestamps.pop(key, None)
+                self._cache_totals.pop(key, None)
         return None
 
-    def _set_cached(self, key: str, score: ConfidenceScore):
-        """Cache a confidence score."""
+    def _set_cached(self, key: str, score: ConfidenceScore, totals: _ConfidenceTotals):
+        """Cache a confidence score with the totals it was built from."""
         self._cache[key] = score
         self._cache_timestamps[key] = datetime.utcnow()
-
-    def _invalidate_cache(self, action_type: str):
-        """Invalidate cache entries for an action type."""
-        to_remove = [k for k in self._cache if k.startswith(f"{action_type}:")]
-        for key in to_remove:
-            del self._cache[key]
-            self._cache_timestamps.pop(key, None)
+        self._cache_totals[key] = totals
+
+    def _apply_to_cache(self, record: ActionRecord):
+        """Fold a new outcome into cached scores for similar contexts."""
+        prefix = f"{record.action_type}:"
+        for key in [k for k in self._cache if k.startswith(prefix)]:
+            totals = self._cache_totals.get(key)
+            if totals is None:
+                # No totals to update; drop it and recompute on next use
+                del self._cache[key]
+                self._cache_timestamps.pop(key, None)
+                continue
+            if self._add_record(totals, record, key[len(prefix):]):
+                self._cache[key] = self._to_score(totals, self._cache[key].similar_actions)
+                self._cache_updates += 1
 
     def clear_cache(self):
         """Clear all cached confidence scores."""
         self._cache.clear()
         self._cache_timestamps.clear()
+        self._cache_totals.clear()
@@ -2,11 +2,19 @@
 File Watcher Event Source
 
 Monitors filesystem for changes and emits events.
+
+When ``watchdog`` is installed, watched directories are backed by its
+observer (inotify, FSEvents, ReadDirectoryChangesW) and nothing is scanned
+after the initial snapshot; a queued change wakes the loop at once instead of
+waiting out the idle back-off. Otherwise a ``SnapshotScanner`` polls on a worker
+thread, re-listing only directories whose mtime changed and backing off
+while nothing changes.
 """
 
 import asyncio
 import fnmatch
 import logging
+import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -14,9 +22,17 @@ from pathlib import Path
 from typing import Optional
 
 from ..event_bus import Event, EventBus, EventPriority
+from .fs_events import FsEventBridge
 
 logger = logging.getLogger(__name__)
 
+# More changes than this for one watcher in one flush are published as a
+# single "file_change_batch" event instead of one event per file
+BATCH_THRESHOLD = 50
+
+# Changes listed in a batch event's payload
+BATCH_SAMPLE_SIZE = 100
+
 
 class FileEventType(Enum):
     """Types of file events."""
@@ -25,6 +41,15 @@ class FileEventType(Enum):
     DELETED = "deleted"
 
 
+# How a new change combines with one still waiting out its debounce
+# (None: the two cancel out)
+_COALESCE: dict[tuple[FileEventType, FileEventType], Optional[FileEventType]] = {
+    (FileEventType.CREATED, FileEventType.MODIFIED): FileEventType.CREATED,
+    (FileEventType.CREATED, FileEventType.DELETED): None,
+    (FileEventType.DELETED, FileEventType.CREATED): FileEventType.MODIFIED,
+}
+
+
 @dataclass
 class WatchConfig:
     """Configuration for a file watcher."""
@@ -58,33 +83,206 @@ class FileState:
     exists: bool
 
 
+def _matches_patterns(name: str, config: WatchConfig) -> bool:
+    """Check if a file name matches any of the configured patterns."""
+    return any(fnmatch.fnmatch(name, pattern) for pattern in config.patterns)
+
+
+def _matches_ignore(name: str, full_path: str, config: WatchConfig) -> bool:
+    """Check if a path matches any ignore patterns."""
+    return any(
+        fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(full_path, pattern)
+        for pattern in config.ignore_patterns
+    )
+
+
+def _prunes_directory(full_path: str, config: WatchConfig) -> bool:
+    """
+    Check if every file below a directory is ignored.
+
+    True when an ignore pattern ending in ``*`` matches the directory path
+    plus a separator (e.g. ``*/node_modules/*``), since the trailing ``*``
+    then matches every path inside it.
+    """
+    prefix = full_path + os.sep
+    return any(
+        pattern.endswith("*") and fnmatch.fnmatch(prefix, pattern)
+        for pattern in config.ignore_patterns
+    )
+
+
+def _file_state(path: str, stat: os.stat_result) -> FileState:
+    return FileState(path=Path(path), mtime=stat.st_mtime, size=stat.st_size, exists=True)
+
+
+@dataclass
+class _DirListing:
+    """Matching files and subdirectories of a directory at one mtime."""
+    mtime_ns: int
+    files: list[str]
+    subdirs: list[str]
+
+
+class SnapshotScanner:
+    """
+    Incremental directory snapshot for one watch config.
+
+    Each directory's matching files and subdirectories are cached with the
+    directory's mtime, which changes whenever an entry is added, removed or
+    renamed; a directory with an unchanged mtime is not listed again. Files
+    are only stat'ed when the config tracks "modified" (or when new), and
+    ignored subtrees are pruned from the walk.
+
+    Methods do blocking I/O and are meant to run on a worker thread.
+    """
+
+    def __init__(self, config: WatchConfig):
+        self.config = config
+        self.root = os.path.abspath(config.path)
+        self.dirs_listed = 0
+        self.dirs_skipped = 0
+        self._listings: dict[str, _DirListing] = {}
+
+    def scan(
+        self, previous: dict[str, FileState]
+    ) -> tuple[dict[str, FileState], list[tuple[str, FileEventType]]]:
+        """
+        Take a snapshot and diff it against *previous*.
+
+        Returns:
+            ``(states, changes)`` -- the new snapshot, and ``(path, type)``
+            for every created, modified or deleted file
+        """
+        visited: set[str] = set()
+        states = self._walk(self.root, previous, visited)
+        for stale in self._listings.keys() - visited:
+            del self._listings[stale]
+
+        changes = []
+        for path, state in states.items():
+            prev = previous.get(path)
+            if prev is None:
+                changes.append((path, FileEventType.CREATED))
+            elif state is not prev and (state.mtime != prev.mtime or state.size != prev.size):
+                changes.append((path, FileEventType.MODIFIED))
+        for path in previous:
+            if path not in states:
+                changes.append((path, FileEventType.DELETED))
+        return states, changes
+
+    def scan_tree(self, directory: str) -> dict[str, FileState]:
+        """Snapshot the files below *directory* (e.g. a directory moved in)."""
+        return self._walk(os.path.abspath(directory), {}, set())
+
+    def _walk(self, top: str, previous: dict[str, FileState], visited: set[str]) -> dict[str, FileState]:
+        track_modified = "modified" in self.config.events
+        states: dict[str, FileState] = {}
+        stack = [top]
+        while stack:
+            directory = stack.pop()
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+            visited.add(directory)
+
+            listing = self._listings.get(directory)
+            if listing is None or listing.mtime_ns != mtime_ns:
+                listing = self._list(directory, mtime_ns)
+                self._listings[directory] = listing
+                self.dirs_listed += 1
+            else:
+                self.dirs_skipped += 1
+
+            for path in listing.files:
+                prev = previous.get(path)
+                if prev is not None and not track_modified:
+                    states[path] = prev
+                    continue
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if prev is not None and prev.mtime == stat.st_mtime and prev.size == stat.st_size:
+                    states[path] = prev
+                else:
+                    states[path] = _file_state(path, stat)
+
+            if self.config.recursive:
+                stack.extend(listing.subdirs)
+        return states
+
+    def _list(self, directory: str, mtime_ns: int) -> _DirListing:
+        files: list[str] = []
+        subdirs: list[str] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not _prunes_directory(entry.path, self.config):
+                                subdirs.append(entry.path)
+                        elif (
+                            entry.is_file()
+                            and _matches_patterns(entry.name, self.config)
+                            and not _matches_ignore(entry.name, entry.path, self.config)
+                        ):
+                            files.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return _DirListing(mtime_ns=mtime_ns, files=files, subdirs=subdirs)
+
+
 class FileWatcher:
     """
     Monitors filesystem for changes and emits events.
 
-    Uses polling-based change detection (cross-platform).
-    Emits events when files are created, modified, or deleted.
+    Uses ``watchdog`` filesystem events when available and polling-based
+    change detection otherwise (cross-platform). Emits events when files
+    are created, modified, or deleted; changes to the same file within the
+    debounce window are coalesced, and large bursts are batched.
     """
 
-    def __init__(self, event_bus: EventBus, poll_interval: float = 1.0):
+    def __init__(
+        self,
+        event_bus: EventBus,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 10.0,
+        batch_threshold: int = BATCH_THRESHOLD,
+    ):
         """
         Initialize the file watcher.
 
         Args:
             event_bus: Event bus to publish events to
-            poll_interval: Seconds between filesystem polls
+            poll_interval: Seconds between filesystem polls (and debounce checks)
+            max_poll_interval: Polls back off up to this while nothing changes
+            batch_threshold: Publish one batch event when a watcher has more
+                changes than this in one flush (0 to disable batching)
         """
         self.event_bus = event_bus
         self.poll_interval = poll_interval
+        self.max_poll_interval = max(max_poll_interval, poll_interval)
+        self.batch_threshold = batch_threshold
         self._configs: dict[str, WatchConfig] = {}
         self._running = False
         self._task: Optional[asyncio.Task] = None
+        self._interval = poll_interval
 
         # File state tracking
         self._file_states: dict[str, dict[str, FileState]] = {}
+        self._scanners: dict[str, SnapshotScanner] = {}
+        self._background: set[asyncio.Task] = set()
 
-        # Debouncing
-        self._pending_events: dict[str, tuple[datetime, Event]] = {}
+        # Filesystem events; watchers that can't use them are polled
+        self._events = FsEventBridge(self._on_fs_event, include_directories=True)
+        self._polled: set[str] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+
+        # Debouncing: (watcher_id, path) -> (last change, coalesced type)
+        self._pending_events: dict[tuple[str, str], tuple[datetime, FileEventType]] = {}
 
     async def start(self):
         """Start watching for file changes."""
@@ -92,26 +290,32 @@ class FileWatcher:
             return
 
         self._running = True
+        self._wakeup = asyncio.Event()
+        self._events.start()
 
         # Initialize file states
-        for config_id, config in self._configs.items():
-            self._file_states[config_id] = self._scan_directory(config)
+        for config in list(self._configs.values()):
+            await self._init_watcher(config)
 
         # Start polling task
         self._task = asyncio.create_task(self._poll_loop())
 
-        logger.info(f"File watcher started with {len(self._configs)} watchers")
+        mode = "filesystem events" if self._events.running else "polling"
+        logger.info(f"File watcher started with {len(self._configs)} watchers ({mode})")
 
     async def stop(self):
         """Stop watching for file changes."""
         self._running = False
+        self._events.stop()
 
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        for task in [self._task, *self._background]:
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._background.clear()
 
         logger.info("File watcher stopped")
 
@@ -124,9 +328,9 @@ class FileWatcher:
         """
         self._configs[config.id] = config
 
-        # Initialize state if already running
+        # Initialize state if already running (the snapshot is taken off-loop)
         if self._running:
-            self._file_states[config.id] = self._scan_directory(config)
+            self._spawn(self._init_watcher(config))
 
         logger.info(f"Added file watcher: {config.id} ({config.path})")
 
@@ -143,76 +347,132 @@ class FileWatcher:
         if config_id not in self._configs:
             return False
 
-        del self._configs[config_id]
+        config = self._configs.pop(config_id)
         self._file_states.pop(config_id, None)
+        self._scanners.pop(config_id, None)
+        self._polled.discard(config_id)
+        if not any(
+            (c.path, c.recursive) == (config.path, config.recursive) for c in self._configs.values()
+        ):
+            self._events.unwatch(config.path, recursive=config.recursive)
 
         logger.info(f"Removed file watcher: {config_id}")
         return True
 
-    def _scan_directory(self, config: WatchConfig) -> dict[str, FileState]:
-        """Scan a directory and return file states."""
-        states = {}
-        path = Path(config.path)
+    async def _init_watcher(self, config: WatchConfig):
+        """Subscribe to events (or mark for polling) and take the first snapshot."""
+        scanner = SnapshotScanner(config)
+        self._scanners[config.id] = scanner
 
-        if not path.exists():
-            return states
-
-        # Get all matching files
-        if config.recursive:
-            files = path.rglob("*")
+        if self._events.running and self._events.watch(config.path, recursive=config.recursive):
+            self._polled.discard(config.id)
         else:
-            files = path.glob("*")
-
-        for file_path in files:
-            if not file_path.is_file():
-                continue
-
-            # Check patterns
-            if not self._matches_patterns(file_path, config):
-                continue
-
-            # Check ignore patterns
-            if self._matches_ignore(file_path, config):
+            self._polled.add(config.id)
+
+        states, _ = await asyncio.to_thread(scanner.scan, {})
+        if self._configs.get(config.id) is config:
+            # Keep files already reported by events during the scan
+            self._file_states[config.id] = {**states, **self._file_states.get(config.id, {})}
+
+    def _spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    # ------------------------------------------------------------------
+    # Filesystem events
+    # ------------------------------------------------------------------
+
+    def _on_fs_event(self, event_type: str, src_path: str, dest_path: str, is_directory: bool):
+        """Apply a watchdog event to every watcher it concerns (runs on the loop)."""
+        for config_id, config in list(self._configs.items()):
+            if config_id in self._polled:
                 continue
-
-            try:
-                stat = file_path.stat()
-                states[str(file_path)] = FileState(
-                    path=file_path,
-                    mtime=stat.st_mtime,
-                    size=stat.st_size,
-                    exists=True
+            states = self._file_states.setdefault(config_id, {})
+            if event_type == "moved":
+                self._apply_removed(config, states, os.path.abspath(src_path), is_directory)
+                self._apply_present(config, states, os.path.abspath(dest_path), is_directory, created=True)
+            elif event_type == "deleted":
+                self._apply_removed(config, states, os.path.abspath(src_path), is_directory)
+            elif event_type in ("created", "modified"):
+                self._apply_present(
+                    config, states, os.path.abspath(src_path), is_directory,
+                    created=event_type == "created",
                 )
-            except OSError:
-                continue
 
-        return states
+    def _in_scope(self, config: WatchConfig, path: str) -> bool:
+        """Check if a path lies inside a watcher's root (and depth)."""
+        root = self._scanners[config.id].root if config.id in self._scanners else os.path.abspath(config.path)
+        if config.recursive:
+            return path.startswith(root + os.sep)
+        return os.path.dirname(path) == root
+
+    def _apply_removed(self, config: WatchConfig, states: dict[str, FileState], path: str, is_directory: bool):
+        if is_directory:
+            prefix = path + os.sep
+            for gone in [p for p in states if p.startswith(prefix)]:
+                del states[gone]
+                self._queue_event(config, gone, FileEventType.DELETED)
+        elif states.pop(path, None) is not None:
+            self._queue_event(config, path, FileEventType.DELETED)
+
+    def _apply_present(
+        self, config: WatchConfig, states: dict[str, FileState], path: str, is_directory: bool, created: bool
+    ):
+        if is_directory:
+            # A directory moved in arrives without events for its contents
+            if created and config.recursive and self._in_scope(config, path) and not _prunes_directory(path, config):
+                self._spawn(self._scan_new_directory(config, path))
+            return
 
-    def _matches_patterns(self, path: Path, config: WatchConfig) -> bool:
-        """Check if a path matches any of the configured patterns."""
-        name = path.name
-        for pattern in config.patterns:
-            if fnmatch.fnmatch(name, pattern):
-                return True
-        return False
+        name = os.path.basename(path)
+        if (
+            not self._in_scope(config, path)
+            or not _matches_patterns(name, config)
+            or _matches_ignore(name, path, config)
+        ):
+            return
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
 
-    def _matches_ignore(self, path: Path, config: WatchConfig) -> bool:
-        """Check if a path matches any ignore patterns."""
-        name = path.name
-        full_path = str(path)
+        prev = states.get(path)
+        if prev is None:
+            states[path] = _file_state(path, stat)
+            self._queue_event(config, path, FileEventType.CREATED)
+        elif prev.mtime != stat.st_mtime or prev.size != stat.st_size:
+            states[path] = _file_state(path, stat)
+            self._queue_event(config, path, FileEventType.MODIFIED)
+
+    async def _scan_new_directory(self, config: WatchConfig, directory: str):
+        scanner = self._scanners.get(config.id)
+        if scanner is None:
+            return
+        found = await asyncio.to_thread(scanner.scan_tree, directory)
+        states = self._file_states.setdefault(config.id, {})
+        for path, state in found.items():
+            if path not in states:
+                states[path] = state
+                self._queue_event(config, path, FileEventType.CREATED)
 
-        for pattern in config.ignore_patterns:
-            if fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(full_path, pattern):
-                return True
-        return False
+    # ------------------------------------------------------------------
+    # Polling
+    # ------------------------------------------------------------------
 
     async def _poll_loop(self):
         """Main polling loop."""
         while self._running:
             try:
-                await self._check_all_watchers()
+                changed = await self._check_all_watchers()
                 await self._process_pending_events()
-                await asyncio.sleep(self.poll_interval)
+
+                # Back off while idle; stay responsive while debouncing
+                if changed or self._pending_events:
+                    self._interval = self.poll_interval
+                else:
+                    self._interval = min(self._interval * 2, self.max_poll_interval)
+                await self._sleep(self.poll_interval if self._pending_events else self._interval)
 
             except asyncio.CancelledError:
                 break
@@ -220,47 +480,80 @@ class FileWatcher:
                 logger.error(f"Error in file watcher: {e}")
                 await asyncio.sleep(self.poll_interval)
 
-    async def _check_all_watchers(self):
-        """Check all configured watchers for changes."""
-        for config_id, config in self._configs.items():
+    async def _sleep(self, delay: float):
+        """Sleep for *delay*, or until a change is queued (see ``_queue_event``)."""
+        if self._wakeup is None:
+            await asyncio.sleep(delay)
+            return
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _check_all_watchers(self) -> bool:
+        """
+        Poll the watchers that have no filesystem events.
+
+        Returns:
+            True if any change was found
+        """
+        changed = False
+        for config_id, config in list(self._configs.items()):
+            if self._events.running and config_id not in self._polled:
+                continue
             try:
-                await self._check_watcher(config_id, config)
+                if await self._check_watcher(config_id, config):
+                    changed = True
             except Exception as e:
                 logger.error(f"Error checking watcher {config_id}: {e}")
+        return changed
+
+    async def _check_watcher(self, config_id: str, config: WatchConfig) -> bool:
+        """
+        Check a single watcher for changes.
 
-    async def _check_watcher(self, config_id: str, config: WatchConfig):
-        """Check a single watcher for changes."""
-        current_states = self._scan_directory(config)
-        previous_states = self._file_states.get(config_id, {})
-
-        # Find created files
-        if "created" in config.events:
-            for path, state in current_states.items():
-                if path not in previous_states:
-                    self._queue_event(config, path, FileEventType.CREATED)
-
-        # Find modified files
-        if "modified" in config.events:
-            for path, state in current_states.items():
-                if path in previous_states:
-                    prev = previous_states[path]
-                    if state.mtime != prev.mtime or state.size != prev.size:
-                        self._queue_event(config, path, FileEventType.MODIFIED)
-
-        # Find deleted files
-        if "deleted" in config.events:
-            for path in previous_states:
-                if path not in current_states:
-                    self._queue_event(config, path, FileEventType.DELETED)
-
-        # Update states
-        self._file_states[config_id] = current_states
+        The scan and diff run on a worker thread.
 
-    def _queue_event(self, config: WatchConfig, path: str, event_type: FileEventType):
-        """Queue an event for debounced emission."""
-        key = f"{config.id}:{path}:{event_type.value}"
+        Returns:
+            True if any change was found
+        """
+        scanner = self._scanners.get(config_id)
+        previous = self._file_states.get(config_id)
+        if scanner is None or previous is None:
+            return False  # First snapshot not taken yet
+
+        states, changes = await asyncio.to_thread(scanner.scan, previous)
+        if self._configs.get(config_id) is not config:
+            return False  # Removed or replaced during the scan
 
-        event = Event(
+        self._file_states[config_id] = states
+        for path, event_type in changes:
+            self._queue_event(config, path, event_type)
+        return bool(changes)
+
+    # ------------------------------------------------------------------
+    # Emission
+    # ------------------------------------------------------------------
+
+    def _queue_event(self, config: WatchConfig, path: str, event_type: FileEventType):
+        """Queue an event for debounced emission, coalescing with a pending one."""
+        key = (config.id, path)
+
+        pending = self._pending_events.get(key)
+        if pending is not None:
+            merged = _COALESCE.get((pending[1], event_type), event_type)
+            if merged is None:
+                del self._pending_events[key]
+                return
+            event_type = merged
+
+        self._pending_events[key] = (datetime.utcnow(), event_type)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _make_event(self, config: WatchConfig, path: str, event_type: FileEventType) -> Event:
+        return Event(
             event_type="file_change",
             source=f"file_watcher:{config.id}",
             payload={
@@ -272,50 +565,73 @@ class FileWatcher:
             priority=EventPriority.MEDIUM
         )
 
-        emit_at = datetime.utcnow()
-        self._pending_events[key] = (emit_at, event)
+    def _make_batch_event(self, config: WatchConfig, changes: list[tuple[str, FileEventType]]) -> Event:
+        counts = {t.value: 0 for t in FileEventType}
+        for _, event_type in changes:
+            counts[event_type.value] += 1
+        return Event(
+            event_type="file_change_batch",
+            source=f"file_watcher:{config.id}",
+            payload={
+                "watcher_id": config.id,
+                "watch_path": config.path,
+                "change_count": len(changes),
+                "counts": counts,
+                "changes": [
+                    {"path": path, "event_type": event_type.value}
+                    for path, event_type in changes[:BATCH_SAMPLE_SIZE]
+                ],
+                "truncated": len(changes) > BATCH_SAMPLE_SIZE,
+            },
+            priority=EventPriority.MEDIUM
+        )
 
     async def _process_pending_events(self):
         """Process and emit debounced events."""
         now = datetime.utcnow()
-        to_emit = []
-        to_remove = []
+        due: dict[str, list[tuple[str, FileEventType]]] = {}
 
-        for key, (queued_at, event) in self._pending_events.items():
-            config_id = event.payload.get("watcher_id")
+        for key, (queued_at, event_type) in list(self._pending_events.items()):
+            config_id, path = key
             config = self._configs.get(config_id)
 
             if not config:
-                to_remove.append(key)
+                del self._pending_events[key]
                 continue
 
             # Check if debounce period has passed
             elapsed = (now - queued_at).total_seconds()
             if elapsed >= config.debounce_seconds:
-                to_emit.append(event)
-                to_remove.append(key)
+                del self._pending_events[key]
+                if event_type.value in config.events:
+                    due.setdefault(config_id, []).append((path, event_type))
 
         # Emit events
-        for event in to_emit:
-            await self.event_bus.publish(event)
-            logger.info(
-                f"File event: {event.payload['event_type']} - {event.payload['path']}"
-            )
+        for config_id, changes in due.items():
+            config = self._configs[config_id]
+            if self.batch_threshold and len(changes) > self.batch_threshold:
+                await self.event_bus.publish(self._make_batch_event(config, changes))
+                logger.info(f"File events: {len(changes)} changes under {config.path}")
+                continue
 
-        # Clean up
-        for key in to_remove:
-            del self._pending_events[key]
+            for path, event_type in changes:
+                await self.event_bus.publish(self._make_event(config, path, event_type))
+                logger.info(f"File event: {event_type.value} - {path}")
 
     def get_status(self) -> dict:
         """Get watcher status."""
         return {
             "running": self._running,
             "watcher_count": len(self._configs),
+            "poll_interval": self._interval,
             "watchers": {
                 config_id: {
                     "path": config.path,
                     "patterns": config.patterns,
-                    "file_count": len(self._file_states.get(config_id, {}))
+                    "file_count": len(self._file_states.get(config_id, {})),
+                    "mode": "events" if self._events.running and config_id not in self._polled else "polling",
+                    "dirs_listed": self._scanners[config_id].dirs_listed if config_id in self._scanners else 0,
+                    "dirs_skipped": self._scanners[config_id].dirs_skipped if config_id in self._scanners else 0,
                 }
                 for config_id, config in self._configs.items()
             }
@@ -0,0 +1,159 @@
+"""
+Filesystem Event Bridge
+
+Forwards ``watchdog`` observer events (inotify, FSEvents, ReadDirectoryChangesW)
+to a callback on an asyncio event loop, so event sources can wake up on change
+instead of polling. ``watchdog`` is optional: when it is not installed,
+``FsEventBridge.available`` is False and callers keep polling.
+
+``ag3nt_agent.file_watcher.FileWatcher`` is not reused here: it is a
+process-wide singleton bound to the agent workspace (and its .gitignore),
+drops dependency/build directories, ignores directory events that are needed
+to follow moves, and calls back on timer threads rather than the loop.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    from watchdog.events import FileSystemEvent, FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without watchdog
+    FileSystemEventHandler = object  # type: ignore[assignment,misc]
+    Observer = None  # type: ignore[assignment,misc]
+    WATCHDOG_AVAILABLE = False
+
+# (event_type, src_path, dest_path, is_directory) -- dest_path is "" except
+# for moves
+FsEventCallback = Callable[[str, str, str, bool], None]
+
+
+class _Handler(FileSystemEventHandler):
+    """Hands watchdog events to the bridge from the observer thread."""
+
+    def __init__(self, bridge: "FsEventBridge"):
+        super().__init__()
+        self._bridge = bridge
+
+    def on_any_event(self, event: "FileSystemEvent") -> None:
+        if event.event_type in ("opened", "closed", "closed_no_write"):
+            return
+        self._bridge._forward(
+            event.event_type,
+            os.fsdecode(event.src_path),
+            os.fsdecode(getattr(event, "dest_path", "") or ""),
+            event.is_directory,
+        )
+
+
+class FsEventBridge:
+    """
+    Watches directories and calls back on the event loop for each change.
+
+    The callback runs on the loop thread, so it may touch asyncio objects
+    and source state without locking.
+    """
+
+    def __init__(self, callback: FsEventCallback, include_directories: bool = False):
+        """
+        Initialize the bridge.
+
+        Args:
+            callback: Called as
+                ``callback(event_type, src_path, dest_path, is_directory)``
+            include_directories: Also report events for directories
+        """
+        self._callback = callback
+        self._include_directories = include_directories
+        self._observer = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._watches: dict[tuple[str, bool], object] = {}
+
+    @property
+    def available(self) -> bool:
+        """True if ``watchdog`` is installed."""
+        return WATCHDOG_AVAILABLE
+
+    @property
+    def running(self) -> bool:
+        """True while the observer thread is running."""
+        return self._observer is not None
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> bool:
+        """
+        Start the observer thread.
+
+        Returns:
+            True if started, False if ``watchdog`` is unavailable or failed
+        """
+        if not WATCHDOG_AVAILABLE:
+            return False
+        if self._observer is not None:
+            return True
+
+        self._loop = loop or asyncio.get_running_loop()
+        try:
+            observer = Observer()
+            observer.daemon = True
+            observer.start()
+        except Exception as e:
+            logger.warning(f"Filesystem events unavailable, polling instead: {e}")
+            return False
+
+        self._observer = observer
+        return True
+
+    def watch(self, directory: str, recursive: bool = False) -> bool:
+        """
+        Watch a directory.
+
+        Returns:
+            True if the directory is now watched
+        """
+        if self._observer is None:
+            return False
+
+        key = (os.path.abspath(directory), recursive)
+        if key in self._watches:
+            return True
+        try:
+            self._watches[key] = self._observer.schedule(_Handler(self), key[0], recursive=recursive)
+        except Exception as e:  # missing directory, inotify watch limit, ...
+            logger.warning(f"Cannot watch {directory}: {e}")
+            return False
+        return True
+
+    def unwatch(self, directory: str, recursive: bool = False) -> None:
+        """Stop watching a directory."""
+        watch = self._watches.pop((os.path.abspath(directory), recursive), None)
+        if watch is not None and self._observer is not None:
+            try:
+                self._observer.unschedule(watch)
+            except Exception:  # already gone with its directory
+                pass
+
+    def stop(self) -> None:
+        """Stop the observer thread."""
+        observer, self._observer = self._observer, None
+        self._watches.clear()
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=2.0)
+
+    def _forward(self, event_type: str, src_path: str, dest_path: str, is_directory: bool) -> None:
+        """Schedule the callback on the loop (called on the observer thread)."""
+        if is_directory and not self._include_directories:
+            return
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._callback, event_type, src_path, dest_path, is_directory)
+        except RuntimeError:  # loop closed between the check and the call
+            pass
@@ -2,21 +2,45 @@
 Log Monitor Event Source
 
 Monitors log files for patterns and emits events.
+
+Each log is followed by a ``LogTailer`` that remembers its byte offset, line
+count and file identity, so a check only reads bytes appended since the last
+one. Reads happen in bounded chunks on a worker thread, and the new text is
+searched with one combined regex per monitor. When ``watchdog`` is installed
+the monitor wakes up on filesystem events instead of polling every interval.
 """
 
 import asyncio
 import logging
+import os
 import re
+import time
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from pathlib import Path
 from typing import Optional
 
 from ..event_bus import Event, EventBus, EventPriority
+from .fs_events import FsEventBridge
 
 logger = logging.getLogger(__name__)
 
+# Bytes read per chunk, and at most per log per check; a log that is further
+# behind is picked up again straight away instead of after the interval
+READ_CHUNK_BYTES = 1 << 20
+MAX_BYTES_PER_CHECK = 16 << 20
+
+# An unterminated line this long is processed in pieces, all numbered as
+# the one line; shorter ones wait for their newline
+MAX_LINE_BYTES = 1 << 20
+
+# With filesystem events, logs are still re-checked this often in case an
+# event was missed (e.g. files on network mounts)
+EVENT_FALLBACK_INTERVAL = 30.0
+
+# Patterns that behave differently when searched across a block of lines
+_BLOCK_UNSAFE_RE = re.compile(r"\\[AZz]|\\\d|\(\?P=")
+
 
 @dataclass
 class LogMonitorConfig:
@@ -52,15 +76,205 @@ class LogMatch:
     timestamp: datetime
 
 
+class PatternSet:
+    """
+    A monitor's patterns behind one combined regex.
+
+    ``find`` returns, for every line of a text block that matches, the index
+    of the first pattern (in config order) that matches it -- the same result
+    as testing each line against each pattern, but lines that match nothing
+    (nearly all of them) are skipped by a single regex scan of the block.
+    """
+
+    def __init__(self, patterns: list[str]):
+        self.patterns = [
+            re.compile(p[6:]) if p.startswith("regex:") else re.compile(re.escape(p))
+            for p in patterns
+        ]
+        self._combined: Optional[re.Pattern] = None
+        if self.patterns and not any(_BLOCK_UNSAFE_RE.search(p.pattern) for p in self.patterns):
+            try:
+                self._combined = re.compile(
+                    "|".join(f"(?:{p.pattern})" for p in self.patterns), re.MULTILINE
+                )
+            except re.error:  # e.g. duplicate group names; test line by line
+                self._combined = None
+
+    def match_line(self, line: str) -> Optional[int]:
+        """Return the index of the first pattern matching *line*."""
+        for i, pattern in enumerate(self.patterns):
+            if pattern.search(line):
+                return i
+        return None
+
+    def find(self, text: str) -> list[tuple[int, int, str]]:
+        """
+        Find matching lines in a block of newline-separated lines.
+
+        Returns:
+            ``(line_index, pattern_index, line)`` for each matching line,
+            where ``line_index`` is 0-based within *text*
+        """
+        if not self.patterns:
+            return []
+
+        if self._combined is None:
+            results = []
+            for index, line in enumerate(text.split("\n")):
+                hit = self.match_line(line)
+                if hit is not None:
+                    results.append((index, hit, line))
+            return results
+
+        results = []
+        pos = 0
+        line_index = 0
+        counted_to = 0
+        while pos <= len(text):
+            m = self._combined.search(text, pos)
+            if m is None:
+                break
+            start = text.rfind("\n", 0, m.start()) + 1
+            end = text.find("\n", start)
+            if end == -1:
+                end = len(text)
+            line_index += text.count("\n", counted_to, start)
+            counted_to = start
+            line = text[start:end]
+            # The combined match may span lines; confirm on the line alone
+            hit = self.match_line(line)
+            if hit is not None:
+                results.append((line_index, hit, line))
+            pos = end + 1
+        return results
+
+
+class LogTailer:
+    """
+    Incremental reader for one log file.
+
+    Tracks the byte offset, the number of lines before it and the file's
+    identity (device, inode). A changed identity (rotation by rename) or a
+    shrinking file (truncation) restarts from the top of the new file.
+    Methods do blocking I/O and are meant to run on a worker thread.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.position = 0
+        self.line_count: Optional[int] = None  # Lines before position; None until counted
+        self.identity: Optional[tuple[int, int]] = None
+        self.rotations = 0
+        self._partial = b""
+
+    def seek_to_end(self) -> None:
+        """Start from the current end of the file (a single ``stat``)."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            self.position, self.line_count, self.identity = 0, 0, None
+            return
+        self.position = st.st_size
+        self.identity = (st.st_dev, st.st_ino)
+        self.line_count = None if st.st_size else 0
+        self._partial = b""
+
+    def read_lines(self, max_bytes: int = MAX_BYTES_PER_CHECK) -> tuple[str, int, bool]:
+        """
+        Read complete lines appended since the last call.
+
+        Returns:
+            ``(text, first_line_number, more)`` -- *text* holds the new lines
+            joined by newlines (no trailing newline), *first_line_number* is
+            the 1-based number of its first line, and *more* is True if the
+            file has unread bytes beyond *max_bytes*.
+        """
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return "", 0, False
+
+        identity = (st.st_dev, st.st_ino)
+        if self.identity is not None and identity != self.identity:
+            self._restart()
+            self.rotations += 1
+            logger.info(f"Log rotated: {self.path}")
+        elif st.st_size < self.position:
+            self._restart()
+            logger.info(f"Log truncated: {self.path}")
+        self.identity = identity
+
+        if self.line_count is None:
+            self.line_count = self._count_lines(self.position)
+
+        data = b""
+        if st.st_size > self.position:
+            try:
+                with open(self.path, "rb") as f:
+                    f.seek(self.position)
+                    chunks = []
+                    remaining = min(max_bytes, st.st_size - self.position)
+                    while remaining > 0:
+                        chunk = f.read(min(READ_CHUNK_BYTES, remaining))
+                        if not chunk:
+                            break
+                        chunks.append(chunk)
+                        remaining -= len(chunk)
+                    data = b"".join(chunks)
+            except OSError as e:
+                logger.warning(f"Could not read {self.path}: {e}")
+                return "", 0, False
+            self.position += len(data)
+
+        more = st.st_size > self.position
+        buffer = self._partial + data
+        cut = buffer.rfind(b"\n") + 1
+        complete, self._partial = buffer[:cut], buffer[cut:]
+        first_line = self.line_count + 1
+        self.line_count += complete.count(b"\n")
+        if len(self._partial) >= MAX_LINE_BYTES:
+            # Oversized unterminated line: pass on what there is; the newline
+            # added here isn't counted, so the rest keeps the same number
+            complete += self._partial + b"\n"
+            self._partial = b""
+        if not complete:
+            return "", 0, more
+
+        text = complete.decode("utf-8", errors="replace").replace("\r\n", "\n")[:-1]
+        return text, first_line, more
+
+    def _restart(self) -> None:
+        self.position = 0
+        self.line_count = 0
+        self._partial = b""
+
+    def _count_lines(self, end: int) -> int:
+        """Count newlines in the first *end* bytes, in bounded chunks."""
+        count = 0
+        try:
+            with open(self.path, "rb") as f:
+                remaining = end
+                while remaining > 0:
+                    chunk = f.read(min(READ_CHUNK_BYTES, remaining))
+                    if not chunk:
+                        break
+                    count += chunk.count(b"\n")
+                    remaining -= len(chunk)
+        except OSError:
+            pass
+        return count
+
+
 class LogMonitor:
     """
     Monitors log files for patterns and emits events.
 
     Features:
-    - Tails log files for new lines
+    - Tails log files for new lines (rotation and truncation aware)
     - Pattern matching with regex support
     - Threshold-based alerting (N matches in M seconds)
     - Deduplication of repeated alerts
+    - Filesystem-event wakeups when ``watchdog`` is installed
     """
 
     def __init__(self, event_bus: EventBus, poll_interval: float = 1.0):
@@ -78,13 +292,20 @@ class LogMonitor:
         self._task: Optional[asyncio.Task] = None
 
         # File tracking
-        self._file_positions: dict[str, int] = {}
+        self._tailers: dict[str, LogTailer] = {}
 
         # Match tracking for threshold detection
         self._recent_matches: dict[str, deque] = {}
 
         # Compiled regex patterns
-        self._compiled_patterns: dict[str, list[re.Pattern]] = {}
+        self._compiled_patterns: dict[str, PatternSet] = {}
+
+        # Filesystem-event wakeups
+        self._events = FsEventBridge(self._on_fs_event)
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dirty: set[str] = set()
+        self._unwatched: set[str] = set()  # Logs whose directory can't be watched
+        self._swept_at = 0.0  # Last time every log was re-checked
 
     async def start(self):
         """Start monitoring log files."""
@@ -92,11 +313,17 @@ class LogMonitor:
             return
 
         self._running = True
+        self._wakeup = asyncio.Event()
+        self._swept_at = time.monotonic()
 
         # Initialize file positions
         for config in self._configs.values():
             self._init_file_position(config)
 
+        if self._events.start():
+            for config in self._configs.values():
+                self._watch(config)
+
         # Start polling task
         self._task = asyncio.create_task(self._poll_loop())
 
@@ -105,6 +332,7 @@ class LogMonitor:
     async def stop(self):
         """Stop monitoring log files."""
         self._running = False
+        self._events.stop()
 
         if self._task:
             self._task.cancel()
@@ -125,13 +353,7 @@ class LogMonitor:
         self._configs[config.id] = config
 
         # Compile patterns
-        compiled = []
-        for pattern in config.patterns:
-            if pattern.startswith("regex:"):
-                compiled.append(re.compile(pattern[6:]))
-            else:
-                compiled.append(re.compile(re.escape(pattern)))
-        self._compiled_patterns[config.id] = compiled
+        self._compiled_patterns[config.id] = PatternSet(config.patterns)
 
         # Initialize match tracking
         self._recent_matches[config.id] = deque()
@@ -139,6 +361,7 @@ class LogMonitor:
         # Initialize file position if running
         if self._running:
             self._init_file_position(config)
+            self._watch(config)
 
         logger.info(f"Added log monitor: {config.id} ({config.path})")
 
@@ -157,7 +380,9 @@ class LogMonitor:
 
         config = self._configs[config_id]
         del self._configs[config_id]
-        self._file_positions.pop(config.path, None)
+        if not any(c.path == config.path for c in self._configs.values()):
+            self._tailers.pop(config.path, None)
+            self._unwatch(config)
         self._recent_matches.pop(config_id, None)
         self._compiled_patterns.pop(config_id, None)
 
@@ -166,18 +391,55 @@ class LogMonitor:
 
     def _init_file_position(self, config: LogMonitorConfig):
         """Initialize file position to end of file."""
-        path = Path(config.path)
-        if path.exists():
-            self._file_positions[config.path] = path.stat().st_size
+        if config.path not in self._tailers:
+            tailer = LogTailer(config.path)
+            tailer.seek_to_end()
+            self._tailers[config.path] = tailer
+
+    def _watch(self, config: LogMonitorConfig):
+        """Watch the directory of a log (also sees rotation renames)."""
+        path = os.path.abspath(config.path)
+        if self._events.watch(os.path.dirname(path)):
+            self._unwatched.discard(path)
         else:
-            self._file_positions[config.path] = 0
+            self._unwatched.add(path)
+
+    def _unwatch(self, config: LogMonitorConfig):
+        """Stop watching the directory of a log no longer monitored."""
+        path = os.path.abspath(config.path)
+        self._unwatched.discard(path)
+        self._dirty.discard(path)
+        directory = os.path.dirname(path)
+        if not any(os.path.dirname(os.path.abspath(c.path)) == directory for c in self._configs.values()):
+            self._events.unwatch(directory)
+
+    def _retry_unwatched(self):
+        """Try again to watch logs whose directory couldn't be watched."""
+        for config in list(self._configs.values()):
+            path = os.path.abspath(config.path)
+            if path in self._unwatched:
+                self._watch(config)
+                if path not in self._unwatched:
+                    self._dirty.add(path)  # Catch up on writes before the watch
+
+    def _on_fs_event(self, event_type: str, src_path: str, dest_path: str, is_directory: bool = False):
+        """Wake the loop if a monitored log changed (runs on the loop)."""
+        for path in (src_path, dest_path):
+            if path and os.path.abspath(path) in self._watched_paths():
+                self._dirty.add(os.path.abspath(path))
+                if self._wakeup is not None:
+                    self._wakeup.set()
+
+    def _watched_paths(self) -> set[str]:
+        return {os.path.abspath(path) for path in self._tailers}
 
     async def _poll_loop(self):
         """Main polling loop."""
         while self._running:
             try:
-                await self._check_all_logs()
-                await asyncio.sleep(self.poll_interval)
+                behind = await self._check_all_logs()
+                if not behind:
+                    await self._wait_for_change()
 
             except asyncio.CancelledError:
                 break
@@ -185,66 +447,92 @@ class LogMonitor:
                 logger.error(f"Error in log monitor: {e}")
                 await asyncio.sleep(self.poll_interval)
 
-    async def _check_all_logs(self):
-        """Check all configured log files."""
-        for config in self._configs.values():
-            try:
-                await self._check_log(config)
-            except Exception as e:
-                logger.error(f"Error checking log {config.id}: {e}")
-
-    async def _check_log(self, config: LogMonitorConfig):
-        """Check a single log file for new content."""
-        path = Path(config.path)
-
-        if not path.exists():
-            return
-
-        current_size = path.stat().st_size
-        last_position = self._file_positions.get(config.path, 0)
-
-        # Handle log rotation (file got smaller)
-        if current_size < last_position:
-            last_position = 0
+    async def _wait_for_change(self):
+        """Sleep until a filesystem event or the (fallback) poll interval.
 
-        # No new content
-        if current_size == last_position:
+        Logs whose directory isn't watched yet (e.g. it doesn't exist) are
+        polled every ``poll_interval``, and watching them is retried then.
+        """
+        if not self._events.running or self._wakeup is None:
+            await asyncio.sleep(self.poll_interval)
             return
 
-        # Read new content
+        timeout = self.poll_interval if self._unwatched else EVENT_FALLBACK_INTERVAL
         try:
-            with open(path, 'r', encoding='utf-8', errors='replace') as f:
-                f.seek(last_position)
-                new_content = f.read()
-                self._file_positions[config.path] = f.tell()
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            self._retry_unwatched()
+            if time.monotonic() - self._swept_at >= EVENT_FALLBACK_INTERVAL:
+                self._swept_at = time.monotonic()
+                self._dirty.update(self._watched_paths())
+        self._wakeup.clear()
+        # Let a burst of writes settle into one read
+        await asyncio.sleep(min(self.poll_interval, 0.05))
+
+    async def _check_all_logs(self) -> bool:
+        """
+        Check configured log files.
 
-        except IOError as e:
-            logger.warning(f"Could not read {config.path}: {e}")
-            return
+        With filesystem events only logs with pending events are read.
+        Monitors sharing a log file share one read of it.
 
-        # Process new lines
-        line_number = sum(1 for _ in open(path, 'r', encoding='utf-8', errors='replace'))
-        lines_read = 0
+        Returns:
+            True if some log has more unread content than one check reads
+        """
+        dirty, self._dirty = self._dirty, set()
+        by_path: dict[str, list[LogMonitorConfig]] = {}
+        for config in self._configs.values():
+            by_path.setdefault(config.path, []).append(config)
 
-        for line in new_content.splitlines():
-            lines_read += 1
-            await self._check_line(config, line, line_number - len(new_content.splitlines()) + lines_read)
+        behind = False
+        for log_path, configs in by_path.items():
+            path = os.path.abspath(log_path)
+            if self._events.running and path not in dirty and path not in self._unwatched:
+                continue
+            try:
+                if await self._check_log(log_path, configs):
+                    behind = True
+                    self._dirty.add(path)
+            except Exception as e:
+                logger.error(f"Error checking log {log_path}: {e}")
+        return behind
 
-    async def _check_line(self, config: LogMonitorConfig, line: str, line_number: int):
-        """Check a single line against patterns."""
-        patterns = self._compiled_patterns.get(config.id, [])
+    async def _check_log(self, path: str, configs: list[LogMonitorConfig]) -> bool:
+        """
+        Check a single log file for new content.
 
-        for i, pattern in enumerate(patterns):
-            if pattern.search(line):
-                match = LogMatch(
-                    pattern=config.patterns[i],
-                    line=line,
-                    line_number=line_number,
-                    timestamp=datetime.utcnow()
-                )
+        Reading and matching run on a worker thread; only matches come back
+        to the event loop.
 
-                await self._record_match(config, match)
-                break  # Only match once per line
+        Returns:
+            True if the log has more unread content
+        """
+        if path not in self._tailers:
+            self._init_file_position(configs[0])
+        tailer = self._tailers[path]
+        pattern_sets = [self._compiled_patterns[config.id] for config in configs]
+
+        def read_and_match():
+            text, first_line, more = tailer.read_lines()
+            if not text:
+                return [], more
+            return [
+                (config_index, first_line + index, pattern_index, line)
+                for config_index, patterns in enumerate(pattern_sets)
+                for index, pattern_index, line in patterns.find(text)
+            ], more
+
+        hits, more = await asyncio.to_thread(read_and_match)
+
+        for config_index, line_number, pattern_index, line in hits:
+            config = configs[config_index]
+            await self._record_match(config, LogMatch(
+                pattern=config.patterns[pattern_index],
+                line=line,
+                line_number=line_number,
+                timestamp=datetime.utcnow()
+            ))
+        return more
 
     async def _record_match(self, config: LogMonitorConfig, match: LogMatch):
         """Record a match and check threshold."""
@@ -295,12 +583,15 @@ class LogMonitor:
         """Get monitor status."""
         return {
             "running": self._running,
+            "wakeups": "events" if self._events.running else "polling",
             "monitor_count": len(self._configs),
             "monitors": {
                 config_id: {
                     "path": config.path,
                     "patterns": config.patterns,
-                    "recent_matches": len(self._recent_matches.get(config_id, []))
+                    "recent_matches": len(self._recent_matches.get(config_id, [])),
+                    "position": self._tailers[config.path].position if config.path in self._tailers else 0,
+                    "line_count": self._tailers[config.path].line_count if config.path in self._tailers else 0,
                 }
                 for config_id, config in self._configs.items()
             }
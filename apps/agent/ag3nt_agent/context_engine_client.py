@@ -7,20 +7,36 @@ Provides integration with Context-Engine MCP servers for:
 - RAG-style Q&A capabilities
 
 This client connects to Context-Engine's Memory Server and Indexer Server
-via the MCP HTTP protocol.
+via the MCP HTTP protocol. Connections are pooled (HTTP/2 when ``h2`` is
+installed), writes can be sent as one JSON-RPC batch, and results of
+read-only tools are cached briefly with identical concurrent calls sharing
+one request.
 """
 
+import asyncio
+import copy
+import itertools
 import os
 import json
 import logging
+import time
+from collections import OrderedDict
 from typing import Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
 import httpx
 
+try:
+    import h2  # noqa: F401 - lets httpx negotiate HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without h2
+    HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
 
 @dataclass
 class MemoryResult:
@@ -77,6 +93,45 @@ class ToolCallError(ContextEngineError):
     pass
 
 
+class _ResultCache:
+    """LRU cache of tool results that expire after a time-to-live."""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple) -> Any:
+        """Get a cached result, or _MISSING."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return _MISSING
+
+    def put(self, key: tuple, value: Any):
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, server_url: str):
+        """Drop cached results from one server."""
+        for key in [k for k in self._entries if k[0] == server_url]:
+            del self._entries[key]
+
+
 class ContextEngineClient:
     """
     Client for interacting with Context-Engine MCP servers.
@@ -118,12 +173,20 @@ class ContextEngineClient:
     COLLECTION_STATE = "agent-state"
     COLLECTION_BLUEPRINTS = "agent-blueprints"
 
+    # Tools whose results may be cached and shared between identical calls
+    READ_ONLY_TOOLS = frozenset({"find", "repo_search", "context_answer"})
+
     def __init__(
         self,
         memory_url: Optional[str] = None,
         indexer_url: Optional[str] = None,
         qdrant_url: Optional[str] = None,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        cache_size: int = 256,
+        cache_ttl: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None
     ):
         """
         Initialize the Context-Engine client.
@@ -136,6 +199,11 @@ class ContextEngineClient:
             qdrant_url: URL for direct Qdrant access (optional).
                        Defaults to QDRANT_URL env var or localhost:6333.
             timeout: Request timeout in seconds.
+            max_connections: Connection pool size across both servers.
+            max_keepalive_connections: Idle connections kept open for reuse.
+            cache_size: Read-only tool results kept in the cache (0 disables it).
+            cache_ttl: Seconds a cached result stays valid.
+            transport: Custom httpx transport, e.g. a stand-in server in tests.
         """
         self.memory_url = memory_url or os.getenv(
             "CONTEXT_ENGINE_MEMORY_URL",
@@ -150,12 +218,38 @@ class ContextEngineClient:
             "http://localhost:6333"
         )
         self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=30.0
+        )
+        self._transport = transport
         self._client: Optional[httpx.AsyncClient] = None
 
+        # JSON-RPC request IDs, unique for the client's lifetime
+        self._request_ids = itertools.count(1)
+
+        # Read-only results, and calls currently waiting on a response
+        self._cache = _ResultCache(cache_size, cache_ttl)
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+        # Bumped by every write, so a read that started before it is not cached
+        self._generations: dict[str, int] = {}
+        self._batch_unsupported: set[str] = set()
+
+        # Stats
+        self._requests = 0
+        self._batch_requests = 0
+        self._deduplicated = 0
+
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client."""
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=HTTP2_AVAILABLE,
+                transport=self._transport
+            )
         return self._client
 
     async def close(self):
@@ -179,7 +273,10 @@ class ContextEngineClient:
         """
         Call an MCP tool on the specified server.
 
-        Uses the MCP HTTP protocol to invoke tools.
+        Uses the MCP HTTP protocol to invoke tools. Results of read-only
+        tools are cached for ``cache_ttl`` seconds, and identical calls made
+        while one is in flight share its response. Any other tool call
+        invalidates the cache for that server.
 
         Args:
             server_url: The MCP server URL
@@ -192,12 +289,116 @@ class ContextEngineClient:
         Raises:
             ToolCallError: If the tool call fails
         """
-        client = await self._get_client()
+        if tool_name not in self.READ_ONLY_TOOLS:
+            self._bump_generation(server_url)
+            return self._unwrap(await self._post(server_url, self._request(tool_name, arguments)), tool_name)
+
+        key = (server_url, tool_name, json.dumps(arguments, sort_keys=True, default=str))
+        cached = self._cache.get(key)
+        if cached is not _MISSING:
+            return copy.deepcopy(cached)
+
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                self._post(server_url, self._request(tool_name, arguments))
+            )
+            self._in_flight[key] = future
+            generation = self._generations.get(server_url, 0)
+            future.add_done_callback(
+                lambda done: self._on_read_done(key, done, generation)
+            )
+        else:
+            self._deduplicated += 1
+
+        # Shielded so one cancelled caller does not cancel the shared request
+        return copy.deepcopy(self._unwrap(await asyncio.shield(future), tool_name))
+
+    async def _call_mcp_batch(
+        self,
+        server_url: str,
+        calls: list[tuple[str, dict]]
+    ) -> list[Any]:
+        """
+        Call several MCP tools in one JSON-RPC batch request.
+
+        Servers that reject batches (a non-batch reply such as a JSON-RPC
+        -32600 error, or a 4xx response) get one request per call instead,
+        made concurrently; the server is remembered so later batches skip
+        the try.
+
+        Args:
+            server_url: The MCP server URL
+            calls: (tool_name, arguments) pairs
 
-        # MCP tool call request format
-        request_body = {
+        Returns:
+            One entry per call, in order: the tool result, or the
+            ContextEngineError for that call
+        """
+        if len(calls) <= 1 or server_url in self._batch_unsupported:
+            return await asyncio.gather(
+                *(self._call_mcp_tool(server_url, name, arguments) for name, arguments in calls),
+                return_exceptions=True
+            )
+
+        if any(name not in self.READ_ONLY_TOOLS for name, _ in calls):
+            self._bump_generation(server_url)
+
+        requests = [self._request(name, arguments) for name, arguments in calls]
+        self._batch_requests += 1
+        try:
+            responses = await self._post(server_url, requests)
+        except ContextEngineError as e:
+            if not self._rejects_batch(e):
+                return [e] * len(calls)
+            responses = None
+
+        if not isinstance(responses, list) or self._is_invalid_request(responses):
+            logger.info(f"{server_url} does not accept JSON-RPC batches; sending calls individually")
+            self._batch_unsupported.add(server_url)
+            return await self._call_mcp_batch(server_url, calls)
+
+        by_id = {response.get("id"): response for response in responses if isinstance(response, dict)}
+        results = []
+        for request in requests:
+            response = by_id.get(request["id"])
+            if response is None:
+                results.append(ToolCallError(f"No response to request {request['id']} in batch"))
+            elif "error" in response:
+                results.append(ToolCallError(f"MCP error: {response['error']}"))
+            else:
+                results.append(response.get("result", {}))
+        return results
+
+    @staticmethod
+    def _rejects_batch(error: ContextEngineError) -> bool:
+        """Check if a failed batch POST means the server doesn't take batches.
+
+        Client errors other than auth, timeout and rate limiting, which would
+        fail individual calls just the same, count as a rejection.
+        """
+        cause = error.__cause__
+        if not isinstance(cause, httpx.HTTPStatusError):
+            return False
+        status = cause.response.status_code
+        return 400 <= status < 500 and status not in (401, 403, 408, 429)
+
+    @staticmethod
+    def _is_invalid_request(responses: list) -> bool:
+        """Check for a batch answered only by JSON-RPC "Invalid Request" (-32600) errors."""
+        return bool(responses) and all(
+            isinstance(response, dict)
+            and response.get("id") is None
+            and isinstance(response.get("error"), dict)
+            and response["error"].get("code") == -32600
+            for response in responses
+        )
+
+    def _request(self, tool_name: str, arguments: dict) -> dict:
+        """Build an MCP tool call request."""
+        return {
             "jsonrpc": "2.0",
-            "id": 1,
+            "id": next(self._request_ids),
             "method": "tools/call",
             "params": {
                 "name": tool_name,
@@ -205,31 +406,71 @@ class ContextEngineClient:
             }
         }
 
+    async def _post(self, server_url: str, body: Any) -> Any:
+        """POST a JSON-RPC request or batch and return the decoded response."""
+        client = await self._get_client()
+        label = body["params"]["name"] if isinstance(body, dict) else f"batch of {len(body)}"
+        self._requests += 1
+
         try:
             response = await client.post(
                 server_url,
-                json=request_body,
+                json=body,
                 headers={"Content-Type": "application/json"}
             )
             response.raise_for_status()
-
-            result = response.json()
-
-            if "error" in result:
-                raise ToolCallError(f"MCP error: {result['error']}")
-
-            return result.get("result", {})
+            return response.json()
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error calling {tool_name}: {e}")
+            logger.error(f"HTTP error calling {label}: {e}")
             raise ToolCallError(f"HTTP error: {e}") from e
         except httpx.RequestError as e:
-            logger.error(f"Request error calling {tool_name}: {e}")
+            logger.error(f"Request error calling {label}: {e}")
             raise ConnectionError(f"Connection error: {e}") from e
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON response from {tool_name}: {e}")
+            logger.error(f"Invalid JSON response from {label}: {e}")
             raise ToolCallError(f"Invalid response: {e}") from e
 
+    @staticmethod
+    def _unwrap(response: Any, tool_name: str) -> Any:
+        """Get the result of a single JSON-RPC response."""
+        if not isinstance(response, dict):
+            raise ToolCallError(f"Invalid response to {tool_name}: {response!r}")
+        if "error" in response:
+            raise ToolCallError(f"MCP error: {response['error']}")
+        return response.get("result", {})
+
+    def _on_read_done(self, key: tuple, future: asyncio.Future, generation: int):
+        """Cache a finished read unless a write to its server started meanwhile."""
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if future.cancelled() or future.exception() is not None:
+            return
+        response = future.result()
+        if (
+            isinstance(response, dict) and "error" not in response
+            and self._generations.get(key[0], 0) == generation
+        ):
+            self._cache.put(key, response.get("result", {}))
+
+    def _bump_generation(self, server_url: str):
+        self._generations[server_url] = self._generations.get(server_url, 0) + 1
+        self._cache.invalidate(server_url)
+
+    def get_stats(self) -> dict:
+        """Get request, batching and cache statistics."""
+        return {
+            "requests": self._requests,
+            "batch_requests": self._batch_requests,
+            "deduplicated": self._deduplicated,
+            "in_flight": len(self._in_flight),
+            "cache_size": len(self._cache),
+            "cache_hits": self._cache.hits,
+            "cache_misses": self._cache.misses,
+            "http2": HTTP2_AVAILABLE,
+            "batch_unsupported": sorted(self._batch_unsupported)
+        }
+
     # =========================================================================
     # Memory Operations (Memory Server)
     # =========================================================================
@@ -251,19 +492,22 @@ class ContextEngineClient:
         Returns:
             Storage confirmation with ID
         """
-        metadata = metadata or {}
-        metadata["stored_at"] = datetime.utcnow().isoformat()
-
         return await self._call_mcp_tool(
             self.memory_url,
             "store",
-            {
-                "information": information,
-                "metadata": json.dumps(metadata),
-                "collection": collection
-            }
+            self._store_arguments(information, metadata, collection)
         )
 
+    @staticmethod
+    def _store_arguments(information: str, metadata: Optional[dict], collection: str) -> dict:
+        metadata = metadata or {}
+        metadata["stored_at"] = datetime.utcnow().isoformat()
+        return {
+            "information": information,
+            "metadata": json.dumps(metadata),
+            "collection": collection
+        }
+
     async def find_memories(
         self,
         query: str,
@@ -413,17 +657,19 @@ class ContextEngineClient:
         """
         results = {"memory": [], "code": []}
 
-        if include_memory:
+        async def search(kind: str, search_fn):
             try:
-                results["memory"] = await self.find_memories(query, limit=limit)
+                results[kind] = await search_fn(query, limit=limit)
             except ContextEngineError as e:
-                logger.warning(f"Memory search failed: {e}")
+                logger.warning(f"{kind.title()} search failed: {e}")
 
+        # The two servers are independent, so query them concurrently
+        searches = []
+        if include_memory:
+            searches.append(search("memory", self.find_memories))
         if include_code:
-            try:
-                results["code"] = await self.search_code(query, limit=limit)
-            except ContextEngineError as e:
-                logger.warning(f"Code search failed: {e}")
+            searches.append(search("code", self.search_code))
+        await asyncio.gather(*searches)
 
         return results
 
@@ -503,6 +749,47 @@ class ContextEngineClient:
         Returns:
             Storage confirmation
         """
+        information, metadata = self._action_memory(
+            action_type, goal_id, success, duration_ms, context, details
+        )
+
+        return await self.store_memory(
+            information=information,
+            metadata=metadata,
+            collection=self.COLLECTION_LEARNING
+        )
+
+    async def store_actions(self, actions: list[dict]) -> list[Any]:
+        """
+        Store several action outcomes in one batch request.
+
+        Used by the Learning Engine to flush its write-behind buffer.
+
+        Args:
+            actions: Keyword arguments for store_action, one dict per action
+
+        Returns:
+            One entry per action, in order: the storage confirmation, or the
+            ContextEngineError raised for that action
+        """
+        calls = [
+            ("store", self._store_arguments(
+                *self._action_memory(**action), self.COLLECTION_LEARNING
+            ))
+            for action in actions
+        ]
+        return await self._call_mcp_batch(self.memory_url, calls)
+
+    @staticmethod
+    def _action_memory(
+        action_type: str,
+        goal_id: str,
+        success: bool,
+        duration_ms: int,
+        context: str,
+        details: Optional[dict] = None
+    ) -> tuple[str, dict]:
+        """Build the memory text and metadata for an action outcome."""
         information = f"{action_type} action for goal '{goal_id}': {context}"
 
         metadata = {
@@ -513,12 +800,7 @@ class ContextEngineClient:
             "timestamp": datetime.utcnow().isoformat(),
             **(details or {})
         }
-
-        return await self.store_memory(
-            information=information,
-            metadata=metadata,
-            collection=self.COLLECTION_LEARNING
-        )
+        return information, metadata
 
     async def get_action_confidence(
         self,
@@ -30,6 +30,7 @@ Usage:
 
 from __future__ import annotations
 
+import contextvars
 import logging
 import threading
 import uuid
@@ -40,6 +41,8 @@ from typing import TYPE_CHECKING, Any
 
 from langchain_core.tools import tool
 
+from ag3nt_agent.request_context import get_session_id, set_session_id
+
 logger = logging.getLogger(__name__)
 
 
@@ -776,18 +779,19 @@ def reset_session_manager() -> None:
 # =============================================================================
 
 
-# Thread-local storage for session ID context
-_thread_local = threading.local()
-
+def set_current_session_id(session_id: str) -> contextvars.Token:
+    """Set the current session ID for the calling context.
 
-def set_current_session_id(session_id: str) -> None:
-    """Set the current session ID for the calling thread."""
-    _thread_local.session_id = session_id
+    Prefer ``request_context.request_context(session_id)``, which restores the
+    previous session when the turn ends. Otherwise pass the returned token to
+    ``request_context.reset``.
+    """
+    return set_session_id(session_id)
 
 
 def get_current_session_id() -> str:
-    """Get the current session ID for the calling thread."""
-    return getattr(_thread_local, "session_id", "default")
+    """Get the session ID of the turn this call belongs to."""
+    return get_session_id()
 
 
 @tool
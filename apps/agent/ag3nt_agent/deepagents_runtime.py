@@ -84,6 +84,8 @@ from __future__ import annotations
 import logging
 import os
 import re
+import threading
+import time
 from pathlib import Path
 from typing import Any, Literal
 
@@ -94,12 +96,15 @@ from langchain_core.tools import tool
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.types import Command
 
+from ag3nt_agent.agent_pool import get_agent_pool
 from ag3nt_agent.context_summarization import (
     create_summarization_middleware,
     get_default_summarization_config,
 )
 from ag3nt_agent.interactive_tools import get_interactive_tools
 from ag3nt_agent.planning_middleware import PlanningMiddleware
+from ag3nt_agent.prompt_layout import PromptLayoutMiddleware
+from ag3nt_agent.request_context import request_context
 from ag3nt_agent.shell_middleware import ShellMiddleware
 from ag3nt_agent.skill_trigger_middleware import SkillTriggerMiddleware
 
@@ -165,6 +170,11 @@ _pending_interrupt_ids: dict[str, list[str]] = {}
 # Agent pool for pre-warmed instances (optional feature)
 _use_agent_pool: bool = os.environ.get("AG3NT_USE_AGENT_POOL", "false").lower() == "true"
 
+# Conversation checkpoints, shared by every agent instance so a session's
+# history survives being served by a different pooled instance
+_checkpointer: Any = None
+_checkpointer_lock = threading.Lock()
+
 # Set up logging for approval events
 logger = logging.getLogger("ag3nt.approval")
 
@@ -552,40 +562,27 @@ def fetch_url(
         - markdown_content: The page content converted to markdown
         - status_code: HTTP status code
         - content_length: Length of the markdown content
+        - cached: Whether the content was served from the local HTTP cache
     """
     try:
-        import requests
-        from markdownify import markdownify
-
-        response = requests.get(
-            url,
-            timeout=timeout,
-            headers={
-                "User-Agent": "Mozilla/5.0 (compatible; AG3NT/1.0; +https://github.com/ag3nt)"
-            },
-        )
-        response.raise_for_status()
+        from ag3nt_agent.web_fetch import get_web_fetcher
 
-        # Convert HTML content to markdown
-        markdown_content = markdownify(response.text)
-
-        # Truncate if too long (100KB limit)
-        max_length = 100_000
-        if len(markdown_content) > max_length:
-            markdown_content = markdown_content[:max_length]
-            markdown_content += f"\n\n... Content truncated at {max_length} characters."
+        # Shared pooled client; fresh or revalidated (304) responses come from
+        # the on-disk cache and bodies are only read up to the size cap.
+        result = get_web_fetcher().fetch(url, timeout=timeout)
 
         return {
             "success": True,
-            "url": str(response.url),
-            "markdown_content": markdown_content,
-            "status_code": response.status_code,
-            "content_length": len(markdown_content),
+            "url": result.url,
+            "markdown_content": result.markdown,
+            "status_code": result.status_code,
+            "content_length": len(result.markdown),
+            "cached": result.from_cache,
         }
     except ImportError as e:
         return {
             "error": f"Missing dependency: {e}",
-            "suggestion": "Install with: pip install requests markdownify",
+            "suggestion": "Install with: pip install httpx markdownify",
         }
     except (OSError, RuntimeError, ValueError) as e:
         return {
@@ -941,8 +938,12 @@ def _build_agent() -> CompiledStateGraph:
     # Note: SqliteSaver doesn't support async methods, and AsyncSqliteSaver
     # requires async context management which is complex for our use case.
     # MemorySaver works reliably for both sync and async agent execution.
-    checkpointer = MemorySaver()
-    logger.info("Using MemorySaver checkpointer")
+    global _checkpointer
+    with _checkpointer_lock:
+        if _checkpointer is None:
+            _checkpointer = MemorySaver()
+            logger.info("Using MemorySaver checkpointer")
+    checkpointer = _checkpointer
 
     # Create shell middleware for command execution
     # Uses ~/.ag3nt/workspace/ as the working directory
@@ -971,7 +972,18 @@ def _build_agent() -> CompiledStateGraph:
         watcher = FileWatcher.get_instance()
         watcher.start(str(workspace_path), debounce_seconds=FILE_WATCHER_DEBOUNCE)
         watcher.on_change(_on_file_change)
+        watcher.on_change(_invalidate_source_cache)
         logger.info("File watcher started for workspace")
+
+        # Parsed skills/memory are shared across sessions. Once the watcher
+        # covers every source root, trust them for a few seconds between
+        # re-stats; otherwise they are re-stat'ed on every lookup.
+        from deepagents.middleware.source_cache import get_source_cache
+        from ag3nt_agent.agent_config import SOURCE_CACHE_REVALIDATE
+
+        watched = [watcher.watch(str(root), recursive=recursive) for root, recursive in _source_cache_roots(repo_root)]
+        if all(watched):
+            get_source_cache().revalidate_interval = SOURCE_CACHE_REVALIDATE
     except ImportError:
         logger.debug("watchdog not installed — file watcher disabled")
 
@@ -1519,7 +1531,13 @@ Implements JWT-based authentication.
     # Note: create_deep_agent already adds TodoListMiddleware internally
     # so we only add AG3NT-specific middleware here to avoid duplicates
     planning_middleware = PlanningMiddleware(yolo_mode=_is_yolo_mode())
-    skill_trigger_middleware = SkillTriggerMiddleware(planning_middleware=planning_middleware)
+    from ag3nt_agent.agent_config import SKILL_TRIGGER_MATCH
+    skill_trigger_middleware = SkillTriggerMiddleware(
+        planning_middleware=planning_middleware,
+        word_boundary=SKILL_TRIGGER_MATCH in ("word", "stem"),
+        stem=SKILL_TRIGGER_MATCH == "stem",
+        revalidate_interval=SOURCE_CACHE_REVALIDATE,
+    )
     middleware_list = [
         planning_middleware,  # Plan mode enforcement (MUST be first)
         shell_middleware,  # Shell execution capability
@@ -1527,6 +1545,9 @@ Implements JWT-based authentication.
     ]
     if path_protection_middleware:
         middleware_list.append(path_protection_middleware)
+    # Stable, cache-friendly prompt layout (MUST be last: it reorders what the
+    # middlewares above appended to the system prompt)
+    middleware_list.append(PromptLayoutMiddleware())
 
     agent = create_deep_agent(
         model=model,
@@ -1549,28 +1570,27 @@ Implements JWT-based authentication.
 def get_agent() -> CompiledStateGraph:
     """Get or create the singleton agent instance.
 
-    If AG3NT_USE_AGENT_POOL=true, this uses the agent pool for pre-warmed
-    instances. Otherwise, returns a singleton agent.
+    If AG3NT_USE_AGENT_POOL=true, this returns a warm instance from the
+    agent pool without keeping it checked out. Otherwise, returns a
+    singleton agent.
 
     For pooled usage, prefer using acquire_agent() and release_agent()
     directly for proper lifecycle management.
     """
     global _agent
     if _use_agent_pool:
-        # Use pool but don't track release - for compatibility
-        from ag3nt_agent.agent_pool import get_agent_pool
-        pool = get_agent_pool()
-        if not pool._initialized:
-            pool.initialize()
-        entry = pool.acquire()
-        return entry.agent
+        agent, entry = acquire_agent()
+        get_agent_pool().release(entry, completed_turn=False)
+        return agent
     else:
         if _agent is None:
             _agent = _build_agent()
         return _agent
 
 
-def acquire_agent() -> tuple[CompiledStateGraph, Any]:
+def acquire_agent(
+    session_id: str | None = None, timeout: float | None = None
+) -> tuple[CompiledStateGraph, Any]:
     """Acquire an agent from the pool.
 
     Returns a tuple of (agent, pool_entry). The pool_entry must be
@@ -1578,35 +1598,41 @@ def acquire_agent() -> tuple[CompiledStateGraph, Any]:
 
     If pooling is disabled, returns (singleton_agent, None).
 
+    Args:
+        session_id: Session of the turn; it is served by the same warm
+            instance as its previous turn whenever that instance is idle.
+        timeout: Seconds to wait for an idle instance (pool default if None).
+
     Usage:
-        agent, entry = acquire_agent()
+        agent, entry = acquire_agent(session_id)
         try:
-            result = await run_turn_with_agent(agent, ...)
+            result = agent.invoke(...)
         finally:
             release_agent(entry)
     """
     if _use_agent_pool:
-        from ag3nt_agent.agent_pool import get_agent_pool
         pool = get_agent_pool()
         if not pool._initialized:
             pool.initialize()
-        entry = pool.acquire()
+        entry = pool.acquire(session_id, timeout)
         return entry.agent, entry
     else:
         return get_agent(), None
 
 
-async def acquire_agent_async() -> tuple[CompiledStateGraph, Any]:
+async def acquire_agent_async(
+    session_id: str | None = None, timeout: float | None = None
+) -> tuple[CompiledStateGraph, Any]:
     """Acquire an agent from the pool asynchronously.
 
-    Same as acquire_agent() but uses async pool initialization.
+    Same as acquire_agent() but uses async pool initialization and never
+    blocks the event loop while waiting for an idle instance.
     """
     if _use_agent_pool:
-        from ag3nt_agent.agent_pool import get_agent_pool
         pool = get_agent_pool()
         if not pool._initialized:
             await pool.initialize_async()
-        entry = await pool.acquire_async()
+        entry = await pool.acquire_async(session_id, timeout)
         return entry.agent, entry
     else:
         return get_agent(), None
@@ -1620,20 +1646,55 @@ def release_agent(entry: Any) -> None:
                If None (non-pooled mode), this is a no-op.
     """
     if entry is not None and _use_agent_pool:
-        from ag3nt_agent.agent_pool import get_agent_pool
-        pool = get_agent_pool()
-        pool.release(entry)
+        get_agent_pool().release(entry)
+
+
+_SOURCE_CACHE_FILENAMES = {"SKILL.md", "AGENTS.md", "MEMORY.md"}
+
+
+def _source_cache_roots(repo_root: Path) -> list[tuple[Path, bool]]:
+    """Directories holding cached skill/memory sources, as (path, recursive).
+
+    Mirrors _get_skill_sources() and _get_memory_sources(). The user data
+    directory is watched non-recursively since it also contains the
+    workspace, which the watcher already covers.
+    """
+    roots = [(_get_user_data_path(), False)]
+    for skills_dir in (repo_root / "skills", _get_global_skills_path(), repo_root / ".ag3nt" / "skills"):
+        if skills_dir is not None and skills_dir.is_dir():
+            roots.append((skills_dir, True))
+    return roots
+
+
+def _invalidate_source_cache(file_path: str, event_type: str) -> None:
+    """Drop cached skills/memory when a skill or memory file changes on disk.
+
+    Watcher paths are real filesystem paths while cache keys are backend paths,
+    so any relevant change clears the whole (cheap to rebuild) cache.
+    """
+    path = Path(file_path)
+    if path.name in _SOURCE_CACHE_FILENAMES or (event_type != "modified" and "skills" in path.parts):
+        from deepagents.middleware.source_cache import get_source_cache
+
+        get_source_cache().invalidate()
+
+
+def get_source_cache_stats() -> dict[str, Any]:
+    """Get hit/miss statistics for the shared skills/memory source cache."""
+    from deepagents.middleware.source_cache import get_source_cache
+
+    return get_source_cache().stats()
 
 
 def get_pool_stats() -> dict[str, Any] | None:
-    """Get agent pool statistics.
+    """Get agent pool statistics, including per-instance memory and latency.
 
     Returns None if pooling is disabled.
     """
     if not _use_agent_pool:
         return None
-    from ag3nt_agent.agent_pool import get_agent_pool
-    return get_agent_pool().get_stats().to_dict()
+    pool = get_agent_pool()
+    return {**pool.get_stats().to_dict(), "instances": pool.get_instance_stats()}
 
 
 def _extract_interrupt_info(result: dict[str, Any]) -> dict[str, Any] | None:
@@ -1759,13 +1820,18 @@ def _extract_usage_info(result: dict[str, Any]) -> dict[str, Any]:
         result: The agent's result dictionary containing messages
 
     Returns:
-        Dict with usage info: input_tokens, output_tokens, model, provider
+        Dict with usage info: input_tokens, output_tokens, model, provider,
+        plus cache_read_tokens / cache_creation_tokens / uncached_input_tokens
+        (input_tokens includes both cached and uncached input)
     """
     provider, model_name = _get_model_config()
     usage = {
         "input_tokens": 0,
         "output_tokens": 0,
         "total_tokens": 0,
+        "cache_read_tokens": 0,
+        "cache_creation_tokens": 0,
+        "uncached_input_tokens": 0,
         "model": model_name,
         "provider": provider,
     }
@@ -1778,14 +1844,30 @@ def _extract_usage_info(result: dict[str, Any]) -> dict[str, Any]:
             meta = msg.usage_metadata
             usage["input_tokens"] += meta.get("input_tokens", 0)
             usage["output_tokens"] += meta.get("output_tokens", 0)
+            details = meta.get("input_token_details") or {}
+            usage["cache_read_tokens"] += details.get("cache_read", 0) or 0
+            usage["cache_creation_tokens"] += details.get("cache_creation", 0) or 0
         elif hasattr(msg, "response_metadata") and msg.response_metadata:
             meta = msg.response_metadata
             if "usage" in meta:
                 u = meta["usage"]
-                usage["input_tokens"] += u.get("input_tokens", u.get("prompt_tokens", 0))
+                cache_read = u.get("cache_read_input_tokens", 0) or 0
+                cache_creation = u.get("cache_creation_input_tokens", 0) or 0
+                # Anthropic's raw input_tokens excludes cached tokens; OpenAI's
+                # prompt_tokens already includes prompt_tokens_details.cached_tokens
+                if "input_tokens" in u:
+                    usage["input_tokens"] += u["input_tokens"] + cache_read + cache_creation
+                else:
+                    usage["input_tokens"] += u.get("prompt_tokens", 0)
+                    cache_read += (u.get("prompt_tokens_details") or {}).get("cached_tokens", 0) or 0
                 usage["output_tokens"] += u.get("output_tokens", u.get("completion_tokens", 0))
+                usage["cache_read_tokens"] += cache_read
+                usage["cache_creation_tokens"] += cache_creation
 
     usage["total_tokens"] = usage["input_tokens"] + usage["output_tokens"]
+    usage["uncached_input_tokens"] = max(
+        0, usage["input_tokens"] - usage["cache_read_tokens"] - usage["cache_creation_tokens"]
+    )
     return usage
 
 
@@ -1808,14 +1890,8 @@ def run_turn(
             - events: List of tool call events (if any)
             - interrupt: Dict with interrupt details (if paused for approval)
     """
-    agent = get_agent()
-
-    # Set session context for deep reasoning tool
-    try:
-        from ag3nt_agent.deep_reasoning import set_current_session_id
-        set_current_session_id(session_id)
-    except ImportError:
-        pass
+    # Check out a warm instance for this turn, preferring the session's last one
+    agent, pool_entry = acquire_agent(session_id)
 
     # Build the input messages
     messages = [HumanMessage(content=text)]
@@ -1827,9 +1903,11 @@ def run_turn(
         }
     }
 
-    # Invoke the agent
+    # Invoke the agent with this session as the current request context, so
+    # tools running for this turn (on any thread) see their own session
     try:
-        result = agent.invoke({"messages": messages}, config=config)
+        with request_context(session_id, metadata):
+            result = agent.invoke({"messages": messages}, config=config)
     except Exception as e:
         logger.error(f"Agent error: {e}")
         return {
@@ -1837,6 +1915,8 @@ def run_turn(
             "text": f"Error: {e!s}",
             "events": [],
         }
+    finally:
+        release_agent(pool_entry)
 
     # Check for interrupt (approval required)
     interrupt_info = _extract_interrupt_info(result)
@@ -1888,7 +1968,7 @@ def resume_turn(
             - events: List of tool call events (if any)
             - interrupt: Dict with interrupt details (if another approval is needed)
     """
-    agent = get_agent()
+    agent, pool_entry = acquire_agent(session_id)
 
     # Log the decision
     decision_types = [d.get("type", "unknown") for d in decisions]
@@ -1918,7 +1998,8 @@ def resume_turn(
         resume_input = Command(resume={"decisions": decisions})
 
     try:
-        result = agent.invoke(resume_input, config=config)
+        with request_context(session_id):
+            result = agent.invoke(resume_input, config=config)
     except Exception as e:
         logger.error(f"Resume error: {e}")
         return {
@@ -1926,6 +2007,8 @@ def resume_turn(
             "text": f"Error resuming: {e!s}",
             "events": [],
         }
+    finally:
+        release_agent(pool_entry)
 
     # Check for another interrupt
     interrupt_info = _extract_interrupt_info(result)
@@ -1995,9 +2078,11 @@ class AutonomousRuntime:
             goals_dir: Directory containing goal YAML files.
                        Defaults to config/goals/ in workspace.
         """
+        from ag3nt_agent.agent_config import DECISION_AUDIT_SPILL_PATH, EVENT_LOG_DIR, LEARNING_SPOOL_PATH
         from ag3nt_agent.autonomous.event_bus import EventBus
+        from ag3nt_agent.autonomous.event_log import EventLog
         from ag3nt_agent.autonomous.goal_manager import GoalManager
-        from ag3nt_agent.autonomous.decision_engine import DecisionEngine, DecisionConfig
+        from ag3nt_agent.autonomous.decision_engine import DecisionAuditLog, DecisionEngine, DecisionConfig
         from ag3nt_agent.autonomous.learning_engine import LearningEngine
 
         # Determine goals directory
@@ -2006,16 +2091,19 @@ class AutonomousRuntime:
             goals_dir = Path(workspace) / "config" / "goals"
 
         # Initialize components
-        self.event_bus = EventBus()
+        self.event_bus = EventBus(event_log=EventLog(EVENT_LOG_DIR) if EVENT_LOG_DIR else None)
         self.goal_manager = GoalManager(config_dir=goals_dir if goals_dir.exists() else None)
-        self.learning_engine = LearningEngine()
+        self.learning_engine = LearningEngine(spool_path=LEARNING_SPOOL_PATH or None)
         self.decision_engine = DecisionEngine(
             learning_engine=self.learning_engine,
             config=DecisionConfig()
         )
+        # Full spill batches are written in a worker thread, not from record()
+        self.decision_log = DecisionAuditLog(spill_path=DECISION_AUDIT_SPILL_PATH or None, auto_flush=False)
+        self._decision_flush = None  # asyncio.Task writing a spill batch
 
         # Subscribe to event bus
-        self.event_bus.subscribe(self._handle_event)
+        self.event_bus.subscribe(self._handle_event, name="autonomous_runtime")
 
         self._running = False
         logger.info("Autonomous runtime initialized")
@@ -2025,14 +2113,21 @@ class AutonomousRuntime:
         if self._running:
             return
         await self.event_bus.start()
+        await self.learning_engine.start()
         self._running = True
         logger.info("Autonomous runtime started")
 
     async def stop(self) -> None:
         """Stop the autonomous runtime."""
+        import asyncio
+
         if not self._running:
             return
         await self.event_bus.stop()
+        await self.learning_engine.stop()
+        if self._decision_flush is not None:
+            await self._decision_flush
+        await asyncio.to_thread(self.decision_log.flush)
         self._running = False
         logger.info("Autonomous runtime stopped")
 
@@ -2083,12 +2178,21 @@ class AutonomousRuntime:
         for goal in matching_goals:
             await self._process_goal(goal, event)
 
+    def _record_decision(self, decision) -> None:
+        """Add a decision to the audit log, spilling full batches off the loop."""
+        import asyncio
+
+        self.decision_log.record(decision)
+        if self.decision_log.needs_flush() and (self._decision_flush is None or self._decision_flush.done()):
+            self._decision_flush = asyncio.create_task(asyncio.to_thread(self.decision_log.flush))
+
     async def _process_goal(self, goal, event) -> None:
         """Process a single goal for an event."""
         from ag3nt_agent.autonomous.decision_engine import DecisionType
 
         # Get decision from decision engine
         decision = await self.decision_engine.evaluate(goal, event)
+        self._record_decision(decision)
 
         logger.info(
             f"Decision for goal '{goal.name}': {decision.decision_type.value} "
@@ -2097,12 +2201,15 @@ class AutonomousRuntime:
 
         if decision.decision_type == DecisionType.ACT:
             # Execute autonomously
+            started = time.monotonic()
             success = await self._execute_goal(goal, event)
             self.decision_engine.record_outcome(goal.id, success)
-            await self.learning_engine.record_outcome(
+            await self.learning_engine.record_action(
                 action_type=goal.action.type.value,
+                goal_id=goal.id,
                 context=f"Goal: {goal.name}",
-                success=success
+                success=success,
+                duration_ms=int((time.monotonic() - started) * 1000)
             )
         elif decision.decision_type == DecisionType.ASK:
             # Queue for human approval (integrate with HITL)
@@ -2180,6 +2287,7 @@ class AutonomousRuntime:
             "running": self._running,
             "event_bus": self.event_bus.get_metrics(),
             "goals": self.goal_manager.get_status(),
+            "decisions": self.decision_log.get_stats(),
             "learning": self.learning_engine.get_stats() if hasattr(self.learning_engine, "get_stats") else {}
         }
 
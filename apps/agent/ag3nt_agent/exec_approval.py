@@ -22,7 +22,6 @@ from __future__ import annotations
 
 import logging
 import os
-import re
 import shlex
 import shutil
 import threading
@@ -30,6 +29,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal
 
+from ag3nt_agent.shell_policy import RuleSet, base_command, get_decision_cache, parse_command
+
 logger = logging.getLogger("ag3nt.exec_approval")
 
 
@@ -149,12 +150,11 @@ class SafeBinDetector:
 
 
 class ShellPipelineAnalyzer:
-    """Analyze shell command pipelines and chains."""
+    """Analyze shell command pipelines and chains.
 
-    # Operators that chain commands
-    _CHAIN_OPS = re.compile(r"\s*(?:&&|\|\||;)\s*")
-    # Pipe operator
-    _PIPE_OP = re.compile(r"\s*\|\s*")
+    Thin wrapper over ``shell_policy.parse_command``, which parses each
+    command once and memoizes the result.
+    """
 
     @classmethod
     def analyze(cls, command: str) -> list[str]:
@@ -166,16 +166,7 @@ class ShellPipelineAnalyzer:
         Returns:
             List of individual commands in the pipeline/chain
         """
-        # First split on chain operators (&&, ||, ;)
-        chain_parts = cls._CHAIN_OPS.split(command)
-
-        # Then split each part on pipes
-        all_commands: list[str] = []
-        for part in chain_parts:
-            pipe_parts = cls._PIPE_OP.split(part.strip())
-            all_commands.extend(p.strip() for p in pipe_parts if p.strip())
-
-        return all_commands
+        return [segment.text for segment in parse_command(command).segments]
 
     @classmethod
     def has_chains(cls, command: str) -> bool:
@@ -187,7 +178,7 @@ class ShellPipelineAnalyzer:
         Returns:
             True if command contains &&, ||, or ;
         """
-        return bool(cls._CHAIN_OPS.search(command))
+        return parse_command(command).has_chains
 
     @classmethod
     def extract_base_command(cls, command: str) -> str:
@@ -201,26 +192,7 @@ class ShellPipelineAnalyzer:
         Returns:
             The base command/binary name
         """
-        parts = command.strip().split()
-        if not parts:
-            return ""
-
-        cmd = parts[0]
-
-        # Handle env prefix: `env VAR=val command`
-        if cmd == "env" and len(parts) > 1:
-            for part in parts[1:]:
-                if "=" not in part:
-                    cmd = part
-                    break
-
-        # Handle path: /usr/bin/ls -> ls
-        if "/" in cmd:
-            cmd = cmd.rsplit("/", 1)[-1]
-        if "\\" in cmd:
-            cmd = cmd.rsplit("\\", 1)[-1]
-
-        return cmd
+        return base_command(command.split())
 
 
 class ExecApprovalEvaluator:
@@ -244,11 +216,14 @@ class ExecApprovalEvaluator:
         self._ask_mode = ask_mode
         self._safe_detector = SafeBinDetector()
         self._allowlist_patterns: list[str] = []
-        self._deny_patterns: list[tuple[re.Pattern, str]] = [
-            (re.compile(p, re.IGNORECASE), reason)
-            for p, reason in DENY_PATTERNS
-        ]
+        self._deny_rules = RuleSet(DENY_PATTERNS)
         self._load_config()
+        # Everything a decision depends on besides ask mode, command and PATH
+        self._policy_key = (
+            tuple(self._allowlist_patterns),
+            frozenset(self._safe_detector._safe),
+            self._deny_rules.key,
+        )
 
     @classmethod
     def get_instance(cls) -> ExecApprovalEvaluator:
@@ -293,9 +268,7 @@ class ExecApprovalEvaluator:
                     if isinstance(item, dict):
                         pattern = item.get("pattern", "")
                         reason = item.get("reason", "Custom deny pattern")
-                        self._deny_patterns.append(
-                            (re.compile(pattern, re.IGNORECASE), reason)
-                        )
+                        self._deny_rules.add(pattern, reason)
 
         except ImportError:
             logger.debug("PyYAML not installed, using defaults")
@@ -324,12 +297,23 @@ class ExecApprovalEvaluator:
         if not command or not command.strip():
             return ExecApprovalResult("deny", "Empty command")
 
+        cache = get_decision_cache()
+        key = ("exec", self._ask_mode, self._policy_key, os.environ.get("PATH", ""), command)
+        result = cache.get(key)
+        if result is None:
+            result = self._evaluate(command)
+            cache.put(key, result)
+        return result
+
+    def _evaluate(self, command: str) -> ExecApprovalResult:
+        """Run the decision steps for ``evaluate`` (uncached)."""
         # Step 1: Check deny patterns
-        for pattern, reason in self._deny_patterns:
-            if pattern.search(command):
-                return ExecApprovalResult(
-                    "deny", reason, matched_rule=f"deny:{pattern.pattern}"
-                )
+        hit = self._deny_rules.first_match(command)
+        if hit:
+            pattern, reason = hit
+            return ExecApprovalResult(
+                "deny", reason, matched_rule=f"deny:{pattern.pattern}"
+            )
 
         # Step 2: Ask mode overrides
         if self._ask_mode == "never":
@@ -349,12 +333,13 @@ class ExecApprovalEvaluator:
             )
 
         # Step 4: Analyze pipeline
-        commands = ShellPipelineAnalyzer.analyze(command)
+        segments = parse_command(command).segments
 
         # For chained commands, require approval if any component is unsafe
         all_safe = True
-        for cmd_part in commands:
-            base_cmd = ShellPipelineAnalyzer.extract_base_command(cmd_part)
+        for segment in segments:
+            cmd_part = segment.text
+            base_cmd = segment.base
 
             # Check version flags
             if self._safe_detector.check_version_flag(cmd_part):
@@ -396,7 +381,11 @@ class ExecApprovalEvaluator:
         """
         import fnmatch
 
+        if not self._allowlist_patterns:
+            return False
+
         base_cmd = ShellPipelineAnalyzer.extract_base_command(command)
+        resolved = shutil.which(base_cmd) if base_cmd else None
 
         for pattern in self._allowlist_patterns:
             # Try matching against base command name
@@ -404,7 +393,6 @@ class ExecApprovalEvaluator:
                 return True
 
             # Try matching against resolved path
-            resolved = shutil.which(base_cmd)
             if resolved and fnmatch.fnmatch(resolved, pattern):
                 return True
 
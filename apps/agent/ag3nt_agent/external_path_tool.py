@@ -67,8 +67,10 @@ def request_external_access(
     # after the user approves via the HITL flow.
     # When this tool is executed (post-approval), we record the approval.
 
-    # Get session ID from context (will be set by middleware)
-    session_id = os.environ.get("AG3NT_CURRENT_SESSION", "default")
+    # Get session ID of the current turn
+    from ag3nt_agent.request_context import get_session_id
+
+    session_id = get_session_id(os.environ.get("AG3NT_CURRENT_SESSION", "default"))
 
     # Record the approval (this is called after HITL approval)
     protection.record_approval(session_id, abs_path, approved=True)
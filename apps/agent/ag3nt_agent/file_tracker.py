@@ -12,6 +12,9 @@ Usage:
     # ... later ...
     tracker.assert_fresh("session-1", "/path/to/file.py")  # raises if file changed on disk
     tracker.record_write("session-1", "/path/to/file.py")
+
+    # Inside a turn, pass None to use the turn's session (see request_context)
+    tracker.record_read(None, "/path/to/file.py")
 """
 
 from __future__ import annotations
@@ -27,6 +30,15 @@ from typing import Iterator
 logger = logging.getLogger("ag3nt.file_tracker")
 
 
+def _resolve_session(session_id: str | None) -> str:
+    """Return *session_id*, or the session of the current turn when None."""
+    if session_id is not None:
+        return session_id
+    from ag3nt_agent.request_context import get_session_id
+
+    return get_session_id()
+
+
 class FileNotReadError(Exception):
     """Raised when an edit is attempted on a file that was never read in the session."""
 
@@ -73,13 +85,15 @@ class FileTracker:
                     logger.debug("FileTracker singleton created")
         return cls._instance
 
-    def record_read(self, session_id: str, file_path: str) -> None:
+    def record_read(self, session_id: str | None, file_path: str) -> None:
         """Record that the agent read a file, storing its current mtime.
 
         Args:
-            session_id: The current session identifier.
+            session_id: The current session identifier, or None for the
+                session of the current turn.
             file_path: Absolute path to the file that was read.
         """
+        session_id = _resolve_session(session_id)
         file_path = os.path.normpath(file_path)
         mtime = os.path.getmtime(file_path)
         now = time.time()
@@ -98,13 +112,15 @@ class FileTracker:
             mtime,
         )
 
-    def record_write(self, session_id: str, file_path: str) -> None:
+    def record_write(self, session_id: str | None, file_path: str) -> None:
         """Record that the agent wrote/edited a file, updating the stored mtime.
 
         Args:
-            session_id: The current session identifier.
+            session_id: The current session identifier, or None for the
+                session of the current turn.
             file_path: Absolute path to the file that was written.
         """
+        session_id = _resolve_session(session_id)
         file_path = os.path.normpath(file_path)
         mtime = os.path.getmtime(file_path)
         now = time.time()
@@ -130,20 +146,22 @@ class FileTracker:
             mtime,
         )
 
-    def assert_fresh(self, session_id: str, file_path: str) -> None:
+    def assert_fresh(self, session_id: str | None, file_path: str) -> None:
         """Assert that a file has not been modified externally since last read.
 
         Must be called before editing a file. Raises if the file was never read
         in this session or if it has been modified on disk since the last read.
 
         Args:
-            session_id: The current session identifier.
+            session_id: The current session identifier, or None for the
+                session of the current turn.
             file_path: Absolute path to the file to check.
 
         Raises:
             FileNotReadError: If the file was never read in this session.
             StaleFileError: If the file was modified externally since last read.
         """
+        session_id = _resolve_session(session_id)
         file_path = os.path.normpath(file_path)
 
         session_files = self._tracking.get(session_id)
@@ -169,33 +187,37 @@ class FileTracker:
             file_path,
         )
 
-    def is_fresh(self, session_id: str, file_path: str) -> bool:
+    def is_fresh(self, session_id: str | None, file_path: str) -> bool:
         """Check whether a file is fresh without raising exceptions.
 
         Args:
-            session_id: The current session identifier.
+            session_id: The current session identifier, or None for the
+                session of the current turn.
             file_path: Absolute path to the file to check.
 
         Returns:
             True if the file has been read and has not been modified externally
             since the last read; False otherwise.
         """
+        session_id = _resolve_session(session_id)
         try:
             self.assert_fresh(session_id, file_path)
             return True
         except (FileNotReadError, StaleFileError):
             return False
 
-    def invalidate(self, session_id: str, file_path: str) -> None:
+    def invalidate(self, session_id: str | None, file_path: str) -> None:
         """Remove tracking for a specific file in a session.
 
         Useful when a file watcher detects an external change and the cached
         record should be discarded.
 
         Args:
-            session_id: The current session identifier.
+            session_id: The current session identifier, or None for the
+                session of the current turn.
             file_path: Absolute path to the file to invalidate.
         """
+        session_id = _resolve_session(session_id)
         file_path = os.path.normpath(file_path)
         session_files = self._tracking.get(session_id)
         if session_files is not None and file_path in session_files:
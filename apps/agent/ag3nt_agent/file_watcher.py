@@ -71,6 +71,7 @@ class FileWatcher:
         self._debounce_seconds = _DEFAULT_DEBOUNCE_SECONDS
         self._workspace_path: str | None = None
         self._gitignore_spec: object | None = None  # pathspec.PathSpec
+        self._extra_watches: dict[tuple[str, bool], object] = {}
 
     # ------------------------------------------------------------------
     # Singleton
@@ -126,8 +127,33 @@ class FileWatcher:
         self._observer.start()
         logger.info("FileWatcher started for %s", workspace_path)
 
+    def watch(self, path: str, recursive: bool = True) -> bool:
+        """Also watch *path*, e.g. a directory outside the workspace.
+
+        Events go to the same callbacks. Extra watches last until ``stop()``.
+
+        Returns:
+            True if *path* is now watched, False if the watcher is not
+            running or the path cannot be watched.
+        """
+        if self._observer is None:
+            return False
+        key = (os.path.normpath(path), recursive)
+        if key in self._extra_watches:
+            return True
+        try:
+            self._extra_watches[key] = self._observer.schedule(
+                _WatchHandler(self), key[0], recursive=recursive
+            )
+        except Exception as e:  # missing directory, inotify watch limit, ...
+            logger.warning("Cannot watch %s: %s", path, e)
+            return False
+        logger.debug("FileWatcher also watching %s", key[0])
+        return True
+
     def stop(self) -> None:
         """Stop watching and cancel pending debounce timers."""
+        self._extra_watches.clear()
         if self._observer is not None:
             self._observer.stop()
             self._observer.join(timeout=5)
@@ -212,11 +238,11 @@ class FileWatcher:
             if part in _IGNORE_DIRS:
                 return True
 
-        # Check gitignore patterns
+        # Check gitignore patterns (they only apply inside the workspace)
         if self._gitignore_spec is not None and self._workspace_path is not None:
             try:
                 rel = os.path.relpath(file_path, self._workspace_path)
-                if self._gitignore_spec.match_file(rel):  # type: ignore[union-attr]
+                if not rel.startswith(os.pardir) and self._gitignore_spec.match_file(rel):  # type: ignore[union-attr]
                     return True
             except (ValueError, TypeError):
                 pass
@@ -20,6 +20,14 @@ Strategy cascade
    only 50 % of middle lines need to match.  Falls back to
    ``BlockAnchorReplacer`` for short old_strings (< 5 lines).
 
+All line-based strategies share one :class:`_Document` per
+:func:`fuzzy_replace` call: the content is split once, stripped and
+whitespace-normalised lines are computed once, line start offsets come from
+a prefix-sum table, and a line -> positions index lets strategies jump
+straight to candidate windows instead of sliding over every line.  Fuzzy
+line similarity is prefiltered with length bounds and
+``real_quick_ratio``/``quick_ratio`` before the full ``ratio`` is computed.
+
 Only stdlib dependencies are used: ``difflib``, ``re``, ``textwrap``,
 ``logging``.
 """
@@ -44,6 +52,50 @@ def _similarity(a: str, b: str) -> float:
     return difflib.SequenceMatcher(None, a, b).ratio()
 
 
+class _SimilarLine:
+    """Reusable ``_similarity(line, target) >= threshold`` predicate.
+
+    ``2 * min(len) / (len(a) + len(b))`` is an upper bound on the ratio, so
+    lines of very different length are rejected without touching difflib;
+    ``real_quick_ratio`` and ``quick_ratio`` are successively tighter upper
+    bounds checked before the full ``ratio``.  The target is installed as
+    ``seq2`` once so difflib's index of it is built a single time, and
+    verdicts are memoised because code repeats lines heavily.
+    """
+
+    __slots__ = ("target", "threshold", "_matcher", "_memo")
+
+    def __init__(self, target: str, threshold: float) -> None:
+        self.target = target
+        self.threshold = threshold
+        self._matcher: difflib.SequenceMatcher | None = None
+        self._memo: dict[str, bool] = {}
+
+    def __call__(self, line: str) -> bool:
+        if line == self.target:
+            return True
+        verdict = self._memo.get(line)
+        if verdict is None:
+            verdict = self._compute(line)
+            self._memo[line] = verdict
+        return verdict
+
+    def _compute(self, line: str) -> bool:
+        threshold = self.threshold
+        total = len(line) + len(self.target)
+        if 2.0 * min(len(line), len(self.target)) < threshold * total:
+            return False
+        if self._matcher is None:
+            self._matcher = difflib.SequenceMatcher(None, "", self.target)
+        matcher = self._matcher
+        matcher.set_seq1(line)
+        return (
+            matcher.real_quick_ratio() >= threshold
+            and matcher.quick_ratio() >= threshold
+            and matcher.ratio() >= threshold
+        )
+
+
 def _splitlines_keep(text: str) -> list[str]:
     """Split *text* into lines **without** stripping the trailing newline.
 
@@ -58,6 +110,93 @@ def _splitlines_keep(text: str) -> list[str]:
     return lines
 
 
+# ---------------------------------------------------------------------------
+# Document model
+# ---------------------------------------------------------------------------
+
+
+_WS_RE = re.compile(r"[ \t]+")
+
+
+def _normalise_line(line: str) -> str:
+    """Collapse intra-line whitespace runs to single spaces and strip."""
+    return _WS_RE.sub(" ", line).strip()
+
+
+class _Document:
+    """Line model of the content, built once per call and shared by strategies.
+
+    ``offsets[i]`` is the character offset of ``lines[i]``; it has one extra
+    trailing entry so the span of any line window is two table lookups.
+    Per-line derived views and their line -> positions indexes are built
+    lazily on first use.
+    """
+
+    def __init__(self, content: str) -> None:
+        self.content = content
+        self.lines = _splitlines_keep(content)
+        offsets = [0]
+        total = 0
+        for line in self.lines:
+            total += len(line) + 1  # +1 for '\n'
+            offsets.append(total)
+        self.offsets = offsets
+        self._stripped: list[str] | None = None
+        self._normalised: list[str] | None = None
+        self._stripped_index: dict[str, list[int]] | None = None
+        self._normalised_index: dict[str, list[int]] | None = None
+
+    @property
+    def stripped(self) -> list[str]:
+        if self._stripped is None:
+            self._stripped = [line.strip() for line in self.lines]
+        return self._stripped
+
+    @property
+    def normalised(self) -> list[str]:
+        if self._normalised is None:
+            self._normalised = [_normalise_line(line) for line in self.lines]
+        return self._normalised
+
+    @staticmethod
+    def _build_index(lines: list[str]) -> dict[str, list[int]]:
+        index: dict[str, list[int]] = {}
+        for i, line in enumerate(lines):
+            index.setdefault(line, []).append(i)
+        return index
+
+    def stripped_positions(self, line: str) -> list[int]:
+        """Indices of lines whose stripped text equals *line*."""
+        if self._stripped_index is None:
+            self._stripped_index = self._build_index(self.stripped)
+        return self._stripped_index.get(line, [])
+
+    def normalised_positions(self, line: str) -> list[int]:
+        """Indices of lines whose whitespace-normalised text equals *line*."""
+        if self._normalised_index is None:
+            self._normalised_index = self._build_index(self.normalised)
+        return self._normalised_index.get(line, [])
+
+    def span(self, start_line: int, window: int) -> tuple[int, int]:
+        """Character span of ``"\n".join(lines[start_line:start_line + window])``."""
+        return self.offsets[start_line], self.offsets[start_line + window] - 1
+
+    def window_starts(self, candidates: list[int], window: int) -> list[int]:
+        """Filter anchor *candidates* to those where a full window fits."""
+        limit = len(self.lines) - window
+        return [i for i in candidates if i <= limit]
+
+
+def _match_windows(
+    doc_lines: list[str],
+    starts: list[int],
+    target: list[str],
+) -> list[int]:
+    """Return the *starts* at which ``doc_lines`` equals *target* exactly."""
+    window = len(target)
+    return [i for i in starts if doc_lines[i : i + window] == target]
+
+
 # ---------------------------------------------------------------------------
 # Base class
 # ---------------------------------------------------------------------------
@@ -69,10 +208,18 @@ class _Replacer(ABC):
     name: str
 
     @abstractmethod
-    def find(self, content: str, old_string: str) -> list[tuple[int, int]]:
+    def find(
+        self,
+        content: str,
+        old_string: str,
+        doc: _Document | None = None,
+    ) -> list[tuple[int, int]]:
         """Return a list of ``(start, end)`` byte-offset pairs in *content*
         where *old_string* matches according to this strategy.
 
+        *doc* is the shared line model of *content*; strategies build their
+        own when called directly without one.
+
         An empty list means "no match found".
         """
 
@@ -88,7 +235,6 @@ class _Replacer(ABC):
         The default implementation replaces spans back-to-front so that
         earlier offsets are not invalidated.
         """
-        parts = list(content)  # character list -- simple but correct
         # Work backwards so indices stay valid.
         for start, end in sorted(matches, reverse=True):
             content = content[:start] + new_string + content[end:]
@@ -105,7 +251,12 @@ class ExactReplacer(_Replacer):
 
     name = "ExactReplacer"
 
-    def find(self, content: str, old_string: str) -> list[tuple[int, int]]:
+    def find(
+        self,
+        content: str,
+        old_string: str,
+        doc: _Document | None = None,
+    ) -> list[tuple[int, int]]:
         spans: list[tuple[int, int]] = []
         start = 0
         while True:
@@ -129,39 +280,23 @@ class LineTrimmedReplacer(_Replacer):
 
     name = "LineTrimmedReplacer"
 
-    def find(self, content: str, old_string: str) -> list[tuple[int, int]]:
-        content_lines = _splitlines_keep(content)
+    def find(
+        self,
+        content: str,
+        old_string: str,
+        doc: _Document | None = None,
+    ) -> list[tuple[int, int]]:
         old_lines = _splitlines_keep(old_string)
 
         # Avoid degenerate single-empty-line matches.
         if all(l.strip() == "" for l in old_lines):
             return []
 
+        doc = doc or _Document(content)
         trimmed_old = [l.strip() for l in old_lines]
-        trimmed_content = [l.strip() for l in content_lines]
-
-        spans: list[tuple[int, int]] = []
         window = len(trimmed_old)
-
-        for i in range(len(trimmed_content) - window + 1):
-            if trimmed_content[i : i + window] == trimmed_old:
-                # Map line indices back to character offsets.
-                start_offset = sum(len(content_lines[j]) + 1 for j in range(i))
-                end_offset = sum(len(content_lines[j]) + 1 for j in range(i + window))
-                # The last line group might overshoot by 1 if the content
-                # does not end with a newline.
-                # Adjust: the span should cover exactly the original substring
-                # that those lines represent when joined with "\n".
-                matched_text = "\n".join(content_lines[i : i + window])
-                start_offset = content.find(matched_text, max(start_offset - window * 20, 0))
-                if start_offset == -1:
-                    # Fallback: recalculate by summing lengths.
-                    start_offset = sum(len(content_lines[j]) + 1 for j in range(i))
-                    end_offset = start_offset + len(matched_text)
-                else:
-                    end_offset = start_offset + len(matched_text)
-                spans.append((start_offset, end_offset))
-        return spans
+        starts = doc.window_starts(doc.stripped_positions(trimmed_old[0]), window)
+        return [doc.span(i, window) for i in _match_windows(doc.stripped, starts, trimmed_old)]
 
 
 # ---------------------------------------------------------------------------
@@ -176,40 +311,28 @@ class WhitespaceNormalizedReplacer(_Replacer):
 
     name = "WhitespaceNormalizedReplacer"
 
-    _WS_RE = re.compile(r"[ \t]+")
+    _WS_RE = _WS_RE
 
     def _normalise(self, text: str) -> str:
         """Collapse intra-line whitespace runs to single spaces and strip
         each line.  Newlines are preserved."""
-        lines = text.split("\n")
-        return "\n".join(self._WS_RE.sub(" ", line).strip() for line in lines)
+        return "\n".join(_normalise_line(line) for line in text.split("\n"))
 
-    def find(self, content: str, old_string: str) -> list[tuple[int, int]]:
+    def find(
+        self,
+        content: str,
+        old_string: str,
+        doc: _Document | None = None,
+    ) -> list[tuple[int, int]]:
         norm_old = self._normalise(old_string)
         if not norm_old.strip():
             return []
 
-        content_lines = content.split("\n")
-        norm_content_lines = [self._WS_RE.sub(" ", l).strip() for l in content_lines]
+        doc = doc or _Document(content)
         old_norm_lines = norm_old.split("\n")
-
         window = len(old_norm_lines)
-        spans: list[tuple[int, int]] = []
-
-        for i in range(len(norm_content_lines) - window + 1):
-            if norm_content_lines[i : i + window] == old_norm_lines:
-                matched_text = "\n".join(content_lines[i : i + window])
-                offset = self._find_line_offset(content_lines, i)
-                spans.append((offset, offset + len(matched_text)))
-        return spans
-
-    @staticmethod
-    def _find_line_offset(lines: list[str], line_idx: int) -> int:
-        """Return the character offset of the start of ``lines[line_idx]``."""
-        offset = 0
-        for j in range(line_idx):
-            offset += len(lines[j]) + 1  # +1 for the '\n'
-        return offset
+        starts = doc.window_starts(doc.normalised_positions(old_norm_lines[0]), window)
+        return [doc.span(i, window) for i in _match_windows(doc.normalised, starts, old_norm_lines)]
 
 
 # ---------------------------------------------------------------------------
@@ -225,7 +348,12 @@ class IndentationFlexibleReplacer(_Replacer):
 
     name = "IndentationFlexibleReplacer"
 
-    def find(self, content: str, old_string: str) -> list[tuple[int, int]]:
+    def find(
+        self,
+        content: str,
+        old_string: str,
+        doc: _Document | None = None,
+    ) -> list[tuple[int, int]]:
         dedented = textwrap.dedent(old_string)
         dedented_lines = dedented.split("\n")
 
@@ -233,19 +361,11 @@ class IndentationFlexibleReplacer(_Replacer):
         if dedented == old_string or all(l.strip() == "" for l in dedented_lines):
             return []
 
+        doc = doc or _Document(content)
         stripped_old = [l.strip() for l in dedented_lines]
-        content_lines = content.split("\n")
-        stripped_content = [l.strip() for l in content_lines]
-
         window = len(stripped_old)
-        spans: list[tuple[int, int]] = []
-
-        for i in range(len(stripped_content) - window + 1):
-            if stripped_content[i : i + window] == stripped_old:
-                matched_text = "\n".join(content_lines[i : i + window])
-                offset = self._line_offset(content_lines, i)
-                spans.append((offset, offset + len(matched_text)))
-        return spans
+        starts = doc.window_starts(doc.stripped_positions(stripped_old[0]), window)
+        return [doc.span(i, window) for i in _match_windows(doc.stripped, starts, stripped_old)]
 
     def apply(
         self,
@@ -290,13 +410,6 @@ class IndentationFlexibleReplacer(_Replacer):
             content = content[:start] + replacement + content[end:]
         return content
 
-    @staticmethod
-    def _line_offset(lines: list[str], idx: int) -> int:
-        offset = 0
-        for j in range(idx):
-            offset += len(lines[j]) + 1
-        return offset
-
 
 # ---------------------------------------------------------------------------
 # Strategy 5 -- Block-anchor with fuzzy middle
@@ -313,7 +426,12 @@ class BlockAnchorReplacer(_Replacer):
 
     SIMILARITY_THRESHOLD = 0.8
 
-    def find(self, content: str, old_string: str) -> list[tuple[int, int]]:
+    def find(
+        self,
+        content: str,
+        old_string: str,
+        doc: _Document | None = None,
+    ) -> list[tuple[int, int]]:
         old_lines = old_string.split("\n")
         if len(old_lines) < 2:
             return []  # Need at least 2 lines for anchors.
@@ -325,29 +443,21 @@ class BlockAnchorReplacer(_Replacer):
         if not first_trimmed or not last_trimmed:
             return []
 
-        content_lines = content.split("\n")
+        doc = doc or _Document(content)
+        stripped = doc.stripped
+        middle = [
+            _SimilarLine(l.strip(), self.SIMILARITY_THRESHOLD) for l in old_lines[1:-1]
+        ]
         window = len(old_lines)
         spans: list[tuple[int, int]] = []
 
-        for i in range(len(content_lines) - window + 1):
-            # Check anchors.
-            if content_lines[i].strip() != first_trimmed:
-                continue
-            if content_lines[i + window - 1].strip() != last_trimmed:
+        for i in doc.window_starts(doc.stripped_positions(first_trimmed), window):
+            # Check closing anchor.
+            if stripped[i + window - 1] != last_trimmed:
                 continue
             # Check middle lines.
-            ok = True
-            for j in range(1, window - 1):
-                sim = _similarity(
-                    content_lines[i + j].strip(), old_lines[j].strip()
-                )
-                if sim < self.SIMILARITY_THRESHOLD:
-                    ok = False
-                    break
-            if ok:
-                matched = "\n".join(content_lines[i : i + window])
-                offset = _line_offset(content_lines, i)
-                spans.append((offset, offset + len(matched)))
+            if all(similar(stripped[i + 1 + j]) for j, similar in enumerate(middle)):
+                spans.append(doc.span(i, window))
         return spans
 
 
@@ -372,12 +482,17 @@ class ContextAwareReplacer(_Replacer):
     def __init__(self) -> None:
         self._block_fallback = BlockAnchorReplacer()
 
-    def find(self, content: str, old_string: str) -> list[tuple[int, int]]:
+    def find(
+        self,
+        content: str,
+        old_string: str,
+        doc: _Document | None = None,
+    ) -> list[tuple[int, int]]:
         old_lines = old_string.split("\n")
+        doc = doc or _Document(content)
         if len(old_lines) < self.MIN_LINES:
-            return self._block_fallback.find(content, old_string)
+            return self._block_fallback.find(content, old_string, doc)
 
-        content_lines = content.split("\n")
         window = len(old_lines)
 
         head_old = [l.strip() for l in old_lines[: self.ANCHOR_LINES]]
@@ -388,56 +503,41 @@ class ContextAwareReplacer(_Replacer):
         if any(not l for l in head_old) or any(not l for l in tail_old):
             return []
 
+        stripped = doc.stripped
+        middle = [_SimilarLine(l, self.SIMILARITY_THRESHOLD) for l in middle_old]
+        # Enough middle lines must match for the window to be accepted.
+        required = self.MIDDLE_MATCH_RATIO * len(middle_old)
         spans: list[tuple[int, int]] = []
 
-        for i in range(len(content_lines) - window + 1):
-            # Check head anchors.
-            head_ok = all(
-                content_lines[i + k].strip() == head_old[k]
-                for k in range(self.ANCHOR_LINES)
-            )
-            if not head_ok:
+        for i in doc.window_starts(doc.stripped_positions(head_old[0]), window):
+            # Check head and tail anchors.
+            if stripped[i : i + self.ANCHOR_LINES] != head_old:
                 continue
-
-            # Check tail anchors.
-            tail_ok = all(
-                content_lines[i + window - self.ANCHOR_LINES + k].strip() == tail_old[k]
-                for k in range(self.ANCHOR_LINES)
-            )
-            if not tail_ok:
+            if stripped[i + window - self.ANCHOR_LINES : i + window] != tail_old:
                 continue
 
-            # Check middle lines -- at least 50 % must match.
+            # Check middle lines -- at least 50 % must match.  Stop as soon
+            # as the outcome is decided either way.
             if middle_old:
-                match_count = 0
-                for j, mid in enumerate(middle_old):
-                    c_idx = i + self.ANCHOR_LINES + j
-                    sim = _similarity(content_lines[c_idx].strip(), mid)
-                    if sim >= self.SIMILARITY_THRESHOLD:
-                        match_count += 1
-                if match_count / len(middle_old) < self.MIDDLE_MATCH_RATIO:
+                base = i + self.ANCHOR_LINES
+                matched = 0
+                remaining = len(middle_old)
+                for j, similar in enumerate(middle):
+                    remaining -= 1
+                    if similar(stripped[base + j]):
+                        matched += 1
+                        if matched >= required:
+                            break
+                    elif matched + remaining < required:
+                        break
+                if matched < required:
                     continue
 
-            matched = "\n".join(content_lines[i : i + window])
-            offset = _line_offset(content_lines, i)
-            spans.append((offset, offset + len(matched)))
+            spans.append(doc.span(i, window))
 
         return spans
 
 
-# ---------------------------------------------------------------------------
-# Shared helper for line-offset computation
-# ---------------------------------------------------------------------------
-
-
-def _line_offset(lines: list[str], idx: int) -> int:
-    """Return the character offset of ``lines[idx]`` within the joined text."""
-    offset = 0
-    for j in range(idx):
-        offset += len(lines[j]) + 1  # +1 for '\n'
-    return offset
-
-
 # ---------------------------------------------------------------------------
 # Strategy cascade
 # ---------------------------------------------------------------------------
@@ -486,8 +586,11 @@ def fuzzy_replace(
         An error message on failure (no match, or ambiguous match when
         ``replace_all`` is ``False``).
     """
+    doc: _Document | None = None
     for strategy in _STRATEGIES:
-        matches = strategy.find(content, old_string)
+        if strategy.name != "ExactReplacer" and doc is None:
+            doc = _Document(content)
+        matches = strategy.find(content, old_string, doc)
         if not matches:
             continue
 
@@ -15,6 +15,13 @@ Supported linters:
 - Shell: shellcheck
 - Custom: user-configured via ~/.ag3nt/lint.yaml
 
+Lint runs are scheduled through a ``LintScheduler``: concurrent requests
+for the same linter are coalesced into a single invocation (ruff, eslint and
+friends accept many paths) and results are cached by
+``(linter, config hash, content hash)`` so re-linting unchanged content never
+spawns a process. Linters that ship a daemon (``eslint_d``) are used in
+daemon mode when the daemon binary is on PATH.
+
 Usage:
     from ag3nt_agent.lint_runner import LintRunner
 
@@ -26,11 +33,13 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
 import shutil
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, Literal
 
@@ -83,6 +92,10 @@ class LinterConfig:
     args_before_file: list[str] = field(default_factory=list)  # Extra args before file path
     working_dir_mode: str = "file"  # "file" = file's parent, "workspace" = workspace root
     timeout: float = 30.0
+    batchable: bool = False  # Accepts many paths in one invocation with per-file output
+    config_files: list[str] = field(default_factory=list)  # Files that affect results (hashed)
+    daemon_binary: str | None = None  # Daemon variant binary (e.g. eslint_d)
+    daemon_command: list[str] | None = None  # Command used when the daemon is available
 
 
 # Built-in linter configurations
@@ -95,6 +108,8 @@ LINTERS: list[LinterConfig] = [
         parse_output="ruff",
         check_binary="ruff",
         install_hint="pip install ruff",
+        batchable=True,
+        config_files=["pyproject.toml", "ruff.toml", ".ruff.toml"],
     ),
     # Python — flake8 (fallback)
     LinterConfig(
@@ -104,6 +119,8 @@ LINTERS: list[LinterConfig] = [
         parse_output="flake8",
         check_binary="flake8",
         install_hint="pip install flake8",
+        batchable=True,
+        config_files=["setup.cfg", "tox.ini", ".flake8"],
     ),
     # TypeScript/JavaScript — eslint
     LinterConfig(
@@ -114,6 +131,14 @@ LINTERS: list[LinterConfig] = [
         check_binary="npx",
         install_hint="npm install eslint",
         working_dir_mode="workspace",
+        batchable=True,
+        config_files=[
+            "eslint.config.js", "eslint.config.mjs", "eslint.config.cjs",
+            ".eslintrc", ".eslintrc.js", ".eslintrc.cjs", ".eslintrc.json",
+            ".eslintrc.yml", ".eslintrc.yaml", "package.json",
+        ],
+        daemon_binary="eslint_d",
+        daemon_command=["eslint_d", "--format=json", "--no-error-on-unmatched-pattern"],
     ),
     # Go — golangci-lint
     LinterConfig(
@@ -151,6 +176,8 @@ LINTERS: list[LinterConfig] = [
         parse_output="shellcheck",
         check_binary="shellcheck",
         install_hint="apt install shellcheck / brew install shellcheck",
+        batchable=True,
+        config_files=[".shellcheckrc"],
     ),
     # CSS/SCSS — stylelint
     LinterConfig(
@@ -161,6 +188,11 @@ LINTERS: list[LinterConfig] = [
         check_binary="npx",
         install_hint="npm install stylelint",
         working_dir_mode="workspace",
+        batchable=True,
+        config_files=[
+            ".stylelintrc", ".stylelintrc.json", ".stylelintrc.yml",
+            "stylelint.config.js", "stylelint.config.mjs", "package.json",
+        ],
     ),
     # Ruby — rubocop
     LinterConfig(
@@ -170,6 +202,8 @@ LINTERS: list[LinterConfig] = [
         parse_output="rubocop",
         check_binary="rubocop",
         install_hint="gem install rubocop",
+        batchable=True,
+        config_files=[".rubocop.yml"],
     ),
     # PHP — phpstan
     LinterConfig(
@@ -436,6 +470,156 @@ PARSERS: dict[str, Any] = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+_DEFAULT_CACHE_ENTRIES = 2048
+_DEFAULT_BATCH_WINDOW = 0.05  # seconds to wait for more files before spawning
+_MAX_BATCH_FILES = 200  # keep command lines well below OS argv limits
+
+
+def _hash_file(file_path: str) -> str | None:
+    """Return the sha256 of a file's bytes, or None if it can't be read."""
+    try:
+        with open(file_path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _resolve(path: str) -> str:
+    """Absolute path with symlinks resolved, for matching linter output."""
+    try:
+        return str(Path(path).resolve())
+    except OSError:
+        return os.path.normpath(os.path.abspath(path))
+
+
+@dataclass
+class LintStats:
+    """Counters describing scheduler and cache effectiveness."""
+
+    cache_hits: int = 0
+    cache_misses: int = 0
+    invocations: int = 0
+    files_linted: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.cache_hits + self.cache_misses
+        return self.cache_hits / total if total > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "cacheHits": self.cache_hits,
+            "cacheMisses": self.cache_misses,
+            "hitRate": self.hit_rate,
+            "invocations": self.invocations,
+            "filesLinted": self.files_linted,
+        }
+
+
+class LintCache:
+    """LRU cache of lint issues keyed by (linter, config hash, content hash).
+
+    Issues are stored without regard to the path they were produced for;
+    ``get`` rewrites ``LintIssue.file`` to the requesting path so identical
+    content at two locations shares one entry.
+    """
+
+    def __init__(self, max_entries: int = _DEFAULT_CACHE_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str, str], list[LintIssue]] = OrderedDict()
+
+    def get(self, key: tuple[str, str, str], file_path: str) -> list[LintIssue] | None:
+        issues = self._entries.get(key)
+        if issues is None:
+            return None
+        self._entries.move_to_end(key)
+        return [replace(issue, file=file_path) for issue in issues]
+
+    def put(self, key: tuple[str, str, str], issues: list[LintIssue]) -> None:
+        self._entries[key] = list(issues)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# ---------------------------------------------------------------------------
+# Scheduler
+# ---------------------------------------------------------------------------
+
+class LintScheduler:
+    """Coalesces pending lint requests into one invocation per linter.
+
+    The first request for a ``(linter, cwd)`` pair opens a short batching
+    window; every file requested for the same pair before the window closes
+    is linted by the same process. A batch is flushed early once it reaches
+    ``_MAX_BATCH_FILES`` paths.
+    """
+
+    def __init__(self, runner: LintRunner, batch_window: float = _DEFAULT_BATCH_WINDOW) -> None:
+        self._runner = runner
+        self._batch_window = batch_window
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: dict[tuple[str, str], dict[str, list[asyncio.Future[LintResult]]]] = {}
+        self._linters: dict[tuple[str, str], LinterConfig] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, file_path: str, linter: LinterConfig, cwd: str) -> LintResult:
+        """Queue a file for linting and wait for its share of the batch result."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Pending futures belong to a previous (closed) loop; drop them.
+            self._loop = loop
+            self._pending = {}
+
+        key = (linter.name, cwd)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = {}
+            self._linters[key] = linter
+            loop.call_later(self._batch_window, self._flush, key)
+
+        future: asyncio.Future[LintResult] = loop.create_future()
+        batch.setdefault(file_path, []).append(future)
+        if len(batch) >= _MAX_BATCH_FILES:
+            self._flush(key)
+        return await future
+
+    def _flush(self, key: tuple[str, str]) -> None:
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._run_batch(key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(
+        self,
+        key: tuple[str, str],
+        batch: dict[str, list[asyncio.Future[LintResult]]],
+    ) -> None:
+        linter = self._linters[key]
+        paths = list(batch)
+        try:
+            results = await self._runner._run_linter_batch(paths, linter, key[1])
+        except Exception as e:
+            logger.error(f"Batched {linter.name} run failed: {e}")
+            results = {p: LintResult(file=p, linter=linter.name, error=str(e)) for p in paths}
+        for path, futures in batch.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(results[path])
+
+
 # ---------------------------------------------------------------------------
 # Lint Runner
 # ---------------------------------------------------------------------------
@@ -444,15 +628,28 @@ class LintRunner:
     """Runs linters on files and returns structured diagnostics.
 
     Singleton. Auto-detects the appropriate linter based on file extension.
-    Prefers the first available linter for each language.
+    Prefers the first available linter for each language. Results are cached
+    by content and linter configuration, and batchable linters are invoked
+    once per batch of concurrently requested files.
     """
 
     _instance: LintRunner | None = None
 
-    def __init__(self, workspace_root: str | None = None) -> None:
+    def __init__(
+        self,
+        workspace_root: str | None = None,
+        *,
+        batch_window: float = _DEFAULT_BATCH_WINDOW,
+        cache_entries: int = _DEFAULT_CACHE_ENTRIES,
+        use_daemons: bool = True,
+    ) -> None:
         self._workspace_root = workspace_root or os.getcwd()
         self._available_cache: dict[str, bool] = {}
         self._custom_commands: dict[str, list[str]] = {}
+        self._use_daemons = use_daemons
+        self._cache = LintCache(cache_entries)
+        self._scheduler = LintScheduler(self, batch_window)
+        self._stats = LintStats()
         self._load_custom_config()
 
     @classmethod
@@ -508,9 +705,56 @@ class LintRunner:
         ext = Path(file_path).suffix.lower()
         return [l for l in LINTERS if ext in l.extensions and self._is_available(l.check_binary)]
 
+    def get_stats(self) -> LintStats:
+        """Return cache and invocation counters."""
+        return self._stats
+
+    def clear_cache(self) -> None:
+        """Drop all cached lint results."""
+        self._cache.clear()
+
+    def _command_for(self, linter: LinterConfig) -> list[str]:
+        """Base command for a linter, preferring its daemon when installed."""
+        if (
+            self._use_daemons
+            and linter.daemon_command
+            and linter.daemon_binary
+            and self._is_available(linter.daemon_binary)
+        ):
+            return list(linter.daemon_command)
+        return list(linter.command)
+
+    def _working_dir(self, linter: LinterConfig, file_path: str) -> str:
+        if linter.working_dir_mode == "workspace":
+            return self._workspace_root
+        return str(Path(file_path).parent)
+
+    def _config_hash(self, linter: LinterConfig, file_path: str) -> str:
+        """Hash the linter command plus every config file that could apply.
+
+        Config files are looked up from the file's directory to the root and
+        fingerprinted by mtime and size, so editing ``pyproject.toml`` or an
+        eslint config invalidates cached results without reading them.
+        """
+        parts = [" ".join(self._command_for(linter) + linter.args_before_file)]
+        directory = Path(file_path).parent
+        for d in (directory, *directory.parents):
+            for name in linter.config_files:
+                candidate = d / name
+                try:
+                    st = candidate.stat()
+                except OSError:
+                    continue
+                parts.append(f"{candidate}:{st.st_mtime_ns}:{st.st_size}")
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()[:16]
+
     async def lint_file(self, file_path: str) -> LintResult:
         """Run the appropriate linter on a file.
 
+        Unchanged content is served from the result cache; otherwise the
+        file is queued with the scheduler and may share a linter process
+        with other files requested at the same time.
+
         Args:
             file_path: Absolute path to the file to lint.
 
@@ -528,80 +772,140 @@ class LintRunner:
         if linter is None:
             return LintResult(file=file_path, linter="none", error=None)
 
-        return await self._run_linter(file_path, linter)
+        content_hash = _hash_file(file_path)
+        key = None
+        if content_hash is not None:
+            key = (linter.name, self._config_hash(linter, file_path), content_hash)
+            cached = self._cache.get(key, file_path)
+            if cached is not None:
+                self._stats.cache_hits += 1
+                return LintResult(file=file_path, issues=cached, linter=linter.name)
+        self._stats.cache_misses += 1
+
+        if linter.batchable:
+            cwd = self._working_dir(linter, file_path)
+            result = await self._scheduler.submit(file_path, linter, cwd)
+        else:
+            result = await self._run_linter(file_path, linter)
+
+        # Only cache clean runs, and only if the file didn't change under us.
+        if key is not None and result.error is None and _hash_file(file_path) == content_hash:
+            self._cache.put(key, result.issues)
+        return result
 
     async def lint_files(self, file_paths: list[str]) -> list[LintResult]:
-        """Run linters on multiple files concurrently."""
+        """Run linters on multiple files concurrently.
+
+        Requests are issued together so the scheduler coalesces them into
+        one invocation per linter.
+        """
         tasks = [self.lint_file(fp) for fp in file_paths]
         return await asyncio.gather(*tasks)
 
-    async def _run_linter(self, file_path: str, linter: LinterConfig) -> LintResult:
-        """Execute a linter and parse its output."""
-        cmd = list(linter.command) + linter.args_before_file + [file_path]
-
-        if linter.working_dir_mode == "workspace":
-            cwd = self._workspace_root
-        else:
-            cwd = str(Path(file_path).parent)
-
-        logger.debug(f"Running {linter.name}: {' '.join(cmd)} in {cwd}")
+    async def _exec(self, cmd: list[str], cwd: str, timeout: float) -> tuple[int | None, str, str]:
+        """Run a command and return (returncode, stdout, stderr).
 
+        Raises:
+            asyncio.TimeoutError: If the command exceeds ``timeout``.
+        """
+        self._stats.invocations += 1
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+        )
         try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=cwd,
+            stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                proc.communicate(),
+                timeout=timeout,
             )
-            try:
-                stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                    proc.communicate(),
-                    timeout=linter.timeout,
-                )
-            except asyncio.TimeoutError:
-                proc.kill()
-                return LintResult(
-                    file=file_path,
-                    linter=linter.name,
-                    error=f"Linter timed out after {linter.timeout}s",
-                )
+        except asyncio.TimeoutError:
+            proc.kill()
+            raise
+        return (
+            proc.returncode,
+            stdout_bytes.decode("utf-8", errors="replace"),
+            stderr_bytes.decode("utf-8", errors="replace"),
+        )
 
-            stdout = stdout_bytes.decode("utf-8", errors="replace")
-            stderr = stderr_bytes.decode("utf-8", errors="replace")
-
-            # Many linters use non-zero exit code to indicate issues found
-            # (not necessarily an error in the linter itself)
-            parser = PARSERS.get(linter.parse_output, _parse_line_output)
-            issues = parser(stdout, file_path)
-
-            # If no issues parsed from stdout, try stderr
-            if not issues and stderr.strip() and proc.returncode not in (0, 1):
-                return LintResult(
-                    file=file_path,
-                    linter=linter.name,
-                    error=f"Linter error: {stderr[:500]}",
-                )
-
-            return LintResult(
-                file=file_path,
-                issues=issues,
-                linter=linter.name,
-            )
+    async def _run_linter(self, file_path: str, linter: LinterConfig) -> LintResult:
+        """Execute a linter on a single file and parse its output."""
+        cwd = self._working_dir(linter, file_path)
+        results = await self._run_linter_batch([file_path], linter, cwd)
+        return results[file_path]
+
+    async def _run_linter_batch(
+        self,
+        file_paths: list[str],
+        linter: LinterConfig,
+        cwd: str,
+    ) -> dict[str, LintResult]:
+        """Execute a linter once over several files and split results per file."""
+        cmd = self._command_for(linter) + linter.args_before_file + list(file_paths)
+        timeout = linter.timeout * max(1.0, len(file_paths) / 10)
+
+        logger.debug(f"Running {linter.name} on {len(file_paths)} file(s) in {cwd}")
+
+        def _all(**kwargs: Any) -> dict[str, LintResult]:
+            return {fp: LintResult(file=fp, linter=linter.name, **kwargs) for fp in file_paths}
 
+        try:
+            returncode, stdout, stderr = await self._exec(cmd, cwd, timeout)
+        except asyncio.TimeoutError:
+            return _all(error=f"Linter timed out after {timeout:g}s")
         except FileNotFoundError:
             self._available_cache[linter.check_binary] = False
-            return LintResult(
-                file=file_path,
-                linter=linter.name,
-                error=f"{linter.name} not found. Install with: {linter.install_hint}",
-            )
+            if linter.daemon_binary:
+                self._available_cache[linter.daemon_binary] = False
+            return _all(error=f"{linter.name} not found. Install with: {linter.install_hint}")
         except Exception as e:
             logger.error(f"Linter {linter.name} failed: {e}")
-            return LintResult(
-                file=file_path,
-                linter=linter.name,
-                error=str(e),
-            )
+            return _all(error=str(e))
+
+        self._stats.files_linted += len(file_paths)
+
+        # Many linters use non-zero exit code to indicate issues found
+        # (not necessarily an error in the linter itself)
+        parser = PARSERS.get(linter.parse_output, _parse_line_output)
+        issues = parser(stdout, file_paths[0])
+
+        # If no issues parsed from stdout, try stderr
+        if not issues and stderr.strip() and returncode not in (0, 1):
+            return _all(error=f"Linter error: {stderr[:500]}")
+
+        if len(file_paths) == 1:
+            return _all(issues=issues)
+
+        # Linters may report relative, absolute or symlink-resolved paths, so
+        # compare fully resolved paths on both sides.
+        requested = {_resolve(fp): fp for fp in file_paths}
+        by_file: dict[str, list[LintIssue]] = {fp: [] for fp in file_paths}
+        for issue in issues:
+            path = requested.get(_resolve(os.path.join(cwd, issue.file)))
+            if path is None:
+                # An issue we can't place means any file could be missing
+                # one; lint them separately rather than report (and cache)
+                # them as clean.
+                logger.debug(f"{linter.name} reported unrequested path {issue.file}; linting files one by one")
+                return await self._run_linter_each(file_paths, linter, cwd)
+            by_file[path].append(issue)
+        return {
+            fp: LintResult(file=fp, issues=by_file[fp], linter=linter.name)
+            for fp in file_paths
+        }
+
+    async def _run_linter_each(
+        self,
+        file_paths: list[str],
+        linter: LinterConfig,
+        cwd: str,
+    ) -> dict[str, LintResult]:
+        """Execute a linter once per file, concurrently."""
+        results = await asyncio.gather(
+            *(self._run_linter_batch([fp], linter, cwd) for fp in file_paths)
+        )
+        return {fp: result[fp] for fp, result in zip(file_paths, results)}
 
     async def _run_custom(self, file_path: str, ext: str) -> LintResult:
         """Run a user-configured custom lint command."""
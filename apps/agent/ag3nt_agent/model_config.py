@@ -55,6 +55,32 @@ def get_model_config() -> tuple[str, str]:
     return provider, model
 
 
+# ---------------------------------------------------------------------------
+# Prompt caching – where explicit ``cache_control`` breakpoints are honoured
+# ---------------------------------------------------------------------------
+# Anthropic (direct, or via OpenRouter) only caches up to explicit block-level
+# breakpoints. OpenAI, Kimi and most OpenRouter models cache stable prompt
+# prefixes automatically, so they only need a stable layout.
+_BREAKPOINT_PROVIDERS: set[str] = {"anthropic"}
+_BREAKPOINT_OPENROUTER_PREFIXES: tuple[str, ...] = ("anthropic/", "google/gemini")
+# Anthropic accepts at most four breakpoints per request.
+MAX_CACHE_BREAKPOINTS = 4
+
+
+def supports_cache_breakpoints(provider: str | None = None, model_name: str | None = None) -> bool:
+    """Return True if the provider/model needs explicit ``cache_control`` breakpoints.
+
+    Defaults to the configured provider and model.
+    """
+    if provider is None or model_name is None:
+        provider, model_name = get_model_config()
+    if provider in _BREAKPOINT_PROVIDERS:
+        return True
+    if provider == "openrouter":
+        return model_name.startswith(_BREAKPOINT_OPENROUTER_PREFIXES)
+    return False
+
+
 def _create_openrouter_model(model_name: str) -> BaseChatModel:
     """Create a ChatOpenAI instance configured for OpenRouter."""
     api_key = os.environ.get("OPENROUTER_API_KEY")
@@ -18,6 +18,8 @@ import threading
 from langchain.agents.middleware.types import AgentMiddleware, AgentState, ModelRequest, ModelResponse
 from deepagents.middleware._utils import append_to_system_message
 
+from ag3nt_agent.prompt_layout import turn_hint
+
 logger = logging.getLogger(__name__)
 
 
@@ -436,7 +438,7 @@ If a validation gate fails, fix the issues before moving to the next task.
         thread_id = self._get_thread_id_from_request(request)
         prompt_text = self._compute_planning_prompt(thread_id)
         if prompt_text:
-            new_sys = append_to_system_message(request.system_message, prompt_text)
+            new_sys = append_to_system_message(request.system_message, turn_hint(prompt_text))
             request = request.override(system_message=new_sys)
         response = handler(request)
         return self._filter_blocked_tools(request, response)
@@ -450,7 +452,7 @@ If a validation gate fails, fix the issues before moving to the next task.
         thread_id = self._get_thread_id_from_request(request)
         prompt_text = self._compute_planning_prompt(thread_id)
         if prompt_text:
-            new_sys = append_to_system_message(request.system_message, prompt_text)
+            new_sys = append_to_system_message(request.system_message, turn_hint(prompt_text))
             request = request.override(system_message=new_sys)
         response = await handler(request)
         return self._filter_blocked_tools(request, response)
@@ -0,0 +1,223 @@
+"""Cache-friendly prompt layout for AG3NT.
+
+Provider prompt caches only reuse an identical prompt *prefix*: Anthropic up to
+explicit ``cache_control`` breakpoints, OpenAI/Kimi automatically. deepagents
+and AG3NT middlewares each append a block to the system message, in middleware
+order, and some of those blocks (plan progress, skill suggestions) change every
+turn — so a different block sits in front of the conversation on every call and
+nothing after it can be served from cache.
+
+``PromptLayoutMiddleware`` runs innermost (last in the middleware list) and
+reassembles each model request as:
+
+1. static core instructions (base prompt, todo/filesystem/subagent guidance)
+2. skills list
+3. memory (AGENTS.md / MEMORY.md)
+4. the conversation
+5. per-turn hints, appended to the final message
+
+Tool schemas are sent ahead of the system prompt by the providers themselves.
+For providers that need explicit breakpoints (see
+``model_config.supports_cache_breakpoints``) it tags the end of (1), the end of
+(3) and the last stable block of (4). Breakpoints already present in earlier
+messages are kept, newest first, only while the request stays within
+``model_config.MAX_CACHE_BREAKPOINTS``.
+
+Middlewares mark per-turn text with :func:`turn_hint` so it can be recognised
+and moved; unmarked blocks are treated as static.
+
+Usage:
+    from ag3nt_agent.prompt_layout import PromptLayoutMiddleware, turn_hint
+
+    text = turn_hint("Current task: 2/5")
+    request = request.override(system_message=append_to_system_message(request.system_message, text))
+    ...
+    middleware_list.append(PromptLayoutMiddleware())  # must be last
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from enum import IntEnum
+from typing import Any
+
+from deepagents.middleware.memory import MEMORY_SYSTEM_PROMPT
+from deepagents.middleware.skills import SKILLS_SYSTEM_PROMPT
+from langchain.agents.middleware.types import (
+    AgentMiddleware,
+    ModelRequest,
+    ModelResponse,
+)
+from langchain_core.messages import AIMessage, SystemMessage
+
+_TURN_HINT_OPEN = "<turn_context>"
+_TURN_HINT_CLOSE = "</turn_context>"
+_SKILLS_MARKER = SKILLS_SYSTEM_PROMPT.strip().splitlines()[0]
+_MEMORY_MARKER = MEMORY_SYSTEM_PROMPT.strip().splitlines()[0]
+_CACHE_CONTROL = {"type": "ephemeral"}
+
+
+class Segment(IntEnum):
+    """System prompt segments, in the order they are laid out."""
+
+    STATIC = 0
+    SKILLS = 1
+    MEMORY = 2
+    TURN = 3
+
+
+def turn_hint(text: str) -> str:
+    """Mark *text* as per-turn context that should be kept out of the cached prefix."""
+    return f"{_TURN_HINT_OPEN}\n{text.strip()}\n{_TURN_HINT_CLOSE}"
+
+
+def classify_block(block: dict[str, Any]) -> Segment:
+    """Return the segment a system content block belongs to."""
+    if block.get("type") != "text":
+        return Segment.STATIC
+    text = block.get("text", "").lstrip()
+    if text.startswith(_TURN_HINT_OPEN):
+        return Segment.TURN
+    if text.startswith(_MEMORY_MARKER):
+        return Segment.MEMORY
+    if text.startswith(_SKILLS_MARKER):
+        return Segment.SKILLS
+    return Segment.STATIC
+
+
+def _strip_cache_control(block: dict[str, Any]) -> dict[str, Any]:
+    if "cache_control" not in block:
+        return block
+    return {k: v for k, v in block.items() if k != "cache_control"}
+
+
+def _tag(block: dict[str, Any], cache_control: dict[str, Any]) -> dict[str, Any]:
+    return {**block, "cache_control": dict(cache_control)}
+
+
+def _tagged_indexes(content: str | list) -> list[int]:
+    if isinstance(content, str):
+        return []
+    return [i for i, b in enumerate(content) if isinstance(b, dict) and "cache_control" in b]
+
+
+def _cap_message_breakpoints(messages: list, limit: int) -> list:
+    """Strip ``cache_control`` from all but the newest *limit* tagged message blocks."""
+    capped = list(messages)
+    for index in range(len(capped) - 1, -1, -1):
+        content = capped[index].content
+        tagged = _tagged_indexes(content)
+        if len(tagged) <= limit:
+            limit -= len(tagged)
+            continue
+        drop = set(tagged[: len(tagged) - max(limit, 0)])
+        content = [_strip_cache_control(b) if i in drop else b for i, b in enumerate(content)]
+        capped[index] = capped[index].model_copy(update={"content": content})
+        limit = 0
+    return capped
+
+
+def _content_blocks(content: str | list) -> list[dict[str, Any]]:
+    if isinstance(content, str):
+        return [{"type": "text", "text": content}] if content else []
+    return [{"type": "text", "text": b} if isinstance(b, str) else _strip_cache_control(b) for b in content]
+
+
+class PromptLayoutMiddleware(AgentMiddleware):
+    """Reorder the prompt into a stable, cacheable prefix plus a per-turn tail.
+
+    Must be the innermost middleware that edits the system message, i.e. the
+    last one in the list passed to ``create_deep_agent``.
+    """
+
+    def __init__(self, *, cache_breakpoints: bool | None = None) -> None:
+        """Initialize the middleware.
+
+        Args:
+            cache_breakpoints: Whether to place ``cache_control`` breakpoints.
+                Defaults to what the configured provider/model supports.
+        """
+        super().__init__()
+        if cache_breakpoints is None:
+            from ag3nt_agent.model_config import supports_cache_breakpoints
+
+            cache_breakpoints = supports_cache_breakpoints()
+        self.cache_breakpoints = cache_breakpoints
+
+    def layout(self, request: ModelRequest) -> ModelRequest:
+        """Return *request* with its system prompt and final message laid out for caching."""
+        if request.system_message is None:
+            return request
+
+        blocks = [_strip_cache_control(b) for b in request.system_message.content_blocks]
+        segments = [classify_block(b) for b in blocks]
+        stable = sorted(
+            (pair for pair in zip(segments, blocks) if pair[0] is not Segment.TURN),
+            key=lambda pair: pair[0],
+        )
+        hints = [b for seg, b in zip(segments, blocks) if seg is Segment.TURN]
+
+        messages = list(request.messages)
+        last = messages[-1] if messages else None
+        if hints and (last is None or isinstance(last, AIMessage)):
+            # Nowhere to put per-turn text after the conversation; keep it last
+            # in the system prompt, after every stable segment.
+            stable.extend((Segment.TURN, b) for b in hints)
+            hints = []
+
+        system_blocks = [b for _, b in stable]
+        if system_blocks:
+            # append_to_system_message separates blocks with a leading blank line;
+            # the new first block does not need it.
+            first = system_blocks[0]
+            if first.get("type") == "text":
+                system_blocks[0] = {**first, "text": first["text"].lstrip("\n")}
+
+        # Reuse the TTL chosen by AnthropicPromptCachingMiddleware, if it ran.
+        cache_control = request.model_settings.get("cache_control") or _CACHE_CONTROL
+        if self.cache_breakpoints and system_blocks:
+            static_end = max((i for i, (seg, _) in enumerate(stable) if seg is Segment.STATIC), default=None)
+            stable_end = max((i for i, (seg, _) in enumerate(stable) if seg is not Segment.TURN), default=None)
+            for i in {static_end, stable_end} - {None}:
+                system_blocks[i] = _tag(system_blocks[i], cache_control)
+
+        if last is not None and not isinstance(last, AIMessage) and (hints or self.cache_breakpoints):
+            tail = _content_blocks(last.content)
+            if self.cache_breakpoints and tail:
+                tail[-1] = _tag(tail[-1], cache_control)
+            tail.extend({"type": "text", "text": h["text"].lstrip("\n")} for h in hints)
+            if tail:
+                messages[-1] = last.model_copy(update={"content": tail})
+
+        if self.cache_breakpoints:
+            from ag3nt_agent.model_config import MAX_CACHE_BREAKPOINTS
+
+            # The message-tail breakpoint is the newest, so it is always kept
+            messages = _cap_message_breakpoints(messages, MAX_CACHE_BREAKPOINTS - len(_tagged_indexes(system_blocks)))
+
+        overrides: dict[str, Any] = {
+            "system_message": SystemMessage(content=system_blocks),
+            "messages": messages,
+        }
+        if self.cache_breakpoints and "cache_control" in request.model_settings:
+            # We placed the message-tail breakpoint ourselves; a second one from
+            # model_settings would land on the per-turn hints.
+            overrides["model_settings"] = {k: v for k, v in request.model_settings.items() if k != "cache_control"}
+        return request.override(**overrides)
+
+    def wrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], ModelResponse],
+    ) -> ModelResponse:
+        """Lay out the prompt before calling the model."""
+        return handler(self.layout(request))
+
+    async def awrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], Awaitable[ModelResponse]],
+    ) -> ModelResponse:
+        """Lay out the prompt before calling the model (async version)."""
+        return await handler(self.layout(request))
+
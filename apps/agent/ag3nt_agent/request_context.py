@@ -0,0 +1,135 @@
+"""Per-turn request context for AG3NT.
+
+Holds the identity of the turn being executed (session ID, turn ID) in a
+``contextvars.ContextVar`` instead of a module global or thread-local, so
+several turns can run concurrently in one worker process without seeing each
+other's session.
+
+Context variables follow the work automatically into asyncio tasks and into
+LangChain/LangGraph tool executors (which copy the caller's context). For
+plain ``ThreadPoolExecutor``/``loop.run_in_executor`` calls, wrap the callable
+with :func:`bind` or submit via :func:`run_in_executor`.
+
+Usage:
+    from ag3nt_agent.request_context import get_session_id, request_context
+
+    with request_context(session_id):
+        agent.invoke(...)
+
+    # In any tool, middleware or helper running for that turn:
+    session_id = get_session_id()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+DEFAULT_SESSION_ID = "default"
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RequestContext:
+    """Identity of the turn currently being executed."""
+
+    session_id: str = DEFAULT_SESSION_ID
+    turn_id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+_current: contextvars.ContextVar[RequestContext | None] = contextvars.ContextVar(
+    "ag3nt_request_context", default=None
+)
+
+
+def get_request_context() -> RequestContext | None:
+    """Return the context of the current turn, or None outside a turn."""
+    return _current.get()
+
+
+def _session_from_runnable_config() -> str | None:
+    """Fall back to the LangGraph ``thread_id`` of the running graph, if any."""
+    try:
+        from langchain_core.runnables.config import var_child_runnable_config
+    except ImportError:
+        return None
+    config = var_child_runnable_config.get() or {}
+    thread_id = (config.get("configurable") or {}).get("thread_id")
+    return str(thread_id) if thread_id else None
+
+
+def get_session_id(default: str = DEFAULT_SESSION_ID) -> str:
+    """Return the session ID of the current turn.
+
+    Looks at the request context first, then at the ``thread_id`` of the
+    LangGraph run the caller is part of, and finally returns *default*.
+    """
+    ctx = _current.get()
+    if ctx is not None:
+        return ctx.session_id
+    return _session_from_runnable_config() or default
+
+
+@contextmanager
+def request_context(
+    session_id: str, metadata: dict[str, Any] | None = None
+) -> Iterator[RequestContext]:
+    """Make *session_id* the current session for the duration of the block."""
+    ctx = RequestContext(session_id=session_id, metadata=dict(metadata or {}))
+    token = _current.set(ctx)
+    try:
+        yield ctx
+    finally:
+        _current.reset(token)
+
+
+def set_session_id(session_id: str) -> contextvars.Token[RequestContext | None]:
+    """Set the current session without a scope; prefer :func:`request_context`.
+
+    Returns the token to pass to :func:`reset` to restore the previous value.
+    """
+    return _current.set(RequestContext(session_id=session_id))
+
+
+def reset(token: contextvars.Token[RequestContext | None]) -> None:
+    """Restore the context that was current before :func:`set_session_id`."""
+    _current.reset(token)
+
+
+def bind(fn: Callable[..., T]) -> Callable[..., T]:
+    """Return *fn* bound to a copy of the caller's context, for use on another thread."""
+    ctx = contextvars.copy_context()
+
+    @functools.wraps(fn)
+    def bound(*args: Any, **kwargs: Any) -> T:
+        # Copy per call: one Context cannot be entered by two threads at once
+        return ctx.copy().run(fn, *args, **kwargs)
+
+    return bound
+
+
+async def run_in_executor(fn: Callable[..., T], *args: Any) -> T:
+    """Like ``loop.run_in_executor(None, fn, *args)`` but keeps the request context."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, bind(fn), *args)
+
+
+__all__ = [
+    "DEFAULT_SESSION_ID",
+    "RequestContext",
+    "bind",
+    "get_request_context",
+    "get_session_id",
+    "request_context",
+    "reset",
+    "run_in_executor",
+    "set_session_id",
+]
@@ -24,9 +24,12 @@ _DEFAULT_SESSION = "default"
 
 
 def _get_session_id() -> str:
-    """Get the current session ID from environment or default."""
+    """Get the session ID of the current turn, falling back to the environment."""
     import os
-    return os.environ.get("AG3NT_SESSION_ID", _DEFAULT_SESSION)
+
+    from ag3nt_agent.request_context import get_session_id
+
+    return get_session_id(os.environ.get("AG3NT_SESSION_ID", _DEFAULT_SESSION))
 
 
 @tool
@@ -0,0 +1,305 @@
+"""Compiled shell command policy for AG3NT.
+
+Shared building blocks for ``shell_security`` and ``exec_approval``:
+
+- ``parse_command``: splits a command once into chain/pipe segments, argv,
+  redirect targets and path-like tokens. Results are memoized, so the exec
+  approval evaluator, the security validator and the path sandbox all reuse
+  one parse of the same command string.
+- ``RuleSet``: an ordered list of ``(regex, reason)`` rules behind one
+  combined alternation. Commands that match no rule (the common case) are
+  rejected with a single regex search; only a hit falls back to the ordered
+  scan, so the reported rule is still the first one in list order.
+- ``DecisionCache``: process-wide LRU of final decisions keyed by
+  ``(policy key, command)``. Re-running the same command (test loops, retries)
+  skips evaluation entirely. The policy key changes whenever the policy does,
+  so stale decisions are never served.
+
+Parsing is deliberately as simple as the analyzers it replaces: operators are
+recognised without regard to quoting, and arguments are whitespace-split.
+
+Usage:
+    from ag3nt_agent.shell_policy import RuleSet, parse_command
+
+    parsed = parse_command("cat log | grep err && echo done")
+    [s.base for s in parsed.segments]  # ['cat', 'grep', 'echo']
+
+    rules = RuleSet([(r"\\bmkfs\\b", "Filesystem format")])
+    rules.first_match("mkfs.ext4 /dev/sda1")  # (re.Pattern, "Filesystem format")
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+_PARSE_CACHE_SIZE = 4096
+_DEFAULT_DECISION_CACHE_SIZE = 4096
+
+CHAIN_OPERATORS = frozenset({"&&", "||", ";"})
+_REDIRECT_RE = re.compile(r"^\d*(?:>>?|<)(.*)$")
+# Numbered/named backreferences would be renumbered inside a combined pattern.
+_BACKREF_RE = re.compile(r"\\\d|\(\?P=")
+
+
+def base_command(argv: tuple[str, ...] | list[str]) -> str:
+    """Return the binary name of a command, skipping ``env VAR=val`` and paths."""
+    if not argv:
+        return ""
+
+    cmd = argv[0]
+
+    # Handle env prefix: `env VAR=val command`
+    if cmd == "env" and len(argv) > 1:
+        for part in argv[1:]:
+            if "=" not in part:
+                cmd = part
+                break
+
+    # Handle path: /usr/bin/ls -> ls
+    if "/" in cmd:
+        cmd = cmd.rsplit("/", 1)[-1]
+    if "\\" in cmd:
+        cmd = cmd.rsplit("\\", 1)[-1]
+
+    return cmd
+
+
+@dataclass(frozen=True)
+class CommandSegment:
+    """One simple command inside a chain or pipeline."""
+
+    text: str
+    argv: tuple[str, ...]
+    base: str
+    operator: str = ""  # Operator joining it to the previous segment
+
+
+@dataclass(frozen=True)
+class ParsedCommand:
+    """A shell command split into segments, tokens and redirects."""
+
+    raw: str
+    segments: tuple[CommandSegment, ...]
+    operators: tuple[str, ...]
+    tokens: tuple[str, ...]
+    redirects: tuple[str, ...]
+
+    @property
+    def has_chains(self) -> bool:
+        """True if the command contains ``&&``, ``||`` or ``;``."""
+        return any(op in CHAIN_OPERATORS for op in self.operators)
+
+    @property
+    def absolute_paths(self) -> tuple[str, ...]:
+        """Tokens and redirect targets that are absolute paths."""
+        return tuple(t for t in (*self.tokens, *self.redirects) if t.startswith("/"))
+
+    @property
+    def traversal_paths(self) -> tuple[str, ...]:
+        """Tokens that contain ``..``."""
+        return tuple(t for t in self.tokens if ".." in t)
+
+
+def _segment(text: str, operator: str) -> CommandSegment:
+    argv = tuple(text.split())
+    return CommandSegment(text=text, argv=argv, base=base_command(argv), operator=operator)
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def parse_command(command: str) -> ParsedCommand:
+    """Parse *command* in a single pass over its characters.
+
+    Args:
+        command: Full shell command string.
+
+    Returns:
+        The parsed command (memoized; treat as read-only).
+    """
+    segments: list[CommandSegment] = []
+    operators: list[str] = []
+    pending_op = ""
+    start = 0
+    i = 0
+    n = len(command)
+    while i < n:
+        ch = command[i]
+        if ch not in "&|;":
+            i += 1
+            continue
+        pair = command[i : i + 2]
+        if pair in ("&&", "||"):
+            op = pair
+        elif ch in "|;":
+            op = ch
+        else:  # A lone `&` (background, `2>&1`) does not split commands
+            i += 1
+            continue
+        text = command[start:i].strip()
+        if text:
+            segments.append(_segment(text, pending_op))
+        operators.append(op)
+        pending_op = op
+        i += len(op)
+        start = i
+    text = command[start:].strip()
+    if text:
+        segments.append(_segment(text, pending_op))
+
+    redirects: list[str] = []
+    for segment in segments:
+        argv = segment.argv
+        for j, token in enumerate(argv):
+            match = _REDIRECT_RE.match(token)
+            if not match:
+                continue
+            target = match.group(1) or (argv[j + 1] if j + 1 < len(argv) else "")
+            if target and not target.startswith("&"):
+                redirects.append(target)
+
+    return ParsedCommand(
+        raw=command,
+        segments=tuple(segments),
+        operators=tuple(operators),
+        tokens=tuple(command.split()),
+        redirects=tuple(redirects),
+    )
+
+
+class RuleSet:
+    """Ordered ``(pattern, reason)`` rules matched through one combined regex.
+
+    Patterns are compiled case-insensitively. ``first_match`` returns the first
+    rule in list order that matches, exactly like scanning the list, but a
+    command that matches nothing costs a single search.
+    """
+
+    def __init__(self, rules: Iterable[tuple[str, str]] = ()) -> None:
+        self._rules: list[tuple[re.Pattern[str], str]] = []
+        self._combined: re.Pattern[str] | None = None
+        self._exact_prefilter = True
+        for pattern, reason in rules:
+            self._rules.append((re.compile(pattern, re.IGNORECASE), reason))
+        self._recompile()
+
+    def _recompile(self) -> None:
+        mergeable = [p.pattern for p, _ in self._rules if not _BACKREF_RE.search(p.pattern)]
+        self._exact_prefilter = len(mergeable) == len(self._rules)
+        self._combined = None
+        if mergeable:
+            try:
+                self._combined = re.compile("|".join(f"(?:{p})" for p in mergeable), re.IGNORECASE)
+            except re.error:  # e.g. inline global flags; fall back to the ordered scan
+                self._exact_prefilter = False
+
+    def add(self, pattern: str, reason: str) -> None:
+        """Append a rule (lowest priority) and rebuild the combined matcher."""
+        self._rules.append((re.compile(pattern, re.IGNORECASE), reason))
+        self._recompile()
+
+    def first_match(self, command: str) -> tuple[re.Pattern[str], str] | None:
+        """Return ``(pattern, reason)`` of the first matching rule, or None."""
+        if not self._rules:
+            return None
+        if self._exact_prefilter and self._combined is not None and not self._combined.search(command):
+            return None
+        for pattern, reason in self._rules:
+            if pattern.search(command):
+                return pattern, reason
+        return None
+
+    @property
+    def key(self) -> tuple[tuple[str, str], ...]:
+        """Hashable identity of the rules, for use in cache keys."""
+        return tuple((p.pattern, reason) for p, reason in self._rules)
+
+    def __iter__(self):
+        return iter(self._rules)
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+
+@lru_cache(maxsize=64)
+def compile_rules(rules: tuple[tuple[str, str], ...]) -> RuleSet:
+    """Return a shared compiled ``RuleSet`` for *rules* (do not ``add`` to it)."""
+    return RuleSet(rules)
+
+
+class DecisionCache:
+    """Thread-safe LRU of policy decisions keyed by ``(policy_key, command)``.
+
+    The same decision object is returned to every caller, so values must be
+    immutable (``ValidationResult`` and ``ExecApprovalResult`` are frozen).
+    """
+
+    def __init__(self, maxsize: int = _DEFAULT_DECISION_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached decision for *key*, or None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a decision, evicting the least recently used one if full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached decision and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return hit/miss counters."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+_decision_cache = DecisionCache()
+
+
+def get_decision_cache() -> DecisionCache:
+    """Return the process-wide decision cache shared by the shell policies."""
+    return _decision_cache
+
+
+__all__ = [
+    "CHAIN_OPERATORS",
+    "CommandSegment",
+    "DecisionCache",
+    "ParsedCommand",
+    "RuleSet",
+    "base_command",
+    "compile_rules",
+    "get_decision_cache",
+    "parse_command",
+]
@@ -12,12 +12,13 @@ This is a defense-in-depth layer. HITL approval remains the primary safety mecha
 from __future__ import annotations
 
 import os
-import re
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Literal
 
+from ag3nt_agent.shell_policy import RuleSet, compile_rules, get_decision_cache, parse_command
+
 
 class SecurityLevel(Enum):
     """Security validation strictness levels."""
@@ -112,36 +113,32 @@ class ShellSecurityValidator:
     """Validates shell commands for security risks.
 
     This validator checks commands against known dangerous patterns
-    and can operate in different security levels.
+    and can operate in different security levels. Pattern lists are
+    compiled into combined ``RuleSet`` matchers, and decisions are cached
+    per ``(policy, command)`` in the shared decision cache.
     """
 
     security_level: SecurityLevel = SecurityLevel.STANDARD
     allowed_commands: list[str] = field(default_factory=list)
     blocked_patterns: list[tuple[str, str]] = field(default_factory=list)
-    _compiled_dangerous: list[tuple[re.Pattern, str]] = field(
-        default_factory=list, init=False, repr=False
-    )
-    _compiled_suspicious: list[tuple[re.Pattern, str]] = field(
-        default_factory=list, init=False, repr=False
-    )
-    _compiled_blocked: list[tuple[re.Pattern, str]] = field(
-        default_factory=list, init=False, repr=False
-    )
+    _dangerous: RuleSet = field(init=False, repr=False)
+    _suspicious: RuleSet = field(init=False, repr=False)
+    _blocked: RuleSet = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Compile regex patterns for efficient matching."""
-        self._compiled_dangerous = [
-            (re.compile(pattern, re.IGNORECASE), reason)
-            for pattern, reason in DANGEROUS_PATTERNS
-        ]
-        self._compiled_suspicious = [
-            (re.compile(pattern, re.IGNORECASE), reason)
-            for pattern, reason in SUSPICIOUS_PATTERNS
-        ]
-        self._compiled_blocked = [
-            (re.compile(pattern, re.IGNORECASE), reason)
-            for pattern, reason in self.blocked_patterns
-        ]
+        # Built-in rules are compiled once and shared by every validator
+        self._dangerous = compile_rules(tuple(DANGEROUS_PATTERNS))
+        self._suspicious = compile_rules(tuple(SUSPICIOUS_PATTERNS))
+        self._blocked = RuleSet(self.blocked_patterns)
+
+    def _policy_key(self) -> tuple:
+        return (
+            "shell",
+            self.security_level,
+            tuple(self.allowed_commands),
+            self._blocked.key,
+        )
 
     def validate(self, command: str) -> ValidationResult:
         """Validate a shell command for security risks.
@@ -155,31 +152,37 @@ class ShellSecurityValidator:
         if not command or not command.strip():
             return ValidationResult.unsafe("Empty command", severity="warning")
 
+        cache = get_decision_cache()
+        key = (self._policy_key(), command)
+        result = cache.get(key)
+        if result is None:
+            result = self._evaluate(command)
+            cache.put(key, result)
+        return result
+
+    def _evaluate(self, command: str) -> ValidationResult:
+        """Run the rules for ``validate`` (uncached)."""
         # In STRICT mode, only allow explicitly permitted commands
         if self.security_level == SecurityLevel.STRICT:
             return self._validate_strict(command)
 
-        # Check dangerous patterns (blocked in all modes)
-        for pattern, reason in self._compiled_dangerous:
-            if pattern.search(command):
-                return ValidationResult.unsafe(
-                    reason, pattern=pattern.pattern, severity="critical"
-                )
-
-        # Check custom blocked patterns
-        for pattern, reason in self._compiled_blocked:
-            if pattern.search(command):
+        # Check dangerous patterns (blocked in all modes), then custom blocked patterns
+        for rules in (self._dangerous, self._blocked):
+            hit = rules.first_match(command)
+            if hit:
+                pattern, reason = hit
                 return ValidationResult.unsafe(
                     reason, pattern=pattern.pattern, severity="critical"
                 )
 
         # Check suspicious patterns (blocked in STANDARD and STRICT modes)
         if self.security_level in (SecurityLevel.STANDARD, SecurityLevel.STRICT):
-            for pattern, reason in self._compiled_suspicious:
-                if pattern.search(command):
-                    return ValidationResult.unsafe(
-                        reason, pattern=pattern.pattern, severity="warning"
-                    )
+            hit = self._suspicious.first_match(command)
+            if hit:
+                pattern, reason = hit
+                return ValidationResult.unsafe(
+                    reason, pattern=pattern.pattern, severity="warning"
+                )
 
         return ValidationResult.safe()
 
@@ -193,16 +196,18 @@ class ShellSecurityValidator:
             ValidationResult - only safe if command matches allowlist.
         """
         # Extract the base command (first word)
-        base_command = command.strip().split()[0] if command.strip() else ""
+        tokens = parse_command(command).tokens
+        base_command = tokens[0] if tokens else ""
 
         # Check if base command is in allowlist
         if base_command in self.allowed_commands:
             # Still check for dangerous patterns even in allowlist
-            for pattern, reason in self._compiled_dangerous:
-                if pattern.search(command):
-                    return ValidationResult.unsafe(
-                        reason, pattern=pattern.pattern, severity="critical"
-                    )
+            hit = self._dangerous.first_match(command)
+            if hit:
+                pattern, reason = hit
+                return ValidationResult.unsafe(
+                    reason, pattern=pattern.pattern, severity="critical"
+                )
             return ValidationResult.safe()
 
         return ValidationResult.unsafe(
@@ -227,9 +232,7 @@ class ShellSecurityValidator:
             reason: Human-readable reason for blocking.
         """
         self.blocked_patterns.append((pattern, reason))
-        self._compiled_blocked.append(
-            (re.compile(pattern, re.IGNORECASE), reason)
-        )
+        self._blocked.add(pattern, reason)
 
 
 @dataclass
@@ -306,32 +309,27 @@ class PathSandbox:
             ValidationResult indicating if paths are safe.
         """
         cwd_path = Path(cwd).resolve()
+        parsed = parse_command(command)
 
         # Check for path traversal attempts
-        if ".." in command:
-            # Extract potential paths and validate them
-            parts = command.split()
-            for part in parts:
-                if ".." in part:
-                    # Try to resolve the path
-                    try:
-                        if part.startswith("/"):
-                            resolved = Path(part).resolve()
-                        else:
-                            resolved = (cwd_path / part).resolve()
-
-                        if not self.is_path_allowed(resolved):
-                            return ValidationResult.unsafe(
-                                f"Path traversal outside sandbox: {part}",
-                                severity="critical",
-                            )
-                    except (OSError, ValueError):
-                        pass  # Invalid path, let the shell handle it
-
-        # Check for absolute paths in command
-        abs_path_pattern = re.compile(r'(?:^|\s)(/[^\s]+)')
-        for match in abs_path_pattern.finditer(command):
-            abs_path = match.group(1)
+        for part in parsed.traversal_paths:
+            # Try to resolve the path
+            try:
+                if part.startswith("/"):
+                    resolved = Path(part).resolve()
+                else:
+                    resolved = (cwd_path / part).resolve()
+
+                if not self.is_path_allowed(resolved):
+                    return ValidationResult.unsafe(
+                        f"Path traversal outside sandbox: {part}",
+                        severity="critical",
+                    )
+            except (OSError, ValueError):
+                pass  # Invalid path, let the shell handle it
+
+        # Check for absolute paths in command (arguments and redirect targets)
+        for abs_path in parsed.absolute_paths:
             # Skip common safe paths
             if abs_path in ("/dev/null", "/dev/stdin", "/dev/stdout", "/dev/stderr"):
                 continue
@@ -10,6 +10,8 @@ from __future__ import annotations
 import logging
 import re
 import threading
+import time
+from collections import OrderedDict, deque
 from pathlib import Path
 from typing import Any, Awaitable, Callable
 
@@ -17,6 +19,8 @@ import yaml
 from langchain.agents.middleware.types import AgentMiddleware, AgentState, ModelRequest, ModelResponse
 from langchain_core.messages import HumanMessage
 
+from ag3nt_agent.prompt_layout import turn_hint
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,50 +47,191 @@ def find_repo_root() -> Path:
     return Path.cwd()
 
 
-def load_skill_triggers() -> dict[str, list[str]]:
-    """Load triggers from all skills.
-    
-    Returns:
-        Dictionary mapping skill names to their trigger phrases
-    """
+def skill_dirs() -> list[Path]:
+    """Skill directories in precedence order (later sources override earlier ones)."""
     repo_root = find_repo_root()
-    skill_dirs = [
+    return [
         repo_root / "skills",  # Bundled
         Path.home() / ".ag3nt" / "skills",  # Global
         repo_root / ".ag3nt" / "skills",  # Workspace
     ]
+
+
+def read_skill_triggers(skill_md: Path) -> tuple[str, list[str]] | None:
+    """Read ``(skill_name, triggers)`` from one SKILL.md.
+
+    Returns None if the file is missing, unreadable or declares no triggers.
+    """
+    try:
+        content = skill_md.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to load triggers from {skill_md}: {e}")
+        return None
+
+    frontmatter = parse_skill_frontmatter(content)
+    if not frontmatter or not isinstance(frontmatter.get("triggers"), list):
+        return None
+    return str(frontmatter.get("name", skill_md.parent.name)), frontmatter["triggers"]
+
+
+def _skill_md_stamps() -> dict[Path, tuple[int, int]]:
+    """Return ``(mtime_ns, size)`` for every SKILL.md in every skill directory."""
+    stamps: dict[Path, tuple[int, int]] = {}
+    for skill_dir in skill_dirs():
+        try:
+            entries = list(skill_dir.iterdir())
+        except OSError:
+            continue
+        for skill_path in entries:
+            skill_md = skill_path / "SKILL.md"
+            try:
+                st = skill_md.stat()
+            except OSError:
+                continue
+            stamps[skill_md] = (st.st_mtime_ns, st.st_size)
+    return stamps
+
+
+def load_skill_triggers(skill_names: dict[str, str] | None = None) -> dict[str, list[str]]:
+    """Load triggers from all skills.
+
+    Args:
+        skill_names: If given, filled with skill directory name -> skill name
+            for every skill that declares triggers
     
+    Returns:
+        Dictionary mapping skill names to their trigger phrases
+    """
     triggers_map: dict[str, list[str]] = {}
-    
-    for skill_dir in skill_dirs:
+
+    for skill_dir in skill_dirs():
         if not skill_dir.exists():
             continue
-        
+
         for skill_path in skill_dir.iterdir():
             if not skill_path.is_dir():
                 continue
-            
-            skill_md = skill_path / "SKILL.md"
-            if not skill_md.exists():
-                continue
-            
-            try:
-                content = skill_md.read_text(encoding="utf-8")
-                frontmatter = parse_skill_frontmatter(content)
-                
-                if frontmatter and "triggers" in frontmatter:
-                    skill_name = frontmatter.get("name", skill_path.name)
-                    triggers = frontmatter["triggers"]
-                    
-                    if isinstance(triggers, list):
-                        # Later sources override earlier ones
-                        triggers_map[skill_name] = triggers
-            except Exception as e:
-                logger.warning(f"Failed to load triggers from {skill_md}: {e}")
-    
+
+            found = read_skill_triggers(skill_path / "SKILL.md")
+            if found:
+                # Later sources override earlier ones
+                skill_name, triggers = found
+                triggers_map[skill_name] = triggers
+                if skill_names is not None:
+                    skill_names[skill_path.name] = skill_name
+
     return triggers_map
 
 
+_WORD_RE = re.compile(r"\w+")
+
+
+def _stem(word: str) -> str:
+    """Light suffix stripper so "opening files" matches the trigger "open file"."""
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    for suffix in ("ing", "ed", "es", "s"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            if suffix == "s" and word.endswith("ss"):
+                break
+            word = word[: -len(suffix)]
+            # running -> runn -> run
+            if suffix in ("ing", "ed") and word[-1] == word[-2] and word[-1] not in "aeiouls":
+                word = word[:-1]
+            break
+    if len(word) > 3 and word.endswith("e"):
+        word = word[:-1]
+    return word
+
+
+class TriggerMatcher:
+    """Aho-Corasick automaton over every trigger of every skill.
+
+    One pass over the message finds all matching skills, instead of one
+    substring search per trigger.
+
+    Args:
+        triggers_map: Skill name -> trigger phrases.
+        word_boundary: Only match whole words. Text is tokenized on ``\\w+`` so
+            punctuation and repeated whitespace are ignored ("open-file"
+            matches "open file").
+        stem: Also reduce each word to a crude stem ("opening files" matches
+            "open file"). Implies ``word_boundary``.
+    """
+
+    def __init__(
+        self,
+        triggers_map: dict[str, list[str]],
+        *,
+        word_boundary: bool = False,
+        stem: bool = False,
+    ) -> None:
+        self.word_boundary = word_boundary or stem
+        self.stem = stem
+        self._skills = list(triggers_map)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[frozenset[int]] = [frozenset()]
+
+        outputs: list[set[int]] = [set()]
+        for index, triggers in enumerate(triggers_map.values()):
+            for trigger in triggers:
+                pattern = self._normalize(str(trigger))
+                if not pattern.strip():
+                    continue
+                state = 0
+                for ch in pattern:
+                    nxt = self._goto[state].get(ch)
+                    if nxt is None:
+                        nxt = len(self._goto)
+                        self._goto[state][ch] = nxt
+                        self._goto.append({})
+                        self._fail.append(0)
+                        outputs.append(set())
+                    state = nxt
+                outputs[state].add(index)
+
+        # Breadth-first failure links; each state also reports its suffixes' outputs.
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(ch, 0) if state else 0
+                outputs[nxt] |= outputs[self._fail[nxt]]
+        self._out = [frozenset(o) for o in outputs]
+
+    def _normalize(self, text: str) -> str:
+        text = text.lower()
+        if not self.word_boundary:
+            return text
+        words = _WORD_RE.findall(text)
+        if self.stem:
+            words = [_stem(w) for w in words]
+        # Pad with spaces so a pattern can only start and end on a word boundary.
+        return f" {' '.join(words)} "
+
+    def match(self, text: str) -> list[str]:
+        """Return the skills with a trigger in *text*, in ``triggers_map`` order."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: set[int] = set()
+        state = 0
+        for ch in self._normalize(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found |= out[state]
+                if len(found) == len(self._skills):
+                    break
+        return [self._skills[i] for i in sorted(found)]
+
+
 def match_triggers(user_message: str, triggers_map: dict[str, list[str]]) -> list[str]:
     """Match user message against skill triggers.
     
@@ -97,37 +242,125 @@ def match_triggers(user_message: str, triggers_map: dict[str, list[str]]) -> lis
     Returns:
         List of skill names that match the user message
     """
-    user_message_lower = user_message.lower()
-    matched_skills = []
-    
-    for skill_name, triggers in triggers_map.items():
-        for trigger in triggers:
-            trigger_lower = trigger.lower()
-            # Simple substring matching (could be enhanced with fuzzy matching)
-            if trigger_lower in user_message_lower:
-                matched_skills.append(skill_name)
-                break  # Only match once per skill
-    
-    return matched_skills
+    return TriggerMatcher(triggers_map).match(user_message)
+
+
+_MATCH_CACHE_SIZE = 256
+_DEFAULT_REVALIDATE_INTERVAL = 5.0
 
 
 class SkillTriggerMiddleware(AgentMiddleware):
-    """Middleware that suggests skills based on trigger matching."""
+    """Middleware that suggests skills based on trigger matching.
+
+    Triggers are compiled into a :class:`TriggerMatcher`. Every
+    ``revalidate_interval`` seconds the SKILL.md files are re-stat'd and only
+    the skills whose file changed, appeared or disappeared are re-read, so new
+    skills are picked up without a restart. Match results are cached per
+    message, since every model call in a turn sees the same user message.
+    """
     
-    def __init__(self, planning_middleware=None):
+    def __init__(
+        self,
+        planning_middleware=None,
+        *,
+        word_boundary: bool = False,
+        stem: bool = False,
+        revalidate_interval: float = _DEFAULT_REVALIDATE_INTERVAL,
+    ):
         super().__init__()
         self._triggers_map: dict[str, list[str]] | None = None
         self._planning_middleware = planning_middleware
         self._triggers_lock = threading.Lock()
+        self._word_boundary = word_boundary
+        self._stem = stem
+        self._revalidate_interval = revalidate_interval
+        self._matcher: TriggerMatcher | None = None
+        self._match_cache: OrderedDict[str, list[str]] = OrderedDict()
+        self._generation = 0
+        self._stamps: dict[Path, tuple[int, int]] = {}
+        self._checked_at = 0.0
+        self._skill_names: dict[str, str] = {}  # skill directory name -> skill name
 
     def _load_triggers(self) -> dict[str, list[str]]:
         """Load triggers lazily with double-checked locking."""
         if self._triggers_map is None:
             with self._triggers_lock:
                 if self._triggers_map is None:
-                    self._triggers_map = load_skill_triggers()
+                    skill_names: dict[str, str] = {}
+                    self._triggers_map = load_skill_triggers(skill_names)
+                    self._skill_names = skill_names
+                    self._stamps = _skill_md_stamps()
+                    self._checked_at = time.monotonic()
         return self._triggers_map
-    
+
+    def _get_matcher(self) -> TriggerMatcher:
+        """Compile the current triggers on first use and after each reload."""
+        self._load_triggers()
+        with self._triggers_lock:
+            if self._matcher is None:
+                self._matcher = TriggerMatcher(
+                    self._triggers_map or {},
+                    word_boundary=self._word_boundary,
+                    stem=self._stem,
+                )
+            return self._matcher
+
+    def reload_skill(self, dir_name: str) -> None:
+        """Re-read the triggers of one skill directory across all skill sources."""
+        resolved = None
+        for skill_dir in skill_dirs():
+            found = read_skill_triggers(skill_dir / dir_name / "SKILL.md")
+            if found:
+                resolved = found  # Later sources override earlier ones
+
+        self._load_triggers()
+        with self._triggers_lock:
+            updated = dict(self._triggers_map or {})
+            updated.pop(self._skill_names.pop(dir_name, dir_name), None)
+            if resolved:
+                skill_name, triggers = resolved
+                updated[skill_name] = triggers
+                self._skill_names[dir_name] = skill_name
+            self._triggers_map = updated
+            self._matcher = None
+            self._generation += 1
+            self._match_cache.clear()
+        logger.info("Reloaded skill triggers for %s", dir_name)
+
+    def refresh(self, *, force: bool = False) -> None:
+        """Reload the triggers of skills whose SKILL.md changed since the last check."""
+        self._load_triggers()
+        now = time.monotonic()
+        if not force and now - self._checked_at < self._revalidate_interval:
+            return
+        self._checked_at = now
+        stamps = _skill_md_stamps()
+        changed = {p.parent.name for p in stamps.keys() ^ self._stamps.keys()}
+        changed.update(p.parent.name for p, stamp in stamps.items() if self._stamps.get(p, stamp) != stamp)
+        self._stamps = stamps
+        for dir_name in sorted(changed):
+            self.reload_skill(dir_name)
+
+    def match(self, user_message: str) -> list[str]:
+        """Return the skills triggered by *user_message*, using the per-message cache."""
+        if self._revalidate_interval > 0:
+            self.refresh()
+        with self._triggers_lock:
+            cached = self._match_cache.get(user_message)
+            if cached is not None:
+                self._match_cache.move_to_end(user_message)
+                return list(cached)
+            generation = self._generation
+
+        matched = self._get_matcher().match(user_message)
+
+        with self._triggers_lock:
+            if generation == self._generation:
+                self._match_cache[user_message] = matched
+                if len(self._match_cache) > _MATCH_CACHE_SIZE:
+                    self._match_cache.popitem(last=False)
+        return list(matched)
+
     def wrap_model_call(
         self,
         request: ModelRequest,
@@ -153,14 +386,13 @@ class SkillTriggerMiddleware(AgentMiddleware):
         if not last_user_message or not isinstance(last_user_message, str):
             return handler(request)
         
-        # Load triggers and match
-        triggers_map = self._load_triggers()
-        matched_skills = match_triggers(last_user_message, triggers_map)
+        # Match against the compiled triggers (cached per message)
+        matched_skills = self.match(last_user_message)
         
         if not matched_skills:
             return handler(request)
         
-        # Inject skill suggestions into system prompt
+        # Inject skill suggestions as per-turn context (kept out of the cached prefix)
         suggestion_text = "\n\n**💡 Skill Suggestions:**\n\n"
         suggestion_text += f"Based on the user's message, these skills may be relevant:\n"
         for skill_name in matched_skills:
@@ -169,7 +401,7 @@ class SkillTriggerMiddleware(AgentMiddleware):
         
         # Append to system message
         from deepagents.middleware._utils import append_to_system_message
-        new_system_message = append_to_system_message(request.system_message, suggestion_text)
+        new_system_message = append_to_system_message(request.system_message, turn_hint(suggestion_text))
         modified_request = request.override(system_message=new_system_message)
         
         return handler(modified_request)
@@ -199,14 +431,13 @@ class SkillTriggerMiddleware(AgentMiddleware):
         if not last_user_message or not isinstance(last_user_message, str):
             return await handler(request)
 
-        # Load triggers and match
-        triggers_map = self._load_triggers()
-        matched_skills = match_triggers(last_user_message, triggers_map)
+        # Match against the compiled triggers (cached per message)
+        matched_skills = self.match(last_user_message)
 
         if not matched_skills:
             return await handler(request)
 
-        # Inject skill suggestions into system prompt
+        # Inject skill suggestions as per-turn context (kept out of the cached prefix)
         suggestion_text = "\n\n**💡 Skill Suggestions:**\n\n"
         suggestion_text += "Based on the user's message, these skills may be relevant:\n"
         for skill_name in matched_skills:
@@ -220,7 +451,7 @@ class SkillTriggerMiddleware(AgentMiddleware):
         # Append to system message
         from deepagents.middleware._utils import append_to_system_message
 
-        new_system_message = append_to_system_message(request.system_message, suggestion_text)
+        new_system_message = append_to_system_message(request.system_message, turn_hint(suggestion_text))
         modified_request = request.override(system_message=new_system_message)
 
         return await handler(modified_request)
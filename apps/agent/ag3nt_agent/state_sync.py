@@ -7,6 +7,12 @@ Supports:
 1. Redis (recommended) - Real pub/sub, horizontal scaling
 2. In-memory (fallback) - For single-instance deployments
 
+In Redis each session is a hash (one JSON-encoded value per field).
+Updates run as a server-side Lua script that bumps ``version`` and publishes
+a delta containing only the changed fields, so concurrent writers from the
+gateway and worker never lose each other's updates and never re-send the
+full session.
+
 Usage:
     from ag3nt_agent.state_sync import get_state_sync
 
@@ -23,12 +29,25 @@ import logging
 import os
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
 logger = logging.getLogger("ag3nt.state_sync")
 
 
+class SessionVersionConflict(Exception):
+    """Raised when an update's ``expected_version`` no longer matches."""
+
+    def __init__(self, session_id: str, expected: int, actual: int) -> None:
+        super().__init__(
+            f"Session {session_id} is at version {actual}, expected {expected}"
+        )
+        self.session_id = session_id
+        self.expected = expected
+        self.actual = actual
+
+
 # =============================================================================
 # Types
 # =============================================================================
@@ -185,12 +204,21 @@ class InMemoryStateSync:
         self,
         session_id: str,
         updates: dict[str, Any],
+        expected_version: int | None = None,
     ) -> SessionState:
-        """Update specific fields of a session."""
+        """Update specific fields of a session.
+
+        Raises:
+            ValueError: If the session does not exist.
+            SessionVersionConflict: If ``expected_version`` is given and the
+                stored version differs.
+        """
         async with self._lock:
             session = self._sessions.get(session_id)
             if not session:
                 raise ValueError(f"Session not found: {session_id}")
+            if expected_version is not None and session.version != expected_version:
+                raise SessionVersionConflict(session_id, expected_version, session.version)
 
             # Apply updates
             state_dict = session.to_dict()
@@ -287,11 +315,78 @@ class InMemoryStateSync:
 # =============================================================================
 
 
+# Atomic partial update.
+#   KEYS[1]  session hash
+#   KEYS[2]  pub/sub channel for the session
+#   ARGV[1]  JSON object of field -> JSON-encoded value
+#   ARGV[2]  JSON-encoded updatedAt timestamp
+#   ARGV[3]  expected version, or "" for an unconditional update
+# Returns the full hash (HGETALL) on success, {"missing"} if the key does not
+# exist, {"legacy"} if it still holds a JSON string, or {"conflict", version}.
+# The published delta is {"version": n, "changes": {...}} with the changed
+# fields as raw JSON values.
+_UPDATE_SCRIPT = """
+local key_type = redis.call('TYPE', KEYS[1])['ok']
+if key_type == 'none' then
+  return {'missing'}
+end
+if key_type ~= 'hash' then
+  return {'legacy'}
+end
+local version = tonumber(redis.call('HGET', KEYS[1], 'version') or '0') or 0
+if ARGV[3] ~= '' and tonumber(ARGV[3]) ~= version then
+  return {'conflict', tostring(version)}
+end
+version = version + 1
+local updates = cjson.decode(ARGV[1])
+updates['updatedAt'] = ARGV[2]
+updates['version'] = tostring(version)
+local args = {}
+local parts = {}
+for field, value in pairs(updates) do
+  args[#args + 1] = field
+  args[#args + 1] = value
+  parts[#parts + 1] = cjson.encode(field) .. ':' .. value
+end
+redis.call('HSET', KEYS[1], unpack(args))
+redis.call('PUBLISH', KEYS[2],
+  '{"version":' .. version .. ',"changes":{' .. table.concat(parts, ',') .. '}}')
+return redis.call('HGETALL', KEYS[1])
+"""
+
+
+def _encode_fields(data: dict[str, Any]) -> dict[str, str]:
+    """JSON-encode each top-level value for storage in a Redis hash."""
+    return {key: json.dumps(value) for key, value in data.items()}
+
+
+def _decode_fields(raw: Any) -> dict[str, Any]:
+    """Decode a Redis hash (dict or flat HGETALL list) of JSON-encoded values."""
+    if isinstance(raw, dict):
+        items = raw.items()
+    else:
+        items = zip(raw[::2], raw[1::2])
+    result: dict[str, Any] = {}
+    for key, value in items:
+        if isinstance(key, bytes):
+            key = key.decode()
+        result[key] = json.loads(value)
+    return result
+
+
 class RedisStateSync:
-    """Redis-backed state synchronization."""
+    """Redis-backed state synchronization.
+
+    Sessions are stored as hashes and updated with ``_UPDATE_SCRIPT`` so the
+    read-modify-write is atomic on the server. Subscribers still receive full
+    ``SessionState`` objects: the listener keeps the last state it saw per
+    session and applies incoming deltas to it, re-reading the hash when a
+    version gap shows that a delta was missed.
+    """
 
-    def __init__(self, redis_url: str) -> None:
+    def __init__(self, redis_url: str, max_known_sessions: int = 1024) -> None:
         self.redis_url = redis_url
+        self.max_known_sessions = max_known_sessions
         self.redis: Any = None
         self.pubsub: Any = None
         self._subscribers: dict[str, list[Callable[[SessionState], None]]] = {}
@@ -299,6 +394,10 @@ class RedisStateSync:
         self._listen_task: asyncio.Task | None = None
         self._key_prefix = "ag3nt:session:"
         self._channel_prefix = "ag3nt:updates:"
+        self._update_script: Any = None
+        # Last state seen per session, used to apply pub/sub deltas. Bounded
+        # LRU: a session that falls out is re-read on its next delta.
+        self._known: OrderedDict[str, dict[str, Any]] = OrderedDict()
 
     async def connect(self) -> None:
         """Connect to Redis."""
@@ -306,13 +405,7 @@ class RedisStateSync:
             import redis.asyncio as redis
 
             self.redis = redis.from_url(self.redis_url)
-            self.pubsub = self.redis.pubsub()
-
-            # Subscribe to all session updates
-            await self.pubsub.psubscribe(f"{self._channel_prefix}*")
-
-            # Start listener
-            self._listen_task = asyncio.create_task(self._listen())
+            await self._start()
 
             logger.info("Connected to Redis for state sync")
         except ImportError:
@@ -321,50 +414,114 @@ class RedisStateSync:
                 "Install with: pip install redis"
             )
 
+    @classmethod
+    async def from_client(cls, client: Any) -> RedisStateSync:
+        """Create a state sync around an existing ``redis.asyncio`` client."""
+        sync = cls(redis_url="")
+        sync.redis = client
+        await sync._start()
+        return sync
+
+    async def _start(self) -> None:
+        self._update_script = self.redis.register_script(_UPDATE_SCRIPT)
+        self.pubsub = self.redis.pubsub()
+
+        # Subscribe to all session updates
+        await self.pubsub.psubscribe(f"{self._channel_prefix}*")
+
+        # Start listener
+        self._listen_task = asyncio.create_task(self._listen())
+
+    async def _read_hash(self, session_id: str) -> dict[str, Any] | None:
+        key = f"{self._key_prefix}{session_id}"
+        try:
+            raw = await self.redis.hgetall(key)
+        except Exception as e:
+            if "WRONGTYPE" not in str(e):
+                raise
+            # Written by an older version as a single JSON string.
+            data = await self.redis.get(key)
+            return json.loads(data) if data else None
+        return _decode_fields(raw) if raw else None
+
     async def get_session(self, session_id: str) -> SessionState | None:
         """Get session state from Redis."""
-        data = await self.redis.get(f"{self._key_prefix}{session_id}")
+        data = await self._read_hash(session_id)
         if data:
-            return SessionState.from_dict(json.loads(data))
+            return SessionState.from_dict(data)
         return None
 
     async def set_session(self, session_id: str, state: SessionState) -> None:
         """Set full session state in Redis."""
-        await self.redis.set(
-            f"{self._key_prefix}{session_id}",
-            json.dumps(state.to_dict()),
-        )
-        await self._publish(session_id, state)
+        data = state.to_dict()
+        key = f"{self._key_prefix}{session_id}"
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping=_encode_fields(data))
+            pipe.publish(
+                f"{self._channel_prefix}{session_id}",
+                json.dumps({"version": state.version, "changes": data, "full": True}),
+            )
+            await pipe.execute()
 
     async def update_session(
         self,
         session_id: str,
         updates: dict[str, Any],
+        expected_version: int | None = None,
     ) -> SessionState:
-        """Update session state atomically."""
-        # Get current state
-        data = await self.redis.get(f"{self._key_prefix}{session_id}")
-        if not data:
-            raise ValueError(f"Session not found: {session_id}")
-
-        state_dict = json.loads(data)
-        state_dict.update(updates)
-        state_dict["updatedAt"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        state_dict["version"] = state_dict.get("version", 0) + 1
-
-        await self.redis.set(
-            f"{self._key_prefix}{session_id}",
-            json.dumps(state_dict),
+        """Update session state atomically.
+
+        Only the changed fields are sent to Redis and published.
+
+        Raises:
+            ValueError: If the session does not exist.
+            SessionVersionConflict: If ``expected_version`` is given and the
+                stored version differs.
+        """
+        key = f"{self._key_prefix}{session_id}"
+        args = [
+            json.dumps(_encode_fields(updates)),
+            json.dumps(time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())),
+            "" if expected_version is None else str(expected_version),
+        ]
+        result = await self._update_script(
+            keys=[key, f"{self._channel_prefix}{session_id}"], args=args
         )
+        status = result[0].decode() if isinstance(result[0], bytes) else result[0]
+        if status == "missing":
+            raise ValueError(f"Session not found: {session_id}")
+        if status == "legacy":
+            await self._migrate_legacy(session_id)
+            return await self.update_session(session_id, updates, expected_version)
+        if status == "conflict":
+            raise SessionVersionConflict(
+                session_id, expected_version or 0, int(result[1])
+            )
+        return SessionState.from_dict(_decode_fields(result))
 
-        updated = SessionState.from_dict(state_dict)
-        await self._publish(session_id, updated)
+    async def _migrate_legacy(self, session_id: str) -> None:
+        """Rewrite a JSON-string session as a hash, guarded by WATCH."""
+        from redis.exceptions import WatchError
 
-        return updated
+        key = f"{self._key_prefix}{session_id}"
+        async with self.redis.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(key)
+                if await pipe.type(key) not in (b"string", "string"):
+                    return  # Already migrated by another writer.
+                data = json.loads(await pipe.get(key))
+                pipe.multi()
+                pipe.delete(key)
+                pipe.hset(key, mapping=_encode_fields(data))
+                await pipe.execute()
+            except WatchError:
+                pass  # Someone else changed it; the caller retries.
 
     async def delete_session(self, session_id: str) -> bool:
         """Delete a session from Redis."""
         result = await self.redis.delete(f"{self._key_prefix}{session_id}")
+        self._known.pop(session_id, None)
         return result > 0
 
     def subscribe(
@@ -401,12 +558,30 @@ class RedisStateSync:
 
         return unsubscribe
 
-    async def _publish(self, session_id: str, state: SessionState) -> None:
-        """Publish state update to Redis."""
-        await self.redis.publish(
-            f"{self._channel_prefix}{session_id}",
-            json.dumps(state.to_dict()),
-        )
+    async def _apply_message(self, session_id: str, payload: dict[str, Any]) -> SessionState | None:
+        """Turn a pub/sub payload into a full state using the last known state.
+
+        Payloads are either deltas (``{"version", "changes", "full"?}``) or,
+        from older publishers, a complete session dict.
+        """
+        if "changes" not in payload:
+            data = payload
+        elif payload.get("full"):
+            data = dict(payload["changes"])
+        else:
+            known = self._known.get(session_id)
+            if known is not None and known.get("version", 0) == payload["version"] - 1:
+                data = {**known, **payload["changes"]}
+            else:
+                # Missed a delta (or first sighting): re-read the hash.
+                data = await self._read_hash(session_id)
+                if data is None:
+                    return None
+        self._known[session_id] = data
+        self._known.move_to_end(session_id)
+        while len(self._known) > self.max_known_sessions:
+            self._known.popitem(last=False)
+        return SessionState.from_dict(data)
 
     async def _listen(self) -> None:
         """Listen for Redis pub/sub messages."""
@@ -414,19 +589,30 @@ class RedisStateSync:
             async for message in self.pubsub.listen():
                 if message["type"] == "pmessage":
                     try:
-                        channel = message["channel"].decode()
+                        channel = message["channel"]
+                        if isinstance(channel, bytes):
+                            channel = channel.decode()
                         session_id = channel.replace(self._channel_prefix, "")
-                        data = json.loads(message["data"])
-                        state = SessionState.from_dict(data)
+
+                        session_callbacks = list(self._subscribers.get(session_id, []))
+                        all_callbacks = list(self._all_subscribers)
+                        if not session_callbacks and not all_callbacks:
+                            continue
+
+                        state = await self._apply_message(
+                            session_id, json.loads(message["data"])
+                        )
+                        if state is None:
+                            continue
 
                         # Notify local subscribers
-                        for callback in self._subscribers.get(session_id, []):
+                        for callback in session_callbacks:
                             try:
                                 callback(state)
                             except Exception as e:
                                 logger.error(f"Subscriber error: {e}")
 
-                        for callback in self._all_subscribers:
+                        for callback in all_callbacks:
                             try:
                                 callback(session_id, state)
                             except Exception as e:
@@ -29,6 +29,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable
 
+from ag3nt_agent.request_context import get_session_id
+
 logger = logging.getLogger("ag3nt.streaming")
 
 
@@ -195,12 +197,13 @@ class StreamingContext:
 
     def __init__(
         self,
-        session_id: str,
+        session_id: str | None,
         tool_name: str,
         tool_call_id: str | None = None,
         args: dict[str, Any] | None = None,
     ) -> None:
-        self.session_id = session_id
+        # None: stream to the session of the current turn (see request_context)
+        self.session_id = session_id if session_id is not None else get_session_id()
         self.tool_name = tool_name
         self.tool_call_id = tool_call_id or str(uuid.uuid4())
         self.args = args or {}
@@ -321,7 +324,7 @@ class StreamingContext:
 
 
 def emit_tool_event(
-    session_id: str,
+    session_id: str | None,
     tool_name: str,
     tool_call_id: str,
     event_type: EventType,
@@ -330,7 +333,7 @@ def emit_tool_event(
     """Convenience function to emit a tool event.
 
     Args:
-        session_id: Session ID
+        session_id: Session ID, or None for the session of the current turn
         tool_name: Name of the tool
         tool_call_id: Unique ID for this tool call
         event_type: Type of event
@@ -339,7 +342,7 @@ def emit_tool_event(
     get_stream_manager().emit(
         ToolEvent(
             event_type=event_type,
-            session_id=session_id,
+            session_id=session_id if session_id is not None else get_session_id(),
             tool_name=tool_name,
             tool_call_id=tool_call_id,
             data=data or {},
@@ -5,7 +5,7 @@ This module provides:
 - SubagentMonitor: Tracks subagent executions for debugging and analytics
 - SubagentEventType: Lifecycle event types for subagent execution
 - SubagentEvent: Event data for lifecycle callbacks
-- Persistence: Save/load subagent runs to disk for resume after restart
+- Persistence: Append-only journal of subagent runs for resume after restart
 - AnnounceQueue: Priority queue for subagent announcements (Moltbot parity)
 - CrossSessionBus: Message bus for cross-session communication (Moltbot parity)
 - DeliveryTracker: Track message delivery context and status (Moltbot parity)
@@ -18,8 +18,10 @@ from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
 from typing import Any, Callable
-from collections import defaultdict
+from collections import defaultdict, deque
+import asyncio
 import heapq
+import itertools
 import json
 import threading
 import uuid
@@ -293,12 +295,56 @@ class SubagentExecution:
         }
 
 
+@dataclass
+class _HistoryAggregates:
+    """Running totals over the retained execution history.
+
+    Updated as executions enter and leave the history, so statistics never
+    need a pass over the full list.
+    """
+    total: int = 0
+    successful: int = 0
+    failed: int = 0
+    duration_sum: float = 0.0
+    duration_count: int = 0
+    tokens: int = 0
+    turns: int = 0
+    tool_calls: int = 0
+    by_type: dict[str, int] = field(default_factory=dict)
+
+    def update(self, execution: SubagentExecution, sign: int = 1) -> None:
+        """Add (sign=1) or remove (sign=-1) an execution from the totals."""
+        self.total += sign
+        if execution.is_success:
+            self.successful += sign
+        if execution.error is not None:
+            self.failed += sign
+        duration = execution.duration_seconds
+        if duration:
+            self.duration_sum += sign * duration
+            self.duration_count += sign
+        self.tokens += sign * execution.tokens_used
+        self.turns += sign * execution.turns
+        self.tool_calls += sign * len(execution.tool_calls)
+
+        count = self.by_type.get(execution.subagent_type, 0) + sign
+        if count:
+            self.by_type[execution.subagent_type] = count
+        else:
+            self.by_type.pop(execution.subagent_type, None)
+
+
 class SubagentMonitor:
     """Monitors subagent executions for debugging and resource tracking.
 
     This class maintains a history of subagent executions and provides
     statistics for monitoring and debugging purposes.
 
+    Completed executions are persisted to an append-only JSONL journal: each
+    end_execution appends one record. Once the journal holds more than
+    ``JOURNAL_COMPACT_FACTOR`` times the retained history, it is rewritten
+    with just the retained executions on a background thread.
+
     Features matching Moltbot:
     - Disk persistence for subagent runs (save/load)
     - Lifecycle event callbacks (started, completed, failed, timeout)
@@ -306,7 +352,10 @@ class SubagentMonitor:
     """
 
     # Default persistence path
-    DEFAULT_PERSISTENCE_PATH = Path.home() / ".ag3nt" / "subagent_runs.json"
+    DEFAULT_PERSISTENCE_PATH = Path.home() / ".ag3nt" / "subagent_runs.jsonl"
+
+    # Compact once the journal holds this many times max_history records
+    JOURNAL_COMPACT_FACTOR = 2
 
     def __init__(
         self,
@@ -321,7 +370,7 @@ class SubagentMonitor:
             persistence_path: Path to save/load executions. None disables persistence.
             auto_persist: If True, automatically save after each execution ends.
         """
-        self.executions: list[SubagentExecution] = []
+        self.executions: deque[SubagentExecution] = deque()
         self.max_history = max_history
         self.active_subagents: dict[str, SubagentExecution] = {}
         self.persistence_path = (
@@ -330,6 +379,15 @@ class SubagentMonitor:
         self.auto_persist = auto_persist
         self._lock = threading.Lock()
 
+        # Completed executions by ID and running totals, kept in step with history
+        self._history_index: dict[str, SubagentExecution] = {}
+        self._aggregates = _HistoryAggregates()
+
+        # Journal state; lock order is _journal_lock, then _lock
+        self._journal_lock = threading.Lock()
+        self._journal_records = 0
+        self._compaction_thread: threading.Thread | None = None
+
         # Lifecycle event callbacks
         self._event_callbacks: dict[SubagentEventType, list[SubagentEventCallback]] = {
             event_type: [] for event_type in SubagentEventType
@@ -585,10 +643,7 @@ class SubagentMonitor:
             execution.tokens_used += tokens_used
 
             # Append to history BEFORE removing from active to prevent data loss
-            self.executions.append(execution)
-            # Trim history if needed
-            if len(self.executions) > self.max_history:
-                self.executions = self.executions[-self.max_history:]
+            self._add_to_history(execution)
 
             subagent_type = execution.subagent_type
             emit_data = {
@@ -618,7 +673,7 @@ class SubagentMonitor:
         try:
             # Auto-persist if enabled
             if self.auto_persist:
-                self.save_to_disk()
+                self._append_to_journal(execution)
         finally:
             # Remove from active only after save attempt completes
             with self._lock:
@@ -640,10 +695,7 @@ class SubagentMonitor:
             if execution_id in self.active_subagents:
                 return self.active_subagents[execution_id]
             # Check completed
-            for execution in self.executions:
-                if execution.id == execution_id:
-                    return execution
-            return None
+            return self._history_index.get(execution_id)
 
     def get_active_count(self) -> int:
         """Get number of active subagents.
@@ -673,7 +725,7 @@ class SubagentMonitor:
             List of recent completed executions (newest first).
         """
         with self._lock:
-            return list(reversed(self.executions[-limit:]))
+            return list(itertools.islice(reversed(self.executions), max(limit, 0)))
 
     def get_statistics(self) -> dict[str, Any]:
         """Get execution statistics.
@@ -682,35 +734,27 @@ class SubagentMonitor:
             Dictionary with execution statistics.
         """
         with self._lock:
-            if not self.executions:
+            agg = self._aggregates
+            if not agg.total:
                 return {
                     "total_executions": 0,
                     "active_count": len(self.active_subagents),
                 }
 
-            executions_snapshot = list(self.executions)
-            active_count = len(self.active_subagents)
-
-        successful = [e for e in executions_snapshot if e.is_success]
-        failed = [e for e in executions_snapshot if e.error is not None]
-        durations = [e.duration_seconds for e in executions_snapshot if e.duration_seconds]
-
-        counts: dict[str, int] = {}
-        for e in executions_snapshot:
-            counts[e.subagent_type] = counts.get(e.subagent_type, 0) + 1
-
-        return {
-            "total_executions": len(executions_snapshot),
-            "successful": len(successful),
-            "failed": len(failed),
-            "success_rate": len(successful) / len(executions_snapshot) if executions_snapshot else 0,
-            "active_count": active_count,
-            "avg_duration_seconds": sum(durations) / len(durations) if durations else 0,
-            "total_tokens": sum(e.tokens_used for e in executions_snapshot),
-            "avg_turns": sum(e.turns for e in executions_snapshot) / len(executions_snapshot),
-            "avg_tool_calls": sum(len(e.tool_calls) for e in executions_snapshot) / len(executions_snapshot),
-            "by_type": counts,
-        }
+            return {
+                "total_executions": agg.total,
+                "successful": agg.successful,
+                "failed": agg.failed,
+                "success_rate": agg.successful / agg.total,
+                "active_count": len(self.active_subagents),
+                "avg_duration_seconds": (
+                    agg.duration_sum / agg.duration_count if agg.duration_count else 0
+                ),
+                "total_tokens": agg.tokens,
+                "avg_turns": agg.turns / agg.total,
+                "avg_tool_calls": agg.tool_calls / agg.total,
+                "by_type": dict(agg.by_type),
+            }
 
     def clear_history(self) -> int:
         """Clear completed execution history.
@@ -720,38 +764,59 @@ class SubagentMonitor:
         """
         with self._lock:
             count = len(self.executions)
-            self.executions.clear()
+            self._reset_history([])
         if self.auto_persist:
             self.save_to_disk()
         return count
 
+    def _add_to_history(self, execution: SubagentExecution) -> None:
+        """Append to history, trimming the oldest. Called with lock held."""
+        self.executions.append(execution)
+        self._history_index[execution.id] = execution
+        self._aggregates.update(execution)
+
+        while len(self.executions) > self.max_history:
+            evicted = self.executions.popleft()
+            if self._history_index.get(evicted.id) is evicted:
+                del self._history_index[evicted.id]
+            self._aggregates.update(evicted, -1)
+
+    def _reset_history(self, executions: list[SubagentExecution]) -> None:
+        """Replace the history and rebuild its index and totals. Called with lock held."""
+        self.executions = deque()
+        self._history_index = {}
+        self._aggregates = _HistoryAggregates()
+        for execution in executions:
+            self._add_to_history(execution)
+
     # =========================================================================
     # PERSISTENCE METHODS (Matching Moltbot's subagent-registry.store.ts)
     # =========================================================================
 
     def save_to_disk(self) -> bool:
-        """Save completed executions to disk.
+        """Rewrite the journal with the retained executions.
+
+        end_execution only appends to the journal; this compacts it. Called
+        automatically on a background thread once the journal grows.
 
         Returns:
             True if save was successful.
         """
         try:
-            # Ensure directory exists
-            self.persistence_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Serialize executions
-            data = {
-                "version": 1,
-                "saved_at": datetime.now().isoformat(),
-                "max_history": self.max_history,
-                "executions": [e.to_dict() for e in self.executions],
-            }
-
-            # Write atomically (write to temp, then rename)
-            temp_path = self.persistence_path.with_suffix(".tmp")
-            with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-            temp_path.replace(self.persistence_path)
+            with self._journal_lock:
+                # Snapshot under the journal lock so no appended record is lost;
+                # one journaled concurrently may be written twice (deduped on load)
+                with self._lock:
+                    snapshot = list(self.executions)
+                data = "".join(self._journal_line(e) for e in snapshot)
+
+                # Write atomically (write to temp, then rename)
+                self.persistence_path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = self.persistence_path.with_suffix(".tmp")
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    f.write(data)
+                temp_path.replace(self.persistence_path)
+                self._journal_records = len(snapshot)
 
             return True
         except (OSError, TypeError, ValueError):
@@ -760,43 +825,53 @@ class SubagentMonitor:
     def load_from_disk(self) -> int:
         """Load executions from disk.
 
+        Reads the JSONL journal, keeping the latest record per execution ID.
+        A file in the older single-document JSON format is also accepted and
+        rewritten as a journal.
+        If the journal doesn't exist yet, history saved by older versions to
+        the ``.json`` file beside it is imported into a new journal.
+
         Returns:
             Number of executions loaded.
         """
-        if not self.persistence_path.exists():
-            return 0
+        source = self.persistence_path
+        legacy = False
+        if not source.exists():
+            source = self.persistence_path.with_suffix(".json")
+            if self.persistence_path.suffix != ".jsonl" or not source.exists():
+                return 0
 
         try:
-            with open(self.persistence_path, encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Parse executions
-            loaded_executions = []
-            for e_dict in data.get("executions", []):
-                execution = SubagentExecution(
-                    id=e_dict["id"],
-                    parent_id=e_dict["parent_id"],
-                    subagent_type=e_dict["subagent_type"],
-                    task=e_dict["task"],
-                    started_at=datetime.fromisoformat(e_dict["started_at"]),
-                    ended_at=(
-                        datetime.fromisoformat(e_dict["ended_at"])
-                        if e_dict.get("ended_at")
-                        else None
-                    ),
-                    turns=e_dict.get("turns", 0),
-                    tool_calls=e_dict.get("tool_calls", []),
-                    result=e_dict.get("result"),
-                    error=e_dict.get("error"),
-                    tokens_used=e_dict.get("tokens_used", 0),
-                )
-                loaded_executions.append(execution)
-
-            self.executions = loaded_executions[-self.max_history:]
-            return len(self.executions)
-        except (OSError, KeyError, ValueError):
+            with self._journal_lock:
+                with open(source, encoding="utf-8") as f:
+                    first_line = f.readline()
+                    if first_line.strip() == "{":
+                        # Pre-journal format: one indented JSON document
+                        f.seek(0)
+                        records = json.load(f).get("executions", [])
+                        legacy = True
+                    else:
+                        records = self._read_journal(itertools.chain([first_line], f))
+                self._journal_records = len(records)
+
+            # Latest record wins; a compaction racing an append can duplicate one
+            latest: dict[str, dict[str, Any]] = {}
+            for e_dict in records:
+                latest.pop(e_dict["id"], None)
+                latest[e_dict["id"]] = e_dict
+            loaded_executions = [self._execution_from_dict(e_dict) for e_dict in latest.values()]
+            with self._lock:
+                self._reset_history(loaded_executions)
+                count = len(self.executions)
+        except (OSError, KeyError, ValueError, AttributeError):
             return 0
 
+        if legacy or source != self.persistence_path:
+            # Rewrite as a journal so later appends don't land inside the JSON
+            # document; a separate ``.json`` source file is left as is
+            self.save_to_disk()
+        return count
+
     def delete_persistence_file(self) -> bool:
         """Delete the persistence file.
 
@@ -804,12 +879,84 @@ class SubagentMonitor:
             True if file was deleted or didn't exist.
         """
         try:
-            if self.persistence_path.exists():
-                self.persistence_path.unlink()
+            with self._journal_lock:
+                if self.persistence_path.exists():
+                    self.persistence_path.unlink()
+                self._journal_records = 0
             return True
         except OSError:
             return False
 
+    def _append_to_journal(self, execution: SubagentExecution) -> bool:
+        """Append one completed execution to the journal.
+
+        Starts a background compaction once the journal has grown past
+        ``JOURNAL_COMPACT_FACTOR`` times the retained history.
+
+        Returns:
+            True if the record was written.
+        """
+        try:
+            line = self._journal_line(execution)
+            with self._journal_lock:
+                if not self._journal_records:
+                    self.persistence_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.persistence_path, "a", encoding="utf-8") as f:
+                    f.write(line)
+                self._journal_records += 1
+
+                compact = (
+                    self._journal_records > self.JOURNAL_COMPACT_FACTOR * self.max_history
+                    and (self._compaction_thread is None or not self._compaction_thread.is_alive())
+                )
+                if compact:
+                    self._compaction_thread = threading.Thread(
+                        target=self.save_to_disk,
+                        name="subagent-journal-compaction",
+                        daemon=True,
+                    )
+                    self._compaction_thread.start()
+            return True
+        except (OSError, TypeError, ValueError):
+            return False
+
+    @staticmethod
+    def _journal_line(execution: SubagentExecution) -> str:
+        return json.dumps(execution.to_dict(), separators=(",", ":")) + "\n"
+
+    @staticmethod
+    def _read_journal(lines: Any) -> list[dict[str, Any]]:
+        """Parse journal lines, skipping blank and torn records."""
+        records = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                logger.warning("Skipping corrupt subagent journal record")
+        return records
+
+    @staticmethod
+    def _execution_from_dict(e_dict: dict[str, Any]) -> SubagentExecution:
+        return SubagentExecution(
+            id=e_dict["id"],
+            parent_id=e_dict["parent_id"],
+            subagent_type=e_dict["subagent_type"],
+            task=e_dict["task"],
+            started_at=datetime.fromisoformat(e_dict["started_at"]),
+            ended_at=(
+                datetime.fromisoformat(e_dict["ended_at"])
+                if e_dict.get("ended_at")
+                else None
+            ),
+            turns=e_dict.get("turns", 0),
+            tool_calls=e_dict.get("tool_calls", []),
+            result=e_dict.get("result"),
+            error=e_dict.get("error"),
+            tokens_used=e_dict.get("tokens_used", 0),
+        )
+
 
 # =============================================================================
 # ANNOUNCE QUEUE SYSTEM
@@ -825,10 +972,18 @@ class AnnounceQueue:
 
     Features:
     - Priority-based ordering (URGENT > HIGH > NORMAL > LOW)
-    - Topic-based filtering
-    - Automatic expiration handling
+    - Topic-based filtering, backed by one priority heap per topic
+    - Session-based filtering, backed by one priority heap per source session
+      (overall and within each topic)
+    - Automatic expiration handling via an expiry min-heap
+    - Bounded size: the lowest-priority, oldest message is evicted first
+    - Blocking (poll_wait) and async (poll_async) polling with timeouts
     - Thread-safe operations
 
+    Messages live in ``_messages`` keyed by sequence number; the heaps hold
+    (key, sequence) entries and drop entries whose message is gone when they
+    reach the top, so removing a message never requires a re-sort.
+
     Example:
         queue = AnnounceQueue()
 
@@ -855,12 +1010,34 @@ class AnnounceQueue:
         self.max_size = max_size
         self.default_ttl_seconds = default_ttl_seconds
 
-        # Priority queue: (negative_priority, sequence, message)
+        # Live messages by sequence number (monotonically increasing, FIFO tie-break)
+        self._messages: dict[int, AnnounceMessage] = {}
+        self._sequence = 0
+
+        # Delivery order, per topic and across topics: (negative_priority, sequence)
         # Negative priority ensures higher priority comes first in min-heap
-        # Sequence ensures FIFO order for same priority and prevents message comparison
-        self._queue: list[tuple[int, int, AnnounceMessage]] = []
-        self._sequence = 0  # Monotonically increasing counter for FIFO tie-breaking
+        self._topic_heaps: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        self._all_heap: list[tuple[int, int]] = []
+        self._topic_counts: dict[str, int] = defaultdict(int)
+
+        # Delivery order per source session, keyed by (topic, session_id) and
+        # (None, session_id) so a session-filtered poll never skips past
+        # other sessions' messages
+        self._session_heaps: dict[tuple[str | None, str], list[tuple[int, int]]] = defaultdict(list)
+
+        # Expiry order: (expires_at, sequence)
+        self._expiry_heap: list[tuple[datetime, int]] = []
+
+        # Eviction order, lowest priority then oldest: (priority, sequence)
+        self._eviction_heap: list[tuple[int, int]] = []
+
+        # Entries across all heaps, and how many of them belong to live messages
+        self._heap_entries = 0
+        self._live_entries = 0
+
         self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._async_waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
 
         # Topic subscriptions: topic -> list of session_ids
         self._subscriptions: dict[str, set[str]] = defaultdict(set)
@@ -906,21 +1083,28 @@ class AnnounceQueue:
         )
 
         with self._lock:
-            # Add to priority queue (negative priority for max-heap behavior)
-            # Use sequence counter as tiebreaker for same priority (FIFO order)
             seq = self._sequence
             self._sequence += 1
-            heapq.heappush(
-                self._queue,
-                (-priority.value, seq, message)
-            )
+            self._messages[seq] = message
+            self._topic_counts[topic] += 1
+
+            heapq.heappush(self._topic_heaps[topic], (-priority.value, seq))
+            heapq.heappush(self._all_heap, (-priority.value, seq))
+            heapq.heappush(self._session_heaps[(topic, source_session_id)], (-priority.value, seq))
+            heapq.heappush(self._session_heaps[(None, source_session_id)], (-priority.value, seq))
+            heapq.heappush(self._eviction_heap, (priority.value, seq))
+            if expires_at is not None:
+                heapq.heappush(self._expiry_heap, (expires_at, seq))
+            entries = self._entries_per(message)
+            self._heap_entries += entries
+            self._live_entries += entries
 
             # Trim if over max size (remove oldest low-priority)
-            if len(self._queue) > self.max_size:
-                # Sort to find lowest priority, oldest messages
-                self._queue.sort(key=lambda x: (x[0], x[1]))  # Lowest priority, oldest sequence
-                self._queue = self._queue[:self.max_size]
-                heapq.heapify(self._queue)
+            while len(self._messages) > self.max_size:
+                self._evict_one()
+
+            self._compact_if_needed()
+            self._notify_waiters()
 
         return message
 
@@ -974,34 +1158,83 @@ class AnnounceQueue:
             List of matching announcements (highest priority first).
         """
         with self._lock:
-            # Clean expired messages first
-            self._cleanup_expired()
+            return self._poll_locked(topic, session_id, limit, remove)
+
+    def poll_wait(
+        self,
+        topic: str | None = None,
+        session_id: str | None = None,
+        limit: int = 10,
+        timeout: float | None = None,
+    ) -> list[AnnounceMessage]:
+        """Poll, blocking until a matching announcement arrives.
 
-            # Find matching messages
-            matches: list[AnnounceMessage] = []
-            remaining: list[tuple[int, float, AnnounceMessage]] = []
+        Args:
+            topic: Filter by topic (None = all topics).
+            session_id: Filter by source session (None = all sessions).
+            limit: Maximum messages to return.
+            timeout: Seconds to wait (None = wait indefinitely).
 
-            for item in self._queue:
-                _, _, msg = item
-                is_match = True
+        Returns:
+            Matching announcements (removed from the queue), or an empty
+            list if none arrived before the timeout.
+        """
+        with self._available:
+            messages = self._poll_locked(topic, session_id, limit, True)
+            if messages:
+                return messages
 
-                if topic is not None and msg.topic != topic:
-                    is_match = False
-                if session_id is not None and msg.source_session_id != session_id:
-                    is_match = False
-
-                if is_match and len(matches) < limit:
-                    matches.append(msg)
-                    if not remove:
-                        remaining.append(item)
-                else:
-                    remaining.append(item)
+            def ready() -> bool:
+                nonlocal messages
+                messages = self._poll_locked(topic, session_id, limit, True)
+                return bool(messages)
 
-            if remove:
-                self._queue = remaining
-                heapq.heapify(self._queue)
+            self._available.wait_for(ready, timeout=timeout)
+            return messages
 
-            return matches
+    async def poll_async(
+        self,
+        topic: str | None = None,
+        session_id: str | None = None,
+        limit: int = 10,
+        timeout: float | None = None,
+    ) -> list[AnnounceMessage]:
+        """Poll without blocking the event loop until a matching announcement arrives.
+
+        Publishers may run on any thread; they wake waiting coroutines via
+        their event loop.
+
+        Args:
+            topic: Filter by topic (None = all topics).
+            session_id: Filter by source session (None = all sessions).
+            limit: Maximum messages to return.
+            timeout: Seconds to wait (None = wait indefinitely).
+
+        Returns:
+            Matching announcements (removed from the queue), or an empty
+            list if none arrived before the timeout.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        while True:
+            waiter = (loop, asyncio.Event())
+            with self._lock:
+                messages = self._poll_locked(topic, session_id, limit, True)
+                if messages:
+                    return messages
+                self._async_waiters.add(waiter)
+
+            try:
+                remaining = None if deadline is None else deadline - loop.time()
+                if remaining is not None and remaining <= 0:
+                    return []
+                await asyncio.wait_for(waiter[1].wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return []
+            finally:
+                with self._lock:
+                    self._async_waiters.discard(waiter)
 
     def poll_all(self, topic: str | None = None) -> list[AnnounceMessage]:
         """Poll all matching announcements.
@@ -1058,8 +1291,8 @@ class AnnounceQueue:
         """
         with self._lock:
             if topic is None:
-                return len(self._queue)
-            return sum(1 for _, _, msg in self._queue if msg.topic == topic)
+                return len(self._messages)
+            return self._topic_counts.get(topic, 0)
 
     def clear(self, topic: str | None = None) -> int:
         """Clear messages from queue.
@@ -1072,17 +1305,139 @@ class AnnounceQueue:
         """
         with self._lock:
             if topic is None:
-                count = len(self._queue)
-                self._queue.clear()
+                count = len(self._messages)
+                self._messages.clear()
+                self._topic_heaps.clear()
+                self._topic_counts.clear()
+                self._all_heap.clear()
+                self._session_heaps.clear()
+                self._expiry_heap.clear()
+                self._eviction_heap.clear()
+                self._heap_entries = 0
+                self._live_entries = 0
                 return count
 
-            original_count = len(self._queue)
-            self._queue = [
-                item for item in self._queue
-                if item[2].topic != topic
-            ]
-            heapq.heapify(self._queue)
-            return original_count - len(self._queue)
+            count = 0
+            heap = self._topic_heaps.pop(topic, [])
+            self._heap_entries -= len(heap)
+            for _, seq in heap:
+                if self._discard(seq) is not None:
+                    count += 1
+            for key in [key for key in self._session_heaps if key[0] == topic]:
+                self._heap_entries -= len(self._session_heaps.pop(key))
+            self._compact_if_needed()
+            return count
+
+    def _poll_locked(
+        self,
+        topic: str | None,
+        session_id: str | None,
+        limit: int,
+        remove: bool,
+    ) -> list[AnnounceMessage]:
+        """Take up to ``limit`` matching messages in priority order. Called with lock held."""
+        # Clean expired messages first
+        self._cleanup_expired()
+
+        heaps: dict[Any, list[tuple[int, int]]]
+        if session_id is not None:
+            heaps, key = self._session_heaps, (topic, session_id)
+        elif topic is not None:
+            heaps, key = self._topic_heaps, topic
+        else:
+            heaps, key = {None: self._all_heap}, None
+        heap = heaps.get(key)
+        if not heap:
+            return []
+
+        taken: list[tuple[int, int]] = []
+        while heap and len(taken) < limit:
+            entry = heapq.heappop(heap)
+            if entry[1] not in self._messages:
+                self._heap_entries -= 1
+                continue  # Removed through another index
+            taken.append(entry)
+
+        matches = [self._messages[seq] for _, seq in taken]
+        if remove:
+            self._heap_entries -= len(taken)
+            for _, seq in taken:
+                self._discard(seq)
+        else:
+            for entry in taken:
+                heapq.heappush(heap, entry)
+
+        if key is not None and not heap:
+            del heaps[key]
+        if remove:
+            self._compact_if_needed()
+        return matches
+
+    def _discard(self, seq: int) -> AnnounceMessage | None:
+        """Remove a message; its heap entries become stale. Called with lock held."""
+        message = self._messages.pop(seq, None)
+        if message is not None:
+            self._live_entries -= self._entries_per(message)
+            remaining = self._topic_counts[message.topic] - 1
+            if remaining:
+                self._topic_counts[message.topic] = remaining
+            else:
+                del self._topic_counts[message.topic]
+        return message
+
+    def _evict_one(self) -> None:
+        """Evict the lowest-priority, oldest message. Called with lock held."""
+        while self._eviction_heap:
+            _, seq = heapq.heappop(self._eviction_heap)
+            self._heap_entries -= 1
+            if self._discard(seq) is not None:
+                return
+
+    @staticmethod
+    def _entries_per(message: AnnounceMessage) -> int:
+        """Heap entries a live message has: topic, all, two session, eviction (and expiry)."""
+        return 5 if message.expires_at is None else 6
+
+    def _compact_if_needed(self) -> None:
+        """Rebuild the heaps once stale entries outnumber live ones. Called with lock held.
+
+        Stale entries are counted across all heaps, since a message removed
+        through one heap leaves entries behind in the others.
+        """
+        if self._heap_entries - self._live_entries <= self._live_entries + 64:
+            return
+
+        self._topic_heaps = defaultdict(list)
+        self._all_heap = []
+        self._session_heaps = defaultdict(list)
+        self._eviction_heap = []
+        self._expiry_heap = []
+        for seq, message in self._messages.items():
+            self._topic_heaps[message.topic].append((-message.priority.value, seq))
+            self._all_heap.append((-message.priority.value, seq))
+            self._session_heaps[(message.topic, message.source_session_id)].append((-message.priority.value, seq))
+            self._session_heaps[(None, message.source_session_id)].append((-message.priority.value, seq))
+            self._eviction_heap.append((message.priority.value, seq))
+            if message.expires_at is not None:
+                self._expiry_heap.append((message.expires_at, seq))
+        for heap in (
+            *self._topic_heaps.values(),
+            *self._session_heaps.values(),
+            self._all_heap,
+            self._eviction_heap,
+            self._expiry_heap,
+        ):
+            heapq.heapify(heap)
+        self._heap_entries = self._live_entries
+
+    def _notify_waiters(self) -> None:
+        """Wake blocked and async pollers. Called with lock held."""
+        self._available.notify_all()
+        for loop, event in self._async_waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:  # Loop closed
+                pass
 
     def _cleanup_expired(self) -> int:
         """Remove expired messages. Called with lock held.
@@ -1090,14 +1445,14 @@ class AnnounceQueue:
         Returns:
             Number of messages removed.
         """
-        original_count = len(self._queue)
-        self._queue = [
-            item for item in self._queue
-            if not item[2].is_expired()
-        ]
-        heapq.heapify(self._queue)
-        return original_count - len(self._queue)
-
+        now = datetime.now()
+        removed = 0
+        while self._expiry_heap and self._expiry_heap[0][0] < now:
+            _, seq = heapq.heappop(self._expiry_heap)
+            self._heap_entries -= 1
+            if self._discard(seq) is not None:
+                removed += 1
+        return removed
 
 
 
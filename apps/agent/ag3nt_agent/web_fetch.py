@@ -0,0 +1,392 @@
+"""Pooled, cache-aware URL fetching for the ``fetch_url`` tool.
+
+This module provides:
+- One shared ``httpx.Client`` with keep-alive connection pooling (and HTTP/2
+  when the ``h2`` package is installed)
+- Streaming downloads that stop reading at a byte cap instead of buffering
+  whole pages
+- An on-disk HTTP cache honouring ``Cache-Control``/``Expires`` freshness
+  with ``ETag``/``Last-Modified`` conditional revalidation
+- Markdown conversion cached by content hash, so identical bodies (e.g. after
+  a 304 or from a mirror) are never re-converted
+
+Usage:
+    from ag3nt_agent.web_fetch import get_web_fetcher
+
+    result = get_web_fetcher().fetch("https://example.com", timeout=30)
+    print(result.markdown, result.from_cache)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Callable
+
+logger = logging.getLogger("ag3nt.web_fetch")
+
+_USER_AGENT = "Mozilla/5.0 (compatible; AG3NT/1.0; +https://github.com/ag3nt)"
+_DEFAULT_CACHE_DIR = Path.home() / ".ag3nt" / "fetch_cache"
+_MAX_BODY_BYTES = 2 * 1024 * 1024  # Raw bytes read before we stop the stream
+_MAX_MARKDOWN_CHARS = 100_000
+_HEURISTIC_FRESHNESS_CAP = 24 * 3600  # RFC 9111 §4.2.2 heuristic upper bound
+_PRUNE_EVERY = 100  # Stores between stale-entry sweeps
+_PRUNE_AGE_SECONDS = 7 * 24 * 3600
+
+_MAX_AGE_RE = re.compile(r"max-age\s*=\s*\"?(\d+)")
+
+
+class FetchError(RuntimeError):
+    """Raised when a URL cannot be fetched (network or HTTP error status)."""
+
+
+@dataclass
+class FetchResult:
+    """Result of fetching a URL."""
+
+    url: str
+    status_code: int
+    markdown: str
+    content_hash: str
+    from_cache: bool = False
+    revalidated: bool = False
+    truncated: bool = False
+
+
+@dataclass
+class CacheEntry:
+    """Cached response metadata for one URL."""
+
+    url: str
+    final_url: str
+    status_code: int
+    content_hash: str
+    stored_at: float
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+    truncated: bool = False
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        return (now or time.time()) < self.expires_at
+
+
+def _freshness_lifetime(headers: Any, now: float) -> float | None:
+    """Seconds a response may be served without revalidation.
+
+    Returns None if the response must not be stored at all.
+    """
+    cache_control = (headers.get("cache-control") or "").lower()
+    if "no-store" in cache_control:
+        return None
+    if "no-cache" in cache_control:
+        return 0.0
+    match = _MAX_AGE_RE.search(cache_control)
+    if match:
+        return float(match.group(1))
+    expires = headers.get("expires")
+    if expires:
+        try:
+            return max(0.0, parsedate_to_datetime(expires).timestamp() - now)
+        except (TypeError, ValueError):
+            return 0.0  # Invalid Expires means "already expired"
+    last_modified = headers.get("last-modified")
+    if last_modified:
+        try:
+            age = now - parsedate_to_datetime(last_modified).timestamp()
+        except (TypeError, ValueError):
+            return 0.0
+        return min(max(0.0, age / 10), _HEURISTIC_FRESHNESS_CAP)
+    return 0.0
+
+
+def _default_converter(html: str) -> str:
+    from markdownify import markdownify
+
+    return markdownify(html)
+
+
+class FetchCache:
+    """On-disk HTTP response cache.
+
+    Layout under ``cache_dir``:
+    - ``meta/<sha256(url)>.json`` -- ``CacheEntry`` for the URL
+    - ``markdown/<content_hash>.md`` -- converted markdown, shared by every
+      URL whose body hashes the same
+    """
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self.cache_dir = cache_dir or _DEFAULT_CACHE_DIR
+        self._meta_dir = self.cache_dir / "meta"
+        self._markdown_dir = self.cache_dir / "markdown"
+        self._meta_dir.mkdir(parents=True, exist_ok=True)
+        self._markdown_dir.mkdir(parents=True, exist_ok=True)
+        self._stores = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _write_atomic(path: Path, text: str) -> None:
+        tmp = path.with_suffix(f"{path.suffix}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _meta_path(self, url: str) -> Path:
+        return self._meta_dir / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    def get_entry(self, url: str) -> CacheEntry | None:
+        path = self._meta_path(url)
+        try:
+            entry = CacheEntry(**json.loads(path.read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logger.debug(f"Fetch cache read error: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        # Entry is useless if its markdown was pruned.
+        if not (self._markdown_dir / f"{entry.content_hash}.md").exists():
+            return None
+        return entry
+
+    def put_entry(self, entry: CacheEntry) -> None:
+        try:
+            self._write_atomic(self._meta_path(entry.url), json.dumps(asdict(entry)))
+        except OSError as e:
+            logger.warning(f"Fetch cache write error: {e}")
+            return
+        with self._lock:
+            self._stores += 1
+            prune = self._stores % _PRUNE_EVERY == 0
+        if prune:
+            self.prune()
+
+    def get_markdown(self, content_hash: str) -> str | None:
+        try:
+            return (self._markdown_dir / f"{content_hash}.md").read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def put_markdown(self, content_hash: str, markdown: str) -> None:
+        try:
+            self._write_atomic(self._markdown_dir / f"{content_hash}.md", markdown)
+        except OSError as e:
+            logger.warning(f"Fetch cache write error: {e}")
+
+    def prune(self, max_age_seconds: float = _PRUNE_AGE_SECONDS) -> int:
+        """Remove cache files not written within ``max_age_seconds``."""
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        for directory in (self._meta_dir, self._markdown_dir):
+            for path in directory.iterdir():
+                try:
+                    if path.stat().st_mtime < cutoff:
+                        path.unlink()
+                        removed += 1
+                except OSError:
+                    continue
+        return removed
+
+    def clear(self) -> int:
+        """Remove every cache entry."""
+        return self.prune(max_age_seconds=-1)
+
+
+class WebFetcher:
+    """Fetches URLs as markdown through a pooled client and an HTTP cache."""
+
+    def __init__(
+        self,
+        cache: FetchCache | None = None,
+        max_body_bytes: int = _MAX_BODY_BYTES,
+        max_markdown_chars: int = _MAX_MARKDOWN_CHARS,
+        converter: Callable[[str], str] | None = None,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+    ) -> None:
+        self.cache = cache
+        self.max_body_bytes = max_body_bytes
+        self.max_markdown_chars = max_markdown_chars
+        self._convert = converter or _default_converter
+        self._max_connections = max_connections
+        self._max_keepalive = max_keepalive_connections
+        self._client: Any = None
+        self._client_lock = threading.Lock()
+
+    def _get_client(self) -> Any:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    import httpx
+
+                    try:
+                        import h2  # noqa: F401
+
+                        http2 = True
+                    except ImportError:
+                        http2 = False
+                    self._client = httpx.Client(
+                        http2=http2,
+                        follow_redirects=True,
+                        headers={"User-Agent": _USER_AGENT},
+                        limits=httpx.Limits(
+                            max_connections=self._max_connections,
+                            max_keepalive_connections=self._max_keepalive,
+                        ),
+                    )
+        return self._client
+
+    def _markdown_for(self, body: bytes, encoding: str) -> tuple[str, str]:
+        """Return (content_hash, markdown), converting only on a cache miss."""
+        content_hash = hashlib.sha256(body).hexdigest()
+        if self.cache is not None:
+            cached = self.cache.get_markdown(content_hash)
+            if cached is not None:
+                return content_hash, cached
+        markdown = self._convert(body.decode(encoding, errors="replace"))
+        if len(markdown) > self.max_markdown_chars:
+            markdown = markdown[: self.max_markdown_chars]
+            markdown += f"\n\n... Content truncated at {self.max_markdown_chars} characters."
+        if self.cache is not None:
+            self.cache.put_markdown(content_hash, markdown)
+        return content_hash, markdown
+
+    def fetch(self, url: str, timeout: float = 30) -> FetchResult:
+        """Fetch *url* and return its content as markdown.
+
+        Raises:
+            FetchError: On invalid URLs, network errors or HTTP error statuses.
+        """
+        import httpx
+
+        entry = self.cache.get_entry(url) if self.cache is not None else None
+        if entry is not None and entry.is_fresh():
+            markdown = self.cache.get_markdown(entry.content_hash)
+            if markdown is not None:
+                return FetchResult(
+                    url=entry.final_url,
+                    status_code=entry.status_code,
+                    markdown=markdown,
+                    content_hash=entry.content_hash,
+                    from_cache=True,
+                    truncated=entry.truncated,
+                )
+
+        headers: dict[str, str] = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        try:
+            with self._get_client().stream("GET", url, headers=headers, timeout=timeout) as response:
+                now = time.time()
+                if response.status_code == 304 and entry is not None:
+                    return self._revalidated(entry, response.headers, now)
+                response.raise_for_status()
+
+                chunks: list[bytes] = []
+                size = 0
+                truncated = False
+                for chunk in response.iter_bytes():
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= self.max_body_bytes:
+                        truncated = True
+                        break
+                body = b"".join(chunks)[: self.max_body_bytes]
+                encoding = response.encoding or "utf-8"
+                final_url = str(response.url)
+                status_code = response.status_code
+                response_headers = response.headers
+        except httpx.HTTPStatusError as e:
+            raise FetchError(f"HTTP {e.response.status_code} for {url}") from e
+        except httpx.InvalidURL as e:  # Not an httpx.HTTPError
+            raise FetchError(f"Invalid URL {url!r}: {e}") from e
+        except httpx.HTTPError as e:  # Includes httpx.UnsupportedProtocol
+            raise FetchError(str(e) or type(e).__name__) from e
+
+        content_hash, markdown = self._markdown_for(body, encoding)
+
+        if self.cache is not None:
+            lifetime = _freshness_lifetime(response_headers, now)
+            etag = response_headers.get("etag")
+            last_modified = response_headers.get("last-modified")
+            if lifetime is not None and (lifetime > 0 or etag or last_modified):
+                self.cache.put_entry(CacheEntry(
+                    url=url,
+                    final_url=final_url,
+                    status_code=status_code,
+                    content_hash=content_hash,
+                    stored_at=now,
+                    expires_at=now + lifetime,
+                    etag=etag,
+                    last_modified=last_modified,
+                    truncated=truncated,
+                ))
+
+        return FetchResult(
+            url=final_url,
+            status_code=status_code,
+            markdown=markdown,
+            content_hash=content_hash,
+            truncated=truncated,
+        )
+
+    def _revalidated(self, entry: CacheEntry, headers: Any, now: float) -> FetchResult:
+        """Refresh a cache entry after a 304 Not Modified."""
+        markdown = self.cache.get_markdown(entry.content_hash) or ""
+        lifetime = _freshness_lifetime(headers, now)
+        entry.stored_at = now
+        entry.expires_at = now + (lifetime or 0.0)
+        entry.etag = headers.get("etag") or entry.etag
+        entry.last_modified = headers.get("last-modified") or entry.last_modified
+        self.cache.put_entry(entry)
+        return FetchResult(
+            url=entry.final_url,
+            status_code=entry.status_code,
+            markdown=markdown,
+            content_hash=entry.content_hash,
+            from_cache=True,
+            revalidated=True,
+            truncated=entry.truncated,
+        )
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+
+# Global instance (lazy initialization)
+_web_fetcher: WebFetcher | None = None
+_web_fetcher_lock = threading.Lock()
+
+
+def get_web_fetcher() -> WebFetcher:
+    """Get or create the shared WebFetcher instance.
+
+    The disk cache is disabled when ``AG3NT_FETCH_CACHE`` is ``0``.
+    """
+    global _web_fetcher
+    if _web_fetcher is None:
+        with _web_fetcher_lock:
+            if _web_fetcher is None:
+                cache = None
+                if os.environ.get("AG3NT_FETCH_CACHE", "1") != "0":
+                    try:
+                        cache = FetchCache()
+                    except OSError as e:
+                        logger.warning(f"Fetch cache unavailable: {e}")
+                _web_fetcher = WebFetcher(cache=cache)
+    return _web_fetcher
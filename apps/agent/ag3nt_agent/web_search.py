@@ -3,7 +3,8 @@
 This module provides web search capabilities with:
 - Tavily as primary provider (requires TAVILY_API_KEY)
 - DuckDuckGo as fallback (no API key required)
-- Result caching to reduce API calls
+- Result caching (indexed SQLite store, normalized query keys) to reduce API calls
+- Coalescing of concurrent identical searches into a single provider call
 - Rate limiting to prevent abuse
 - Structured output with SearchResult dataclass
 
@@ -20,15 +21,20 @@ Usage:
 
 from __future__ import annotations
 
+import atexit
+import concurrent.futures
 import hashlib
 import json
 import logging
 import os
+import re
+import sqlite3
 import time
+import unicodedata
 from dataclasses import asdict, dataclass, field
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from pathlib import Path
-from threading import Lock
+from threading import Lock, RLock
 from typing import Literal
 
 logger = logging.getLogger("ag3nt.web_search")
@@ -130,56 +136,156 @@ class RateLimiter:
             self._timestamps.clear()
 
 
+_QUERY_STRIP_RE = re.compile(r"[^\w\s+#.\-/:\"]")
+_WS_RUN_RE = re.compile(r"\s+")
+_LEGACY_ENTRY_RE = re.compile(r"[0-9a-f]{16}\.json")
+_LEGACY_ENTRY_FIELDS = frozenset({"query", "results", "provider", "timestamp"})
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query so trivially different phrasings share a cache key.
+
+    Applies NFKC + casefold, drops punctuation other than characters that
+    carry meaning in technical queries (``+ # . - / :``) and double quotes
+    (exact-phrase search), trims trailing sentence punctuation and collapses
+    whitespace.  Word order is kept.
+    """
+    text = unicodedata.normalize("NFKC", query).casefold()
+    text = _QUERY_STRIP_RE.sub(" ", text)
+    text = _WS_RUN_RE.sub(" ", text).strip()
+    return text.rstrip(".:-/ ").strip()
+
+
 @dataclass
 class SearchCache:
-    """Simple file-based cache for search results."""
+    """SQLite-backed cache for search results.
+
+    All entries live in one indexed table (``search_cache.db`` under
+    ``cache_dir``), so expiry and LRU eviction are single indexed DELETEs
+    rather than directory scans.  Writes and access-time updates are
+    buffered in memory and committed in batches; buffered entries are
+    visible to ``get`` immediately.
+    """
 
     cache_dir: Path = field(default_factory=lambda: Path.home() / ".ag3nt" / "search_cache")
     ttl_hours: int = 1
     enabled: bool = True
+    max_entries: int = 5000
+    batch_size: int = 32
+    flush_interval: float = 2.0
 
     def __post_init__(self) -> None:
-        """Ensure cache directory exists."""
+        """Ensure cache directory and schema exist."""
+        self._lock = RLock()
+        self._conn: sqlite3.Connection | None = None
+        self._pending: dict[str, tuple[str, str, float, float]] = {}
+        self._touched: dict[str, float] = {}
+        self._last_flush = time.monotonic()
         if self.enabled:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._connect()
+            atexit.register(self.flush)
+
+    def _connect(self) -> None:
+        conn = sqlite3.connect(
+            str(self.cache_dir / "search_cache.db"),
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS search_cache (
+                key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_search_cache_expires
+                ON search_cache(expires_at);
+            CREATE INDEX IF NOT EXISTS idx_search_cache_access
+                ON search_cache(last_access);
+            """
+        )
+        self._conn = conn
+        (schema_version,) = conn.execute("PRAGMA user_version").fetchone()
+        if schema_version < 1:
+            self._remove_legacy_files()
+            conn.execute("PRAGMA user_version = 1")
+
+    def _remove_legacy_files(self) -> None:
+        """Delete entries of the old one-JSON-file-per-query layout.
+
+        ``cache_dir`` may be shared, so only files with this cache's key
+        naming and entry fields are removed.
+        """
+        removed = 0
+        for path in self.cache_dir.glob("*.json"):
+            if not _LEGACY_ENTRY_RE.fullmatch(path.name):
+                continue
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if isinstance(data, dict) and _LEGACY_ENTRY_FIELDS <= data.keys():
+                path.unlink(missing_ok=True)
+                removed += 1
+        if removed:
+            logger.info(f"Removed {removed} legacy search cache files from {self.cache_dir}")
 
-    def _get_cache_key(self, query: str, max_results: int) -> str:
+    def _get_cache_key(self, query: str, max_results: int, topic: str = "general") -> str:
         """Generate cache key from query parameters."""
-        key_str = f"{query.lower().strip()}:{max_results}"
+        key_str = f"{normalize_query(query)}:{max_results}:{topic}"
         return hashlib.sha256(key_str.encode()).hexdigest()[:16]
 
-    def _get_cache_path(self, cache_key: str) -> Path:
-        """Get path to cache file."""
-        return self.cache_dir / f"{cache_key}.json"
-
-    def get(self, query: str, max_results: int) -> SearchResponse | None:
+    def get(
+        self,
+        query: str,
+        max_results: int,
+        topic: str = "general",
+    ) -> SearchResponse | None:
         """Get cached response if valid.
 
         Args:
             query: Search query.
             max_results: Max results requested.
+            topic: Search topic.
 
         Returns:
             Cached SearchResponse or None if not found/expired.
         """
-        if not self.enabled:
+        if not self.enabled or self._conn is None:
             return None
 
-        cache_key = self._get_cache_key(query, max_results)
-        cache_path = self._get_cache_path(cache_key)
+        cache_key = self._get_cache_key(query, max_results, topic)
+        now = time.time()
 
-        if not cache_path.exists():
-            return None
-
-        try:
-            data = json.loads(cache_path.read_text(encoding="utf-8"))
-            cached_time = datetime.fromisoformat(data["timestamp"].replace("Z", "+00:00"))
-            expiry = cached_time + timedelta(hours=self.ttl_hours)
-
-            if datetime.now(timezone.utc) > expiry:
-                cache_path.unlink(missing_ok=True)
+        with self._lock:
+            row = self._pending.get(cache_key)
+            if row is None:
+                found = self._conn.execute(
+                    "SELECT payload, created_at, expires_at FROM search_cache WHERE key = ?",
+                    (cache_key,),
+                ).fetchone()
+                if found is None:
+                    return None
+                payload, created_at, expires_at = found
+            else:
+                payload, _query, created_at, expires_at = row
+
+            if now > expires_at:
+                self._pending.pop(cache_key, None)
+                self._touched.pop(cache_key, None)
+                self._conn.execute("DELETE FROM search_cache WHERE key = ?", (cache_key,))
                 return None
 
+            self._touched[cache_key] = now
+            self._maybe_flush()
+
+        try:
+            data = json.loads(payload)
             results = tuple(
                 SearchResult(
                     title=r["title"],
@@ -191,7 +297,6 @@ class SearchCache:
                 )
                 for r in data["results"]
             )
-
             return SearchResponse(
                 query=data["query"],
                 results=results,
@@ -200,35 +305,111 @@ class SearchCache:
                 timestamp=data["timestamp"],
                 error=data.get("error"),
             )
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
             logger.debug(f"Cache read error: {e}")
-            cache_path.unlink(missing_ok=True)
+            with self._lock:
+                self._pending.pop(cache_key, None)
+                self._conn.execute("DELETE FROM search_cache WHERE key = ?", (cache_key,))
             return None
 
-    def set(self, query: str, max_results: int, response: SearchResponse) -> None:
+    def set(
+        self,
+        query: str,
+        max_results: int,
+        response: SearchResponse,
+        topic: str = "general",
+    ) -> None:
         """Cache a search response.
 
         Args:
             query: Search query.
             max_results: Max results requested.
             response: Response to cache.
+            topic: Search topic.
         """
-        if not self.enabled or response.error:
+        if not self.enabled or self._conn is None or response.error:
             return
 
-        cache_key = self._get_cache_key(query, max_results)
-        cache_path = self._get_cache_path(cache_key)
-
+        cache_key = self._get_cache_key(query, max_results, topic)
+        timestamp = response.timestamp or datetime.now(timezone.utc).isoformat()
         try:
-            data = {
+            created_at = datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            created_at = time.time()
+        payload = json.dumps(
+            {
                 "query": response.query,
                 "results": [r.to_dict() for r in response.results],
                 "provider": response.provider,
-                "timestamp": response.timestamp or datetime.now(timezone.utc).isoformat(),
-            }
-            cache_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-        except OSError as e:
-            logger.warning(f"Cache write error: {e}")
+                "timestamp": timestamp,
+            },
+            separators=(",", ":"),
+        )
+        with self._lock:
+            self._pending[cache_key] = (
+                payload,
+                response.query,
+                created_at,
+                created_at + self.ttl_hours * 3600,
+            )
+            self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        """Flush if the batch is full or the flush interval elapsed."""
+        if (
+            len(self._pending) + len(self._touched) >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit buffered writes and access times in one transaction."""
+        if self._conn is None:
+            return
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._pending and not self._touched:
+                return
+            now = time.time()
+            try:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO search_cache "
+                    "(key, payload, created_at, expires_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (key, payload, created_at, expires_at, self._touched.get(key, now))
+                        for key, (payload, _query, created_at, expires_at) in self._pending.items()
+                    ],
+                )
+                self._conn.executemany(
+                    "UPDATE search_cache SET last_access = ? WHERE key = ?",
+                    [(t, key) for key, t in self._touched.items() if key not in self._pending],
+                )
+                self._evict()
+                self._conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                logger.warning(f"Cache write error: {e}")
+                self._conn.execute("ROLLBACK")
+            finally:
+                self._pending.clear()
+                self._touched.clear()
+
+    def _evict(self) -> None:
+        """Trim the table to ``max_entries``: expired rows first, then LRU."""
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()
+        if count <= self.max_entries:
+            return
+        count -= self._conn.execute(
+            "DELETE FROM search_cache WHERE expires_at <= ?", (time.time(),)
+        ).rowcount
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM search_cache WHERE key IN ("
+                "SELECT key FROM search_cache ORDER BY last_access LIMIT ?)",
+                (excess,),
+            )
 
     def clear(self, expired_only: bool = True) -> int:
         """Clear cache entries.
@@ -239,28 +420,36 @@ class SearchCache:
         Returns:
             Number of entries removed.
         """
-        if not self.cache_dir.exists():
+        if self._conn is None:
             return 0
 
-        removed = 0
-        now = datetime.now(timezone.utc)
-
-        for cache_file in self.cache_dir.glob("*.json"):
-            try:
-                if expired_only:
-                    data = json.loads(cache_file.read_text(encoding="utf-8"))
-                    cached_time = datetime.fromisoformat(data["timestamp"].replace("Z", "+00:00"))
-                    if now <= cached_time + timedelta(hours=self.ttl_hours):
-                        continue
-                cache_file.unlink()
-                removed += 1
-            except (json.JSONDecodeError, KeyError, ValueError, OSError):
-                cache_file.unlink(missing_ok=True)
-                removed += 1
-
-        return removed
+        self.flush()
+        with self._lock:
+            if expired_only:
+                cursor = self._conn.execute(
+                    "DELETE FROM search_cache WHERE expires_at <= ?", (time.time(),)
+                )
+            else:
+                cursor = self._conn.execute("DELETE FROM search_cache")
+            return cursor.rowcount
 
+    def __len__(self) -> int:
+        if self._conn is None:
+            return 0
+        self.flush()
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()
+        return count
 
+    def close(self) -> None:
+        """Flush pending writes and close the database."""
+        if self._conn is None:
+            return
+        self.flush()
+        with self._lock:
+            self._conn.close()
+            self._conn = None
+        atexit.unregister(self.flush)
 
 
 class WebSearchTool:
@@ -283,10 +472,12 @@ class WebSearchTool:
         """
         self.tavily_api_key = tavily_api_key or os.environ.get("TAVILY_API_KEY")
         self.max_results = max_results
-        self.cache = cache or SearchCache()
-        self.rate_limiter = rate_limiter or RateLimiter()
+        self.cache = cache if cache is not None else SearchCache()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
         self._tavily_limiter = RateLimiter(requests_per_minute=60)  # Tavily limit
         self._ddg_limiter = RateLimiter(requests_per_minute=30)  # DuckDuckGo limit
+        self._inflight: dict[str, concurrent.futures.Future[SearchResponse]] = {}
+        self._inflight_lock = Lock()
 
     def search(
         self,
@@ -307,15 +498,46 @@ class WebSearchTool:
             SearchResponse with results from Tavily or DuckDuckGo.
         """
         max_results = max_results or self.max_results
-        timestamp = datetime.now(timezone.utc).isoformat()
 
         # Check cache first
         if use_cache:
-            cached = self.cache.get(query, max_results)
+            cached = self.cache.get(query, max_results, topic)
             if cached:
                 logger.debug(f"Cache hit for query: {query[:50]}")
                 return cached
 
+        # Coalesce concurrent identical searches onto one provider call
+        key = self.cache._get_cache_key(query, max_results, topic)
+        with self._inflight_lock:
+            pending = self._inflight.get(key)
+            leader = pending is None
+            if leader:
+                pending = concurrent.futures.Future()
+                self._inflight[key] = pending
+        if not leader:
+            logger.debug(f"Joining in-flight search for query: {query[:50]}")
+            return pending.result()
+
+        try:
+            response = self._search_uncached(query, max_results, topic)
+            pending.set_result(response)
+            return response
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _search_uncached(
+        self,
+        query: str,
+        max_results: int,
+        topic: str,
+    ) -> SearchResponse:
+        """Query providers and cache a successful response."""
+        timestamp = datetime.now(timezone.utc).isoformat()
+
         # Check global rate limit
         if not self.rate_limiter.acquire():
             wait = self.rate_limiter.wait_time()
@@ -331,14 +553,14 @@ class WebSearchTool:
         if self.tavily_api_key:
             response = self._search_tavily(query, max_results, topic, timestamp)
             if response.success:
-                self.cache.set(query, max_results, response)
+                self.cache.set(query, max_results, response, topic)
                 return response
             logger.warning(f"Tavily search failed: {response.error}, trying DuckDuckGo")
 
         # Fallback to DuckDuckGo
         response = self._search_duckduckgo(query, max_results, timestamp)
         if response.success:
-            self.cache.set(query, max_results, response)
+            self.cache.set(query, max_results, response, topic)
         return response
 
     def _search_tavily(
@@ -289,7 +289,8 @@ def health():
 def pool_stats():
     """Get agent pool statistics.
 
-    Returns pool hit rate, current size, and usage metrics.
+    Returns pool hit rate, current size, session affinity and wait metrics,
+    plus per-instance memory and turn latency under ``instances``.
     Only available when AG3NT_USE_AGENT_POOL=true.
     """
     if not _use_agent_pool:
@@ -300,6 +301,17 @@ def pool_stats():
     return PoolStatsResponse(enabled=True, stats=stats)
 
 
+@app.get("/sources/cache/stats")
+def source_cache_stats():
+    """Get skills/memory source cache statistics.
+
+    Returns hit rate and counters for the cache that lets new sessions reuse
+    parsed skills and memory files instead of re-reading them.
+    """
+    from ag3nt_agent.deepagents_runtime import get_source_cache_stats
+    return get_source_cache_stats()
+
+
 @app.get("/autonomous/status", response_model=AutonomousStatusResponse)
 async def autonomous_status():
     """Get autonomous system status.
@@ -537,17 +549,19 @@ async def _process_turn_ws(
     try:
         # Set up streaming: forward tool events to WebSocket
         stream_manager = get_stream_manager()
+        loop = asyncio.get_running_loop()
 
         def on_tool_event(event: ToolEvent) -> None:
             """Forward tool events to WebSocket."""
             try:
-                # Use asyncio to send from sync callback
-                asyncio.create_task(
+                # Tools emit from executor threads; hand the send to the event loop
+                asyncio.run_coroutine_threadsafe(
                     ws.send_json({
                         "type": "stream",
                         "request_id": request_id,
                         "event": event.to_dict(),
-                    })
+                    }),
+                    loop,
                 )
             except Exception as e:
                 ws_logger.debug(f"Failed to send stream event: {e}")
@@ -559,7 +573,6 @@ async def _process_turn_ws(
             _session_websockets[session_id] = ws
 
         # Run the synchronous turn in a thread pool
-        loop = asyncio.get_event_loop()
         result = await loop.run_in_executor(
             None,
             lambda: deepagents_run_turn(
@@ -147,6 +147,16 @@ def mock_session() -> dict[str, Any]:
     }
 
 
+@pytest.fixture(autouse=True)
+def _isolated_request_context() -> Generator[None, None, None]:
+    """Start every test outside any turn, whatever earlier tests set."""
+    from ag3nt_agent.request_context import _current
+
+    token = _current.set(None)
+    yield
+    _current.reset(token)
+
+
 # ============================================================================
 # Tool Execution Fixtures
 # ============================================================================
@@ -263,7 +263,8 @@ class TestAgentPoolConcurrency:
             "ag3nt_agent.agent_pool.AgentPool._build_agent",
             return_value=mock_agent,
         ):
-            pool = AgentPool(pool_size=3)
+            # Seven acquirers find every agent checked out and time out
+            pool = AgentPool(pool_size=3, acquire_timeout=0.1)
             barrier = threading.Barrier(10)
 
             def do_acquire():
@@ -371,6 +372,269 @@ class TestAgentPoolConcurrency:
             # Releases may be fewer if acquire hadn't completed yet
 
 
+def _distinct_agents():
+    """Patch _build_agent so every build returns a new mock agent."""
+    return patch(
+        "ag3nt_agent.agent_pool.AgentPool._build_agent",
+        side_effect=lambda: MagicMock(),
+    )
+
+
+def _slow_agents():
+    """Like _distinct_agents, but each build takes a moment, as real builds do."""
+    def build():
+        time.sleep(0.02)
+        return MagicMock()
+
+    return patch("ag3nt_agent.agent_pool.AgentPool._build_agent", side_effect=build)
+
+
+class TestSessionAffinity:
+    """Tests for session-affine checkouts."""
+
+    def test_session_returns_to_same_instance(self):
+        """A session is served by the instance of its previous turn."""
+        with _distinct_agents():
+            pool = AgentPool(pool_size=3)
+            pool.initialize()
+
+            first = {sid: pool.acquire(sid) for sid in ("a", "b", "c")}
+            for entry in first.values():
+                pool.release(entry)
+
+            for sid in ("c", "a", "b"):
+                entry = pool.acquire(sid)
+                assert entry is first[sid]
+                pool.release(entry)
+
+            stats = pool.get_stats()
+            assert stats.affinity_hits == 3
+            assert stats.pool_misses == 0
+
+    def test_busy_affine_instance_falls_back_to_another(self):
+        """A concurrent turn of the same session gets another warm instance."""
+        with _distinct_agents():
+            pool = AgentPool(pool_size=2)
+            pool.initialize()
+
+            first = pool.acquire("a")
+            second = pool.acquire("a")
+
+            assert second is not first
+            assert pool.get_stats().affinity_misses == 1
+
+    def test_concurrent_checkouts_are_exclusive(self):
+        """Concurrent turns never share an instance and all reuse the pool."""
+        with _distinct_agents():
+            pool = AgentPool(pool_size=4, acquire_timeout=5.0)
+            pool.initialize()
+            in_use: set[str] = set()
+            lock = threading.Lock()
+            overlaps = []
+
+            def turn(i):
+                entry = pool.acquire(f"session-{i % 6}")
+                with lock:
+                    if entry.entry_id in in_use:
+                        overlaps.append(entry.entry_id)
+                    in_use.add(entry.entry_id)
+                time.sleep(0.005)
+                with lock:
+                    in_use.discard(entry.entry_id)
+                pool.release(entry)
+
+            threads = [threading.Thread(target=turn, args=(i,)) for i in range(40)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            stats = pool.get_stats()
+            assert overlaps == []
+            assert stats.pool_misses == 0
+            assert stats.current_size == 4
+            assert stats.in_use == 0
+
+
+class TestBoundedWaiting:
+    """Tests for waiting on a fully checked-out pool."""
+
+    def test_waiter_gets_released_instance(self):
+        """An acquirer waits for a release instead of building a new agent."""
+        with _distinct_agents():
+            pool = AgentPool(pool_size=1, acquire_timeout=5.0)
+            pool.initialize()
+            held = pool.acquire("a")
+
+            threading.Timer(0.05, pool.release, args=(held,)).start()
+            entry = pool.acquire("b")
+
+            stats = pool.get_stats()
+            assert entry is held
+            assert stats.waits == 1
+            assert stats.pool_misses == 0
+
+    def test_timeout_builds_extra_instance_dropped_on_release(self):
+        """After the timeout an extra agent is built, then not kept."""
+        with _distinct_agents():
+            pool = AgentPool(pool_size=1, acquire_timeout=0.05)
+            pool.initialize()
+            held = pool.acquire("a")
+
+            extra = pool.acquire("b")
+            assert extra is not held
+            assert pool.get_stats().wait_timeouts == 1
+
+            pool.release(held)
+            pool.release(extra)
+            assert pool.get_stats().current_size == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_async_waits_without_blocking_loop(self):
+        """acquire_async waits in the thread pool, leaving the loop free."""
+        import asyncio
+
+        with _distinct_agents():
+            pool = AgentPool(pool_size=1, acquire_timeout=5.0)
+            await pool.initialize_async()
+            held = await pool.acquire_async("a")
+
+            waiter = asyncio.ensure_future(pool.acquire_async("b"))
+            await asyncio.sleep(0.05)
+            assert not waiter.done()
+
+            pool.release(held)
+            entry = await asyncio.wait_for(waiter, timeout=2.0)
+            assert entry is held
+
+    def test_retired_instance_is_replaced_in_background(self):
+        """Retiring an exhausted agent warms a replacement."""
+        with _distinct_agents():
+            pool = AgentPool(pool_size=2, max_turns_per_agent=1, warmup_threshold=1.0)
+            pool.initialize()
+
+            pool.release(pool.acquire("a"))
+
+            deadline = time.time() + 2.0
+            while pool.get_stats().current_size < 2 and time.time() < deadline:
+                time.sleep(0.01)
+            stats = pool.get_stats()
+            assert stats.retirements == 1
+            assert stats.current_size == 2
+            assert stats.warmups_completed == 3
+
+
+class TestInstanceStats:
+    """Tests for per-instance statistics."""
+
+    def test_latency_and_memory_reported(self):
+        """Each instance reports turn latency and an approximate size."""
+        with patch(
+            "ag3nt_agent.agent_pool.AgentPool._build_agent",
+            side_effect=lambda: {"cache": [str(i) * 1000 for i in range(10)]},
+        ):
+            pool = AgentPool(pool_size=2)
+            pool.initialize()
+
+            entry = pool.acquire("a")
+            time.sleep(0.02)
+            pool.release(entry)
+
+            pool.refresh_memory()
+            instances = {i["id"]: i for i in pool.get_instance_stats()}
+            assert len(instances) == 2
+            used = instances[entry.entry_id]
+            assert used["turnsExecuted"] == 1
+            assert used["lastTurnSeconds"] >= 0.02
+            assert used["memoryBytes"] > 10_000
+            assert used["inUse"] is False
+
+
+    def test_stats_request_does_not_measure_memory(self):
+        """Memory is measured in the background, not on the stats request."""
+        with _distinct_agents():
+            pool = AgentPool(pool_size=1)
+            pool.initialize()
+            measured = threading.Event()
+
+            def slow_estimate(_obj):
+                measured.wait(2.0)
+                return 123
+
+            with patch("ag3nt_agent.agent_pool.estimate_size", side_effect=slow_estimate):
+                start = time.monotonic()
+                instances = pool.get_instance_stats()
+                assert time.monotonic() - start < 0.5
+                assert instances[0]["memoryBytes"] is None
+
+                measured.set()
+                deadline = time.time() + 2.0
+                while pool.get_instance_stats()[0]["memoryBytes"] is None and time.time() < deadline:
+                    time.sleep(0.01)
+            assert pool.get_instance_stats()[0]["memoryBytes"] == 123
+
+
+class TestConcurrentInitialize:
+    """Tests for racing first turns."""
+
+    def test_concurrent_initialize_warms_one_pool(self):
+        """Two threads initializing at once build pool_size agents, not twice that."""
+        with _slow_agents() as built:
+            pool = AgentPool(pool_size=3)
+            threads = [threading.Thread(target=pool.initialize) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            assert built.call_count == 3
+            assert pool.get_stats().current_size == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_initialize_async_warms_one_pool(self):
+        import asyncio
+
+        with _slow_agents() as built:
+            pool = AgentPool(pool_size=3)
+            await asyncio.gather(*(pool.initialize_async() for _ in range(4)))
+
+            assert built.call_count == 3
+            assert pool.get_stats().current_size == 3
+
+
+class TestRuntimeIntegration:
+    """Tests for the pool in the run_turn path."""
+
+    def test_run_turn_releases_instance(self, monkeypatch):
+        """Many more turns than instances all reuse warm, session-affine agents."""
+        from langchain_core.messages import AIMessage
+
+        import ag3nt_agent.agent_pool as pool_module
+        import ag3nt_agent.deepagents_runtime as runtime
+
+        served: dict[str, set[int]] = {}
+
+        class FakeAgent:
+            def invoke(self, _input, config):
+                served.setdefault(config["configurable"]["thread_id"], set()).add(id(self))
+                return {"messages": [AIMessage(content="ok")]}
+
+        monkeypatch.setattr(runtime, "_use_agent_pool", True)
+        monkeypatch.setattr(pool_module, "_agent_pool", AgentPool(pool_size=2, acquire_timeout=0.05))
+        with patch("ag3nt_agent.agent_pool.AgentPool._build_agent", side_effect=FakeAgent):
+            for _ in range(5):
+                for sid in ("a", "b"):
+                    assert runtime.run_turn(sid, "hi")["text"] == "ok"
+
+            stats = pool_module.get_agent_pool().get_stats()
+            assert stats.pool_misses == 0
+            assert stats.current_size == 2
+            assert {sid: len(ids) for sid, ids in served.items()} == {"a": 1, "b": 1}
+
+            assert runtime.get_pool_stats()["instances"][0]["turnsExecuted"] == 5
+        shutdown_pool()
+
+
 class TestGetAgentPool:
     """Tests for the global pool singleton."""
 
@@ -0,0 +1,231 @@
+"""
+Tests for the autonomous File Watcher source.
+"""
+
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ag3nt_agent.autonomous.sources.file_watcher import (
+    FileEventType,
+    FileWatcher,
+    SnapshotScanner,
+    WatchConfig,
+)
+
+
+@pytest.fixture
+def event_bus():
+    bus = MagicMock()
+    bus.publish = AsyncMock()
+    return bus
+
+
+def _manual(watcher, monkeypatch):
+    """Drive checks from the test instead of the background poll loop."""
+    monkeypatch.setattr(watcher, "_poll_loop", AsyncMock())
+    return watcher
+
+
+def _published(bus):
+    return [
+        (call.args[0].payload["event_type"], os.path.basename(call.args[0].payload["path"]))
+        for call in bus.publish.await_args_list
+        if call.args[0].event_type == "file_change"
+    ]
+
+
+class TestSnapshotScanner:
+    """Tests for incremental directory snapshots."""
+
+    def test_detects_created_modified_deleted(self, tmp_path):
+        """Scans diff against the previous snapshot."""
+        (tmp_path / "a.py").write_text("a")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.py").write_text("b")
+        scanner = SnapshotScanner(WatchConfig(id="w", path=str(tmp_path), patterns=["*.py"]))
+        states, changes = scanner.scan({})
+        assert {os.path.basename(p) for p, _ in changes} == {"a.py", "b.py"}
+
+        (tmp_path / "a.py").write_text("a changed")
+        (tmp_path / "sub" / "b.py").unlink()
+        (tmp_path / "sub" / "c.py").write_text("c")
+        (tmp_path / "notes.txt").write_text("ignored by pattern")
+        _, changes = scanner.scan(states)
+
+        assert sorted((os.path.basename(p), t) for p, t in changes) == [
+            ("a.py", FileEventType.MODIFIED),
+            ("b.py", FileEventType.DELETED),
+            ("c.py", FileEventType.CREATED),
+        ]
+
+    def test_unchanged_directories_are_not_relisted(self, tmp_path):
+        """Only directories whose entries changed are listed again."""
+        for name in ("one", "two", "three"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "f.txt").write_text(name)
+        scanner = SnapshotScanner(WatchConfig(id="w", path=str(tmp_path)))
+        states, _ = scanner.scan({})
+        assert scanner.dirs_listed == 4
+
+        (tmp_path / "two" / "g.txt").write_text("new")
+        _, changes = scanner.scan(states)
+
+        assert [os.path.basename(p) for p, _ in changes] == ["g.txt"]
+        assert scanner.dirs_listed == 5
+        assert scanner.dirs_skipped == 3
+
+    def test_ignored_subtrees_are_pruned(self, tmp_path):
+        """Directories fully covered by an ignore pattern are never walked."""
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "index.js").write_text("x")
+        (tmp_path / "app.js").write_text("x")
+        scanner = SnapshotScanner(WatchConfig(
+            id="w", path=str(tmp_path), ignore_patterns=["*/node_modules/*"],
+        ))
+
+        states, _ = scanner.scan({})
+
+        assert [os.path.basename(p) for p in states] == ["app.js"]
+        assert scanner.dirs_listed == 1
+
+    def test_modifications_ignored_when_not_tracked(self, tmp_path):
+        """Without "modified" in events, unchanged listings need no file stats."""
+        (tmp_path / "a.txt").write_text("a")
+        scanner = SnapshotScanner(WatchConfig(id="w", path=str(tmp_path), events=["created", "deleted"]))
+        states, _ = scanner.scan({})
+
+        (tmp_path / "a.txt").write_text("longer content")
+        new_states, changes = scanner.scan(states)
+
+        assert changes == []
+        assert new_states[str(tmp_path / "a.txt")] is states[str(tmp_path / "a.txt")]
+
+
+class TestFileWatcherPolling:
+    """Tests for the polling mode (no watchdog)."""
+
+    async def test_emits_debounced_and_coalesced_events(self, tmp_path, event_bus, monkeypatch):
+        """A file created then modified in one window is reported as created."""
+        (tmp_path / "keep.txt").write_text("k")
+        watcher = _manual(FileWatcher(event_bus), monkeypatch)
+        watcher.add_watcher(WatchConfig(id="w", path=str(tmp_path), debounce_seconds=0))
+        await watcher.start()
+        try:
+            (tmp_path / "new.txt").write_text("1")
+            (tmp_path / "tmp.txt").write_text("1")
+            await watcher._check_all_watchers()
+            (tmp_path / "new.txt").write_text("12")
+            (tmp_path / "tmp.txt").unlink()
+            (tmp_path / "keep.txt").write_text("changed")
+            await watcher._check_all_watchers()
+            await watcher._process_pending_events()
+        finally:
+            await watcher.stop()
+
+        assert sorted(_published(event_bus)) == [("created", "new.txt"), ("modified", "keep.txt")]
+
+    async def test_large_bursts_are_batched(self, tmp_path, event_bus, monkeypatch):
+        """More changes than the threshold become one batch event."""
+        watcher = _manual(FileWatcher(event_bus, batch_threshold=10), monkeypatch)
+        watcher.add_watcher(WatchConfig(id="w", path=str(tmp_path), debounce_seconds=0))
+        await watcher.start()
+        try:
+            for i in range(25):
+                (tmp_path / f"f{i}.txt").write_text("x")
+            await watcher._check_all_watchers()
+            await watcher._process_pending_events()
+        finally:
+            await watcher.stop()
+
+        (event,) = [call.args[0] for call in event_bus.publish.await_args_list]
+        assert event.event_type == "file_change_batch"
+        assert event.payload["change_count"] == 25
+        assert event.payload["counts"] == {"created": 25, "modified": 0, "deleted": 0}
+
+    async def test_poll_interval_backs_off_while_idle(self, tmp_path, event_bus):
+        """Idle polls double the interval up to the maximum."""
+        watcher = FileWatcher(event_bus, poll_interval=0.01, max_poll_interval=0.04)
+        watcher.add_watcher(WatchConfig(id="w", path=str(tmp_path)))
+        await watcher.start()
+        try:
+            await asyncio.sleep(0.2)
+            assert watcher.get_status()["poll_interval"] == 0.04
+        finally:
+            await watcher.stop()
+
+
+class TestFileWatcherEvents:
+    """Tests for the filesystem-event mode."""
+
+    @pytest.fixture
+    async def watcher(self, tmp_path, event_bus, monkeypatch):
+        watcher = _manual(FileWatcher(event_bus), monkeypatch)
+        monkeypatch.setattr(type(watcher._events), "running", property(lambda self: True))
+        monkeypatch.setattr(watcher._events, "start", lambda loop=None: True)
+        monkeypatch.setattr(watcher._events, "watch", lambda directory, recursive=False: True)
+        watcher.add_watcher(WatchConfig(id="w", path=str(tmp_path), debounce_seconds=0, patterns=["*.py"]))
+        await watcher.start()
+        yield watcher
+        await watcher.stop()
+
+    async def test_file_events_update_state(self, tmp_path, event_bus, watcher):
+        """Created, modified and deleted events are applied without scanning."""
+        path = tmp_path / "a.py"
+        path.write_text("1")
+        watcher._on_fs_event("created", str(path), "", False)
+        path.write_text("12")
+        watcher._on_fs_event("modified", str(path), "", False)
+        (tmp_path / "b.txt").write_text("not matching")
+        watcher._on_fs_event("created", str(tmp_path / "b.txt"), "", False)
+        await watcher._process_pending_events()
+
+        path.unlink()
+        watcher._on_fs_event("deleted", str(path), "", False)
+        await watcher._process_pending_events()
+
+        assert _published(event_bus) == [("created", "a.py"), ("deleted", "a.py")]
+        assert watcher._scanners["w"].dirs_listed == 1  # Only the first snapshot
+        assert watcher.get_status()["watchers"]["w"]["mode"] == "events"
+
+    async def test_directory_moves(self, tmp_path, event_bus, watcher):
+        """Moving a directory out deletes its files; moving one in scans it."""
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "m.py").write_text("m")
+        watcher._on_fs_event("created", str(tmp_path / "pkg" / "m.py"), "", False)
+        await watcher._process_pending_events()
+
+        outside = tmp_path.parent / f"{tmp_path.name}-outside"
+        os.rename(tmp_path / "pkg", outside)
+        watcher._on_fs_event("deleted", str(tmp_path / "pkg"), "", True)
+        os.rename(outside, tmp_path / "lib")
+        watcher._on_fs_event("created", str(tmp_path / "lib"), "", True)
+        await asyncio.gather(*watcher._background)
+        await watcher._process_pending_events()
+
+        assert _published(event_bus) == [("created", "m.py"), ("deleted", "m.py"), ("created", "m.py")]
+        assert list(watcher._file_states["w"]) == [str(tmp_path / "lib" / "m.py")]
+
+    async def test_queued_event_wakes_backed_off_loop(self, tmp_path, event_bus, monkeypatch):
+        """In event mode a change is published without waiting out the back-off."""
+        watcher = FileWatcher(event_bus, poll_interval=0.01, max_poll_interval=30.0)
+        monkeypatch.setattr(type(watcher._events), "running", property(lambda self: True))
+        monkeypatch.setattr(watcher._events, "start", lambda loop=None: True)
+        monkeypatch.setattr(watcher._events, "watch", lambda directory, recursive=False: True)
+        watcher.add_watcher(WatchConfig(id="w", path=str(tmp_path), debounce_seconds=0))
+        watcher._interval = 30.0
+        await watcher.start()
+        try:
+            await asyncio.sleep(0.05)  # Loop is now in its 30s idle sleep
+            (tmp_path / "a.txt").write_text("1")
+            watcher._on_fs_event("created", str(tmp_path / "a.txt"), "", False)
+            for _ in range(100):
+                if event_bus.publish.await_count:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await watcher.stop()
+
+        assert _published(event_bus) == [("created", "a.txt")]
@@ -2,6 +2,10 @@
 Tests for Context-Engine client.
 """
 
+import asyncio
+import json
+
+import httpx
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, patch, MagicMock
@@ -12,12 +16,55 @@ from ag3nt_agent.context_engine_client import (
     CodeSearchResult,
     ContextEngineError,
     ToolCallError,
-    ConnectionError,
     get_context_engine,
     init_context_engine,
 )
 
 
+class StandInMCPServer:
+    """In-process MCP server speaking JSON-RPC over an httpx mock transport."""
+
+    def __init__(self, batches: bool = True, delay: float = 0.0, reject_status: int = 200):
+        self.batches = batches
+        self.delay = delay
+        self.reject_status = reject_status  # HTTP status of a batch rejection
+        self.posts = []
+        self.memories = []
+
+    def client(self, **kwargs) -> ContextEngineClient:
+        return ContextEngineClient(
+            memory_url="http://test:8002/mcp",
+            indexer_url="http://test:8003/mcp",
+            transport=httpx.MockTransport(self.handle),
+            **kwargs
+        )
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.posts.append(body)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if isinstance(body, list):
+            if not self.batches:
+                return httpx.Response(self.reject_status, json={
+                    "jsonrpc": "2.0", "id": None,
+                    "error": {"code": -32600, "message": "Batch requests not supported"}
+                })
+            return httpx.Response(200, json=[self.call(item) for item in body])
+        return httpx.Response(200, json=self.call(body))
+
+    def call(self, request: dict) -> dict:
+        arguments = request["params"]["arguments"]
+        if request["params"]["name"] == "store":
+            if "fail" in arguments["information"]:
+                return {"jsonrpc": "2.0", "id": request["id"], "error": {"code": -1, "message": "rejected"}}
+            self.memories.append(arguments["information"])
+            result = {"id": len(self.memories)}
+        else:
+            result = {"results": [{"content": m, "score": 0.9} for m in self.memories]}
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+
 @pytest.fixture
 def client():
     """Create a test client."""
@@ -209,6 +256,22 @@ class TestContextEngineClient:
             call_args = mock.call_args
             assert call_args[1]["collection"] == ContextEngineClient.COLLECTION_LEARNING
 
+    @pytest.mark.asyncio
+    async def test_store_actions_reports_per_action_errors(self):
+        """Test that actions go in one batch and a failed one does not fail the rest."""
+        server = StandInMCPServer()
+        client = server.client()
+
+        results = await client.store_actions([
+            {"action_type": "shell", "goal_id": "g", "success": True, "duration_ms": 1, "context": context}
+            for context in ("a", "fail", "c")
+        ])
+
+        assert len(server.posts) == 1
+        assert results[0] == {"id": 1}
+        assert isinstance(results[1], ToolCallError)
+        assert results[2] == {"id": 2}
+
     @pytest.mark.asyncio
     async def test_get_action_confidence(self, client):
         """Test calculating action confidence."""
@@ -260,6 +323,107 @@ class TestContextEngineClient:
             assert "healthy" in status
 
 
+class TestContextEngineTransport:
+    """Tests for request IDs, batching, deduplication and caching."""
+
+    async def test_request_ids_are_unique(self):
+        """Test that every request gets its own JSON-RPC id."""
+        server = StandInMCPServer()
+        client = server.client(cache_size=0)
+
+        await client.store_memory("one")
+        await client.find_memories("q")
+        await client.store_actions([
+            {"action_type": "shell", "goal_id": "g", "success": True, "duration_ms": 1, "context": str(i)}
+            for i in range(2)
+        ])
+
+        ids = [server.posts[0]["id"], server.posts[1]["id"]] + [r["id"] for r in server.posts[2]]
+        assert len(set(ids)) == 4
+
+    async def test_identical_concurrent_reads_share_one_request(self):
+        """Test that identical reads in flight together are sent once."""
+        server = StandInMCPServer(delay=0.02)
+        client = server.client()
+        await client.store_memory("fact")
+
+        results = await asyncio.gather(*(client.find_memories("q") for _ in range(5)))
+
+        assert len(server.posts) == 2
+        assert all(r[0].content == "fact" for r in results)
+        results[0][0].metadata["changed"] = True
+        assert results[1][0].metadata == {}
+        assert client.get_stats()["deduplicated"] == 4
+
+    async def test_read_results_are_cached_until_a_write(self):
+        """Test that a write to the server invalidates cached reads."""
+        server = StandInMCPServer()
+        client = server.client()
+        await client.store_memory("first")
+
+        assert len(await client.find_memories("q")) == 1
+        assert len(await client.find_memories("q")) == 1
+        assert len(server.posts) == 2
+
+        await client.store_memory("second")
+        assert len(await client.find_memories("q")) == 2
+        assert len(server.posts) == 4
+        assert client.get_stats()["cache_hits"] == 1
+
+    async def test_cache_expires_and_evicts(self, monkeypatch):
+        """Test TTL expiry and least-recently-used eviction."""
+        import ag3nt_agent.context_engine_client as module
+
+        now = [1000.0]
+        monkeypatch.setattr(module.time, "monotonic", lambda: now[0])
+        server = StandInMCPServer()
+        client = server.client(cache_size=2, cache_ttl=10.0)
+
+        for query in ("a", "b", "a", "c"):  # "c" evicts "b", the least recently used
+            await client.find_memories(query)
+        assert len(server.posts) == 3
+        await client.find_memories("b")
+        assert len(server.posts) == 4
+
+        now[0] += 11.0
+        await client.find_memories("c")
+        assert len(server.posts) == 5
+
+    @pytest.mark.parametrize("reject_status", [200, 400])
+    async def test_batch_falls_back_when_unsupported(self, reject_status):
+        """Test that a server rejecting batches gets individual calls, once probed."""
+        server = StandInMCPServer(batches=False, reject_status=reject_status)
+        client = server.client()
+        actions = [
+            {"action_type": "shell", "goal_id": "g", "success": True, "duration_ms": 1, "context": context}
+            for context in ("a", "fail")
+        ]
+
+        results = await client.store_actions(actions)
+        assert results[0] == {"id": 1}
+        assert isinstance(results[1], ToolCallError)
+        assert len(server.posts) == 3
+
+        await client.store_actions(actions)
+        assert len(server.posts) == 5
+        assert client.get_stats()["batch_unsupported"] == ["http://test:8002/mcp"]
+
+
+    async def test_batch_not_marked_unsupported_on_server_error(self):
+        """Test that a 5xx reply fails the batch without giving up on batching."""
+        server = StandInMCPServer(batches=False, reject_status=503)
+        client = server.client()
+        actions = [
+            {"action_type": "shell", "goal_id": "g", "success": True, "duration_ms": 1, "context": context}
+            for context in ("a", "b")
+        ]
+
+        results = await client.store_actions(actions)
+        assert all(isinstance(result, ToolCallError) for result in results)
+        assert len(server.posts) == 1
+        assert client.get_stats()["batch_unsupported"] == []
+
+
 class TestModuleFunctions:
     """Tests for module-level functions."""
 
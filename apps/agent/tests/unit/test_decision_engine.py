@@ -2,6 +2,10 @@
 Tests for Decision Engine.
 """
 
+import json
+import threading
+import time
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime
@@ -439,4 +443,146 @@ class TestDecisionAuditLog:
             )
             log.record(decision)
 
-        assert len(log._log) == 5
+        assert len(log) == 5
+        assert [d.reason for d in log.get_recent()] == [f"Test {i}" for i in range(5, 10)]
+
+
+def _decision(goal_id: str, decision_type: DecisionType, reason: str = "Test") -> Decision:
+    goal = Goal(
+        id=goal_id,
+        name=goal_id,
+        description="Test",
+        trigger=Trigger(event_type="test"),
+        action=Action(type=ActionType.SHELL, command="echo test")
+    )
+    return Decision(
+        decision_type=decision_type,
+        goal=goal,
+        event=Event(event_type="test", source="test"),
+        confidence=ConfidenceScore(0.8, 10, 0.8, 1000),
+        reason=reason
+    )
+
+
+class TestDecisionAuditLogRing:
+    """Tests for the DecisionAuditLog ring buffer, indexes and spill."""
+
+    def test_indexes_follow_overwrites(self):
+        """Overwritten decisions leave the goal and type indexes."""
+        log = DecisionAuditLog(max_entries=4)
+        types = [DecisionType.ACT, DecisionType.ASK, DecisionType.ACT, DecisionType.REJECT]
+        for i in range(10):
+            log.record(_decision(f"goal-{i % 2}", types[i % 4], reason=str(i)))
+
+        assert [d.reason for d in log.get_recent(limit=3)] == ["7", "8", "9"]
+        assert [d.reason for d in log.get_by_goal("goal-0")] == ["6", "8"]
+        assert [d.reason for d in log.get_by_goal("goal-1", limit=1)] == ["9"]
+        assert [d.reason for d in log.get_by_type(DecisionType.ACT)] == ["6", "8"]
+        assert log.get_by_type(DecisionType.ESCALATE) == []
+
+    def test_stats_are_maintained_incrementally(self):
+        """Counts match a recount of the retained decisions."""
+        log = DecisionAuditLog(max_entries=3)
+        for decision_type in [DecisionType.REJECT, DecisionType.ACT, DecisionType.ASK, DecisionType.ACT]:
+            log.record(_decision("g", decision_type))
+
+        stats = log.get_stats()
+
+        assert stats["total"] == 3
+        assert stats["by_type"] == {"act": 2, "ask": 1}
+        assert stats["reject_rate"] == 0.0
+        assert stats["act_rate"] == pytest.approx(2 / 3)
+
+    def test_overwritten_decisions_spill_to_disk(self, tmp_path):
+        """Overwritten decisions are appended to the spill file in batches."""
+        spill_path = tmp_path / "audit" / "decisions.jsonl"
+        log = DecisionAuditLog(max_entries=2, spill_path=str(spill_path), spill_batch_size=2)
+        for i in range(5):
+            log.record(_decision("g", DecisionType.ACT, reason=str(i)))
+
+        assert [json.loads(line)["reason"] for line in spill_path.read_text().splitlines()] == ["0", "1"]
+        assert log.get_stats()["spilled"] == 3
+        assert [e["reason"] for e in log.iter_spilled()] == ["0", "1", "2"]
+        assert [d.reason for d in log.get_recent()] == ["3", "4"]
+
+    async def test_runtime_uses_configured_spill_path_and_flushes_on_stop(self, tmp_path, monkeypatch):
+        """The autonomous runtime spills to the configured file and writes the buffer on stop."""
+        import ag3nt_agent.agent_config as agent_config
+        from ag3nt_agent.deepagents_runtime import AutonomousRuntime
+
+        spill_path = tmp_path / "decisions.jsonl"
+        monkeypatch.setattr(agent_config, "DECISION_AUDIT_SPILL_PATH", str(spill_path))
+        monkeypatch.setattr(agent_config, "LEARNING_SPOOL_PATH", "")
+        monkeypatch.setattr(agent_config, "EVENT_LOG_DIR", "")
+        runtime = AutonomousRuntime(goals_dir=tmp_path / "goals")
+        assert runtime.decision_log.spill_path == spill_path
+
+        runtime.decision_log = DecisionAuditLog(max_entries=1, spill_path=str(spill_path), auto_flush=False)
+        await runtime.start()
+        for i in range(3):
+            runtime.decision_log.record(_decision("g", DecisionType.ACT, reason=str(i)))
+        assert not spill_path.exists()  # Still buffered
+        await runtime.stop()
+
+        assert [json.loads(line)["reason"] for line in spill_path.read_text().splitlines()] == ["0", "1"]
+
+    async def test_runtime_spills_full_batches_off_the_event_loop(self, tmp_path, monkeypatch):
+        """record() never writes the spill file; a worker thread does."""
+        import ag3nt_agent.agent_config as agent_config
+        from ag3nt_agent.deepagents_runtime import AutonomousRuntime
+
+        monkeypatch.setattr(agent_config, "LEARNING_SPOOL_PATH", "")
+        monkeypatch.setattr(agent_config, "EVENT_LOG_DIR", "")
+        spill_path = tmp_path / "decisions.jsonl"
+        runtime = AutonomousRuntime(goals_dir=tmp_path / "goals")
+        runtime.decision_log = DecisionAuditLog(
+            max_entries=1, spill_path=str(spill_path), spill_batch_size=2, auto_flush=False
+        )
+        flush_threads = []
+        flush = runtime.decision_log.flush
+        monkeypatch.setattr(runtime.decision_log, "flush", lambda: flush_threads.append(threading.get_ident()) or flush())
+
+        await runtime.start()
+        for i in range(5):
+            runtime._record_decision(_decision("g", DecisionType.ACT, reason=str(i)))
+        assert flush_threads == []  # Nothing written from record()
+        await runtime._decision_flush
+        await runtime.stop()
+
+        assert threading.get_ident() not in flush_threads
+        assert [json.loads(line)["reason"] for line in spill_path.read_text().splitlines()] == ["0", "1", "2", "3"]
+
+    def test_invalid_capacity(self):
+        """A ring buffer needs at least one slot."""
+        with pytest.raises(ValueError):
+            DecisionAuditLog(max_entries=0)
+
+
+@pytest.mark.slow
+class TestDecisionAuditLogBenchmark:
+    """Dashboard-style queries against a full 10k-entry log."""
+
+    QUERIES = 2000
+
+    def test_query_throughput(self):
+        log = DecisionAuditLog()
+        types = list(DecisionType)
+        decisions = [_decision(f"goal-{i % 100}", types[i % len(types)]) for i in range(20_000)]
+
+        start = time.perf_counter()
+        for decision in decisions:
+            log.record(decision)
+        record_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(self.QUERIES):
+            log.get_by_goal(f"goal-{i % 100}", limit=20)
+            log.get_by_type(types[i % len(types)], limit=20)
+            log.get_stats()
+        query_elapsed = time.perf_counter() - start
+
+        print(
+            f"\nDecisionAuditLog: {len(decisions) / record_elapsed:,.0f} records/s, "
+            f"{self.QUERIES / query_elapsed:,.0f} query rounds/s at {len(log)} entries"
+        )
+        assert query_elapsed < 1.0
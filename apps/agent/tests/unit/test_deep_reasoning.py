@@ -34,6 +34,7 @@ from ag3nt_agent.deep_reasoning import (
     set_current_session_id,
     get_current_session_id,
 )
+from ag3nt_agent.request_context import reset
 
 
 # =============================================================================
@@ -663,17 +664,20 @@ class TestGlobalSessionFunctions:
 
 
 # =============================================================================
-# TEST THREAD-LOCAL CONTEXT
+# TEST SESSION CONTEXT
 # =============================================================================
 
 
 class TestSessionContext:
-    """Tests for thread-local session context."""
+    """Tests for context-local session context."""
 
     def test_set_and_get_session_id(self):
         """Can set and get session ID."""
-        set_current_session_id("my_session")
-        assert get_current_session_id() == "my_session"
+        token = set_current_session_id("my_session")
+        try:
+            assert get_current_session_id() == "my_session"
+        finally:
+            reset(token)
 
     def test_default_session_id(self):
         """Default session ID is 'default'."""
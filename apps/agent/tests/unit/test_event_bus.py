@@ -288,6 +288,139 @@ class TestEventBus:
         await event_bus.stop()
 
 
+class TestEventBusDispatch:
+    """Tests for per-subscription queues, concurrency and retries."""
+
+    @pytest.mark.asyncio
+    async def test_slow_handler_does_not_block_other_subscriptions(self):
+        """Events keep flowing to fast handlers while a slow one is busy."""
+        bus = EventBus()
+        release = asyncio.Event()
+        fast_received = []
+
+        async def slow_handler(event):
+            await release.wait()
+
+        async def fast_handler(event):
+            fast_received.append(event.event_type)
+
+        bus.subscribe(slow_handler)
+        bus.subscribe(fast_handler)
+        await bus.start()
+
+        for i in range(3):
+            await bus.publish(Event(event_type=f"e{i}", source="src"))
+        await asyncio.sleep(0.1)
+
+        assert fast_received == ["e0", "e1", "e2"]
+        release.set()
+        await bus.stop()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limits(self):
+        """Subscriptions run up to max_concurrency, bounded by max_workers."""
+        bus = EventBus(max_workers=3)
+        running = 0
+        peak = 0
+
+        async def handler(event):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+
+        bus.subscribe(handler, max_concurrency=2)
+        bus.subscribe(handler, max_concurrency=2)
+        for i in range(4):
+            await bus.publish(Event(event_type="test", source="src", payload={"i": i}))
+        await bus.start()
+        await asyncio.sleep(0.1)
+
+        assert bus.get_metrics()["in_flight"] == 3
+        await asyncio.sleep(0.3)
+        await bus.stop()
+
+        assert peak == 3
+        assert bus.get_metrics()["handlers_invoked"] == 8
+
+    @pytest.mark.asyncio
+    async def test_retry_is_rescheduled_not_inline(self):
+        """A failing event is retried later without holding up the next one."""
+        bus = EventBus(max_retries=3, retry_delay_seconds=0.1)
+        calls = []
+
+        async def flaky_handler(event):
+            calls.append(event.event_type)
+            if event.event_type == "flaky" and calls.count("flaky") == 1:
+                raise ValueError("try again")
+
+        bus.subscribe(flaky_handler)
+        await bus.start()
+
+        await bus.publish(Event(event_type="flaky", source="src"))
+        await bus.publish(Event(event_type="next", source="src"))
+        await asyncio.sleep(0.05)
+        assert calls == ["flaky", "next"]
+        assert bus.get_metrics()["retries_pending"] == 1
+
+        await asyncio.sleep(0.15)
+        await bus.stop()
+
+        assert calls == ["flaky", "next", "flaky"]
+        metrics = bus.get_metrics()
+        assert metrics["retries_scheduled"] == 1
+        assert metrics["events_failed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_full_subscription_queue_goes_to_dlq(self):
+        """Events beyond a subscription's queue bound are dead-lettered."""
+        bus = EventBus()
+        release = asyncio.Event()
+
+        async def handler(event):
+            await release.wait()
+
+        bus.subscribe(handler, queue_size=2)
+        await bus.start()
+
+        # One event in flight, two queued, the fourth does not fit
+        for i in range(4):
+            await bus.publish(Event(event_type="test", source="src", payload={"i": i}))
+            await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.sleep(0.05)
+        await bus.stop()
+
+        metrics = bus.get_metrics()
+        assert metrics["events_dropped"] == 1
+        assert metrics["handlers_invoked"] == 3
+        assert bus.get_dlq()[0]["error_type"] == "QueueFull"
+
+    @pytest.mark.asyncio
+    async def test_handler_histograms(self):
+        """Per-handler latency and queue depth are reported in metrics."""
+        bus = EventBus()
+
+        async def handler(event):
+            await asyncio.sleep(0.02)
+
+        sub_id = bus.subscribe(handler)
+        await bus.start()
+        for event_type in ("a", "b", "c"):
+            await bus.publish(Event(event_type=event_type, source="src"))
+            await asyncio.sleep(0.001)
+        await asyncio.sleep(0.15)
+        await bus.stop()
+
+        handler_metrics = bus.get_metrics()["handlers"][sub_id]
+        assert handler_metrics["handler"].endswith("handler")
+        assert handler_metrics["invoked"] == 3
+        assert handler_metrics["latency_seconds"]["count"] == 3
+        assert handler_metrics["latency_seconds"]["buckets"]["0.025"] == 3
+        assert handler_metrics["queue_depth"]["max"] == 2  # "a" in flight
+
+
 class TestCreateEvent:
     """Tests for create_event helper."""
 
@@ -0,0 +1,328 @@
+"""
+Tests for the durable Event Log and its use by the Event Bus.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+
+import pytest
+
+from ag3nt_agent.autonomous.event_bus import Event, EventBus
+from ag3nt_agent.autonomous import event_log
+from ag3nt_agent.autonomous.event_log import EventLog
+
+logger = logging.getLogger(__name__)
+
+
+async def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        await asyncio.sleep(0.01)
+
+
+class TestEventLog:
+    """Tests for EventLog."""
+
+    def test_append_read_and_reopen(self, tmp_path):
+        """Offsets continue after reopening; records read back in order."""
+        log = EventLog(str(tmp_path))
+        assert [log.append({"n": i}) for i in range(3)] == [0, 1, 2]
+        log.close()
+
+        log = EventLog(str(tmp_path))
+        log.open()
+        assert log.next_offset == 3
+        assert log.append({"n": 3}) == 3
+        assert [(o, r["n"]) for o, r in log.read(1)] == [(1, 1), (2, 2), (3, 3)]
+        assert [o for o, _ in log.read(0, 2)] == [0, 1]
+        log.close()
+
+    def test_torn_tail_is_truncated(self, tmp_path):
+        """A partial record from a crash is dropped on open."""
+        log = EventLog(str(tmp_path))
+        log.append({"n": 0})
+        log.close()
+        segment = next(tmp_path.glob("*.log"))
+        with open(segment, "ab") as f:
+            f.write(b'{"offset":1,"rec')
+
+        log = EventLog(str(tmp_path))
+        log.open()
+
+        assert log.next_offset == 1
+        assert log.append({"n": 1}) == 1
+        assert [r["n"] for _, r in log.read()] == [0, 1]
+        log.close()
+
+    def test_segments_roll_and_compact(self, tmp_path):
+        """Segments every consumer committed past are deleted."""
+        log = EventLog(str(tmp_path), segment_max_bytes=200)
+        for i in range(20):
+            log.append({"payload": "x" * 40, "n": i})
+        segments = len(list(tmp_path.glob("*.log")))
+        assert segments > 3
+
+        log.commit("a", 15)
+        log.commit("b", 5)
+        removed = log.compact()
+        assert 0 < removed < segments
+        assert [r["n"] for _, r in log.read(5)] == list(range(5, 20))
+
+        log.commit("b", 20)
+        log.compact()
+        assert len(list(tmp_path.glob("*.log"))) < segments - removed
+        assert [r["n"] for _, r in log.read(15)] == list(range(15, 20))
+        log.close()
+
+    def test_stale_consumers_do_not_block_compaction(self, tmp_path):
+        """Only live consumers' offsets hold segments back; forgotten ones are dropped."""
+        log = EventLog(str(tmp_path), segment_max_bytes=200)
+        for i in range(20):
+            log.append({"payload": "x" * 40, "n": i})
+        segments = len(list(tmp_path.glob("*.log")))
+
+        log.commit("renamed-away", 0)
+        log.commit("gone", 0)
+        log.commit("live", 20)
+        assert log.compact() == 0
+        assert log.compact(["live", "not-yet-committed"]) == segments - 1
+
+        log.forget("gone")
+        assert log.committed("gone") is None
+        log.close()
+
+    def test_committed_offsets_persist(self, tmp_path):
+        """Offsets are written on sync and loaded on open."""
+        log = EventLog(str(tmp_path))
+        log.append({})
+        log.commit("goals", 1)
+        log.close()
+
+        log = EventLog(str(tmp_path))
+        log.open()
+        assert log.committed("goals") == 1
+        assert log.committed("other") is None
+        log.close()
+
+    def test_sync_on_worker_thread_races_commits(self, tmp_path):
+        """Offsets change on one thread while another syncs them."""
+        log = EventLog(str(tmp_path), fsync=False)
+        log.open()
+        errors: list[BaseException] = []
+        done = threading.Event()
+
+        def syncer():
+            while not done.is_set():
+                try:
+                    log.sync()
+                except BaseException as e:  # noqa: BLE001 - reported below
+                    errors.append(e)
+                    return
+
+        thread = threading.Thread(target=syncer)
+        thread.start()
+        try:
+            for i in range(2000):
+                log.commit(f"consumer-{i % 50}", i)
+                if i % 7 == 0:
+                    log.forget(f"consumer-{(i * 3) % 50}")
+        finally:
+            done.set()
+            thread.join()
+        log.close()
+
+        assert errors == []
+        log = EventLog(str(tmp_path))
+        log.open()
+        assert log.committed("consumer-49") == 1999
+        log.close()
+
+    def test_sync_writes_a_snapshot_of_the_offsets(self, tmp_path, monkeypatch):
+        """A commit landing mid-write is neither lost nor written half-done."""
+        log = EventLog(str(tmp_path), fsync=False)
+        log.open()
+        log.commit("goals", 1)
+        dumped = []
+        real_dumps = event_log.json.dumps
+
+        def dumps(obj, **kwargs):
+            dumped.append(obj)
+            log.commit("late", 5)  # The loop commits while the worker writes
+            return real_dumps(obj, **kwargs)
+
+        monkeypatch.setattr(event_log.json, "dumps", dumps)
+        log.sync()
+        monkeypatch.undo()
+
+        assert dumped == [{"goals": 1}]
+        assert dumped[0] is not log._offsets
+        log.close()
+        log = EventLog(str(tmp_path))
+        log.open()
+        assert log.committed("late") == 5
+        log.close()
+
+
+class TestDurableEventBus:
+    """Tests for EventBus with an event log."""
+
+    async def test_unhandled_events_are_replayed_after_restart(self, tmp_path):
+        """Only events a consumer had not finished are delivered again."""
+        release = asyncio.Event()
+        handled = []
+
+        async def handler(event):
+            if event.event_type == "slow":
+                await release.wait()
+            handled.append(event.event_type)
+
+        bus = EventBus(event_log=EventLog(str(tmp_path)), log_flush_interval=0.01)
+        bus.subscribe(handler, name="goals")
+        await bus.start()
+        await bus.publish(Event(event_type="fast", source="src"))
+        await _wait_for(lambda: handled == ["fast"])
+        await bus.publish(Event(event_type="slow", source="src"))
+        await bus.publish(Event(event_type="queued", source="src"))
+        await asyncio.sleep(0.05)
+        await bus.stop()  # "slow" in flight, "queued" behind it
+
+        handled.clear()
+        release.set()
+        bus = EventBus(event_log=EventLog(str(tmp_path)), log_flush_interval=0.01)
+        bus.subscribe(handler, name="goals")
+        await bus.start()
+        await _wait_for(lambda: len(handled) == 2)
+        await bus.stop()
+
+        assert handled == ["slow", "queued"]
+        assert bus.get_metrics()["event_log"]["consumer_offsets"] == {"goals": 3}
+
+    async def test_new_consumer_starts_at_log_end(self, tmp_path):
+        """A consumer with no committed offset does not get old events."""
+        bus = EventBus(event_log=EventLog(str(tmp_path)))
+        await bus.publish(Event(event_type="old", source="src"))
+        await bus.stop()
+
+        handled = []
+        bus = EventBus(event_log=EventLog(str(tmp_path)), log_flush_interval=0.01)
+        bus.subscribe(lambda event: handled.append(event.event_type), name="late")
+        await bus.start()
+        await bus.publish(Event(event_type="new", source="src"))
+        await _wait_for(lambda: handled)
+        await bus.stop()
+
+        assert handled == ["new"]
+
+    async def test_unsubscribed_consumer_does_not_block_compaction(self, tmp_path):
+        """Segments are deleted once every remaining consumer is past them."""
+        log = EventLog(str(tmp_path), segment_max_bytes=300)
+        bus = EventBus(event_log=log, log_flush_interval=0.01)
+        handled = []
+
+        async def stall(event):
+            await asyncio.sleep(3600)
+
+        bus.subscribe(lambda event: handled.append(event), name="live")
+        stalled = bus.subscribe(stall, name="stalled")
+        await bus.start()
+        try:
+            for i in range(20):
+                await bus.publish(Event(event_type="e", source="src", payload={"i": i}))
+            await _wait_for(lambda: len(handled) == 20 and log.committed("live") == 20)
+            assert log.committed("stalled") == 0
+            bus.unsubscribe(stalled)
+            await _wait_for(lambda: len(list(tmp_path.glob("*.log"))) == 1)
+        finally:
+            await bus.stop()
+
+        assert EventLog(str(tmp_path)).committed("stalled") is None
+
+    async def test_dedup_cache_is_rebuilt_from_log(self, tmp_path):
+        """An event published just before a restart is still deduplicated."""
+        bus = EventBus(event_log=EventLog(str(tmp_path)))
+        await bus.start()
+        assert await bus.publish(Event(event_type="alert", source="src", payload={"id": 1}))
+        await bus.stop()
+
+        bus = EventBus(event_log=EventLog(str(tmp_path)))
+        await bus.start()
+        try:
+            assert not await bus.publish(Event(event_type="alert", source="src", payload={"id": 1}))
+            assert await bus.publish(Event(event_type="alert", source="src", payload={"id": 2}))
+        finally:
+            await bus.stop()
+
+    async def test_dead_letters_persist_and_replay(self, tmp_path):
+        """Dead letters survive a restart and replay to the failing consumer."""
+        async def failing(event):
+            raise ValueError("boom")
+
+        bus = EventBus(event_log=EventLog(str(tmp_path)), max_retries=1)
+        bus.subscribe(failing, name="goals")
+        await bus.start()
+        await bus.publish(Event(event_type="e", source="src"))
+        await _wait_for(lambda: bus.get_dlq())
+        await bus.stop()
+
+        handled = []
+        bus = EventBus(event_log=EventLog(str(tmp_path)), log_flush_interval=0.01)
+        bus.subscribe(lambda event: handled.append(event.event_type), name="goals")
+        bus.subscribe(lambda event: handled.append("other"), name="other")
+        await bus.start()
+        (entry,) = bus.get_dlq()
+        assert entry["consumer"] == "goals"
+        assert entry["error"] == "boom"
+        assert handled == []  # Dead-lettered events are not replayed on start
+
+        assert await bus.replay_dlq(consumer="goals") == 1
+        await _wait_for(lambda: handled)
+        await bus.stop()
+
+        assert handled == ["e"]
+        assert EventLog(str(tmp_path)).load_dead_letters() == []
+
+
+@pytest.mark.slow
+class TestEventLogBenchmark:
+    """Throughput and commit latency with fsync enabled."""
+
+    EVENTS = 2000
+
+    async def test_publish_throughput_and_commit_latency(self, tmp_path):
+        log = EventLog(str(tmp_path))
+        bus = EventBus(event_log=log, max_queue_size=self.EVENTS * 2, subscription_queue_size=self.EVENTS * 2)
+        bus.subscribe(lambda event: None, name="noop")
+        await bus.start()
+        try:
+            start = time.perf_counter()
+            for i in range(self.EVENTS):
+                await bus.publish(Event(event_type="bench", source="src", payload={"i": i}))
+            publish_elapsed = time.perf_counter() - start
+
+            await _wait_for(lambda: log.committed("noop") == self.EVENTS, timeout=10.0)
+            commit_elapsed = time.perf_counter() - start
+
+            # Latency from publish to a durable commit, one event at a time
+            latencies = []
+            for i in range(20):
+                t0 = time.perf_counter()
+                await bus.publish(Event(event_type="bench", source="src", payload={"single": i}))
+                target = self.EVENTS + i + 1
+                await _wait_for(lambda target=target: log.committed("noop") == target and not log.get_stats()["unsynced"])
+                latencies.append(time.perf_counter() - t0)
+        finally:
+            await bus.stop()
+
+        stats = log.get_stats()
+        latencies.sort()
+        logger.info(
+            "EventLog: %.0f events/s published, %.0f events/s committed; "
+            "commit latency p50=%.1fms max=%.1fms; %d syncs, avg %sms",
+            self.EVENTS / publish_elapsed, self.EVENTS / commit_elapsed,
+            latencies[10] * 1000, latencies[-1] * 1000, stats["syncs"], stats["avg_sync_ms"],
+        )
+        assert stats["syncs"] < self.EVENTS  # fsyncs are batched
@@ -148,6 +148,34 @@ def test_file_create_triggers_callback(workspace: Path):
     watcher.stop()
 
 
+@pytest.mark.unit
+def test_watch_extra_root_outside_workspace(workspace: Path, tmp_path: Path):
+    from ag3nt_agent.file_watcher import FileWatcher
+
+    skills = tmp_path / "skills"
+    skills.mkdir()
+    watcher = FileWatcher.get_instance()
+    assert watcher.watch(str(skills)) is False  # not running yet
+
+    events: list[tuple[str, str]] = []
+    event_ready = threading.Event()
+
+    def cb(path, etype):
+        events.append((path, etype))
+        event_ready.set()
+
+    watcher.on_change(cb)
+    watcher.start(str(workspace), debounce_seconds=0.01)
+    assert watcher.watch(str(skills)) is True
+    assert watcher.watch(str(tmp_path / "missing")) is False
+
+    (skills / "SKILL.md").write_text("---\nname: x\n---\n")
+
+    assert event_ready.wait(timeout=5)
+    assert any("SKILL.md" in e[0] for e in events)
+    watcher.stop()
+
+
 @pytest.mark.unit
 def test_file_delete_triggers_callback(workspace: Path):
     from ag3nt_agent.file_watcher import FileWatcher
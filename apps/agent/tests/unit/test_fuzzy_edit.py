@@ -1,8 +1,15 @@
 """Unit tests for the fuzzy_edit module (Sprint 1 — cascading fuzzy replacement engine)."""
 
+import time
+
 import pytest
 
-from ag3nt_agent.fuzzy_edit import fuzzy_replace, perform_string_replacement
+from ag3nt_agent.fuzzy_edit import (
+    BlockAnchorReplacer,
+    _Document,
+    fuzzy_replace,
+    perform_string_replacement,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -211,3 +218,95 @@ class TestFuzzyEdit:
         # On failure result is an error string; original content must be untouched.
         assert isinstance(result, str)
         assert content == original
+
+    # 13 — line-trimmed spans land on the matched lines, not an earlier
+    # occurrence of the same raw text
+    def test_line_trimmed_replaces_matched_lines_only(self):
+        content = "  y = 2\n\n  y = 2\nz = 3"
+        result = fuzzy_replace(content, "    y = 2", "NEW", replace_all=True)
+        assert isinstance(result, tuple)
+        new_content, count, strategy = result
+        assert strategy == "LineTrimmedReplacer"
+        assert count == 2
+        assert new_content == "NEW\n\nNEW\nz = 3"
+
+
+# ---------------------------------------------------------------------------
+# Document model
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestDocument:
+    def test_span_matches_joined_lines(self):
+        content = "a\n  bb\n\nccc\n"
+        doc = _Document(content)
+        for start in range(len(doc.lines)):
+            for window in range(1, len(doc.lines) - start + 1):
+                begin, end = doc.span(start, window)
+                assert content[begin:end] == "\n".join(doc.lines[start : start + window])
+
+    def test_positions_index(self):
+        doc = _Document("x\n  x\ny\n\tx  ")
+        assert doc.stripped_positions("x") == [0, 1, 3]
+        assert doc.stripped_positions("missing") == []
+
+    def test_strategy_without_shared_document(self):
+        content = "def f():\n    a = 1\n    return a"
+        spans = BlockAnchorReplacer().find(content, "def f():\n    a = 2\n    return a")
+        assert spans == [(0, len(content))]
+
+
+# ---------------------------------------------------------------------------
+# Micro-benchmark
+# ---------------------------------------------------------------------------
+
+
+def _large_file(methods: int) -> str:
+    lines: list[str] = []
+    for i in range(methods):
+        lines += [
+            f"    def method_{i}(self, arg):",
+            f"        result = self.helper_{i % 50}(arg, flag=True)",
+            "        return result",
+            "    }",
+            "",
+        ]
+    return "\n".join(lines)
+
+
+@pytest.mark.slow
+@pytest.mark.unit
+class TestFuzzyEditBenchmark:
+    """Failed exact matches on large files must stay well under a second.
+
+    Every block shares ``}`` anchors, so each strategy sees thousands of
+    candidate windows and the similarity prefilter does the heavy lifting.
+    """
+
+    CONTENT = _large_file(2000)  # 10k lines
+
+    def test_failed_match_on_large_file(self):
+        old = (
+            "    }\n\n    def method_missing(self, arg):\n"
+            "        result = self.helper_unknown(arg, flag=False)\n"
+            "        return result\n    }"
+        )
+        start = time.perf_counter()
+        result = fuzzy_replace(self.CONTENT, old, "x")
+        elapsed = time.perf_counter() - start
+        assert isinstance(result, str)
+        assert elapsed < 1.5, f"fuzzy_replace took {elapsed:.2f}s"
+
+    def test_fuzzy_hit_on_large_file(self):
+        old = (
+            "    def method_1500(self, arg):\n"
+            "        result = self.helper_0(arg, flag=True)  # tweak\n"
+            "        return result"
+        )
+        start = time.perf_counter()
+        result = fuzzy_replace(self.CONTENT, old, "x")
+        elapsed = time.perf_counter() - start
+        assert isinstance(result, tuple)
+        assert result[2] == "BlockAnchorReplacer"
+        assert elapsed < 1.5, f"fuzzy_replace took {elapsed:.2f}s"
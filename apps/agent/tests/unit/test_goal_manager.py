@@ -3,10 +3,13 @@ Tests for Goal Manager.
 """
 
 import pytest
+import re
 import tempfile
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
 
+from ag3nt_agent.autonomous import goal_manager as goal_manager_module
 from ag3nt_agent.autonomous.goal_manager import (
     GoalManager,
     Goal,
@@ -15,6 +18,7 @@ from ag3nt_agent.autonomous.goal_manager import (
     ActionType,
     RiskLevel,
     Limits,
+    TimingWheel,
 )
 from ag3nt_agent.autonomous.event_bus import Event
 
@@ -362,6 +366,119 @@ goals:
         assert goal.risk_level == RiskLevel.LOW
 
 
+def _goal(goal_id, event_type="http_check", filter=None, **kwargs):
+    return Goal(
+        id=goal_id,
+        name=goal_id,
+        description="",
+        trigger=Trigger(event_type=event_type, filter=filter or {}, cooldown_seconds=kwargs.pop("cooldown", 0)),
+        action=Action(type=ActionType.NOTIFY, message="hi"),
+        **kwargs
+    )
+
+
+class TestGoalIndex:
+    """Tests for indexed matching and limit tracking."""
+
+    def test_only_goals_for_the_event_type_are_evaluated(self, monkeypatch):
+        """Goals for other event types are never checked."""
+        manager = GoalManager()
+        manager.add_goal(_goal("http", "http_check"))
+        manager.add_goal(_goal("log", "log_pattern"))
+        checked = []
+        original = Trigger.matches
+        monkeypatch.setattr(Trigger, "matches", lambda self, event: checked.append(self.event_type) or original(self, event))
+
+        matching = manager.find_matching_goals(Event(event_type="log_pattern", source="src"))
+
+        assert [g.id for g in matching] == ["log"]
+        assert checked == ["log_pattern"]
+
+    def test_index_follows_add_replace_remove(self):
+        """Replacing or removing a goal updates the index."""
+        manager = GoalManager()
+        manager.add_goal(_goal("g", "http_check"))
+        manager.add_goal(_goal("g", "log_pattern"))
+
+        assert manager.find_matching_goals(Event(event_type="http_check", source="src")) == []
+        assert len(manager.find_matching_goals(Event(event_type="log_pattern", source="src"))) == 1
+
+        manager.remove_goal("g")
+        assert manager.find_matching_goals(Event(event_type="log_pattern", source="src")) == []
+        assert manager.get_status()["indexed_event_types"] == 0
+
+    def test_filter_is_compiled_once(self, monkeypatch):
+        """Regex filters are compiled on first use, not on every match."""
+        trigger = Trigger(event_type="t", filter={"url": "regex:.*api.*", "status": 500})
+        compiled = []
+        original = re.compile
+        monkeypatch.setattr(goal_manager_module.re, "compile", lambda p: compiled.append(p) or original(p))
+
+        for _ in range(3):
+            assert trigger.matches(Event(event_type="t", source="s", payload={"url": "/api/x", "status": 500}))
+        assert not trigger.matches(Event(event_type="t", source="s", payload={"url": "/api", "status": 200}))
+        assert compiled == [".*api.*"]
+
+        trigger.filter = {"url": "regex:^/web"}
+        assert not trigger.matches(Event(event_type="t", source="s", payload={"url": "/api/x"}))
+
+    def test_executed_goal_is_blocked_until_its_limit_resets(self, monkeypatch):
+        """A goal over its hourly limit is skipped until the wheel releases it."""
+        manager = GoalManager()
+        goal = _goal("g", limits=Limits(max_executions_per_hour=1))
+        manager.add_goal(goal)
+        event = Event(event_type="http_check", source="src")
+
+        goal.record_execution()
+        assert manager.find_matching_goals(event) == []
+        assert manager.get_status()["blocked_goals"] == 1
+
+        # An hour later
+        now = time.monotonic()
+        goal._hour_reset = datetime.utcnow() - timedelta(seconds=1)
+        monkeypatch.setattr(goal_manager_module.time, "monotonic", lambda: now + 3601)
+
+        assert manager.find_matching_goals(event) == [goal]
+        assert manager.get_status()["blocked_goals"] == 0
+
+    def test_goal_added_in_cooldown_is_blocked(self):
+        """Execution state set before add_goal is honoured."""
+        manager = GoalManager()
+        goal = _goal("g", cooldown=300)
+        goal._last_triggered = datetime.utcnow()
+        manager.add_goal(goal)
+
+        assert manager.find_matching_goals(Event(event_type="http_check", source="src")) == []
+
+
+class TestTimingWheel:
+    """Tests for TimingWheel."""
+
+    def test_timers_expire_in_order_and_never_early(self):
+        """Timers fire once their tick has passed."""
+        wheel = TimingWheel(resolution=1.0, slots=8)
+        wheel.schedule("a", 2.5, now=100.0)
+        wheel.schedule("b", 20.0, now=100.0)  # Wraps around the wheel
+
+        assert wheel.advance(102.0) == []
+        assert wheel.advance(103.0) == ["a"]
+        assert wheel.advance(110.0) == []
+        assert "b" in wheel
+        assert wheel.advance(130.0) == ["b"]
+        assert len(wheel) == 0
+
+    def test_reschedule_and_cancel(self):
+        """Rescheduling replaces the timer; cancelled timers never fire."""
+        wheel = TimingWheel(resolution=1.0, slots=8)
+        wheel.schedule("a", 1.0, now=0.0)
+        wheel.schedule("a", 5.0, now=0.0)
+        wheel.schedule("b", 1.0, now=0.0)
+        wheel.cancel("b")
+
+        assert wheel.advance(2.0) == []
+        assert wheel.advance(5.0) == ["a"]
+
+
 class TestRiskLevel:
     """Tests for RiskLevel enum."""
 
@@ -371,3 +488,80 @@ class TestRiskLevel:
         assert RiskLevel.MEDIUM.threshold_multiplier == 0.75
         assert RiskLevel.HIGH.threshold_multiplier == 0.9
         assert RiskLevel.CRITICAL.threshold_multiplier == 1.0
+
+
+@pytest.mark.slow
+class TestGoalMatchingBenchmark:
+    """Matching throughput with 1k goals."""
+
+    GOALS = 1000
+    EVENT_TYPES = 50
+    EVENTS = 10_000
+
+    def _goals(self):
+        goals = []
+        for i in range(self.GOALS):
+            event_type = f"type_{i % self.EVENT_TYPES}"
+            if i % 3 == 0:
+                flt = {"url": f"regex:^/svc{i % 7}/.*"}
+            elif i % 3 == 1:
+                flt = {"status": 500 + i % 4}
+            else:
+                flt = {}
+            goals.append(_goal(f"g{i}", event_type, flt))
+        return goals
+
+    def _events(self, n):
+        return [
+            Event(
+                event_type=f"type_{i % self.EVENT_TYPES}",
+                source="bench",
+                payload={"url": f"/svc{i % 9}/health", "status": 500 + i % 5},
+            )
+            for i in range(n)
+        ]
+
+    @staticmethod
+    def _reference_find(goals, event):
+        """What find_matching_goals did before: every goal, uncompiled regex."""
+        matching = []
+        for goal in goals:
+            if not goal.enabled or event.event_type != goal.trigger.event_type:
+                continue
+            ok = True
+            for key, pattern in goal.trigger.filter.items():
+                value = event.payload.get(key)
+                if value is None:
+                    ok = False
+                elif isinstance(pattern, str) and pattern.startswith("regex:"):
+                    ok = re.search(pattern[6:], str(value)) is not None
+                else:
+                    ok = value == pattern
+                if not ok:
+                    break
+            if ok and goal.can_execute()[0]:
+                matching.append(goal)
+        return matching
+
+    def test_matching_throughput(self):
+        goals = self._goals()
+        manager = GoalManager()
+        for goal in goals:
+            manager.add_goal(goal)
+        events = self._events(self.EVENTS)
+
+        start = time.perf_counter()
+        indexed = [manager.find_matching_goals(e) for e in events]
+        indexed_rate = self.EVENTS / (time.perf_counter() - start)
+
+        sample = events[:1000]
+        start = time.perf_counter()
+        reference = [self._reference_find(goals, e) for e in sample]
+        reference_rate = len(sample) / (time.perf_counter() - start)
+
+        assert [[g.id for g in m] for m in indexed[:1000]] == [[g.id for g in m] for m in reference]
+        print(
+            f"\nGoal matching ({self.GOALS} goals): {indexed_rate:,.0f} events/s indexed, "
+            f"{reference_rate:,.0f} events/s linear scan"
+        )
+        assert indexed_rate > reference_rate * 5
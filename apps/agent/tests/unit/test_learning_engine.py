@@ -2,6 +2,9 @@
 Tests for Learning Engine.
 """
 
+import asyncio
+import json
+
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, patch, MagicMock
@@ -12,7 +15,7 @@ from ag3nt_agent.autonomous.learning_engine import (
     ConfidenceScore,
     Recommendation,
 )
-from ag3nt_agent.context_engine_client import MemoryResult
+from ag3nt_agent.context_engine_client import ConnectionError, MemoryResult
 
 
 class TestActionRecord:
@@ -84,14 +87,17 @@ class TestLearningEngine:
         """Create a mock context engine."""
         mock = MagicMock()
         mock.store_action = AsyncMock(return_value={"id": "stored-id"})
+        mock.store_actions = AsyncMock(side_effect=lambda actions: [{"id": "stored-id"}] * len(actions))
         mock.find_memories = AsyncMock(return_value=[])
         mock.COLLECTION_LEARNING = "agent-learning"
         return mock
 
     @pytest.fixture
-    def engine(self, mock_context_engine):
+    async def engine(self, mock_context_engine):
         """Create a learning engine with mock context engine."""
-        return LearningEngine(context_engine=mock_context_engine)
+        engine = LearningEngine(context_engine=mock_context_engine)
+        yield engine
+        await engine.stop()
 
     @pytest.mark.asyncio
     async def test_record_action_success(self, engine, mock_context_engine):
@@ -106,7 +112,12 @@ class TestLearningEngine:
 
         assert record.action_type == "shell"
         assert record.success is True
-        mock_context_engine.store_action.assert_called_once()
+        mock_context_engine.store_actions.assert_not_called()  # Buffered
+
+        await engine.flush()
+        (actions,) = mock_context_engine.store_actions.call_args.args
+        assert [a["details"]["action_id"] for a in actions] == [record.action_id]
+        assert actions[0]["details"]["timestamp"] == record.timestamp.isoformat()
 
     @pytest.mark.asyncio
     async def test_record_action_failure(self, engine, mock_context_engine):
@@ -287,6 +298,131 @@ class TestLearningEngine:
         assert summary["successes"] == 1
         assert summary["failures"] == 1
 
+    async def test_full_batch_triggers_flush(self, mock_context_engine):
+        """Records are stored in one call once a batch is full."""
+        engine = LearningEngine(context_engine=mock_context_engine, batch_size=3, flush_interval=60)
+        try:
+            for i in range(3):
+                await engine.record_action("shell", "g", f"ctx {i}", True, 10)
+            for _ in range(100):
+                if mock_context_engine.store_actions.call_count:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await engine.stop()
+
+        assert mock_context_engine.store_actions.call_count == 1
+        assert len(mock_context_engine.store_actions.call_args.args[0]) == 3
+        assert engine.get_stats()["stored"] == 3
+
+    async def test_unstored_records_are_spooled_and_retried(self, mock_context_engine, tmp_path):
+        """Records are spooled while Context-Engine is down and stored later."""
+        spool = tmp_path / "spool.jsonl"
+        mock_context_engine.store_actions.side_effect = lambda actions: [ConnectionError("down")] * len(actions)
+        engine = LearningEngine(context_engine=mock_context_engine, spool_path=str(spool))
+        first = await engine.record_action("shell", "g", "restart nginx", False, 10, error_message="boom")
+        await engine.flush()
+
+        assert [json.loads(line)["action_id"] for line in spool.read_text().splitlines()] == [first.action_id]
+        assert engine.get_stats()["spooled"] == 1
+
+        # A fresh engine (e.g. after a restart) drains the spool first
+        mock_context_engine.store_actions.side_effect = lambda actions: [{"id": "ok"}] * len(actions)
+        engine = LearningEngine(context_engine=mock_context_engine, spool_path=str(spool))
+        second = await engine.record_action("shell", "g", "restart nginx", True, 10)
+        await engine.stop()
+
+        stored = [a["details"]["action_id"] for call in mock_context_engine.store_actions.call_args_list[-2:] for a in call.args[0]]
+        assert stored == [first.action_id, second.action_id]
+        assert not spool.exists()
+
+    async def test_unstored_records_stay_buffered_without_spool(self, mock_context_engine):
+        """Without a spool, failed records are kept in memory up to the limit."""
+        mock_context_engine.store_actions.side_effect = ConnectionError("down")
+        engine = LearningEngine(context_engine=mock_context_engine, max_buffer_size=2)
+        for i in range(3):
+            await engine.record_action("shell", "g", f"ctx {i}", True, 10)
+        await engine.stop()
+
+        assert [r.context for r in engine._buffer] == ["ctx 1", "ctx 2"]
+        assert engine.get_stats()["dropped"] == 1
+
+    async def test_stop_lets_spool_drain_finish(self, mock_context_engine, tmp_path):
+        """Stopping during a spool drain neither cancels it nor stores a batch twice."""
+        spool = tmp_path / "spool.jsonl"
+        mock_context_engine.store_actions.side_effect = lambda actions: [ConnectionError("down")] * len(actions)
+        engine = LearningEngine(context_engine=mock_context_engine, spool_path=str(spool), batch_size=2)
+        for i in range(6):
+            await engine.record_action("shell", "g", f"ctx {i}", True, 10)
+        await engine.stop()
+        assert len(spool.read_text().splitlines()) == 6
+
+        stored: list[str] = []
+
+        async def slow_store(actions):
+            await asyncio.sleep(0.05)
+            stored.extend(a["details"]["action_id"] for a in actions)
+            return [{"id": "ok"}] * len(actions)
+
+        mock_context_engine.store_actions.side_effect = slow_store
+        engine = LearningEngine(context_engine=mock_context_engine, spool_path=str(spool), batch_size=2, flush_interval=0.01)
+        await engine.start()
+        for _ in range(100):
+            if stored:
+                break
+            await asyncio.sleep(0.01)
+        await engine.stop()  # Lands while the drain is mid-way
+
+        assert len(stored) == len(set(stored)) == 6
+        assert not spool.exists()
+
+    async def test_failed_flushes_back_off(self, mock_context_engine):
+        """While Context-Engine is down, full batches don't each trigger a new attempt."""
+        mock_context_engine.store_actions.side_effect = lambda actions: [ConnectionError("down")] * len(actions)
+        engine = LearningEngine(context_engine=mock_context_engine, batch_size=1, flush_interval=60)
+        try:
+            for i in range(20):
+                await engine.record_action("shell", "g", f"ctx {i}", True, 10)
+                await asyncio.sleep(0.01)
+            assert mock_context_engine.store_actions.call_count == 1
+            assert engine.get_stats()["buffered"] == 20
+        finally:
+            engine._flush_task.cancel()
+            await asyncio.wait({engine._flush_task})
+            engine._flush_task = None
+
+    async def test_cached_confidence_updated_from_local_outcomes(self, engine, mock_context_engine):
+        """New outcomes update cached scores instead of invalidating them."""
+        now = datetime.utcnow().isoformat()
+        mock_context_engine.find_memories.return_value = [
+            MemoryResult(f"action {i}", 1.0, {"success": True, "timestamp": now, "duration_ms": 100})
+            for i in range(3)
+        ]
+        before = await engine.get_confidence("shell", "restart nginx")
+        assert before.score == 1.0
+
+        await engine.record_action("shell", "g", "restart nginx", False, 400)
+        await engine.record_action("shell", "g", "rotate unrelated logs", False, 400)
+        await engine.record_action("notify", "g", "restart nginx", False, 400)
+        after = await engine.get_confidence("shell", "restart nginx")
+
+        assert mock_context_engine.find_memories.call_count == 1  # Still cached
+        assert after.sample_count == 4
+        assert after.success_rate == 0.75
+        assert after.score == pytest.approx(3 / (3 + 1.5))
+        assert after.avg_duration_ms == 175
+        assert engine.get_stats()["cache_updates"] == 1
+
+    async def test_uncached_confidence_includes_buffered_outcomes(self, engine, mock_context_engine):
+        """Outcomes not yet stored still count toward a fresh score."""
+        for _ in range(3):
+            await engine.record_action("shell", "g", "restart nginx", True, 100)
+
+        score = await engine.get_confidence("shell", "restart nginx")
+
+        assert score.sample_count == 3
+        assert score.score == 1.0
+
     def test_clear_cache(self, engine):
         """Test clearing the cache."""
         engine._cache["test"] = ConfidenceScore(0.9, 5, 0.9, 1000)
@@ -0,0 +1,238 @@
+"""Unit tests for lint_runner.py batching and caching."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from ag3nt_agent import lint_runner
+from ag3nt_agent.lint_runner import LinterConfig, LintRunner
+
+
+# ------------------------------------------------------------------
+# Fixtures
+# ------------------------------------------------------------------
+
+
+_FAKE_LINTER = textwrap.dedent(
+    """
+    import json, os, sys
+    log = os.environ["FAKE_LINT_LOG"]
+    paths = sys.argv[1:]
+    with open(log, "a") as f:
+        f.write(json.dumps(paths) + "\\n")
+    report = os.environ.get("FAKE_LINT_REPORT", "as-given")
+    out = []
+    for p in paths:
+        name = {"real": os.path.realpath(p), "other": "elsewhere.py"}.get(report, p)
+        for i, line in enumerate(open(p).read().splitlines(), 1):
+            if "bad" in line:
+                out.append({
+                    "filename": name,
+                    "location": {"row": i, "column": 1},
+                    "message": "bad word",
+                    "code": "X001",
+                    "fix": None,
+                })
+    print(json.dumps(out))
+    sys.exit(1 if out else 0)
+    """
+)
+
+
+@pytest.fixture
+def fake_linter(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Install a ruff-compatible fake linter that logs each invocation."""
+    script = tmp_path / "fake_lint.py"
+    script.write_text(_FAKE_LINTER)
+    log = tmp_path / "invocations.log"
+    log.write_text("")
+    monkeypatch.setenv("FAKE_LINT_LOG", str(log))
+    monkeypatch.setattr(lint_runner, "LINTERS", [
+        LinterConfig(
+            name="fake",
+            command=[sys.executable, str(script)],
+            extensions=[".py"],
+            parse_output="ruff",
+            check_binary=sys.executable,
+            batchable=True,
+            config_files=["fake.toml"],
+        ),
+    ])
+    return log
+
+
+def _invocations(log: Path) -> list[list[str]]:
+    return [json.loads(line) for line in log.read_text().splitlines()]
+
+
+def _write_files(root: Path, count: int) -> list[str]:
+    paths = []
+    for i in range(count):
+        p = root / f"mod_{i}.py"
+        p.write_text("ok = 1\nbad = 2\n" if i % 2 else "ok = 1\n")
+        paths.append(str(p))
+    return paths
+
+
+# ------------------------------------------------------------------
+# Batching
+# ------------------------------------------------------------------
+
+
+@pytest.mark.unit
+async def test_lint_files_coalesces_into_one_invocation(tmp_path, fake_linter):
+    runner = LintRunner(str(tmp_path))
+    paths = _write_files(tmp_path, 30)
+
+    results = await runner.lint_files(paths)
+
+    calls = _invocations(fake_linter)
+    assert len(calls) == 1
+    assert sorted(calls[0]) == sorted(paths)
+    for i, result in enumerate(results):
+        assert result.error is None
+        assert result.file == paths[i]
+        assert len(result.issues) == (1 if i % 2 else 0)
+        assert all(issue.file == paths[i] for issue in result.issues)
+
+
+@pytest.mark.unit
+async def test_concurrent_lint_file_calls_share_batch(tmp_path, fake_linter):
+    runner = LintRunner(str(tmp_path))
+    paths = _write_files(tmp_path, 5)
+
+    await asyncio.gather(*(runner.lint_file(p) for p in paths))
+
+    assert len(_invocations(fake_linter)) == 1
+    assert runner.get_stats().files_linted == 5
+
+
+@pytest.mark.unit
+async def test_batch_matches_resolved_paths(tmp_path, fake_linter, monkeypatch):
+    real = tmp_path / "real"
+    real.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(real, target_is_directory=True)
+    _write_files(real, 4)
+    paths = [str(link / f"mod_{i}.py") for i in range(4)]
+    monkeypatch.setenv("FAKE_LINT_REPORT", "real")
+    runner = LintRunner(str(tmp_path))
+
+    results = await runner.lint_files(paths)
+
+    assert len(_invocations(fake_linter)) == 1
+    assert [len(r.issues) for r in results] == [0, 1, 0, 1]
+
+
+@pytest.mark.unit
+async def test_unattributed_batch_output_is_relinted_per_file(tmp_path, fake_linter, monkeypatch):
+    paths = _write_files(tmp_path, 4)
+    monkeypatch.setenv("FAKE_LINT_REPORT", "other")
+    runner = LintRunner(str(tmp_path))
+
+    results = await runner.lint_files(paths)
+
+    assert len(_invocations(fake_linter)) == 5
+    assert [len(r.issues) for r in results] == [0, 1, 0, 1]
+    await runner.lint_files(paths)
+    assert len(_invocations(fake_linter)) == 5  # Per-file results are cached
+
+
+# ------------------------------------------------------------------
+# Caching
+# ------------------------------------------------------------------
+
+
+@pytest.mark.unit
+async def test_unchanged_content_is_served_from_cache(tmp_path, fake_linter):
+    runner = LintRunner(str(tmp_path))
+    path = _write_files(tmp_path, 2)[1]
+
+    first = await runner.lint_file(path)
+    second = await runner.lint_file(path)
+
+    assert len(_invocations(fake_linter)) == 1
+    assert [i.message for i in second.issues] == [i.message for i in first.issues]
+    assert runner.get_stats().cache_hits == 1
+
+
+@pytest.mark.unit
+async def test_content_change_invalidates_cache(tmp_path, fake_linter):
+    runner = LintRunner(str(tmp_path))
+    path = Path(_write_files(tmp_path, 1)[0])
+
+    assert (await runner.lint_file(str(path))).issues == []
+    path.write_text("bad = 1\n")
+    result = await runner.lint_file(str(path))
+
+    assert len(_invocations(fake_linter)) == 2
+    assert len(result.issues) == 1
+
+
+@pytest.mark.unit
+async def test_config_change_invalidates_cache(tmp_path, fake_linter):
+    runner = LintRunner(str(tmp_path))
+    path = _write_files(tmp_path, 1)[0]
+
+    await runner.lint_file(path)
+    (tmp_path / "fake.toml").write_text("[tool]\n")
+    await runner.lint_file(path)
+
+    assert len(_invocations(fake_linter)) == 2
+
+
+@pytest.mark.unit
+async def test_identical_content_shares_cache_entry(tmp_path, fake_linter):
+    runner = LintRunner(str(tmp_path))
+    a = tmp_path / "a.py"
+    b = tmp_path / "b.py"
+    a.write_text("bad = 1\n")
+    b.write_text("bad = 1\n")
+
+    await runner.lint_file(str(a))
+    result = await runner.lint_file(str(b))
+
+    assert len(_invocations(fake_linter)) == 1
+    assert result.issues[0].file == str(b)
+
+
+# ------------------------------------------------------------------
+# Daemon mode / errors
+# ------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_daemon_command_preferred_when_available(monkeypatch):
+    runner = LintRunner("/tmp")
+    eslint = next(l for l in lint_runner.LINTERS if l.name == "eslint")
+    monkeypatch.setattr(lint_runner.shutil, "which", lambda b: "/usr/bin/" + b)
+
+    assert runner._command_for(eslint)[0] == "eslint_d"
+    assert LintRunner("/tmp", use_daemons=False)._command_for(eslint)[0] == "npx"
+
+
+@pytest.mark.unit
+async def test_missing_binary_reports_error_for_every_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(lint_runner, "LINTERS", [
+        LinterConfig(
+            name="missing",
+            command=["definitely-not-a-real-linter-binary"],
+            extensions=[".py"],
+            parse_output="ruff",
+            check_binary=sys.executable,
+            batchable=True,
+        ),
+    ])
+    runner = LintRunner(str(tmp_path))
+    paths = _write_files(tmp_path, 3)
+
+    results = await runner.lint_files(paths)
+
+    assert all(r.error and "not found" in r.error for r in results)
+    assert len(runner._cache) == 0
@@ -0,0 +1,292 @@
+"""
+Tests for the autonomous Log Monitor source.
+"""
+
+import asyncio
+import os
+import re
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ag3nt_agent.autonomous.sources import log_monitor
+from ag3nt_agent.autonomous.sources.log_monitor import (
+    LogMonitor,
+    LogMonitorConfig,
+    LogTailer,
+    PatternSet,
+)
+
+
+def _append(path, text):
+    with open(path, "a", encoding="utf-8", newline="") as f:
+        f.write(text)
+
+
+def _reference_find(patterns, text):
+    """Per-line, per-pattern scan (what LogMonitor did before)."""
+    compiled = [
+        re.compile(p[6:]) if p.startswith("regex:") else re.compile(re.escape(p))
+        for p in patterns
+    ]
+    results = []
+    for index, line in enumerate(text.split("\n")):
+        for i, pattern in enumerate(compiled):
+            if pattern.search(line):
+                results.append((index, i, line))
+                break
+    return results
+
+
+class TestPatternSet:
+    """Tests for combined pattern matching."""
+
+    LINES = "\n".join([
+        "2024-01-01 INFO started",
+        "2024-01-01 ERROR disk full",
+        "WARNING low memory",
+        "Traceback (most recent call last):",
+        "  ERROR nested",
+        "",
+        "ERROR: WARNING both",
+        "ok",
+    ])
+
+    @pytest.mark.parametrize("patterns", [
+        ["ERROR"],
+        ["WARNING", "ERROR"],
+        ["regex:^ERROR", "regex:^WARN"],
+        ["regex:\\d{4}-\\d{2}", "Traceback"],
+        ["regex:full$", "regex:\\s+ERROR"],
+        ["regex:(\\w+) \\1"],  # Backreference: line-by-line fallback
+        ["regex:(?P<x>a)", "regex:(?P<x>b)"],  # Duplicate groups: fallback
+    ])
+    def test_agrees_with_line_by_line_scan(self, patterns):
+        """Combined search finds the same lines and first patterns."""
+        assert PatternSet(patterns).find(self.LINES) == _reference_find(patterns, self.LINES)
+
+    def test_match_spanning_lines_is_not_reported(self):
+        """A combined match across a newline does not count for either line."""
+        text = "foo\nbar\nfoo bar"
+
+        assert PatternSet(["regex:foo\\sbar"]).find(text) == [(2, 0, "foo bar")]
+
+
+class TestLogTailer:
+    """Tests for incremental log reading."""
+
+    def test_line_numbers_continue_across_reads(self, tmp_path):
+        """Line numbers count lines that existed before tailing began."""
+        path = tmp_path / "app.log"
+        _append(path, "one\ntwo\nthree\n")
+        tailer = LogTailer(str(path))
+        tailer.seek_to_end()
+
+        _append(path, "four\nfive\n")
+        assert tailer.read_lines() == ("four\nfive", 4, False)
+
+        _append(path, "six\n")
+        assert tailer.read_lines() == ("six", 6, False)
+        assert tailer.line_count == 6
+
+    def test_partial_line_waits_for_newline(self, tmp_path):
+        """An unterminated line is held until it is completed, however long idle."""
+        path = tmp_path / "app.log"
+        path.write_text("")
+        tailer = LogTailer(str(path))
+        tailer.seek_to_end()
+
+        _append(path, "done\nhal")
+        assert tailer.read_lines() == ("done", 1, False)
+
+        _append(path, "f\r\n")
+        assert tailer.read_lines() == ("half", 2, False)
+
+        _append(path, "part")
+        assert tailer.read_lines()[0] == ""
+        assert tailer.read_lines()[0] == ""
+        _append(path, "ial\nnext\n")
+        assert tailer.read_lines() == ("partial\nnext", 3, False)
+        assert tailer.line_count == 4
+
+    def test_oversized_line_passed_on_in_pieces(self, tmp_path, monkeypatch):
+        """A line past MAX_LINE_BYTES is not held, and keeps one line number."""
+        monkeypatch.setattr(log_monitor, "MAX_LINE_BYTES", 8)
+        path = tmp_path / "app.log"
+        path.write_text("")
+        tailer = LogTailer(str(path))
+        tailer.seek_to_end()
+
+        _append(path, "one\n0123456789")
+        assert tailer.read_lines() == ("one\n0123456789", 1, False)
+        _append(path, "ab\nthree\n")
+        assert tailer.read_lines() == ("ab\nthree", 2, False)
+        assert tailer.line_count == 3
+
+    def test_rotation_and_truncation_restart(self, tmp_path):
+        """A new file or a shorter file is read from the top."""
+        path = tmp_path / "app.log"
+        _append(path, "old 1\nold 2\n")
+        tailer = LogTailer(str(path))
+        tailer.seek_to_end()
+
+        os.rename(path, tmp_path / "app.log.1")
+        _append(path, "new 1\n")
+        assert tailer.read_lines() == ("new 1", 1, False)
+        assert tailer.rotations == 1
+
+        path.write_text("x\n")
+        _append(path, "")
+        tailer.position = 100  # Pretend we had read further
+        assert tailer.read_lines() == ("x", 1, False)
+
+    def test_reads_are_bounded(self, tmp_path):
+        """A large backlog is read over several bounded calls."""
+        path = tmp_path / "app.log"
+        path.write_text("")
+        tailer = LogTailer(str(path))
+        tailer.seek_to_end()
+        _append(path, "".join(f"line {i}\n" for i in range(1000)))
+
+        lines = []
+        more = True
+        while more:
+            text, first, more = tailer.read_lines(max_bytes=1000)
+            assert first == len(lines) + 1
+            lines.extend(text.split("\n"))
+
+        assert lines == [f"line {i}" for i in range(1000)]
+
+
+class TestLogMonitor:
+    """Tests for LogMonitor."""
+
+    @pytest.fixture
+    def event_bus(self):
+        bus = MagicMock()
+        bus.publish = AsyncMock()
+        return bus
+
+    async def test_emits_event_for_new_matches(self, tmp_path, event_bus):
+        """Only lines appended after start are matched."""
+        path = tmp_path / "app.log"
+        _append(path, "ERROR before start\n")
+        monitor = LogMonitor(event_bus, poll_interval=0.01)
+        monitor.add_monitor(LogMonitorConfig(
+            id="errors", path=str(path), patterns=["ERROR", "regex:^FATAL"], threshold_count=2,
+        ))
+        await monitor.start()
+        try:
+            _append(path, "INFO fine\nERROR one\nFATAL two\n")
+            await monitor._check_all_logs()
+        finally:
+            await monitor.stop()
+
+        event = event_bus.publish.await_args.args[0]
+        assert event.payload["match_count"] == 2
+        assert event.payload["sample_lines"] == ["ERROR one", "FATAL two"]
+        assert sorted(event.payload["patterns_matched"]) == ["ERROR", "regex:^FATAL"]
+        status = monitor.get_status()["monitors"]["errors"]
+        assert status["line_count"] == 4
+
+    async def test_monitors_sharing_a_file_both_match(self, tmp_path, event_bus):
+        """Two monitors on one log each see every new line."""
+        path = tmp_path / "app.log"
+        path.write_text("")
+        monitor = LogMonitor(event_bus)
+        monitor.add_monitor(LogMonitorConfig(id="a", path=str(path), patterns=["ERROR"]))
+        monitor.add_monitor(LogMonitorConfig(id="b", path=str(path), patterns=["timeout"]))
+        await monitor.start()
+        try:
+            _append(path, "ERROR timeout\n")
+            await monitor._check_all_logs()
+        finally:
+            await monitor.stop()
+
+        sources = {call.args[0].source for call in event_bus.publish.await_args_list}
+        assert sources == {"log_monitor:a", "log_monitor:b"}
+
+    async def test_filesystem_event_wakes_poll_loop(self, tmp_path, event_bus, monkeypatch):
+        """With filesystem events, a change is handled before the fallback interval."""
+        path = tmp_path / "app.log"
+        path.write_text("")
+        monitor = LogMonitor(event_bus)
+        monitor.add_monitor(LogMonitorConfig(id="a", path=str(path), patterns=["ERROR"]))
+        monkeypatch.setattr(type(monitor._events), "running", property(lambda self: True))
+        monkeypatch.setattr(monitor._events, "start", lambda loop=None: True)
+        monkeypatch.setattr(monitor._events, "watch", lambda directory, recursive=False: True)
+        monkeypatch.setattr(log_monitor, "EVENT_FALLBACK_INTERVAL", 60.0)
+        await monitor.start()
+        try:
+            _append(path, "ERROR now\n")
+            await asyncio.sleep(0.05)
+            assert event_bus.publish.await_count == 0  # No event yet: not read
+
+            monitor._on_fs_event("modified", str(path), "")
+            for _ in range(100):
+                if event_bus.publish.await_count:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await monitor.stop()
+
+        assert event_bus.publish.await_count == 1
+        assert monitor.get_status()["wakeups"] == "events"
+
+    async def test_remove_monitor_unwatches_directory(self, tmp_path, event_bus, monkeypatch):
+        """The directory is unwatched once no monitored log is left in it."""
+        unwatched: list[str] = []
+        monitor = LogMonitor(event_bus)
+        monitor.add_monitor(LogMonitorConfig(id="a", path=str(tmp_path / "a.log"), patterns=["ERROR"]))
+        monitor.add_monitor(LogMonitorConfig(id="b", path=str(tmp_path / "b.log"), patterns=["ERROR"]))
+        monitor.add_monitor(LogMonitorConfig(id="c", path=str(tmp_path / "gone" / "c.log"), patterns=["ERROR"]))
+        monkeypatch.setattr(monitor._events, "start", lambda loop=None: True)
+        monkeypatch.setattr(monitor._events, "watch", lambda directory, recursive=False: os.path.isdir(directory))
+        monkeypatch.setattr(monitor._events, "unwatch", lambda directory, recursive=False: unwatched.append(directory))
+        await monitor.start()
+        try:
+            assert monitor._unwatched == {str(tmp_path / "gone" / "c.log")}
+            monitor.remove_monitor("c")
+            assert monitor._unwatched == set()
+            monitor.remove_monitor("a")
+            assert unwatched == [str(tmp_path / "gone")]
+            monitor.remove_monitor("b")
+            assert unwatched == [str(tmp_path / "gone"), str(tmp_path)]
+        finally:
+            await monitor.stop()
+
+    async def test_unwatched_log_polled_and_watched_once_its_directory_exists(
+        self, tmp_path, event_bus, monkeypatch,
+    ):
+        """A log in a missing directory is polled at poll_interval until it can be watched."""
+        log_dir = tmp_path / "later"
+        path = log_dir / "app.log"
+        watched: list[str] = []
+
+        def watch(directory, recursive=False):
+            if not os.path.isdir(directory):
+                return False
+            watched.append(directory)
+            return True
+
+        monitor = LogMonitor(event_bus, poll_interval=0.02)
+        monitor.add_monitor(LogMonitorConfig(id="a", path=str(path), patterns=["ERROR"]))
+        monkeypatch.setattr(type(monitor._events), "running", property(lambda self: True))
+        monkeypatch.setattr(monitor._events, "start", lambda loop=None: True)
+        monkeypatch.setattr(monitor._events, "watch", watch)
+        monkeypatch.setattr(log_monitor, "EVENT_FALLBACK_INTERVAL", 60.0)
+        await monitor.start()
+        try:
+            assert watched == []
+            log_dir.mkdir()
+            _append(path, "ERROR early\n")
+            for _ in range(100):
+                if event_bus.publish.await_count and watched:
+                    break
+                await asyncio.sleep(0.01)
+            assert watched == [str(log_dir)]
+            assert monitor._unwatched == set()
+        finally:
+            await monitor.stop()
+
+        assert event_bus.publish.await_count == 1
@@ -0,0 +1,217 @@
+"""Unit tests for prompt_layout.py (cache-friendly prompt assembly)."""
+
+from __future__ import annotations
+
+import pytest
+from deepagents.middleware._utils import append_to_system_message
+from deepagents.middleware.memory import MEMORY_SYSTEM_PROMPT
+from deepagents.middleware.skills import SKILLS_SYSTEM_PROMPT
+from langchain.agents.middleware.types import ModelRequest, ModelResponse
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from ag3nt_agent.model_config import MAX_CACHE_BREAKPOINTS, supports_cache_breakpoints
+from ag3nt_agent.prompt_layout import (
+    PromptLayoutMiddleware,
+    Segment,
+    classify_block,
+    turn_hint,
+)
+from tests.utils.mock_llm import PrefixCachingChatModel
+
+CORE = "You are AG3NT. " * 40
+TODO = "## `write_todos`\nUse todos for multi-step work. " * 20
+FILESYSTEM = "## Filesystem Tools\nUse ls, read_file, edit_file. " * 20
+MEMORY = MEMORY_SYSTEM_PROMPT.format(agent_memory="The user prefers pytest. " * 20)
+SKILLS = SKILLS_SYSTEM_PROMPT.format(skills_locations="`/skills/`", skills_list="- **pdf**: Read PDFs")
+
+
+def _system(hint: str | None) -> SystemMessage:
+    """System message in deepagents middleware order, plus an AG3NT per-turn hint."""
+    system = SystemMessage(content=CORE)
+    for text in (TODO, MEMORY, SKILLS, FILESYSTEM):
+        system = append_to_system_message(system, text)
+    if hint:
+        system = append_to_system_message(system, turn_hint(hint))
+    return system
+
+
+def _texts(message) -> list[str]:
+    return [b["text"] for b in message.content_blocks if b.get("type") == "text"]
+
+
+def _tagged(blocks) -> list[int]:
+    return [i for i, b in enumerate(blocks) if isinstance(b, dict) and "cache_control" in b]
+
+
+def _capture(middleware: PromptLayoutMiddleware, request: ModelRequest) -> ModelRequest:
+    seen: list[ModelRequest] = []
+    middleware.wrap_model_call(request, lambda r: seen.append(r) or ModelResponse(result=[]))
+    return seen[0]
+
+
+def _request(messages, hint: str | None = "Current task: 1/3", **settings) -> ModelRequest:
+    return ModelRequest(
+        model=PrefixCachingChatModel(),
+        messages=messages,
+        system_message=_system(hint),
+        model_settings=settings,
+    )
+
+
+# ------------------------------------------------------------------
+# Layout
+# ------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_segments_are_ordered_and_hints_move_to_final_message():
+    request = _request([HumanMessage(content="hi")])
+
+    laid_out = _capture(PromptLayoutMiddleware(cache_breakpoints=False), request)
+
+    segments = [classify_block(b) for b in laid_out.system_message.content_blocks]
+    assert segments == [Segment.STATIC] * 3 + [Segment.SKILLS, Segment.MEMORY]
+    assert _texts(laid_out.system_message)[0] == CORE
+    assert _tagged(laid_out.system_message.content) == []
+    final = laid_out.messages[-1]
+    assert [b["text"] for b in final.content] == ["hi", turn_hint("Current task: 1/3")]
+    # The state's message is untouched.
+    assert request.messages[-1].content == "hi"
+
+
+@pytest.mark.unit
+def test_breakpoints_after_static_and_memory_and_on_message_tail():
+    request = _request(
+        [HumanMessage(content="hi"), AIMessage(content="", tool_calls=[{"name": "ls", "args": {}, "id": "t1"}]),
+         ToolMessage(content="a.txt", tool_call_id="t1")],
+        cache_control={"type": "ephemeral"},
+    )
+
+    laid_out = _capture(PromptLayoutMiddleware(cache_breakpoints=True), request)
+
+    assert _tagged(laid_out.system_message.content) == [2, 4]
+    tail = laid_out.messages[-1].content
+    assert _tagged(tail) == [0]
+    assert tail[-1]["text"].startswith("<turn_context>")
+    assert "cache_control" not in laid_out.model_settings
+
+
+@pytest.mark.unit
+def test_breakpoints_capped_at_provider_limit():
+    def tagged_message(cls, text, **kwargs):
+        return cls(content=[{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}], **kwargs)
+
+    request = _request([
+        tagged_message(HumanMessage, "first"),
+        tagged_message(AIMessage, "one"),
+        tagged_message(HumanMessage, "second"),
+        tagged_message(AIMessage, "two"),
+        HumanMessage(content="third"),
+    ])
+
+    laid_out = _capture(PromptLayoutMiddleware(cache_breakpoints=True), request)
+
+    tagged = [len(_tagged(laid_out.system_message.content))] + [len(_tagged(m.content)) for m in laid_out.messages]
+    assert sum(tagged) == MAX_CACHE_BREAKPOINTS
+    # The layout's own breakpoints win, then the newest earlier ones
+    assert tagged == [2, 0, 0, 0, 1, 1]
+    assert _tagged(request.messages[0].content) == [0]
+
+
+@pytest.mark.unit
+def test_hint_stays_in_system_when_conversation_ends_with_ai_message():
+    laid_out = _capture(
+        PromptLayoutMiddleware(cache_breakpoints=True),
+        _request([HumanMessage(content="hi"), AIMessage(content="hello")]),
+    )
+
+    blocks = laid_out.system_message.content_blocks
+    assert classify_block(blocks[-1]) is Segment.TURN
+    assert _tagged(laid_out.system_message.content) == [2, 4]
+    assert laid_out.messages[-1].content == "hello"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("provider", "model", "expected"),
+    [
+        ("anthropic", "claude-sonnet-4-5-20250929", True),
+        ("openrouter", "anthropic/claude-sonnet-4.5", True),
+        ("openrouter", "moonshotai/kimi-k2.5", False),
+        ("openai", "gpt-4o", False),
+        ("kimi", "kimi-latest", False),
+    ],
+)
+def test_supports_cache_breakpoints(provider, model, expected):
+    assert supports_cache_breakpoints(provider, model) is expected
+
+
+# ------------------------------------------------------------------
+# Offline cache-hit measurement
+# ------------------------------------------------------------------
+
+
+def _run_conversation(middleware: PromptLayoutMiddleware | None, automatic: bool = False) -> float:
+    """Run five turns with a changing hint; return cache-read share of input tokens after turn 1."""
+    model = PrefixCachingChatModel(responses=[f"answer {i}" for i in range(5)], automatic=automatic)
+    history: list = []
+    read = total = 0
+    for turn in range(5):
+        history.append(HumanMessage(content=f"question {turn}"))
+        request = ModelRequest(
+            model=model,
+            messages=list(history),
+            system_message=_system(f"Current task: {turn + 1}/5"),
+            model_settings={} if automatic else {"cache_control": {"type": "ephemeral"}},
+        )
+        if middleware is None and not automatic:
+            # What deepagents' AnthropicPromptCachingMiddleware does on its own.
+            blocks = list(request.system_message.content_blocks)
+            blocks[-1] = {**blocks[-1], "cache_control": {"type": "ephemeral"}}
+            request = request.override(system_message=SystemMessage(content=blocks))
+
+        def handler(req: ModelRequest) -> ModelResponse:
+            return ModelResponse(result=[model.invoke([req.system_message, *req.messages], **req.model_settings)])
+
+        result = (middleware.wrap_model_call(request, handler) if middleware else handler(request)).result[0]
+        history.append(AIMessage(content=result.content))
+        if turn:
+            usage = result.usage_metadata
+            read += usage["input_token_details"]["cache_read"]
+            total += usage["input_tokens"]
+    return read / total
+
+
+@pytest.mark.unit
+def test_layout_raises_cache_hit_rate_with_breakpoints():
+    baseline = _run_conversation(None)
+    laid_out = _run_conversation(PromptLayoutMiddleware(cache_breakpoints=True))
+
+    assert baseline == 0.0
+    assert laid_out > 0.8
+
+
+@pytest.mark.unit
+def test_layout_raises_cache_hit_rate_with_automatic_caching():
+    baseline = _run_conversation(None, automatic=True)
+    laid_out = _run_conversation(PromptLayoutMiddleware(cache_breakpoints=False), automatic=True)
+
+    assert laid_out > baseline
+    assert laid_out > 0.8
+
+
+@pytest.mark.unit
+def test_usage_info_reports_cached_tokens():
+    from ag3nt_agent.deepagents_runtime import _extract_usage_info
+
+    model = PrefixCachingChatModel(responses=["a", "b"])
+    messages = [SystemMessage(content=[{"type": "text", "text": CORE, "cache_control": {"type": "ephemeral"}}]),
+                HumanMessage(content="hi")]
+    first = model.invoke(messages)
+    second = model.invoke(messages)
+
+    usage = _extract_usage_info({"messages": [first, second]})
+
+    assert usage["input_tokens"] == first.usage_metadata["input_tokens"] * 2
+    assert usage["cache_creation_tokens"] == usage["cache_read_tokens"] > 0
+    assert usage["uncached_input_tokens"] == usage["input_tokens"] - 2 * usage["cache_read_tokens"]
@@ -0,0 +1,146 @@
+"""Tests for request_context.py (context-local session identity)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from ag3nt_agent.deep_reasoning import (
+    deep_reasoning,
+    get_reasoning_session,
+    reset_session_manager,
+)
+from ag3nt_agent.request_context import (
+    bind,
+    get_request_context,
+    get_session_id,
+    request_context,
+    run_in_executor,
+)
+
+N_SESSIONS = 16
+
+
+@pytest.fixture
+def _fresh_reasoning_sessions():
+    reset_session_manager()
+    yield
+    reset_session_manager()
+
+
+@pytest.mark.unit
+class TestRequestContext:
+    def test_default_outside_turn(self):
+        assert get_request_context() is None
+        assert get_session_id() == "default"
+        assert get_session_id("fallback") == "fallback"
+
+    def test_scoped_and_restored(self):
+        with request_context("outer", {"channel": "test"}) as outer:
+            with request_context("inner"):
+                assert get_session_id() == "inner"
+            assert get_session_id() == "outer"
+            assert outer.metadata == {"channel": "test"}
+        assert get_request_context() is None
+
+    def test_falls_back_to_langgraph_thread_id(self):
+        probe = RunnableLambda(lambda _: get_session_id())
+
+        assert probe.invoke(None, config={"configurable": {"thread_id": "thread-7"}}) == "thread-7"
+
+    def test_plain_threads_need_bind(self):
+        with request_context("s1"), ThreadPoolExecutor(max_workers=1) as pool:
+            assert pool.submit(get_session_id).result() == "default"
+            assert pool.submit(bind(get_session_id)).result() == "s1"
+
+    async def test_async_tasks_and_executor(self):
+        async def probe(session_id: str) -> tuple[str, str, str]:
+            with request_context(session_id):
+                await asyncio.sleep(0)
+                return (
+                    get_session_id(),
+                    await asyncio.to_thread(get_session_id),
+                    await run_in_executor(get_session_id),
+                )
+
+        ids = [f"async-{i}" for i in range(N_SESSIONS)]
+        results = await asyncio.gather(*(probe(i) for i in ids))
+
+        assert results == [(i, i, i) for i in ids]
+
+
+@pytest.mark.unit
+class TestConcurrentSessions:
+    """N sessions running at once must never see each other's identity."""
+
+    def test_parallel_threads_no_cross_talk(self):
+        barrier = threading.Barrier(N_SESSIONS)
+
+        def turn(i: int) -> list[str]:
+            session_id = f"session-{i}"
+            with request_context(session_id):
+                barrier.wait()  # every session is now current somewhere
+                seen = [get_session_id()]
+                # Tools run on LangChain's executor, which copies the context
+                seen += RunnableLambda(lambda _: get_session_id()).batch([None] * 4)
+                seen.append(get_session_id())
+                return seen
+
+        with ThreadPoolExecutor(max_workers=N_SESSIONS) as pool:
+            results = list(pool.map(turn, range(N_SESSIONS)))
+
+        for i, seen in enumerate(results):
+            assert set(seen) == {f"session-{i}"}
+
+    @pytest.mark.usefixtures("_fresh_reasoning_sessions")
+    def test_deep_reasoning_sessions_are_isolated(self):
+        barrier = threading.Barrier(N_SESSIONS)
+
+        def turn(i: int) -> None:
+            with request_context(f"reason-{i}"):
+                barrier.wait()
+                for n in range(1, i % 4 + 2):
+                    result = deep_reasoning.invoke({
+                        "thought": f"session {i} step {n}",
+                        "thought_number": n,
+                        "total_thoughts": 5,
+                        "next_thought_needed": True,
+                    })
+                    assert json.loads(result)["status"] == "success"
+
+        with ThreadPoolExecutor(max_workers=N_SESSIONS) as pool:
+            list(pool.map(turn, range(N_SESSIONS)))
+
+        for i in range(N_SESSIONS):
+            thoughts = get_reasoning_session(f"reason-{i}")._thoughts
+            assert {t.content for t in thoughts} == {f"session {i} step {n}" for n in range(1, i % 4 + 2)}
+
+    def test_run_turn_scopes_each_session(self):
+        from ag3nt_agent import deepagents_runtime
+
+        barrier = threading.Barrier(N_SESSIONS)
+        seen: dict[str, str] = {}
+
+        class FakeAgent:
+            def invoke(self, _input, config):
+                barrier.wait()
+                probe = RunnableLambda(lambda _: get_session_id())
+                seen[config["configurable"]["thread_id"]] = probe.batch([None, None])
+                return {"messages": [AIMessage(content="done")]}
+
+        with patch.object(deepagents_runtime, "get_agent", return_value=FakeAgent()), \
+                ThreadPoolExecutor(max_workers=N_SESSIONS) as pool:
+            results = list(pool.map(
+                lambda i: deepagents_runtime.run_turn(f"turn-{i}", "hi"), range(N_SESSIONS)
+            ))
+
+        assert [r["text"] for r in results] == ["done"] * N_SESSIONS
+        assert seen == {f"turn-{i}": [f"turn-{i}", f"turn-{i}"] for i in range(N_SESSIONS)}
+        assert get_request_context() is None
@@ -102,7 +102,7 @@ class TestSkillTriggerLazyInit:
         call_count = 0
         original_triggers = {"test_skill": ["hello"]}
 
-        def mock_load():
+        def mock_load(skill_names=None):
             nonlocal call_count
             call_count += 1
             return original_triggers
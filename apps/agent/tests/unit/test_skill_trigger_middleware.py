@@ -1,4 +1,6 @@
 """Tests for skill trigger matching middleware."""
+import os
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
@@ -7,7 +9,9 @@ from ag3nt_agent.skill_trigger_middleware import (
     find_repo_root,
     load_skill_triggers,
     match_triggers,
+    read_skill_triggers,
     SkillTriggerMiddleware,
+    TriggerMatcher,
 )
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 
@@ -230,3 +234,127 @@ class TestSkillTriggerMiddleware:
         handler.assert_called_once_with(request)
         assert result == "response"
 
+
+
+class TestTriggerMatcher:
+    """Test suite for the compiled Aho-Corasick matcher."""
+
+    def test_overlapping_triggers_and_order(self):
+        """Overlapping and nested triggers all match, in triggers_map order."""
+        triggers_map = {
+            "a": ["she"],
+            "b": ["he", "hers"],
+            "c": ["his"],
+            "d": ["ushe"],
+        }
+
+        assert TriggerMatcher(triggers_map).match("USHERS") == ["a", "b", "d"]
+
+    def test_matches_naive_substring_search(self):
+        """The automaton agrees with a substring search on every skill."""
+        triggers_map = {f"skill-{i}": [f"task {i}", f"do{i}x", "shared"] for i in range(200)}
+        matcher = TriggerMatcher(triggers_map)
+
+        for message in ["please do17x and task 42", "shared work", "task 1999", "nothing"]:
+            expected = [
+                name for name, triggers in triggers_map.items()
+                if any(t in message for t in triggers)
+            ]
+            assert matcher.match(message) == expected
+
+    def test_word_boundary(self):
+        """Whole-word mode ignores partial words and punctuation."""
+        matcher = TriggerMatcher({"test-skill": ["file", "open file"]}, word_boundary=True)
+
+        assert matcher.match("filename") == []
+        assert matcher.match("Open-file now") == ["test-skill"]
+        assert matcher.match("a file.") == ["test-skill"]
+
+    def test_stemmed(self):
+        """Stemmed mode matches inflected forms."""
+        matcher = TriggerMatcher({"file-manager": ["open file"], "runner": ["run tests"]}, stem=True)
+
+        assert matcher.match("I was opening files") == ["file-manager"]
+        assert matcher.match("Running tests now") == ["runner"]
+        assert matcher.match("reopen filing") == []
+
+
+class TestSkillTriggerReload:
+    """Test suite for per-message caching and hot reload."""
+
+    @staticmethod
+    def _write_skill(skills_dir, name, triggers):
+        skill_md = skills_dir / name / "SKILL.md"
+        skill_md.parent.mkdir(parents=True, exist_ok=True)
+        lines = "".join(f"  - {t}\n" for t in triggers)
+        skill_md.write_text(f"---\nname: {name}\ntriggers:\n{lines}---\n# {name}\n")
+        return skill_md
+
+    @patch('ag3nt_agent.skill_trigger_middleware.TriggerMatcher.match')
+    @patch('ag3nt_agent.skill_trigger_middleware.load_skill_triggers')
+    def test_match_result_cached_per_message(self, mock_load, mock_match):
+        """Repeated model calls in a turn reuse the match result."""
+        mock_load.return_value = {"file-manager": ["open file"]}
+        mock_match.return_value = ["file-manager"]
+        middleware = SkillTriggerMiddleware(revalidate_interval=0)
+
+        for _ in range(3):
+            assert middleware.match("open file x") == ["file-manager"]
+
+        assert mock_match.call_count == 1
+
+    def test_new_changed_and_removed_skills_picked_up(self, tmp_path):
+        """Only changed SKILL.md files are re-read; the rest stay loaded."""
+        skills_dir = tmp_path / "skills"
+        self._write_skill(skills_dir, "alpha", ["alpha task"])
+        beta = self._write_skill(skills_dir, "beta", ["beta task"])
+
+        with patch('ag3nt_agent.skill_trigger_middleware.skill_dirs', return_value=[skills_dir]):
+            middleware = SkillTriggerMiddleware(revalidate_interval=0)
+            assert sorted(middleware.match("alpha task and beta task")) == ["alpha", "beta"]
+
+            self._write_skill(skills_dir, "gamma", ["gamma task"])
+            self._write_skill(skills_dir, "beta", ["beta job"])
+            st = beta.stat()
+            os.utime(beta, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            with patch(
+                'ag3nt_agent.skill_trigger_middleware.read_skill_triggers',
+                wraps=read_skill_triggers,
+            ) as reads:
+                middleware.refresh(force=True)
+            assert sorted(c.args[0].parent.name for c in reads.call_args_list) == ["beta", "gamma"]
+            assert sorted(middleware.match("beta task, beta job, gamma task")) == ["beta", "gamma"]
+            assert middleware.match("beta task") == []
+
+            (skills_dir / "gamma" / "SKILL.md").unlink()
+            middleware.refresh(force=True)
+            assert middleware.match("gamma task") == []
+
+    def test_renamed_skill_dropped_when_name_differs_from_dir(self, tmp_path):
+        """Skills loaded at startup are tracked by directory, not frontmatter name."""
+        skills_dir = tmp_path / "skills"
+        skill_md = skills_dir / "pdf-tools" / "SKILL.md"
+        skill_md.parent.mkdir(parents=True)
+        skill_md.write_text("---\nname: pdf-helper\ntriggers:\n  - merge pdf\n---\n")
+
+        with patch('ag3nt_agent.skill_trigger_middleware.skill_dirs', return_value=[skills_dir]):
+            middleware = SkillTriggerMiddleware(revalidate_interval=0)
+            assert middleware.match("merge pdf files") == ["pdf-helper"]
+
+            skill_md.unlink()
+            middleware.refresh(force=True)
+            assert middleware.match("merge pdf files") == []
+
+    def test_refresh_respects_revalidate_interval(self, tmp_path):
+        """Between checks, new skills are not looked for."""
+        skills_dir = tmp_path / "skills"
+        self._write_skill(skills_dir, "alpha", ["alpha task"])
+
+        with patch('ag3nt_agent.skill_trigger_middleware.skill_dirs', return_value=[skills_dir]):
+            middleware = SkillTriggerMiddleware(revalidate_interval=3600)
+            assert middleware.match("alpha task") == ["alpha"]
+            self._write_skill(skills_dir, "gamma", ["gamma task"])
+
+            assert middleware.match("gamma task") == []
+            middleware.refresh(force=True)
+            assert middleware.match("gamma task") == ["gamma"]
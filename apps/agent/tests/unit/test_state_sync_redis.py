@@ -0,0 +1,267 @@
+"""Tests for RedisStateSync against an in-process fakeredis server."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+
+import pytest
+
+from ag3nt_agent.state_sync import (
+    RedisStateSync,
+    SessionState,
+    SessionVersionConflict,
+)
+
+try:
+    import fakeredis
+    import lupa  # noqa: F401  -- fakeredis needs it for EVAL
+
+    HAS_FAKEREDIS = True
+except ImportError:
+    HAS_FAKEREDIS = False
+
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.skipif(not HAS_FAKEREDIS, reason="fakeredis[lua] not installed")
+
+
+@pytest.fixture
+async def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+async def sync(server):
+    client = fakeredis.FakeAsyncRedis(server=server)
+    s = await RedisStateSync.from_client(client)
+    yield s
+    await s.close()
+
+
+async def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+# ------------------------------------------------------------------
+# Storage
+# ------------------------------------------------------------------
+
+
+@pytest.mark.unit
+async def test_set_and_get_round_trip(sync):
+    state = SessionState(session_id="s1", channel_type="cli", directives=[{"a": 1}])
+    await sync.set_session("s1", state)
+
+    loaded = await sync.get_session("s1")
+    assert loaded == state
+
+
+@pytest.mark.unit
+async def test_session_is_stored_as_hash(sync):
+    await sync.set_session("s1", SessionState(session_id="s1"))
+    await sync.update_session("s1", {"messageCount": 3})
+
+    raw = await sync.redis.hgetall("ag3nt:session:s1")
+    assert json.loads(raw[b"messageCount"]) == 3
+    assert json.loads(raw[b"version"]) == 2
+
+
+@pytest.mark.unit
+async def test_update_missing_session_raises(sync):
+    with pytest.raises(ValueError):
+        await sync.update_session("nope", {"messageCount": 1})
+
+
+@pytest.mark.unit
+async def test_expected_version_conflict(sync):
+    await sync.set_session("s1", SessionState(session_id="s1", version=1))
+    await sync.update_session("s1", {"priority": 2}, expected_version=1)
+
+    with pytest.raises(SessionVersionConflict) as exc:
+        await sync.update_session("s1", {"priority": 3}, expected_version=1)
+    assert exc.value.actual == 2
+    assert (await sync.get_session("s1")).priority == 2
+
+
+@pytest.mark.unit
+async def test_legacy_json_session_is_migrated(sync):
+    legacy = SessionState(session_id="s1", message_count=4).to_dict()
+    await sync.redis.set("ag3nt:session:s1", json.dumps(legacy))
+
+    assert (await sync.get_session("s1")).message_count == 4
+    updated = await sync.update_session("s1", {"paired": True})
+
+    assert updated.message_count == 4
+    assert updated.paired is True
+    assert await sync.redis.type("ag3nt:session:s1") == b"hash"
+
+
+@pytest.mark.unit
+async def test_delete_session(sync):
+    await sync.set_session("s1", SessionState(session_id="s1"))
+    assert await sync.delete_session("s1") is True
+    assert await sync.get_session("s1") is None
+
+
+# ------------------------------------------------------------------
+# Concurrency
+# ------------------------------------------------------------------
+
+
+@pytest.mark.unit
+async def test_concurrent_writers_lose_no_updates(server, sync):
+    """Two clients (gateway + worker) updating disjoint fields concurrently."""
+    other = await RedisStateSync.from_client(fakeredis.FakeAsyncRedis(server=server))
+    try:
+        await sync.set_session("s1", SessionState(session_id="s1", version=1))
+
+        async def writer(client: RedisStateSync, make_update) -> None:
+            for i in range(50):
+                await client.update_session("s1", make_update(i))
+
+        await asyncio.gather(
+            writer(sync, lambda i: {"messageCount": i}),
+            writer(other, lambda i: {"metadata": {"meta": i}}),
+        )
+
+        final = await sync.get_session("s1")
+        assert final.version == 101
+        assert final.message_count == 49
+        assert final.metadata == {"meta": 49}
+    finally:
+        await other.close()
+
+
+@pytest.mark.unit
+async def test_compare_and_set_retry_loop_is_linearizable(sync):
+    """Read-modify-write counters via expected_version never lose increments."""
+    await sync.set_session("s1", SessionState(session_id="s1", version=1))
+
+    async def increment() -> None:
+        while True:
+            current = await sync.get_session("s1")
+            try:
+                await sync.update_session(
+                    "s1",
+                    {"messageCount": current.message_count + 1},
+                    expected_version=current.version,
+                )
+                return
+            except SessionVersionConflict:
+                await asyncio.sleep(0)
+
+    await asyncio.gather(*(increment() for _ in range(40)))
+    assert (await sync.get_session("s1")).message_count == 40
+
+
+@pytest.mark.slow
+@pytest.mark.unit
+async def test_update_throughput_under_contention(server, sync):
+    """Measure ops/sec with several clients hammering one session."""
+    clients = [
+        await RedisStateSync.from_client(fakeredis.FakeAsyncRedis(server=server))
+        for _ in range(3)
+    ]
+    try:
+        await sync.set_session("hot", SessionState(session_id="hot", version=1))
+        ops_per_client = 200
+
+        async def worker(client: RedisStateSync, n: int) -> None:
+            for i in range(ops_per_client):
+                await client.update_session("hot", {"activeTools": [f"tool-{n}-{i}"]})
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(c, n) for n, c in enumerate([sync, *clients])))
+        elapsed = time.perf_counter() - start
+
+        total = ops_per_client * (len(clients) + 1)
+        logger.info(f"RedisStateSync contended updates: {total / elapsed:,.0f} ops/sec")
+        assert (await sync.get_session("hot")).version == total + 1
+    finally:
+        for c in clients:
+            await c.close()
+
+
+# ------------------------------------------------------------------
+# Pub/sub deltas
+# ------------------------------------------------------------------
+
+
+@pytest.mark.unit
+async def test_update_publishes_delta_only(sync):
+    await sync.set_session("s1", SessionState(session_id="s1", user_id="u1"))
+    pubsub = sync.redis.pubsub()
+    await pubsub.subscribe("ag3nt:updates:s1")
+    await pubsub.get_message(timeout=1.0)  # subscribe confirmation
+
+    await sync.update_session("s1", {"messageCount": 7})
+    message = None
+    for _ in range(50):
+        message = await pubsub.get_message(timeout=0.1)
+        if message:
+            break
+    await pubsub.close()
+
+    payload = json.loads(message["data"])
+    assert payload["version"] == 2
+    assert set(payload["changes"]) == {"messageCount", "updatedAt", "version"}
+    assert payload["changes"]["messageCount"] == 7
+
+
+@pytest.mark.unit
+async def test_subscribers_receive_full_state_from_deltas(sync):
+    received: list[SessionState] = []
+    sync.subscribe("s1", received.append)
+
+    await sync.set_session("s1", SessionState(session_id="s1", user_id="u1"))
+    await sync.update_session("s1", {"messageCount": 1})
+    await sync.update_session("s1", {"priority": 9})
+    await _wait_for(lambda: len(received) == 3)
+
+    last = received[-1]
+    assert last.user_id == "u1"
+    assert last.message_count == 1
+    assert last.priority == 9
+    assert last.version == 3
+
+
+@pytest.mark.unit
+async def test_version_gap_rereads_hash(sync):
+    received: list[SessionState] = []
+    sync.subscribe("s1", received.append)
+
+    # Seed the store directly so the listener never saw the base state.
+    base = SessionState(session_id="s1", user_id="u9", version=5).to_dict()
+    await sync.redis.hset(
+        "ag3nt:session:s1",
+        mapping={k: json.dumps(v) for k, v in base.items()},
+    )
+    await sync.update_session("s1", {"messageCount": 2})
+    await _wait_for(lambda: len(received) == 1)
+
+    assert received[0].user_id == "u9"
+    assert received[0].message_count == 2
+    assert received[0].version == 6
+
+
+@pytest.mark.unit
+async def test_known_states_are_bounded(server):
+    sync = await RedisStateSync.from_client(fakeredis.FakeAsyncRedis(server=server))
+    sync.max_known_sessions = 2
+    received: list[str] = []
+    sync.subscribe_all(lambda session_id, state: received.append(session_id))
+    try:
+        for session_id in ("a", "b", "c", "a"):
+            await sync.set_session(session_id, SessionState(session_id=session_id))
+        await _wait_for(lambda: len(received) == 4)
+
+        assert list(sync._known) == ["c", "a"]
+    finally:
+        await sync.close()
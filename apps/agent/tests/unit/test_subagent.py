@@ -1861,6 +1861,141 @@ class TestSubagentMonitorPersistence:
             )
             assert monitor.persistence_path == Path(persistence_path)
 
+    def test_end_execution_appends_one_journal_record(self, tmp_path):
+        """Test that each completed execution appends one JSONL record."""
+        persistence_path = tmp_path / "subagent_runs.jsonl"
+        monitor = SubagentMonitor(persistence_path=persistence_path)
+        for i in range(3):
+            exec = monitor.start_execution("p1", "researcher", f"Task {i}")
+            monitor.record_tool_call(exec.id, "search", {"q": i}, "result")
+            monitor.end_execution(exec.id, result="Done")
+
+        lines = persistence_path.read_text().splitlines()
+        assert [json.loads(line)["task"] for line in lines] == ["Task 0", "Task 1", "Task 2"]
+        assert json.loads(lines[0])["tool_calls"][0]["tool"] == "search"
+
+    def test_journal_is_compacted_in_background(self, tmp_path):
+        """Test that the journal is rewritten once it outgrows the history."""
+        persistence_path = tmp_path / "subagent_runs.jsonl"
+        monitor = SubagentMonitor(max_history=3, persistence_path=persistence_path)
+        for i in range(7):
+            exec = monitor.start_execution("p1", "researcher", f"Task {i}")
+            monitor.end_execution(exec.id, result="Done")
+        monitor._compaction_thread.join(timeout=5.0)
+
+        assert len(persistence_path.read_text().splitlines()) <= 3 * 2
+        monitor2 = SubagentMonitor(max_history=3, persistence_path=persistence_path, auto_persist=False)
+        assert monitor2.load_from_disk() == 3
+        assert [e.task for e in monitor2.executions] == ["Task 4", "Task 5", "Task 6"]
+
+    def test_load_skips_torn_and_duplicate_records(self, tmp_path):
+        """Test that a torn tail is skipped and the latest duplicate wins."""
+        persistence_path = tmp_path / "subagent_runs.jsonl"
+        monitor = SubagentMonitor(persistence_path=persistence_path)
+        for task in ("first", "second"):
+            exec = monitor.start_execution("p1", "coder", task, execution_id=f"id_{task}")
+            monitor.end_execution(exec.id, result="Done")
+        first = persistence_path.read_text().splitlines()[0]
+        with open(persistence_path, "a", encoding="utf-8") as f:
+            f.write(first + "\n")
+            f.write('{"id": "torn", "parent')
+
+        monitor2 = SubagentMonitor(persistence_path=persistence_path, auto_persist=False)
+        assert monitor2.load_from_disk() == 2
+        assert [e.task for e in monitor2.executions] == ["second", "first"]
+        assert monitor2.get_execution("id_first").task == "first"
+
+    def test_load_legacy_json_document(self, tmp_path):
+        """Test loading a file written in the pre-journal JSON format."""
+        persistence_path = tmp_path / "subagent_runs.json"
+        execution = SubagentExecution(
+            id="legacy_1",
+            parent_id="p1",
+            subagent_type="researcher",
+            task="Old task",
+            started_at=datetime.now(),
+            ended_at=datetime.now(),
+            tokens_used=42,
+        )
+        persistence_path.write_text(json.dumps(
+            {"version": 1, "max_history": 100, "executions": [execution.to_dict()]},
+            indent=2,
+        ))
+
+        monitor = SubagentMonitor(persistence_path=persistence_path, auto_persist=False)
+        assert monitor.load_from_disk() == 1
+        assert monitor.get_statistics()["total_tokens"] == 42
+
+    def test_legacy_document_at_persistence_path_becomes_journal(self, tmp_path):
+        """Test that appends after loading a pre-journal file don't corrupt it."""
+        persistence_path = tmp_path / "subagent_runs.jsonl"
+        execution = SubagentExecution(
+            id="legacy_1",
+            parent_id="p1",
+            subagent_type="researcher",
+            task="Old task",
+            started_at=datetime.now(),
+            ended_at=datetime.now(),
+        )
+        persistence_path.write_text(json.dumps(
+            {"version": 1, "max_history": 100, "executions": [execution.to_dict()]},
+            indent=2,
+        ))
+
+        monitor = SubagentMonitor(persistence_path=persistence_path)
+        assert monitor.load_from_disk() == 1
+
+        exec = monitor.start_execution("p1", "coder", "New task")
+        monitor.end_execution(exec.id, result="Done")
+
+        reloaded = SubagentMonitor(persistence_path=persistence_path)
+        assert reloaded.load_from_disk() == 2
+        assert [e.task for e in reloaded.executions] == ["Old task", "New task"]
+
+    def test_load_imports_legacy_file_when_journal_missing(self, tmp_path):
+        """Test that history in subagent_runs.json is imported into the .jsonl journal once."""
+        legacy_path = tmp_path / "subagent_runs.json"
+        execution = SubagentExecution(
+            id="legacy_1",
+            parent_id="p1",
+            subagent_type="researcher",
+            task="Old task",
+            started_at=datetime.now(),
+            ended_at=datetime.now(),
+        )
+        legacy_path.write_text(json.dumps(
+            {"version": 1, "max_history": 100, "executions": [execution.to_dict()]},
+            indent=2,
+        ))
+        journal_path = tmp_path / "subagent_runs.jsonl"
+
+        monitor = SubagentMonitor(persistence_path=journal_path)
+        assert monitor.load_from_disk() == 1
+        assert journal_path.exists()
+
+        exec = monitor.start_execution("p1", "coder", "New task")
+        monitor.end_execution(exec.id, result="Done")
+
+        reloaded = SubagentMonitor(persistence_path=journal_path)
+        assert reloaded.load_from_disk() == 2
+        assert [e.task for e in reloaded.executions] == ["Old task", "New task"]
+
+    def test_statistics_follow_history_trimming(self, tmp_path):
+        """Test that running totals drop executions trimmed from history."""
+        monitor = SubagentMonitor(max_history=2, persistence_path=tmp_path / "runs.jsonl", auto_persist=False)
+        for subagent_type, error, tokens in [("coder", "boom", 100), ("researcher", None, 10), ("researcher", None, 20)]:
+            exec = monitor.start_execution("p1", subagent_type, "Task")
+            monitor.record_turn(exec.id)
+            monitor.end_execution(exec.id, result="Done", error=error, tokens_used=tokens)
+
+        stats = monitor.get_statistics()
+        assert stats["total_executions"] == 2
+        assert stats["failed"] == 0
+        assert stats["success_rate"] == 1.0
+        assert stats["total_tokens"] == 30
+        assert stats["avg_turns"] == 1.0
+        assert stats["by_type"] == {"researcher": 2}
+
 
 # =============================================================================
 # Enhanced Subagent Monitor: Announce Queue Tests
@@ -2103,6 +2238,156 @@ class TestAnnounceQueue:
 
         assert queue.count() <= 5
 
+    def test_max_size_evicts_lowest_priority_oldest(self):
+        """Test that trimming drops the lowest-priority, oldest message."""
+        queue = AnnounceQueue(max_size=3)
+        queue.publish("a", "s", "t", "low_1", priority=AnnouncePriority.LOW)
+        queue.publish("a", "s", "t", "high", priority=AnnouncePriority.HIGH)
+        queue.publish("a", "s", "t", "low_2", priority=AnnouncePriority.LOW)
+        queue.publish("a", "s", "t", "normal")
+
+        assert [m.content for m in queue.poll(limit=10)] == ["high", "normal", "low_2"]
+
+    def test_topic_poll_keeps_other_topics_and_order(self):
+        """Test that polling one topic leaves others intact, highest priority first."""
+        queue = AnnounceQueue()
+        queue.publish("a", "s", "progress", "p1")
+        queue.publish("a", "s", "findings", "f1")
+        queue.publish("a", "s", "progress", "p2", priority=AnnouncePriority.URGENT)
+        queue.publish("a", "s", "progress", "p3")
+
+        assert [m.content for m in queue.poll(topic="progress", limit=2)] == ["p2", "p1"]
+        assert queue.count(topic="progress") == 1
+        assert [m.content for m in queue.poll()] == ["f1", "p3"]
+        assert queue.count() == 0
+
+    def test_session_filter_skips_without_removing(self):
+        """Test that messages from other sessions stay queued."""
+        queue = AnnounceQueue()
+        queue.publish("a", "session_1", "t", "mine")
+        queue.publish("a", "session_2", "t", "theirs", priority=AnnouncePriority.HIGH)
+
+        assert [m.content for m in queue.poll(session_id="session_1")] == ["mine"]
+        assert [m.content for m in queue.peek()] == ["theirs"]
+
+    def test_session_filter_leaves_shared_heaps_alone(self):
+        """Test that a session-filtered poll reads its own heap, not every session's."""
+        queue = AnnounceQueue()
+        for i in range(200):
+            queue.publish("a", f"session_{i}", "t", i, priority=AnnouncePriority.HIGH)
+        queue.publish("a", "mine", "t", "first")
+        queue.publish("a", "mine", "other", "second")
+        all_heap = list(queue._all_heap)
+        topic_heap = list(queue._topic_heaps["t"])
+
+        assert [m.content for m in queue.poll(topic="t", session_id="mine")] == ["first"]
+        assert [m.content for m in queue.poll(session_id="mine")] == ["second"]
+        assert queue._all_heap == all_heap
+        assert queue._topic_heaps["t"] == topic_heap
+        assert queue.count() == 200
+        assert queue.poll(session_id="mine") == []
+
+    def test_expired_messages_are_dropped(self):
+        """Test that expired messages are removed from every index."""
+        queue = AnnounceQueue()
+        expired = queue.publish("a", "s", "t", "old", ttl_seconds=60)
+        queue.publish("a", "s", "t", "forever", ttl_seconds=0)
+        expired.expires_at = datetime.now() - timedelta(seconds=1)
+        queue._expiry_heap[0] = (expired.expires_at, queue._expiry_heap[0][1])
+
+        assert [m.content for m in queue.poll()] == ["forever"]
+        assert queue.count(topic="t") == 0
+
+    def test_stale_heap_entries_are_compacted(self):
+        """Test that the heaps are rebuilt once mostly stale."""
+        queue = AnnounceQueue()
+        for i in range(500):
+            queue.publish("a", "s", f"topic_{i % 5}", i)
+            queue.poll(topic=f"topic_{i % 5}")
+
+        assert queue.count() == 0
+        assert len(queue._all_heap) <= 64 + 1
+        assert len(queue._eviction_heap) <= 64 + 1
+
+    def test_stale_entries_compacted_when_polling_without_topic(self):
+        """Test that polling across topics does not leak topic, eviction or expiry entries."""
+        queue = AnnounceQueue()
+        for i in range(2000):
+            queue.publish("a", "s", f"topic_{i % 5}", i)
+            queue.poll()
+        queue.publish("a", "s", "topic_0", "last", ttl_seconds=0)
+
+        heaps = [
+            queue._all_heap,
+            queue._eviction_heap,
+            queue._expiry_heap,
+            *queue._topic_heaps.values(),
+            *queue._session_heaps.values(),
+        ]
+        assert sum(len(heap) for heap in heaps) <= 2 * 5 + 64 + 6
+        assert queue._heap_entries == sum(len(heap) for heap in heaps)
+        assert [m.content for m in queue.poll(topic="topic_0")] == ["last"]
+
+    def test_poll_wait_times_out(self):
+        """Test that poll_wait returns nothing after the timeout."""
+        queue = AnnounceQueue()
+        start = time.monotonic()
+        assert queue.poll_wait(topic="t", timeout=0.05) == []
+        assert time.monotonic() - start >= 0.05
+
+    def test_poll_wait_wakes_on_publish(self):
+        """Test that poll_wait returns as soon as a matching message arrives."""
+        import threading
+
+        queue = AnnounceQueue()
+        timer = threading.Timer(0.05, lambda: queue.publish("a", "s", "t", "hello"))
+        timer.start()
+        try:
+            messages = queue.poll_wait(topic="t", timeout=5.0)
+        finally:
+            timer.cancel()
+
+        assert [m.content for m in messages] == ["hello"]
+
+    async def test_poll_async_wakes_on_publish_from_thread(self):
+        """Test that poll_async is woken by a publish on another thread."""
+        import asyncio
+
+        queue = AnnounceQueue()
+
+        async def publish_later():
+            await asyncio.sleep(0.05)
+            await asyncio.to_thread(queue.publish, "a", "s", "other", "ignored")
+            await asyncio.to_thread(queue.publish, "a", "s", "t", "hello")
+
+        task = asyncio.create_task(publish_later())
+        messages = await queue.poll_async(topic="t", timeout=5.0)
+        await task
+
+        assert [m.content for m in messages] == ["hello"]
+        assert not queue._async_waiters
+        assert await queue.poll_async(topic="t", timeout=0.01) == []
+
+
+@pytest.mark.slow
+class TestAnnounceQueueBenchmark:
+    """Publish/poll throughput with many topics at the size limit."""
+
+    MESSAGES = 20000
+
+    def test_publish_poll_throughput(self):
+        queue = AnnounceQueue(max_size=1000)
+        start = time.perf_counter()
+        for i in range(self.MESSAGES):
+            queue.publish(f"agent_{i % 50}", "s", f"progress_{i % 50}", i)
+            if i % 10 == 0:
+                queue.poll(topic=f"progress_{i % 50}", limit=5)
+        elapsed = time.perf_counter() - start
+
+        print(f"\nAnnounceQueue: {self.MESSAGES / elapsed:,.0f} publishes/s at max_size=1000")
+        assert queue.count() == 1000
+        assert elapsed < 5.0
+
 
 # =============================================================================
 # Enhanced Subagent Monitor: Cross-Session Bus Tests
@@ -0,0 +1,224 @@
+"""Tests for web_fetch.py against a local HTTP server."""
+
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ag3nt_agent.web_fetch import (
+    FetchCache,
+    FetchError,
+    WebFetcher,
+    _freshness_lifetime,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves a few canned routes and records every request."""
+
+    protocol_version = "HTTP/1.1"
+    requests: list[tuple[str, dict[str, str]]] = []
+    client_ports: set[int] = set()
+
+    def log_message(self, *args):  # silence stderr
+        pass
+
+    def _send(self, status: int, body: bytes = b"", headers: dict[str, str] | None = None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        type(self).requests.append((self.path, dict(self.headers)))
+        type(self).client_ports.add(self.client_address[1])
+        html = {"Content-Type": "text/html; charset=utf-8"}
+        if self.path == "/fresh":
+            self._send(200, b"<h1>Fresh</h1>", {**html, "Cache-Control": "max-age=3600"})
+        elif self.path == "/etag":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self._send(304, headers={"ETag": '"v1"'})
+            else:
+                self._send(200, b"<p>Tagged</p>", {**html, "ETag": '"v1"', "Cache-Control": "no-cache"})
+        elif self.path == "/no-store":
+            self._send(200, b"<p>Secret</p>", {**html, "Cache-Control": "no-store"})
+        elif self.path == "/big":
+            chunk = b"<p>" + b"x" * 1020 + b"</p>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            try:
+                for _ in range(4096):  # ~4MB if fully read
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                self.wfile.write(b"0\r\n\r\n")
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+        elif self.path == "/missing":
+            self._send(404, b"nope")
+        else:
+            self._send(200, b"<p>Plain</p>", html)
+
+
+@pytest.fixture
+def server():
+    _Handler.requests = []
+    _Handler.client_ports = set()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def fetcher(tmp_path):
+    conversions: list[str] = []
+
+    def convert(html: str) -> str:
+        conversions.append(html)
+        return f"MD:{html}"
+
+    f = WebFetcher(cache=FetchCache(tmp_path / "cache"), converter=convert)
+    f.conversions = conversions
+    yield f
+    f.close()
+
+
+def _paths() -> list[str]:
+    return [path for path, _ in _Handler.requests]
+
+
+# ------------------------------------------------------------------
+# Caching
+# ------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_fresh_response_served_from_cache(server, fetcher):
+    first = fetcher.fetch(f"{server}/fresh")
+    second = fetcher.fetch(f"{server}/fresh")
+
+    assert first.markdown == "MD:<h1>Fresh</h1>"
+    assert not first.from_cache
+    assert second.from_cache
+    assert second.markdown == first.markdown
+    assert _paths() == ["/fresh"]
+
+
+@pytest.mark.unit
+def test_etag_revalidation_returns_cached_markdown(server, fetcher):
+    first = fetcher.fetch(f"{server}/etag")
+    second = fetcher.fetch(f"{server}/etag")
+
+    assert _paths() == ["/etag", "/etag"]
+    assert _Handler.requests[1][1].get("If-None-Match") == '"v1"'
+    assert second.revalidated
+    assert second.markdown == first.markdown
+    assert len(fetcher.conversions) == 1
+
+
+@pytest.mark.unit
+def test_no_store_is_never_cached(server, fetcher):
+    fetcher.fetch(f"{server}/no-store")
+    second = fetcher.fetch(f"{server}/no-store")
+
+    assert not second.from_cache
+    assert _paths() == ["/no-store", "/no-store"]
+    # Identical body still reuses the converted markdown.
+    assert len(fetcher.conversions) == 1
+
+
+@pytest.mark.unit
+def test_cache_persists_across_fetcher_instances(server, tmp_path):
+    cache_dir = tmp_path / "shared"
+    WebFetcher(cache=FetchCache(cache_dir), converter=str.upper).fetch(f"{server}/fresh")
+    result = WebFetcher(cache=FetchCache(cache_dir), converter=str.upper).fetch(f"{server}/fresh")
+
+    assert result.from_cache
+    assert _paths() == ["/fresh"]
+
+
+# ------------------------------------------------------------------
+# Streaming / pooling / errors
+# ------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_body_reading_stops_at_cap(server):
+    fetcher = WebFetcher(cache=None, converter=lambda html: html, max_body_bytes=64 * 1024)
+    try:
+        result = fetcher.fetch(f"{server}/big")
+    finally:
+        fetcher.close()
+
+    assert result.truncated
+    assert len(result.markdown.encode()) <= 64 * 1024
+
+
+@pytest.mark.unit
+def test_markdown_truncated_at_char_limit(server):
+    fetcher = WebFetcher(cache=None, converter=lambda html: html * 100, max_markdown_chars=50)
+    try:
+        result = fetcher.fetch(f"{server}/plain")
+    finally:
+        fetcher.close()
+    assert result.markdown.startswith("<p>Plain</p>")
+    assert "truncated at 50 characters" in result.markdown
+
+
+@pytest.mark.unit
+def test_connections_are_reused(server, fetcher):
+    for _ in range(5):
+        fetcher.fetch(f"{server}/plain")
+    assert len(_Handler.requests) == 5
+    assert len(_Handler.client_ports) == 1
+
+
+@pytest.mark.unit
+def test_http_error_raises_fetch_error(server, fetcher):
+    with pytest.raises(FetchError, match="404"):
+        fetcher.fetch(f"{server}/missing")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("url", ["http://[::1", "ftp://example.com/file"])
+def test_bad_url_raises_fetch_error(fetcher, url):
+    with pytest.raises(FetchError):
+        fetcher.fetch(url)
+
+
+@pytest.mark.unit
+def test_fetch_url_tool_reports_invalid_url():
+    from ag3nt_agent.deepagents_runtime import fetch_url
+
+    result = fetch_url.invoke({"url": "http://[::1"})
+    assert result["success"] is False
+    assert result["url"] == "http://[::1"
+    assert result["error"].startswith("Fetch URL error:")
+
+
+# ------------------------------------------------------------------
+# Freshness rules
+# ------------------------------------------------------------------
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({"cache-control": "no-store"}, None),
+        ({"cache-control": "no-cache, max-age=60"}, 0.0),
+        ({"cache-control": "public, max-age=60"}, 60.0),
+        ({"expires": "not a date"}, 0.0),
+        ({}, 0.0),
+    ],
+)
+def test_freshness_lifetime(headers, expected):
+    assert _freshness_lifetime(headers, now=1_000_000.0) == expected
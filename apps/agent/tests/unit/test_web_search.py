@@ -3,15 +3,17 @@
 Tests cover:
 - SearchResult and SearchResponse dataclasses
 - RateLimiter with sliding window
-- SearchCache with TTL expiration
-- WebSearchTool with mocked providers
+- SearchCache with TTL expiration, LRU eviction and key normalization
+- WebSearchTool with mocked providers and in-flight coalescing
 - Error handling and fallback behavior
 """
 
 from __future__ import annotations
 
 import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Literal
@@ -27,6 +29,7 @@ from ag3nt_agent.web_search import (
     WebSearchTool,
     get_web_search_tool,
     internet_search,
+    normalize_query,
 )
 
 
@@ -279,24 +282,20 @@ class TestSearchCache:
         assert cache.get("test", 10) is None
         assert cache.get("test", 5) is not None
 
-    def test_expired_cache_returns_none(self, temp_cache_dir: Path):
+    def test_expired_cache_returns_none(self, cache: SearchCache):
         """Test expired cache entries return None."""
-        cache = SearchCache(cache_dir=temp_cache_dir, ttl_hours=1)
-        # Create an old cache entry manually
         old_time = datetime.now(timezone.utc) - timedelta(hours=2)
-        cache_key = cache._get_cache_key("old query", 5)
-        cache_path = cache._get_cache_path(cache_key)
-        cache_path.write_text(json.dumps({
-            "query": "old query",
-            "results": [],
-            "provider": "tavily",
-            "timestamp": old_time.isoformat(),
-        }))
+        cache.set("old query", 5, SearchResponse(
+            query="old query",
+            results=(SearchResult(title="Old", url="http://old.com", snippet="s"),),
+            provider="tavily",
+            timestamp=old_time.isoformat(),
+        ))
 
         # Should return None for expired entry
         assert cache.get("old query", 5) is None
-        # File should be deleted
-        assert not cache_path.exists()
+        # Row should be deleted
+        assert len(cache) == 0
 
     def test_clear_all(self, cache: SearchCache):
         """Test clear with expired_only=False removes all."""
@@ -325,14 +324,12 @@ class TestSearchCache:
         cache.set("current", 5, current)
 
         old_time = datetime.now(timezone.utc) - timedelta(hours=2)
-        cache_key = cache._get_cache_key("old", 5)
-        cache_path = cache._get_cache_path(cache_key)
-        cache_path.write_text(json.dumps({
-            "query": "old",
-            "results": [],
-            "provider": "tavily",
-            "timestamp": old_time.isoformat(),
-        }))
+        cache.set("old", 5, SearchResponse(
+            query="old",
+            results=(SearchResult(title="Old", url="http://old.com", snippet="s"),),
+            provider="tavily",
+            timestamp=old_time.isoformat(),
+        ))
 
         removed = cache.clear(expired_only=True)
         assert removed == 1
@@ -351,23 +348,117 @@ class TestSearchCache:
         cache.set("error query", 5, response)
         assert cache.get("error query", 5) is None
 
-    def test_get_handles_corrupt_json(self, temp_cache_dir: Path):
-        """Test get handles corrupt JSON gracefully."""
-        cache = SearchCache(cache_dir=temp_cache_dir, ttl_hours=1)
+    def test_get_handles_corrupt_json(self, cache: SearchCache):
+        """Test get handles a corrupt payload gracefully."""
         cache_key = cache._get_cache_key("corrupt", 5)
-        cache_path = cache._get_cache_path(cache_key)
-        cache_path.write_text("not valid json {{{", encoding="utf-8")
+        now = time.time()
+        cache._conn.execute(
+            "INSERT INTO search_cache VALUES (?, ?, ?, ?, ?)",
+            (cache_key, "not valid json {{{", now, now + 3600, now),
+        )
 
         result = cache.get("corrupt", 5)
         assert result is None
-        # File should be deleted
-        assert not cache_path.exists()
+        # Row should be deleted
+        assert len(cache) == 0
 
     def test_clear_nonexistent_dir(self, tmp_path: Path):
         """Test clear on nonexistent directory returns 0."""
         cache = SearchCache(cache_dir=tmp_path / "does_not_exist", enabled=False)
         assert cache.clear() == 0
 
+    def test_cache_key_normalizes_phrasing(self, cache: SearchCache):
+        """Test punctuation and whitespace differences share an entry."""
+        cache.set("What is  Python?", 5, SearchResponse(
+            query="What is  Python?",
+            results=(SearchResult(title="R1", url="http://r1.com", snippet="s1"),),
+            provider="tavily",
+            timestamp=datetime.now(timezone.utc).isoformat(),
+        ))
+        assert cache.get("what is python", 5) is not None
+        assert cache.get("  WHAT IS PYTHON!! ", 5) is not None
+        assert cache.get("python is what", 5) is None
+
+    def test_normalize_query_keeps_technical_symbols(self):
+        """Test symbols that change meaning are preserved."""
+        assert normalize_query("C++ vs C#?") == "c++ vs c#"
+        assert normalize_query("C++") != normalize_query("C")
+        assert normalize_query("node.js   v20") == "node.js v20"
+
+    def test_normalize_query_keeps_phrase_quotes(self):
+        """Test exact-phrase queries get their own cache key."""
+        assert normalize_query('"Exact Phrase"') == '"exact phrase"'
+        assert normalize_query('"exact phrase"') != normalize_query("exact phrase")
+
+    def test_cache_key_includes_topic(self, cache: SearchCache):
+        """Test news and general results are cached separately."""
+        response = SearchResponse(
+            query="election",
+            results=(SearchResult(title="R1", url="http://r1.com", snippet="s1"),),
+            provider="tavily",
+            timestamp=datetime.now(timezone.utc).isoformat(),
+        )
+        cache.set("election", 5, response, topic="news")
+        assert cache.get("election", 5) is None
+        assert cache.get("election", 5, topic="news") is not None
+
+    def test_lru_eviction_over_max_entries(self, temp_cache_dir: Path):
+        """Test least recently used entries are evicted past the cap."""
+        cache = SearchCache(cache_dir=temp_cache_dir, max_entries=3, batch_size=1)
+        for i in range(3):
+            cache.set(f"q{i}", 5, SearchResponse(
+                query=f"q{i}",
+                results=(SearchResult(title="R", url="http://r.com", snippet="s"),),
+                provider="tavily",
+                timestamp=datetime.now(timezone.utc).isoformat(),
+            ))
+            time.sleep(0.01)
+        assert cache.get("q0", 5) is not None  # refresh q0
+        time.sleep(0.01)
+        cache.set("q3", 5, SearchResponse(
+            query="q3",
+            results=(SearchResult(title="R", url="http://r.com", snippet="s"),),
+            provider="tavily",
+            timestamp=datetime.now(timezone.utc).isoformat(),
+        ))
+
+        assert len(cache) == 3
+        assert cache.get("q1", 5) is None
+        assert cache.get("q0", 5) is not None
+
+    def test_writes_are_batched_and_persisted(self, temp_cache_dir: Path):
+        """Test buffered writes are visible immediately and survive reopen."""
+        cache = SearchCache(cache_dir=temp_cache_dir, batch_size=100, flush_interval=60)
+        cache.set("persist me", 5, SearchResponse(
+            query="persist me",
+            results=(SearchResult(title="R", url="http://r.com", snippet="s"),),
+            provider="tavily",
+            timestamp=datetime.now(timezone.utc).isoformat(),
+        ))
+        assert cache.get("persist me", 5) is not None
+        (rows,) = cache._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()
+        assert rows == 0
+        cache.close()
+
+        reopened = SearchCache(cache_dir=temp_cache_dir)
+        assert reopened.get("persist me", 5) is not None
+
+    def test_legacy_json_files_removed(self, temp_cache_dir: Path):
+        """Test old per-query JSON files are cleaned up once, leaving others."""
+        temp_cache_dir.mkdir(parents=True)
+        entry = json.dumps({"query": "q", "results": [], "provider": "tavily", "timestamp": "t"})
+        (temp_cache_dir / "abcdef0123456789.json").write_text(entry)
+        (temp_cache_dir / "settings.json").write_text(entry)
+        (temp_cache_dir / "0123456789abcdef.json").write_text("{}")
+        SearchCache(cache_dir=temp_cache_dir).close()
+        assert sorted(p.name for p in temp_cache_dir.glob("*.json")) == [
+            "0123456789abcdef.json", "settings.json",
+        ]
+
+        (temp_cache_dir / "abcdef0123456789.json").write_text(entry)
+        SearchCache(cache_dir=temp_cache_dir).close()
+        assert (temp_cache_dir / "abcdef0123456789.json").exists()
+
 
 
 
@@ -615,6 +706,43 @@ class TestWebSearchTool:
             assert "DuckDuckGo search failed" in (result.error or "")
 
 
+    def test_concurrent_identical_searches_coalesce(self, mock_cache: SearchCache):
+        """Test concurrent identical queries share one provider call."""
+        tool = WebSearchTool(
+            tavily_api_key="test-key",
+            cache=mock_cache,
+            rate_limiter=RateLimiter(requests_per_minute=100),
+        )
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_search(**kwargs):
+            started.set()
+            release.wait(5)
+            return {"results": [{"title": "Once", "url": "http://once.com", "content": "c"}]}
+
+        mock_tavily_client = MagicMock()
+        mock_tavily_client.search.side_effect = slow_search
+        mock_tavily_module = MagicMock()
+        mock_tavily_module.TavilyClient.return_value = mock_tavily_client
+
+        with patch.dict("sys.modules", {"tavily": mock_tavily_module}):
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                first = pool.submit(tool.search, "Same query", use_cache=False)
+                assert started.wait(5)
+                others = [
+                    pool.submit(tool.search, q, use_cache=False)
+                    for q in ("same query", "SAME  query?", "same query")
+                ]
+                time.sleep(0.05)
+                release.set()
+                results = [first.result(5)] + [f.result(5) for f in others]
+
+        assert mock_tavily_client.search.call_count == 1
+        assert all(r.results[0].title == "Once" for r in results)
+        assert tool._inflight == {}
+
+
 # =============================================================================
 # Integration Tests
 # =============================================================================
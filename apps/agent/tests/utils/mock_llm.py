@@ -1,11 +1,20 @@
 """Mock LLM classes for testing agent interactions.
 
-Provides MockLLM that can simulate various LLM responses without API calls.
+Provides MockLLM that can simulate various LLM responses without API calls,
+and PrefixCachingChatModel, a LangChain chat model that replays recorded
+responses while simulating provider prompt caching.
 """
+import hashlib
+import json
 from dataclasses import dataclass, field
 from typing import Any, Callable
 from unittest.mock import AsyncMock
 
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pydantic import Field, PrivateAttr
+
 
 @dataclass
 class MockLLMResponse:
@@ -122,3 +131,88 @@ def create_mock_response(
         stop_reason=stop_reason,
     )
 
+
+
+class PrefixCachingChatModel(BaseChatModel):
+    """Chat model that replays recorded responses and simulates prompt caching.
+
+    Every call flattens the prompt into content blocks and reports Anthropic-style
+    ``usage_metadata`` (``input_token_details.cache_read`` / ``cache_creation``)
+    as if a provider prefix cache sat in front of it, so cache-hit rates of a
+    prompt layout can be measured offline.
+
+    With ``automatic=False`` (Anthropic) only prefixes ending at a block tagged
+    with ``cache_control`` (or the last block, if ``cache_control`` is passed as
+    a model kwarg) are written to the cache. With ``automatic=True`` (OpenAI)
+    every block boundary is.
+
+    Usage:
+        model = PrefixCachingChatModel(responses=["one", "two"])
+        model.invoke([SystemMessage(...), HumanMessage(...)])
+    """
+
+    responses: list[str] = Field(default_factory=lambda: ["ok"])
+    automatic: bool = False
+    calls: list[list[BaseMessage]] = Field(default_factory=list)
+    _cache: set[str] = PrivateAttr(default_factory=set)
+
+    @property
+    def _llm_type(self) -> str:
+        return "prefix-caching-fake"
+
+    @staticmethod
+    def _blocks(messages: list[BaseMessage]) -> list[tuple[str, bool]]:
+        blocks: list[tuple[str, bool]] = []
+        for msg in messages:
+            content = msg.content
+            if isinstance(content, str):
+                content = [{"type": "text", "text": content}]
+            for block in content:
+                if isinstance(block, str):
+                    block = {"type": "text", "text": block}
+                text = block.get("text") or json.dumps(block, sort_keys=True, default=str)
+                blocks.append((f"{msg.type}:{text}", "cache_control" in block))
+        return blocks
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        self.calls.append(list(messages))
+        blocks = self._blocks(messages)
+        tokens = [len(text) // 4 + 1 for text, _ in blocks]
+        prefixes: list[str] = []
+        digest = hashlib.sha256()
+        for text, _ in blocks:
+            digest.update(text.encode())
+            prefixes.append(digest.hexdigest())
+
+        if self.automatic:
+            breakpoints = list(range(len(blocks)))
+        else:
+            breakpoints = [i for i, (_, tagged) in enumerate(blocks) if tagged]
+            if kwargs.get("cache_control") and blocks:
+                breakpoints.append(len(blocks) - 1)
+        last_bp = max(breakpoints, default=-1)
+
+        read_end = max((i for i in range(last_bp + 1) if prefixes[i] in self._cache), default=-1)
+        cache_read = sum(tokens[: read_end + 1])
+        cache_creation = sum(tokens[read_end + 1 : last_bp + 1])
+        self._cache.update(prefixes[i] for i in breakpoints)
+
+        text = self.responses[min(len(self.calls), len(self.responses)) - 1]
+        input_tokens = sum(tokens)
+        output_tokens = len(text) // 4 + 1
+        message = AIMessage(
+            content=text,
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+                "input_token_details": {"cache_read": cache_read, "cache_creation": cache_creation},
+            },
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
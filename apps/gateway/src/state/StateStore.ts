@@ -157,11 +157,73 @@ export class InMemoryStateStore extends EventEmitter implements StateStore {
 // Redis State Store
 // =============================================================================
 
+/**
+ * Atomic partial update, shared with the agent (`state_sync.py`).
+ *
+ * KEYS[1] session hash, KEYS[2] pub/sub channel.
+ * ARGV[1] JSON object of field -> JSON-encoded value, ARGV[2] JSON-encoded
+ * updatedAt, ARGV[3] expected version or "".
+ * Returns HGETALL on success, or {"missing"} / {"legacy"} / {"conflict", v}.
+ * Publishes {"version": n, "changes": {...}} with only the changed fields.
+ */
+const UPDATE_SCRIPT = `
+local key_type = redis.call('TYPE', KEYS[1])['ok']
+if key_type == 'none' then
+  return {'missing'}
+end
+if key_type ~= 'hash' then
+  return {'legacy'}
+end
+local version = tonumber(redis.call('HGET', KEYS[1], 'version') or '0') or 0
+if ARGV[3] ~= '' and tonumber(ARGV[3]) ~= version then
+  return {'conflict', tostring(version)}
+end
+version = version + 1
+local updates = cjson.decode(ARGV[1])
+updates['updatedAt'] = ARGV[2]
+updates['version'] = tostring(version)
+local args = {}
+local parts = {}
+for field, value in pairs(updates) do
+  args[#args + 1] = field
+  args[#args + 1] = value
+  parts[#parts + 1] = cjson.encode(field) .. ':' .. value
+end
+redis.call('HSET', KEYS[1], unpack(args))
+redis.call('PUBLISH', KEYS[2],
+  '{"version":' .. version .. ',"changes":{' .. table.concat(parts, ',') .. '}}')
+return redis.call('HGETALL', KEYS[1])
+`;
+
+/** JSON-encode each top-level value for storage in a Redis hash. */
+function encodeFields(data: Record<string, unknown>): Record<string, string> {
+  const encoded: Record<string, string> = {};
+  for (const [key, value] of Object.entries(data)) {
+    if (value !== undefined) {
+      encoded[key] = JSON.stringify(value);
+    }
+  }
+  return encoded;
+}
+
+/** Decode a Redis hash (object or flat HGETALL array) of JSON values. */
+function decodeFields(raw: Record<string, string> | string[]): Record<string, unknown> {
+  const entries: [string, string][] = Array.isArray(raw)
+    ? Array.from({ length: raw.length / 2 }, (_, i) => [raw[2 * i], raw[2 * i + 1]])
+    : Object.entries(raw);
+  const decoded: Record<string, unknown> = {};
+  for (const [key, value] of entries) {
+    decoded[key] = JSON.parse(value);
+  }
+  return decoded;
+}
+
 /**
  * Redis implementation of StateStore.
  *
  * Provides real pub/sub for multi-instance deployments.
- * Requires Redis server.
+ * Requires Redis server. Sessions are hashes updated by UPDATE_SCRIPT;
+ * pub/sub carries deltas that are applied to the last state seen locally.
  */
 export class RedisStateStore extends EventEmitter implements StateStore {
   private redis: any; // Redis client (ioredis)
@@ -172,8 +234,17 @@ export class RedisStateStore extends EventEmitter implements StateStore {
     new Set();
   private readonly keyPrefix = "ag3nt:session:";
   private readonly channelPrefix = "ag3nt:updates:";
+  /**
+   * Last state seen per session, used to apply pub/sub deltas. Kept in
+   * least-recently-used order and bounded; an evicted session is re-read
+   * on its next delta.
+   */
+  private known: Map<string, SessionState> = new Map();
 
-  constructor(redisUrl: string) {
+  constructor(
+    redisUrl: string,
+    private readonly maxKnownSessions = 1024
+  ) {
     super();
     this.initRedis(redisUrl);
   }
@@ -193,8 +264,15 @@ export class RedisStateStore extends EventEmitter implements StateStore {
       this.subscriber.on("pmessage", (_pattern: string, channel: string, message: string) => {
         try {
           const sessionId = channel.replace(this.channelPrefix, "");
-          const state = JSON.parse(message) as SessionState;
-          this.notifyLocalSubscribers(sessionId, state);
+          this.applyMessage(sessionId, JSON.parse(message))
+            .then((state) => {
+              if (state) {
+                this.notifyLocalSubscribers(sessionId, state);
+              }
+            })
+            .catch((err) => {
+              console.error("[RedisStateStore] Message apply error:", err);
+            });
         } catch (err) {
           console.error("[RedisStateStore] Message parse error:", err);
         }
@@ -207,17 +285,38 @@ export class RedisStateStore extends EventEmitter implements StateStore {
     }
   }
 
+  private async readHash(sessionId: string): Promise<SessionState | null> {
+    const key = `${this.keyPrefix}${sessionId}`;
+    try {
+      const raw = await this.redis.hgetall(key);
+      return raw && Object.keys(raw).length > 0
+        ? (decodeFields(raw) as unknown as SessionState)
+        : null;
+    } catch (err) {
+      if (!String(err).includes("WRONGTYPE")) {
+        throw err;
+      }
+      // Written by an older version as a single JSON string.
+      const data = await this.redis.get(key);
+      return data ? JSON.parse(data) : null;
+    }
+  }
+
   async getSession(sessionId: string): Promise<SessionState | null> {
-    const data = await this.redis.get(`${this.keyPrefix}${sessionId}`);
-    return data ? JSON.parse(data) : null;
+    return this.readHash(sessionId);
   }
 
   async setSession(sessionId: string, state: SessionState): Promise<void> {
-    await this.redis.set(
-      `${this.keyPrefix}${sessionId}`,
-      JSON.stringify(state)
-    );
-    await this.publishUpdate(sessionId, state);
+    const key = `${this.keyPrefix}${sessionId}`;
+    await this.redis
+      .multi()
+      .del(key)
+      .hset(key, encodeFields(state as unknown as Record<string, unknown>))
+      .publish(
+        `${this.channelPrefix}${sessionId}`,
+        JSON.stringify({ version: state.version, changes: state, full: true })
+      )
+      .exec();
   }
 
   async updateSession(
@@ -225,52 +324,83 @@ export class RedisStateStore extends EventEmitter implements StateStore {
     updates: Partial<SessionState>,
     _source: UpdateSource
   ): Promise<SessionState> {
-    // Use Lua script for atomic update
-    const script = `
-      local key = KEYS[1]
-      local updates = cjson.decode(ARGV[1])
-      local existing = redis.call('GET', key)
-
-      if not existing then
-        return nil
-      end
-
-      local state = cjson.decode(existing)
-
-      -- Apply updates
-      for k, v in pairs(updates) do
-        state[k] = v
-      end
-
-      state.updatedAt = ARGV[2]
-      state.version = state.version + 1
-
-      local result = cjson.encode(state)
-      redis.call('SET', key, result)
-
-      return result
-    `;
-
-    const result = await this.redis.eval(
-      script,
-      1,
-      `${this.keyPrefix}${sessionId}`,
-      JSON.stringify(updates),
-      new Date().toISOString()
+    const key = `${this.keyPrefix}${sessionId}`;
+    const result: string[] = await this.redis.eval(
+      UPDATE_SCRIPT,
+      2,
+      key,
+      `${this.channelPrefix}${sessionId}`,
+      JSON.stringify(encodeFields(updates as Record<string, unknown>)),
+      JSON.stringify(new Date().toISOString()),
+      ""
     );
 
-    if (!result) {
+    if (result[0] === "missing") {
       throw new Error(`Session not found: ${sessionId}`);
     }
+    if (result[0] === "legacy") {
+      await this.migrateLegacy(key);
+      return this.updateSession(sessionId, updates, _source);
+    }
 
-    const updated = JSON.parse(result) as SessionState;
-    await this.publishUpdate(sessionId, updated);
+    return decodeFields(result) as unknown as SessionState;
+  }
 
-    return updated;
+  /**
+   * Rewrite a JSON-string session as a hash, guarded by WATCH. WATCH state
+   * belongs to a connection, so this runs on a dedicated one rather than the
+   * shared client other commands are interleaved on.
+   */
+  private async migrateLegacy(key: string): Promise<void> {
+    const conn = this.redis.duplicate();
+    try {
+      await conn.watch(key);
+      if ((await conn.type(key)) !== "string") {
+        await conn.unwatch();
+        return;
+      }
+      const data = JSON.parse(await conn.get(key));
+      // exec() resolves to null if another writer touched the key; the caller retries.
+      await conn.multi().del(key).hset(key, encodeFields(data)).exec();
+    } finally {
+      await conn.quit();
+    }
+  }
+
+  /**
+   * Turn a pub/sub payload into a full state. Deltas are applied to the last
+   * known state; on a version gap the hash is re-read.
+   */
+  private async applyMessage(
+    sessionId: string,
+    payload: { version?: number; changes?: Partial<SessionState>; full?: boolean }
+  ): Promise<SessionState | null> {
+    let state: SessionState | null;
+    if (!payload.changes) {
+      // Older publishers send the complete session.
+      state = payload as unknown as SessionState;
+    } else if (payload.full) {
+      state = payload.changes as SessionState;
+    } else {
+      const known = this.known.get(sessionId);
+      state =
+        known && known.version === (payload.version ?? 0) - 1
+          ? { ...known, ...payload.changes }
+          : await this.readHash(sessionId);
+    }
+    if (state) {
+      this.known.delete(sessionId);
+      this.known.set(sessionId, state);
+      if (this.known.size > this.maxKnownSessions) {
+        this.known.delete(this.known.keys().next().value!);
+      }
+    }
+    return state;
   }
 
   async deleteSession(sessionId: string): Promise<boolean> {
     const result = await this.redis.del(`${this.keyPrefix}${sessionId}`);
+    this.known.delete(sessionId);
     return result > 0;
   }
 
@@ -305,20 +435,11 @@ export class RedisStateStore extends EventEmitter implements StateStore {
   async close(): Promise<void> {
     await this.subscriber?.quit();
     await this.redis?.quit();
+    this.known.clear();
     this.sessionSubscribers.clear();
     this.allSubscribers.clear();
   }
 
-  private async publishUpdate(
-    sessionId: string,
-    state: SessionState
-  ): Promise<void> {
-    await this.redis.publish(
-      `${this.channelPrefix}${sessionId}`,
-      JSON.stringify(state)
-    );
-  }
-
   private notifyLocalSubscribers(
     sessionId: string,
     state: SessionState